@@ -1,44 +1,64 @@
 import os
-import re
 import logging
-import time
-import isodate
-from dotenv import load_dotenv
 from datetime import datetime, timedelta
-from dateutil import parser, rrule
 from zoneinfo import ZoneInfo
 from threading import Thread, Event
 
-import RPi.GPIO as GPIO
-from src.utils.logging_utils import setup_logging
-from src.database.implementations.json_database import JsonDatabase
-from src.hardware.implementations.mfrc522_reader import MFRC522Reader
-from src.hardware.implementations.continuous_switch_monitor import ContinuousSwitchMonitor
-from src.hardware.implementations.pi_gpio_switch_reader import PiGPIOSwitchReader
-from src.hardware.implementations.pi_gpio_switch_operator import PiGPIOSwitchOperator
-from src.hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
-from src.utils.threading_shared_variable import SharedVariable
-from src.schemas.member_schema import member_schema
-
-# Configure basic logging for now
-# TODO - make this an app configuration
-setup_logging(logging.DEBUG)
+from src.utils.logging_utils import setup_logging, shutdown_logging
+from src.utils.threading_event_queue import EventQueue
+from src.managers.implementations.event_manager import EventManager
+from src.managers.implementations.door_actuator import DoorActuator
+from src.managers.implementations.add_member_workflow import AddMemberWorkflow, is_valid_sponsor
+from src.utils.timer_scheduler import TimerScheduler
+from src.utils.access_point_config import load_access_points, normalize_access_point
+from src.managers.implementations.access_control_manager import ALWAYS, SCHEDULED, AccessControlManager, compile_member
+
+# Hardware drivers, RPi.GPIO, mfrc522 and python-dotenv are imported when the
+# components using them are created, so importing ada stays cheap and works
+# off a Pi. tests/test_startup.py keeps it that way.
+
 logger = logging.getLogger('ADA')
 
-if load_dotenv():
-    logger.info("Environment variables loaded")
-else:
-    logger.info("No environment variables passed, loading defaults")
+# Events published by the hardware monitors
+RFID_SCANNED = "rfid_scanned"
+DOOR_STATE_CHANGED = "door_state_changed"
+MODE_STATE_CHANGED = "mode_state_changed"
+
+def configure():
+    """
+    Load .env into the environment and set up logging. Called first by the
+    entry points rather than at import time.
+    """
+    from dotenv import load_dotenv
+    env_loaded = load_dotenv()
+
+    # Configure basic logging for now
+    # TODO - make this an app configuration
+    setup_logging(
+        logging.DEBUG,
+        async_logging=str_to_bool(os.getenv("LOG_ASYNC", "False")),
+        # Defaults to logs/ada.log in the project directory
+        log_file=os.getenv("LOG_FILE") or None,
+        max_bytes=int(os.getenv("LOG_MAX_BYTES", 0)),
+        backup_count=int(os.getenv("LOG_BACKUP_COUNT", 0)),
+        queue_size=int(os.getenv("LOG_QUEUE_SIZE", 10000)),
+        force=True
+    )
+
+    if env_loaded:
+        logger.info("Environment variables loaded")
+    else:
+        logger.info("No environment variables passed, loading defaults")
 
 class AddMemberModeManager:
     def __init__(self):
         self.thread_stop_event = Event()
         self.thread = None
 
-    def start_add_member_mode(self, db, rfid_monitor_shared_var, get_temp_access_interval):
+    def start_add_member_mode(self, db, rfid_event_queue, get_temp_access_interval):
         if not self.is_active():
             self.thread_stop_event.clear()
-            self.thread = Thread(target=self.handle_active_mode, args=(db, rfid_monitor_shared_var, get_temp_access_interval, self.thread_stop_event))
+            self.thread = Thread(target=self.handle_active_mode, args=(db, rfid_event_queue, get_temp_access_interval, self.thread_stop_event))
             self.thread.start()
 
     def stop_add_member_mode(self):
@@ -49,183 +69,37 @@ class AddMemberModeManager:
 
     def is_active(self):
         return self.thread is not None and self.thread.is_alive()
-    
-    def is_valid_sponsor(member_info):
-        if member_info["membership_status"] == "active" and (member_info["member_level"] == "member" or member_info["member_level"] == "admin"):
-            return True
-        return False
 
-    @staticmethod
-    def handle_active_mode(db, rfid_monitor_shared_var, get_temp_access_interval, stop_event):
-        guest_member_info = {}
-        sponsor_member_info = {}
-        sponsor_obf_id = None
-        guest_obf_id = None
-        is_valid_sponsor = False
-
-        # Loop until one of these occurs:
-            #   + timeout
-            #   + add/update guest to DB
-            #   + sponsor not authorized
-        while not stop_event.is_set():
-            """
-            Loop until sponsor ID is scanned and guest ID is scanned
-            Then determine if sponsor can sponsor the guest
-            """
-            if stop_event.is_set():
-                logger.info("Stop event received, terminating active mode processing.")
-                break
-
-            # Scan for and RFID
-            obf_id = rfid_monitor_shared_var.get()
-            rfid_monitor_shared_var.reset()
-
-            # Get sponsor ID first and run validation checks
-            if obf_id is not None and sponsor_obf_id is None:
-                sponsor_obf_id = obf_id
-                obf_id = None
-                logger.info(f"Sponsor RFID scanned: {sponsor_obf_id}")
-                sponsor_member_info = db.get_member({"obf_rfid": sponsor_obf_id})
-
-                # Check if sponsor is in DB and is a valid sponsor
-                if sponsor_member_info is not None and AddMemberModeManager.is_valid_sponsor(sponsor_member_info):
-                    is_valid_sponsor = True
-                    # TODO - notify user
-                    logger.info(f"Sponsor is authorized")
-                else:
-                    logger.info("Sponsor not authorized")
-                    sponsor_obf_id = None
-
-            # Get guest ID and determine if adding or updating
-            if is_valid_sponsor and obf_id is not None and guest_obf_id is None:
-                
-                # Scan guest ID
-                guest_obf_id = obf_id
-                obf_id = None
-                logger.info(f"Guest RFID scanned: {guest_obf_id}")
-
-                # Assume guest is new and check if renewing temp access
-                guest_is_new = True
-
-                # Check if Guest exists in DB
-                guest_member_info = db.get_member({"obf_rfid": guest_obf_id})
-                if guest_member_info is not None:
-                    guest_is_new = False
-                    logger.info(f"Renewing guest temp access: {guest_obf_id}")
-                else:
-                    guest_member_info = {
-                        "obf_rfid": guest_obf_id,
-                        "member_level": "guest",
-                        "membership_status": "active",
-                        "access_interval": get_temp_access_interval(),
-                        "member_sponsor": sponsor_obf_id,
-                        "created": "",
-                        "last_updated": ""
-                    }
-                    db.add_member(guest_member_info)
-                    logger.info(f"Guest added: {guest_member_info}")
-
-            stop_event.wait(timeout=1)
-
-class DoorManager:
-    def __init__(self, door_latch):
-        self.door_latch = door_latch
-
-    def unlock_door_for_duration(self, duration=7):
-        self.door_latch.set_status("active")  # Unlock the door
-        logger.info("Door unlocked")
-        time.sleep(duration)  # Keep the door unlocked for the specified duration
-        self.door_latch.set_status("inactive")  # Lock the door again
-        logger.info("Door locked")
-
-# Check to confirm member data format follows ADA member_schema
-def _is_valid_member_data(member_data):
-    for key, expected_type in member_schema.items():
-        if key not in member_data or not isinstance(member_data[key], expected_type):
-            raise ValueError(f"Invalid member data for {key}")
-    return True
-
-# Check membership status
-def _is_member_status_active(member_data):
-    if member_data["membership_status"] == "active":
-        return True
-    return False
+    is_valid_sponsor = staticmethod(is_valid_sponsor)
 
-# Check membership access interval
-def _is_within_access_interval(interval_str):
-    try:
-        # Extract the repetition count, start date-time, and duration from the interval string
-        match = re.match(r"R(\d*)/(.*?)/(P.*)", interval_str)
-        if not match:
-            raise ValueError("Invalid interval string format")
-
-        repeat_count, start_str, duration_str = match.groups()
-
-        # If repeat_count is empty, it means infinite repetitions; otherwise, convert to int
-        repeat_count = int(repeat_count) if repeat_count else None
-
-        # Parse the start time in the scanner's local timezone and duration
-        local_tz = ZoneInfo(os.getenv("SCANNER_TIME_ZONE", "UTC"))
-        start_time_local = parser.isoparse(start_str).replace(tzinfo=local_tz)
-
-        # Convert start time from local to UTC (system time)
-        start_time_utc = start_time_local.astimezone(ZoneInfo("UTC"))
-        duration = _parse_duration(duration_str)
-
-        # Create rule for repeating intervals
-        rule = rrule.rrule(rrule.DAILY, interval=1, dtstart=start_time_utc, count=repeat_count)
-
-        # Get current UTC time
-        current_time_utc = datetime.now(ZoneInfo("UTC"))
-
-        # Find the current interval in UTC
-        current_interval_start = rule.before(current_time_utc, inc=True)
-        
-        # If interval is in the future, value will be none
-        if current_interval_start is None:
-            return False
-        
-        current_interval_end = current_interval_start + duration
-        
-        # Check if current UTC time is within the interval
-        return current_interval_start <= current_time_utc <= current_interval_end
-    except Exception as e:
-        logger.error(f"Error parsing interval: {e}")
-        return False
-
-# Helper function for access interval resolving
-def _parse_duration(duration_str):
-    # Parse the ISO 8601 duration string
-    return isodate.parse_duration(duration_str)
+    @staticmethod
+    def handle_active_mode(db, rfid_event_queue, get_temp_access_interval, stop_event):
+        # The sponsor/guest workflow is shared with the asyncio runtime
+        workflow = AddMemberWorkflow({"name": "ADA", "database": db, "get_temp_access_interval": get_temp_access_interval})
 
+        while not stop_event.is_set():
+            # Wait up to a second for the next RFID scan
+            obf_id = rfid_event_queue.get(timeout=1)
+            if obf_id is None:
+                continue
+            try:
+                workflow.handle_scan(obf_id)
+            except Exception as e:
+                logger.error(f"Error in Add Member mode: {e}")
+        logger.info("Stop event received, terminating active mode processing.")
 
 def is_member_access_authorized(member_data):
-    # Confirm ADA schemas are being followed
-    if not _is_valid_member_data(member_data):
-        logger.error("Member Data not in expected format")
-        return False
-    
-    # If member is not active they are not authorized
-    if not _is_member_status_active(member_data):
-        return False
-    
-    # If level is 'member' or 'admin' they have 24/7 access
-    if member_data["member_level"] == "member" or member_data["member_level"] == "admin":
+    """
+    One-off access check for a single member record. The door path uses
+    AccessControlManager, which keeps these verdicts compiled ahead of time.
+    """
+    verdict, reason = compile_member(member_data)
+    if reason:
+        logger.error(f"Member access check failed: {reason}")
+    if verdict.access == ALWAYS:
         return True
-    
-    # If level is 'guest' or 'philanthropist' they have limited access and we need to validate
-    # the scan time is within that interval of limited access
-    elif member_data["member_level"] == "guest" or member_data["member_level"] == "philanthropist":
-        
-        # If current scan time is within the temp access interval, grant access
-        if _is_within_access_interval(member_data["access_interval"]):
-            return True
-        return False
-    
-    # If an unknown member_level is provided report error
-    else:
-        logger.error("Member level provided does not exist")
-    
+    if verdict.access == SCHEDULED:
+        return verdict.schedule.contains(datetime.now(ZoneInfo("UTC")))
     return False
 
 # 
@@ -268,171 +142,347 @@ def get_temp_access_interval():
 def str_to_bool(s):
     return s.lower() in ("true", "t", "1", "yes")
 
-def main():
-    GPIO.setmode(GPIO.BCM)
-    
+def access_point_from_env():
     """
-    Initialize integrated components and hardware
+    Describe the single access point configured by environment variables,
+    used when ACCESS_POINTS_CONFIG is not set.
     """
+    return normalize_access_point({
+        "name": os.getenv("ACCESS_POINT_NAME", "default_AccessPoint"),
+        "unlock_duration": float(os.getenv("DOOR_UNLOCK_DURATION_SEC", 7)),
+        "reader": {
+            "name": os.getenv("RFID_READER_NAME", "default_RfidReader")
+        },
+        "latch": {
+            "name": os.getenv("DOOR_SWITCH_NAME", "default_DoorLatch"),
+            "pin_number": int(os.getenv("DOOR_SWITCH_PIN_NUMBER", 21))
+        },
+        "reed_switch": {
+            "name": os.getenv("REED_SWITCH_NAME", "default_ReedSwitch"),
+            "pin_number": int(os.getenv("REED_SWITCH_PIN_NUMBER", 4)),
+            "normally_open": str_to_bool(os.getenv("REED_SWITCH_NORMALLY_OPEN", "True")),
+            "common_to_ground": str_to_bool(os.getenv("REED_SWITCH_COMMON_TO_GROUND", "True"))
+        },
+        "mode_switch": {
+            "name": os.getenv("MODE_SWITCH_NAME", "default_ModeSwitch"),
+            "pin_number": int(os.getenv("MODE_SWITCH_PIN_NUMBER", 18)),
+            "normally_open": str_to_bool(os.getenv("MODE_SWITCH_NORMALLY_OPEN", "True")),
+            "common_to_ground": str_to_bool(os.getenv("MODE_SWITCH_COMMON_TO_GROUND", "True"))
+        },
+        "rfid_monitor": {
+            "name": os.getenv("RFID_MONITOR_NAME", "default_RfidMonitor"),
+            "monitoring_interval": float(os.getenv("RFID_MONITOR_INTERVAL", 5)),
+            "adaptive_polling": str_to_bool(os.getenv("RFID_MONITOR_ADAPTIVE_POLLING", "True")),
+            "fast_interval": float(os.getenv("RFID_MONITOR_FAST_INTERVAL", 0.05)),
+            "active_window": float(os.getenv("RFID_MONITOR_ACTIVE_WINDOW_SEC", 10)),
+            "duplicate_window": float(os.getenv("RFID_MONITOR_DUPLICATE_WINDOW_SEC", 2))
+        },
+        "door_monitor": {
+            "name": os.getenv("DOOR_MONITOR_NAME", "default_DoorMonitor"),
+            "monitoring_interval": float(os.getenv("DOOR_MONITOR_INTERVAL", 30)),
+            "detection_mode": os.getenv("DOOR_MONITOR_DETECTION_MODE", "poll"),
+            "debounce_time": float(os.getenv("DOOR_MONITOR_DEBOUNCE_SEC", 0.05)),
+            "settle_time": float(os.getenv("DOOR_MONITOR_SETTLE_SEC", 0))
+        },
+        "mode_monitor": {
+            "name": os.getenv("MODE_MONITOR_NAME", "default_ModeMonitor"),
+            "monitoring_interval": float(os.getenv("MODE_MONITOR_INTERVAL", 1)),
+            "detection_mode": os.getenv("MODE_MONITOR_DETECTION_MODE", "poll"),
+            "debounce_time": float(os.getenv("MODE_MONITOR_DEBOUNCE_SEC", 0.05)),
+            "settle_time": float(os.getenv("MODE_MONITOR_SETTLE_SEC", 0))
+        }
+    })
 
-    # Initialize database
+class AccessPoint:
+    """
+    The hardware and monitors of one door, all driven by the shared scheduler,
+    and the door's own Add Member mode, as in the asyncio runtime.
+    """
+    def __init__(self, spec, event_manager, scheduler):
+        from src.hardware.implementations.mfrc522_reader import MFRC522Reader
+        from src.hardware.implementations.pi_gpio_switch_operator import PiGPIOSwitchOperator
+        from src.hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
+
+        self.name = spec["name"]
+        self.add_member_mode = AddMemberModeManager()
+        self.add_member_scans = EventQueue(maxsize=int(os.getenv("RFID_EVENT_QUEUE_SIZE", 32)), coalesce=True)
+        self.monitors = []
+        self.rfid_monitor = RFIDContinuousMonitor({
+            **spec["rfid_monitor"],
+            "event_manager": event_manager,
+            "event_name": RFID_SCANNED,
+            "mfrc522_reader": MFRC522Reader(spec["reader"]),
+            "scheduler": scheduler,
+            "access_point": self.name
+        })
+        self.monitors.append(self.rfid_monitor)
+
+        self.door_actuator = DoorActuator({
+            "name": f"{self.name}_door_actuator",
+            "door_latch": PiGPIOSwitchOperator(spec["latch"]),
+            "scheduler": scheduler,
+            "unlock_duration": spec["unlock_duration"]
+        })
+
+        for device, monitor, event_name in (("reed_switch", "door_monitor", DOOR_STATE_CHANGED), ("mode_switch", "mode_monitor", MODE_STATE_CHANGED)):
+            if spec.get(device) is not None:
+                from src.hardware.implementations.pi_gpio_switch_reader import PiGPIOSwitchReader
+                from src.hardware.implementations.continuous_switch_monitor import ContinuousSwitchMonitor
+                self.monitors.append(ContinuousSwitchMonitor({
+                    **spec[monitor],
+                    "event_manager": event_manager,
+                    "event_name": event_name,
+                    "switch_reader": PiGPIOSwitchReader(spec[device]),
+                    "scheduler": scheduler,
+                    "access_point": self.name
+                }))
+
+    def start(self):
+        for monitor in self.monitors:
+            monitor.start_monitoring()
+
+    def stop(self):
+        for monitor in self.monitors:
+            monitor.stop_monitoring()
+        self.door_actuator.lock_door()
+
+def stop_access_points(access_points):
+    """
+    Stop every door's monitors and relock it. A door that fails to stop, e.g.
+    because its latch write failed, is logged and the other doors are still
+    stopped, so one fault can't leave the rest unlocked.
+    :return: True if every door stopped.
+    """
+    stopped = True
+    for access_point in access_points:
+        try:
+            access_point.stop()
+        except Exception as e:
+            stopped = False
+            logger.error(f"Error stopping access point {access_point.name}: {e}")
+    return stopped
+
+def create_database():
+    """
+    Open the member database configured by environment variables, behind a
+    member lookup cache unless MEMBER_CACHE_SIZE is 0. Badge scans are decided
+    by AccessControlManager's verdict table and never look members up, so the
+    cache only serves Add Member mode and the guest expiry sweeper.
+    """
+    from src.database.implementations.json_database import JsonDatabase
+    connection_info = os.getenv("JSON_DB_CONNECTION_INFO", "default_json_database/db.json")
     db = JsonDatabase({
         "name": os.getenv("JSON_DB_NAME", "default_JsonDB"),
-        "connection_info": os.getenv("JSON_DB_CONNECTION_INFO", "default_json_database/db.json")
+        "connection_info": connection_info,
+        # Decoded members and compiled schedules for fast restarts, "" disables
+        "warm_start_path": os.getenv("JSON_DB_WARM_START_PATH", f"{connection_info}.warm"),
+        # "json" or the compact "binary" member file; the file is converted on the next save
+        "codec": os.getenv("JSON_DB_CODEC", "json"),
+        # Hold members in slotted records for about half the memory
+        "compact_members": str_to_bool(os.getenv("JSON_DB_COMPACT_MEMBERS", "False")),
+        # "sync" writes every change before returning; "group" and "deferred" batch writes
+        "durability": os.getenv("JSON_DB_DURABILITY", "sync"),
+        "commit_delay": float(os.getenv("JSON_DB_COMMIT_DELAY_SEC", 0.02))
     })
 
-    # Initialize a ModeSwitch
-    mode_switch = PiGPIOSwitchReader({
-        "name": os.getenv("MODE_SWITCH_NAME", "default_ModeSwitch"),
-        "pin_number": int(os.getenv("MODE_SWITCH_PIN_NUMBER", 18)),
-        "normally_open": str_to_bool(os.getenv("MODE_SWITCH_NORMALLY_OPEN", "True")),
-        "common_to_ground": str_to_bool(os.getenv("MODE_SWITCH_COMMON_TO_GROUND", "True"))
-    })
-
-    # Initialize a DoorReedSwitch
-    door_reed_switch = PiGPIOSwitchReader({
-        "name": os.getenv("REED_SWITCH_NAME", "default_ReedSwitch"),
-        "pin_number": int(os.getenv("REED_SWITCH_PIN_NUMBER", 4)),
-        "normally_open": str_to_bool(os.getenv("REED_SWITCH_NORMALLY_OPEN", "True")),
-        "common_to_ground": str_to_bool(os.getenv("REED_SWITCH_COMMON_TO_GROUND", "True")),
+    # Cache member lookups, including unknown cards, in front of the database
+    # for the sponsor/guest checks of Add Member mode and the sweeper
+    member_cache_size = int(os.getenv("MEMBER_CACHE_SIZE", 1024))
+    if member_cache_size > 0:
+        from src.database.implementations.caching_database import CachingDatabase
+        db = CachingDatabase({
+            "name": os.getenv("MEMBER_CACHE_NAME", "default_MemberCache"),
+            "database": db,
+            "max_size": member_cache_size,
+            "ttl": float(os.getenv("MEMBER_CACHE_TTL_SEC", 60)),
+            "negative_ttl": float(os.getenv("MEMBER_CACHE_NEGATIVE_TTL_SEC", 5))
+        })
+    return db
+
+def create_access_log():
+    """
+    Open the access attempt log configured by environment variables, or
+    return None if ACCESS_LOG_PATH is set to "".
+    """
+    connection_info = os.getenv("JSON_DB_CONNECTION_INFO", "default_json_database/db.json")
+    path = os.getenv("ACCESS_LOG_PATH", os.path.join(os.path.dirname(connection_info), "access_log"))
+    if not path:
+        return None
+    from src.database.implementations.access_log_store import AccessLogStore
+    return AccessLogStore({
+        "name": os.getenv("ACCESS_LOG_NAME", "default_AccessLog"),
+        "path": path,
+        "flush_interval": float(os.getenv("ACCESS_LOG_FLUSH_INTERVAL_SEC", 1)),
+        "retention_days": int(os.getenv("ACCESS_LOG_RETENTION_DAYS", 90)),
+        "fsync": str_to_bool(os.getenv("ACCESS_LOG_FSYNC", "False"))
     })
 
-    # Initialize a DoorLatch
-    door_latch = PiGPIOSwitchOperator({
-        "name": os.getenv("DOOR_SWITCH_NAME", "default_DoorLatch"), 
-        "pin_number": int(os.getenv("DOOR_SWITCH_PIN_NUMBER", 21))
+def create_guest_expiry_sweeper(db):
+    """
+    Start deactivating guests whose access has ended, or return None if
+    GUEST_EXPIRY_SWEEP_INTERVAL_SEC is 0.
+    """
+    sweep_interval = float(os.getenv("GUEST_EXPIRY_SWEEP_INTERVAL_SEC", 3600))
+    if sweep_interval <= 0:
+        return None
+    from src.managers.implementations.guest_expiry_sweeper import GuestExpirySweeper
+    sweeper = GuestExpirySweeper({
+        "name": os.getenv("GUEST_EXPIRY_NAME", "default_GuestExpirySweeper"),
+        "database": db,
+        "sweep_interval": sweep_interval,
+        "batch_size": int(os.getenv("GUEST_EXPIRY_BATCH_SIZE", 500))
     })
-
-    # Initialize an MFRC522Reader
-    rfid_reader = MFRC522Reader({
-        "name": os.getenv("RFID_READER_NAME", "default_RfidReader")
+    sweeper.start()
+    return sweeper
+
+def load_access_point_specs():
+    # Doors are described by a JSON file, or by environment variables for a single door
+    access_points_config = os.getenv("ACCESS_POINTS_CONFIG")
+    return load_access_points(access_points_config) if access_points_config else [access_point_from_env()]
+
+def create_access_control_manager(db, access_point_specs):
+    # Compile member records into access verdicts, kept current as the database changes
+    return AccessControlManager({
+        "name": os.getenv("ACCESS_CONTROL_NAME", "default_AccessControl"),
+        "database": db,
+        "access_point_levels": {spec["name"]: spec["allowed_levels"] for spec in access_point_specs if spec["allowed_levels"] is not None}
     })
 
+def main(stop_event=None):
+    """
+    Run ADA until interrupted, or until stop_event (a threading.Event) is set.
+    """
+    configure()
+    import RPi.GPIO as GPIO
+    GPIO.setmode(GPIO.BCM)
     
     """
-    Initialize hardware state monitors
+    Initialize integrated components and hardware
     """
+    db = create_database()
+    access_point_specs = load_access_point_specs()
+    access_control_manager = create_access_control_manager(db, access_point_specs)
+    access_log = create_access_log()
+    guest_expiry_sweeper = create_guest_expiry_sweeper(db)
 
-    # Initialize a ContinuousSwitchMonitor for the ModeSwitch
-    mode_monitor_shared_var = SharedVariable() # For switch state access in main
-    mode_monitor = ContinuousSwitchMonitor({
-    "name": os.getenv("MODE_MONITOR_NAME", "default_ModeMonitor"),
-    "monitoring_interval": float(os.getenv("MODE_MONITOR_INTERVAL", 1)),
-    "threading_shared_var": mode_monitor_shared_var,
-    "switch_reader": mode_switch
-    })
+    """
+    Initialize hardware and state monitors
+    """
 
-    # Initialize a ContinuousSwitchMonitor for the DoorReedSwitch
-    door_monitor_shared_var = SharedVariable() # For switch state access in main
-    door_monitor = ContinuousSwitchMonitor({
-    "name": os.getenv("DOOR_MONITOR_NAME", "default_DoorMonitor"),
-    "monitoring_interval": float(os.getenv("DOOR_MONITOR_INTERVAL", 30)),
-    "threading_shared_var": door_monitor_shared_var,
-    "switch_reader": door_reed_switch
+    # Every monitor publishes into one EventManager, dispatched by the main thread
+    event_manager = EventManager({
+        "name": os.getenv("EVENT_MANAGER_NAME", "default_EventManager"),
+        "max_queued_events": int(os.getenv("EVENT_MANAGER_QUEUE_SIZE", 256))
     })
 
-    # Initialize a ContinuousSwitchMonitor for the MFRC522Reader
-    rfid_monitor_shared_var = SharedVariable() # For switch state access in main
-    rfid_monitor = RFIDContinuousMonitor({
-    "name": os.getenv("RFID_MONITOR_NAME", "default_RfidMonitor"),
-    "monitoring_interval": float(os.getenv("RFID_MONITOR_INTERVAL", 5)),
-    "threading_shared_var": rfid_monitor_shared_var,
-    "mfrc522_reader": rfid_reader
-    })
+    # One scheduler thread polls every door's devices and relocks every door
+    scheduler = TimerScheduler(os.getenv("TIMER_SCHEDULER_NAME", "default_TimerScheduler"))
+    scheduler.start()
+    access_points = {spec["name"]: AccessPoint(spec, event_manager, scheduler) for spec in access_point_specs}
+    logger.info(f"Access points: {', '.join(access_points)}")
 
-    # Start the monitoring threads
-    door_monitor.start_monitoring()
-    # mode_monitor.start_monitoring()
-    rfid_monitor.start_monitoring()
-    
-    add_member_mode_manager = AddMemberModeManager()
-    door_manager = DoorManager(door_latch)
+    """
+    Event handlers, called in publish order on the main thread
+    """
 
+    def handle_mode_state_changed(event_data):
+        mode_state = event_data["state"].lower()
+        access_point = event_data.get("access_point")
+        # Each door has its own Add Member mode
+        add_member_mode = access_points[access_point].add_member_mode
+
+        # If 'inactive', then run standard routine logic
+        if mode_state == "inactive":
+            # Confirm Add Member Mode thread is stopped
+            if add_member_mode.is_active():
+                add_member_mode.stop_add_member_mode()
+                logger.info(f"Add Member mode stopped at {access_point}")
+
+        # If 'active', then run add member logic
+        elif mode_state == "active":
+            if not add_member_mode.is_active():
+                # Start active mode thread if not already running
+                add_member_scans = access_points[access_point].add_member_scans
+                add_member_scans.clear()
+                add_member_mode.start_add_member_mode(db, add_member_scans, get_temp_access_interval)
+                logger.info(f"Add Member Mode started at {access_point}")
+        else:
+            logger.warning(f"Unknown mode state")
+
+    def handle_rfid_scanned(event_data):
+        obf_id = event_data["obf_rfid"]
+        access_point = event_data.get("access_point")
+
+        # Scans at a door in Add Member mode belong to the sponsor/guest workflow
+        if access_points[access_point].add_member_mode.is_active():
+            access_points[access_point].add_member_scans.put(obf_id)
+            return
+
+        logger.info(f"RFID scanned at {access_point}: {obf_id}")
+
+        # Validate against the compiled access table
+        granted = access_control_manager.validate_access(obf_id, access_point)
+        attempt = {"obf_rfid": obf_id, "access_point": access_point, "result": "granted" if granted else "denied"}
+        try:
+            if granted:
+                logger.info("Access authorized")
+                # Returns immediately; the scheduler relocks the door
+                access_points[access_point].door_actuator.unlock_door()
+            else:
+                logger.info("Access not authorized")
+        except Exception:
+            attempt["reason"] = "unlock_failed"
+            raise
+        finally:
+            if access_log is not None:
+                # Only buffers the attempt; a writer thread stores it
+                access_log.log_access_attempt(attempt)
+
+    def handle_door_state_changed(event_data):
+        access_point = event_data.get("access_point")
+        logger.info(f"Door State Updated at {access_point}: {event_data['state']}")
+        # Someone is at the door, poll the reader quickly
+        access_points[access_point].rfid_monitor.notify_activity()
+        # Add notification logic here
+
+    event_manager.subscribe_to_event(MODE_STATE_CHANGED, handle_mode_state_changed)
+    event_manager.subscribe_to_event(RFID_SCANNED, handle_rfid_scanned)
+    event_manager.subscribe_to_event(DOOR_STATE_CHANGED, handle_door_state_changed)
+
+    # Start monitoring every door
+    for access_point in access_points.values():
+        access_point.start()
+
+    stop_event = stop_event or Event()
     try:
         logger.info("Starting ADA")
-        while True:
-            # Set the mode state fron the mode_monitor_shared_var
-            mode_state = mode_switch.get_status().lower()
-
-            # If 'inactive', then run standard routine logic
-            if mode_state == "inactive":
-                # Confirm Add Member Mode thread is stopped
-                if add_member_mode_manager.is_active():
-                    # Stop the active mode thread if it's running and we're no longer in active mode
-                    add_member_mode_manager.stop_add_member_mode()
-                    logger.info("Add Member mode stopped")
-
-                # Check for updates to rfid_monitor_shared_var
-                obf_id = rfid_monitor_shared_var.get()
-                if obf_id is not None:
-                    logger.info(f"RFID scanned: {obf_id}")
-
-                    # Validate against database
-                    member_info = db.get_member({"obf_rfid": obf_id})
-                    if member_info:
-                        if is_member_access_authorized(member_info):
-                            logger.info("Access authorized")
-                            # Start a thread to unlock the door for a duration without blocking the main thread
-                            door_unlock_thread = Thread(target=door_manager.unlock_door_for_duration, args=(int(os.getenv("DOOR_UNLOCK_DURATION_SEC", 7)),))
-                            door_unlock_thread.start()
-                            
-                            # # Unlock the door
-                            # door_latch.set_status("active")
-                            # logger.info("Door unlocked")
-
-                            # # Keep the door unlocked for 7 seconds
-                            # time.sleep(7)
-
-                            # # Lock the door again
-                            # door_latch.set_status("inactive")
-                            # logger.info("Door locked")
-                        else:
-                            logger.info("Access not authorized")    
-                    else:
-                        logger.info("Access not authorized")
-
-                    # Reset variable for next iteration
-                    rfid_monitor_shared_var.reset()
-
-            # If 'active', then run add member logic
-            elif mode_state == "active":
-                if not add_member_mode_manager.is_active():
-                    # Start active mode thread if not already running
-                    add_member_mode_manager.start_add_member_mode(db, rfid_monitor_shared_var, get_temp_access_interval)
-                    logger.info("Add Member Mode started")
-            else:
-                if mode_state is not None:
-                    logger.warning(f"Unknown mode state")
-
-            # Check for updates in door_monitor_shared_var
-            door_state = door_monitor_shared_var.get()
-            if door_state is not None:
-                logger.info(f"Door State Updated: {door_state}")
-                # Add notification logic here
-            door_monitor_shared_var.reset()  # Reset after logging the update
-
-            # Reset mode_switch for next iteration
-            mode_monitor_shared_var.reset()
-            time.sleep(0.5)
+        # Sleep until a monitor publishes an event, then dispatch it
+        event_manager.run(stop_event)
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt detected. Shutting down ADA...")
 
     finally:
-        # Stop procesing Add Memebers
-        if add_member_mode_manager.is_active():
-            logger.info("Stopping Add Member Mode processing...")
-            add_member_mode_manager.stop_add_member_mode()
+        stop_event.set()
 
-        if 'door_unlock_thread' in locals() and door_unlock_thread.is_alive():
-            door_unlock_thread.join()
-
-        # Stopping the monitors before exiting (cleanup)
-        rfid_monitor.stop_monitoring()
-        door_monitor.stop_monitoring()
-        # mode_monitor.stop_monitoring()
+        # Stop procesing Add Memebers
+        for access_point in access_points.values():
+            if access_point.add_member_mode.is_active():
+                logger.info(f"Stopping Add Member Mode processing at {access_point.name}...")
+                access_point.add_member_mode.stop_add_member_mode()
+
+        # Stop the monitors and relock every door before the scheduler goes away
+        stop_access_points(access_points.values())
+        scheduler.stop()
+        if guest_expiry_sweeper is not None:
+            guest_expiry_sweeper.stop()
+        if access_log is not None:
+            access_log.close()
+        # Write any member changes still waiting for a group commit
+        if hasattr(db, "close"):
+            db.close()
         GPIO.cleanup()
         logger.info("ADA shutdown completed.")
-
+        shutdown_logging()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Runs ADA on one asyncio event loop instead of a thread per monitor.
+Configured by the same environment variables as ada.py, plus
+ASYNC_EXECUTOR_WORKERS for the number of threads running blocking
+hardware and database calls.
+"""
+import os
+import signal
+import asyncio
+
+from ada import (
+    logger, configure, create_database, load_access_point_specs, create_access_control_manager, create_access_log,
+    create_guest_expiry_sweeper, get_temp_access_interval
+)
+from src.utils.logging_utils import shutdown_logging
+from src.managers.implementations.async_runtime import AsyncRuntime
+
+def build_access_point(spec):
+    """
+    Create the devices of a normalized access point spec for AsyncRuntime.
+    """
+    from src.hardware.implementations.mfrc522_reader import MFRC522Reader
+    from src.hardware.implementations.pi_gpio_switch_reader import PiGPIOSwitchReader
+    from src.hardware.implementations.pi_gpio_switch_operator import PiGPIOSwitchOperator
+
+    return {
+        **spec,
+        "reader": MFRC522Reader(spec["reader"]),
+        "latch": PiGPIOSwitchOperator(spec["latch"]),
+        "reed_switch": PiGPIOSwitchReader(spec["reed_switch"]) if spec.get("reed_switch") else None,
+        "mode_switch": PiGPIOSwitchReader(spec["mode_switch"]) if spec.get("mode_switch") else None
+    }
+
+async def run(runtime):
+    # SIGINT and SIGTERM shut the runtime down instead of interrupting it
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, runtime.stop)
+    await runtime.run()
+
+def main():
+    configure()
+    import RPi.GPIO as GPIO
+    GPIO.setmode(GPIO.BCM)
+
+    db = create_database()
+    access_point_specs = load_access_point_specs()
+    access_control_manager = create_access_control_manager(db, access_point_specs)
+    access_log = create_access_log()
+    guest_expiry_sweeper = create_guest_expiry_sweeper(db)
+
+    runtime = AsyncRuntime({
+        "name": os.getenv("ASYNC_RUNTIME_NAME", "default_AsyncRuntime"),
+        "access_control": access_control_manager,
+        "database": db,
+        "access_points": [build_access_point(spec) for spec in access_point_specs],
+        "get_temp_access_interval": get_temp_access_interval,
+        "access_log": access_log,
+        "max_workers": int(os.getenv("ASYNC_EXECUTOR_WORKERS", 2))
+    })
+
+    try:
+        logger.info("Starting ADA (asyncio runtime)")
+        asyncio.run(run(runtime))
+    finally:
+        if guest_expiry_sweeper is not None:
+            guest_expiry_sweeper.stop()
+        if access_log is not None:
+            access_log.close()
+        # Write any member changes still waiting for a group commit
+        if hasattr(db, "close"):
+            db.close()
+        GPIO.cleanup()
+        logger.info("ADA shutdown completed.")
+        shutdown_logging()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Imports, updates and exports member records in bulk, on the member
+database configured by the same environment variables as ada.py.
+
+    python ada_members.py import roster.csv
+    python ada_members.py update changes.jsonl
+    python ada_members.py export members.csv
+
+Files are CSV (with a header row of member fields) or JSON Lines, chosen
+by suffix or --format; "-" reads stdin or writes stdout and needs --format.
+Imports and updates are all or nothing: a file with any invalid record
+changes nothing and the problems are printed.
+
+A running ADA process keeps its own copy of the JSON member file and does
+not see these changes until it restarts; stop it first so it doesn't
+overwrite them.
+"""
+import argparse
+import logging
+import sys
+from contextlib import nullcontext
+
+from ada import create_database
+from src.database.member_io import member_file_format, read_members, write_members
+from src.utils.atomic_file import atomic_write
+
+def open_input(path):
+    if path == "-":
+        return nullcontext(sys.stdin)
+    return open(path, "r", newline="", encoding="utf-8")
+
+def import_members(db, args):
+    file_format = member_file_format(args.file, args.format)
+    with open_input(args.file) as file:
+        # Empty cells in an update leave the field unchanged
+        members = read_members(file, file_format, skip_empty=args.command == "update")
+        if args.command == "update":
+            count = db.bulk_update_members(members)
+        else:
+            count = db.bulk_add_members(members)
+    print(f"{count} members {'updated' if args.command == 'update' else 'imported'}")
+
+def export_members(db, args):
+    file_format = member_file_format(args.file, args.format)
+    if args.file == "-":
+        count = write_members(sys.stdout, db.export_members(), file_format)
+    else:
+        # Written to a temporary file and renamed, so a failed export leaves no partial file
+        counts = []
+        atomic_write(args.file, lambda file: counts.append(write_members(file, db.export_members(), file_format)))
+        count = counts[0]
+    print(f"{count} members exported", file=sys.stderr if args.file == "-" else sys.stdout)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import, update and export of ADA member records.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log database activity")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in (
+        ("import", "add new members, failing if any already exists"),
+        ("update", "change fields of existing members, keyed by obf_rfid"),
+        ("export", "write every member record")
+    ):
+        command_parser = commands.add_parser(command, help=help_text)
+        command_parser.add_argument("file", help='CSV or JSON Lines file, "-" for stdin/stdout')
+        command_parser.add_argument("--format", choices=("csv", "jsonl"), help="file format when it can't be told from the suffix")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    from dotenv import load_dotenv
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    db = None
+    try:
+        # An unreadable member database is reported like any other failure
+        db = create_database()
+        if args.command == "export":
+            export_members(db, args)
+        else:
+            import_members(db, args)
+    except OSError as e:
+        print(f"{args.command} failed: {e}", file=sys.stderr)
+        return 1
+    except (ValueError, KeyError) as e:
+        print(f"{args.command} failed: {e.args[0] if e.args else e}", file=sys.stderr)
+        return 1
+    finally:
+        close = getattr(db, "close", None)
+        if close:
+            close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
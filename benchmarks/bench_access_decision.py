@@ -0,0 +1,79 @@
+"""
+Per-scan access decision latency over 100k synthetic members with mixed
+levels: member lookup plus per-scan validation (schema check, string
+level/status comparison and interval lookup, as ada.is_member_access_authorized
+did) versus AccessControlManager's precompiled verdict table.
+
+Run from the repository root:
+    python -m benchmarks.bench_access_decision
+"""
+import json
+import logging
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.access_control_manager import AccessControlManager
+from src.schemas.member_schema import member_schema
+from src.utils.access_schedule import access_schedule_cache
+from benchmarks.bench_scan_to_decision import report
+from benchmarks.synthetic_members import synthetic_member, synthetic_obf_rfid
+
+MEMBER_COUNT = 100_000
+SCANS = 20_000
+LEVELS = ("guest", "philanthropist", "member", "admin")
+
+def per_scan_validation(db, obf_rfid):
+    member_info = db.get_member({"obf_rfid": obf_rfid})
+    if not member_info:
+        return False
+    for key, expected_type in member_schema.items():
+        if key not in member_info or not isinstance(member_info[key], expected_type):
+            return False
+    if member_info["membership_status"] != "active":
+        return False
+    if member_info["member_level"] == "member" or member_info["member_level"] == "admin":
+        return True
+    if member_info["member_level"] == "guest" or member_info["member_level"] == "philanthropist":
+        return access_schedule_cache.get(member_info["access_interval"]).contains(datetime.now(ZoneInfo("UTC")))
+    return False
+
+def time_decisions(decide, scans):
+    latencies = []
+    for obf_rfid in scans:
+        start = time.perf_counter()
+        decide(obf_rfid)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def write_members(filepath):
+    data = {}
+    for index in range(MEMBER_COUNT):
+        member = synthetic_member(index, member_level=LEVELS[index % len(LEVELS)])
+        member["membership_status"] = "inactive" if index % 10 == 0 else "active"
+        data[member["obf_rfid"]] = member
+    with open(filepath, "w") as file:
+        json.dump(data, file)
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    scans = [synthetic_obf_rfid(random.randrange(MEMBER_COUNT * 2)) for _ in range(SCANS)]
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "db.json"
+        write_members(json_path)
+        db = JsonDatabase({"name": "bench_access_decision_db", "connection_info": json_path})
+
+        start = time.perf_counter()
+        access_control = AccessControlManager({"name": "bench_access_control", "database": db})
+        print(f"Verdict table build: {time.perf_counter() - start:.2f} s")
+
+        report("Per-scan", MEMBER_COUNT, time_decisions(lambda obf_rfid: per_scan_validation(db, obf_rfid), scans))
+        report("Verdict table", MEMBER_COUNT, time_decisions(lambda obf_rfid: access_control.validate_access(obf_rfid, "front_door"), scans))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Access interval decision time for the original per-scan rrule evaluation
+versus the compiled AccessSchedule, for intervals that started 1 day and
+5 years ago.
+
+Run from the repository root:
+    python -m benchmarks.bench_access_interval
+"""
+import re
+import timeit
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import isodate
+from dateutil import parser, rrule
+
+from src.utils.access_schedule import access_schedule_cache
+
+UTC = ZoneInfo("UTC")
+RUNS = 200
+
+def rrule_is_within_access_interval(interval_str):
+    """
+    The evaluation ada.py performed on every scan before schedules were compiled.
+    """
+    repeat_count, start_str, duration_str = re.match(r"R(\d*)/(.*?)/(P.*)", interval_str).groups()
+    repeat_count = int(repeat_count) if repeat_count else None
+    start_time_utc = parser.isoparse(start_str).replace(tzinfo=UTC).astimezone(UTC)
+    duration = isodate.parse_duration(duration_str)
+    rule = rrule.rrule(rrule.DAILY, interval=1, dtstart=start_time_utc, count=repeat_count)
+    now = datetime.now(UTC)
+    start = rule.before(now, inc=True)
+    return start is not None and start <= now <= start + duration
+
+def compiled_is_within_access_interval(interval_str):
+    return access_schedule_cache.get(interval_str, "UTC").contains(datetime.now(UTC))
+
+def main():
+    now = datetime.now(UTC).replace(microsecond=0, tzinfo=None)
+    for label, age in (("1 day", timedelta(days=1)), ("5 years", timedelta(days=5 * 365))):
+        interval_str = f"R/{(now - age).isoformat()}/PT9H"
+        for name, function in (("rrule", rrule_is_within_access_interval), ("compiled", compiled_is_within_access_interval)):
+            seconds = timeit.timeit(lambda: function(interval_str), number=RUNS) / RUNS
+            print(f"{name:<9} started {label:<8} {seconds * 1_000_000:10.1f} us/decision")
+
+if __name__ == "__main__":
+    main()
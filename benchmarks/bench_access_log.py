@@ -0,0 +1,105 @@
+"""
+AccessLogStore with 1M access attempts over 30 days (2,000 members, 4
+doors): cost of log_access_attempt() on the calling thread, time for the
+writer thread to store everything, and range/member/result queries
+through the segment indexes versus a full scan of every segment.
+
+Run from the repository root:
+    python -m benchmarks.bench_access_log
+"""
+import json
+import logging
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from src.database.implementations.access_log_store import AccessLogStore
+from benchmarks.synthetic_members import synthetic_obf_rfid
+
+ATTEMPTS = 1_000_000
+DAYS = 30
+MEMBERS = 2_000
+ACCESS_POINTS = ("front_door", "side_door", "workshop", "storage")
+START = datetime(2024, 3, 1, tzinfo=ZoneInfo("UTC"))
+
+def attempts():
+    members = [synthetic_obf_rfid(index) for index in range(MEMBERS)]
+    step = timedelta(days=DAYS) / ATTEMPTS
+    for index in range(ATTEMPTS):
+        yield {
+            "timestamp": START + step * index,
+            "obf_rfid": members[(index * 7919) % MEMBERS],
+            "access_point": ACCESS_POINTS[index % len(ACCESS_POINTS)],
+            "result": "denied" if index % 21 == 0 else "granted"
+        }
+
+def full_scan(directory, criteria):
+    """
+    The baseline: read and filter every record of every segment.
+    """
+    matches = []
+    for segment in sorted(Path(directory).glob("access-*.log")):
+        with open(segment, "rb") as file:
+            for line in file:
+                record = json.loads(line)
+                if all(record.get(key) == value for key, value in criteria.items()):
+                    matches.append(record)
+    return matches
+
+def timed(function, *args, runs=3):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function(*args)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        # Room for every attempt, so the benchmark measures throughput rather than drops
+        store = AccessLogStore({"path": directory, "retention_days": 0, "max_buffered": ATTEMPTS})
+        generated = list(attempts())
+
+        call_ns = []
+        start = time.perf_counter()
+        for index, attempt in enumerate(generated):
+            if index % 100:
+                store.log_access_attempt(attempt)
+            else:
+                call_start = time.perf_counter_ns()
+                store.log_access_attempt(attempt)
+                call_ns.append(time.perf_counter_ns() - call_start)
+        logged = time.perf_counter() - start
+        store.flush()
+        stored = time.perf_counter() - start
+        call_ns.sort()
+        print(f"{ATTEMPTS} attempts over {DAYS} days, dropped {store.stats()['dropped']}")
+        print(f"  log_access_attempt: p50 {call_ns[len(call_ns) // 2] / 1000:.2f} us, "
+              f"p99 {call_ns[int(len(call_ns) * 0.99)] / 1000:.2f} us, {ATTEMPTS / logged:,.0f} calls/s")
+        print(f"  everything stored after {stored:.2f} s ({ATTEMPTS / stored:,.0f} attempts/s)")
+        size = sum(path.stat().st_size for path in Path(directory).iterdir())
+        index_size = sum(path.stat().st_size for path in Path(directory).glob("*.idx"))
+        print(f"  {size / 1e6:.1f} MB on disk, of which index {index_size / 1e6:.2f} MB")
+
+        member = synthetic_obf_rfid(42)
+        day = (START + timedelta(days=12)).date().isoformat()
+        queries = [
+            ("one hour", {"start": f"{day}T17:00:00+00:00", "end": f"{day}T18:00:00+00:00"}, None),
+            ("one member, 30 days", {"obf_rfid": member}, {"obf_rfid": member}),
+            ("denied at side door, 30 days", {"result": "denied", "access_point": "side_door"}, {"result": "denied", "access_point": "side_door"})
+        ]
+        scan_time, _ = timed(full_scan, directory, {}, runs=1)
+        for label, criteria, scan_criteria in queries:
+            indexed_time, logs = timed(store.query_access_logs, criteria)
+            if scan_criteria is not None:
+                scan_time, scanned = timed(full_scan, directory, scan_criteria, runs=1)
+                assert len(scanned) == len(logs)
+            print(f"  {label:<30} {len(logs or []):6} rows   indexed {indexed_time * 1000:8.1f} ms   full scan {scan_time * 1000:8.1f} ms")
+        store.close()
+
+if __name__ == "__main__":
+    main()
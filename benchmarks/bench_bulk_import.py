@@ -0,0 +1,75 @@
+"""
+Importing a roster into a member database with 1,000 existing members:
+one add_member call per member (a full JSON file rewrite each for
+JsonDatabase) versus a single bulk_add_members call fed by the streaming
+CSV reader, and exporting the result to CSV.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_import
+"""
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from src.database.implementations.sqlite_database import SqliteDatabase
+from src.database.member_io import read_members, write_members
+from benchmarks.synthetic_members import synthetic_member, write_member_file
+
+EXISTING_MEMBERS = 1_000
+ROSTER_SIZES = (1_000, 5_000)
+
+def open_database(kind, directory):
+    if kind == "JsonDatabase":
+        return JsonDatabase({"name": "bench_json", "connection_info": directory / "db.json"})
+    if kind == "JournaledJsonDatabase":
+        return JournaledJsonDatabase({"name": "bench_journaled", "connection_info": directory / "db.json", "compaction_interval": 0})
+    db = SqliteDatabase({"name": "bench_sqlite", "connection_info": directory / "db.sqlite"})
+    db.bulk_add_members(synthetic_member(index) for index in range(EXISTING_MEMBERS))
+    return db
+
+def write_roster(filepath, roster_size):
+    with open(filepath, "w", newline="") as file:
+        write_members(file, (synthetic_member(EXISTING_MEMBERS + index) for index in range(roster_size)), "csv")
+
+def time_import(kind, roster_path, bulk):
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        if kind != "SqliteDatabase":
+            write_member_file(directory / "db.json", EXISTING_MEMBERS)
+        db = open_database(kind, directory)
+        start = time.perf_counter()
+        with open(roster_path, newline="") as file:
+            members = read_members(file, "csv")
+            if bulk:
+                db.bulk_add_members(members)
+            else:
+                for member_info in members:
+                    db.add_member(member_info)
+        imported = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(directory / "export.csv", "w", newline="") as file:
+            write_members(file, db.export_members(), "csv")
+        exported = time.perf_counter() - start
+        if hasattr(db, "close"):
+            db.close()
+        return imported, exported
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        for roster_size in ROSTER_SIZES:
+            roster_path = Path(directory) / f"roster_{roster_size}.csv"
+            write_roster(roster_path, roster_size)
+            print(f"Importing {roster_size} members into {EXISTING_MEMBERS} existing")
+            for kind in ("JsonDatabase", "JournaledJsonDatabase", "SqliteDatabase"):
+                loop, _ = time_import(kind, roster_path, bulk=False)
+                bulk, exported = time_import(kind, roster_path, bulk=True)
+                print(f"  {kind:<22} add_member loop {loop * 1000:9.1f} ms   bulk_add_members {bulk * 1000:7.1f} ms   "
+                      f"({loop / bulk:6.1f}x)   export {exported * 1000:6.1f} ms")
+
+if __name__ == "__main__":
+    main()
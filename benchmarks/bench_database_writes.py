@@ -0,0 +1,56 @@
+"""
+Per-write latency of JsonDatabase (full-file rewrite) versus
+JournaledJsonDatabase (journal append) at increasing member counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_database_writes
+"""
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+MEMBER_COUNTS = (1_000, 10_000, 100_000)
+WRITES = 50
+
+def time_writes(db, member_count):
+    latencies = []
+    for index in range(WRITES):
+        update = {"obf_rfid": synthetic_obf_rfid(index % member_count), "membership_status": "inactive"}
+        start = time.perf_counter()
+        db.update_member(update)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def report(name, member_count, latencies):
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p99 = latencies_ms[int(len(latencies_ms) * 0.99) - 1]
+    print(f"{name:<22} members={member_count:>7}  p50={statistics.median(latencies_ms):9.3f} ms  p99={p99:9.3f} ms")
+
+def main():
+    logging.disable(logging.INFO)
+    for member_count in MEMBER_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = Path(directory) / "db.json"
+            write_member_file(db_path, member_count)
+            db = JsonDatabase({"name": f"bench_json_{member_count}", "connection_info": db_path})
+            report("JsonDatabase", member_count, time_writes(db, member_count))
+
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = Path(directory) / "db.json"
+            write_member_file(db_path, member_count)
+            db = JournaledJsonDatabase({
+                "name": f"bench_journaled_{member_count}",
+                "connection_info": db_path,
+                "compaction_interval": 0
+            })
+            report("JournaledJsonDatabase", member_count, time_writes(db, member_count))
+            db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Simulated scan-to-unlock latency for the original main loop (SharedVariable
+checked every 0.5 s) versus the EventManager dispatcher.
+
+A publisher thread emits badge scans at random times; the consumer looks the
+card up in a JsonDatabase and "unlocks" by recording the time. Latency is
+measured from publish to unlock.
+
+Run from the repository root:
+    python -m benchmarks.bench_event_dispatch
+"""
+import logging
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.event_manager import EventManager
+from src.utils.threading_shared_variable import SharedVariable
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+SCANS = 40
+MEMBERS = 1_000
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def publish_scans(publish):
+    published_at = {}
+    for index in range(SCANS):
+        time.sleep(random.uniform(0.05, 0.6))
+        obf_rfid = synthetic_obf_rfid(index % MEMBERS)
+        published_at[obf_rfid, index] = time.perf_counter()
+        publish((obf_rfid, index))
+    return published_at
+
+def run_polling_loop(db):
+    shared_var = SharedVariable()
+    unlocked_at = {}
+    done = threading.Event()
+
+    def consume():
+        while not done.is_set() or shared_var.get() is not None:
+            scan = shared_var.get()
+            if scan is not None:
+                if db.get_member({"obf_rfid": scan[0]}):
+                    unlocked_at[scan] = time.perf_counter()
+                shared_var.reset()
+            time.sleep(0.5)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    published_at = publish_scans(shared_var.set)
+    done.set()
+    consumer.join()
+    return published_at, unlocked_at
+
+def run_event_dispatcher(db):
+    event_manager = EventManager({"name": "bench_event_manager"})
+    unlocked_at = {}
+
+    def handle_rfid_scanned(event_data):
+        if db.get_member({"obf_rfid": event_data["obf_rfid"]}):
+            unlocked_at[event_data["obf_rfid"], event_data["index"]] = time.perf_counter()
+
+    event_manager.subscribe_to_event("rfid_scanned", handle_rfid_scanned)
+    stop_event = threading.Event()
+    dispatcher = threading.Thread(target=event_manager.run, args=(stop_event, 0.1))
+    dispatcher.start()
+    published_at = publish_scans(lambda scan: event_manager.publish_event("rfid_scanned", {"obf_rfid": scan[0], "index": scan[1]}))
+    time.sleep(0.1)
+    stop_event.set()
+    dispatcher.join()
+    return published_at, unlocked_at
+
+def report(name, published_at, unlocked_at):
+    latencies = [(unlocked_at[scan] - published_at[scan]) * 1000 for scan in unlocked_at]
+    lost = len(published_at) - len(unlocked_at)
+    print(f"{name:<16} p50={percentile(latencies, 0.5):8.2f} ms  p99={percentile(latencies, 0.99):8.2f} ms  lost scans={lost}")
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = Path(directory) / "db.json"
+        write_member_file(db_path, MEMBERS)
+        db = JsonDatabase({"name": "bench_dispatch_db", "connection_info": db_path})
+        report("sleep-poll loop", *run_polling_loop(db))
+        report("EventManager", *run_event_dispatcher(db))
+
+if __name__ == "__main__":
+    main()
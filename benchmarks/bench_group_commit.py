@@ -0,0 +1,66 @@
+"""
+Member updates per second against a JsonDatabase of 1,000 members, for
+each durability mode: "sync" (one atomic, fsynced file write per update),
+"group" (writers share a write every commit_delay and still wait for it)
+and "deferred" (writers don't wait), with 1 and 8 writer threads.
+
+Run from the repository root:
+    python -m benchmarks.bench_group_commit
+"""
+import logging
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+MEMBERS = 1_000
+DURATION = 3.0
+THREAD_COUNTS = (1, 8)
+COMMIT_DELAY = 0.02
+
+def run(durability, thread_count):
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = Path(directory) / "db.json"
+        write_member_file(db_path, MEMBERS)
+        db = JsonDatabase({"name": "bench_json", "connection_info": db_path,
+                           "durability": durability, "commit_delay": COMMIT_DELAY})
+        saves = [0]
+        save_data = db._save_data
+        def counted_save_data():
+            saves[0] += 1
+            save_data()
+        db._save_data = counted_save_data
+
+        counts = [0] * thread_count
+        deadline = time.perf_counter() + DURATION
+        def writer(thread_index):
+            index = thread_index
+            while time.perf_counter() < deadline:
+                db.update_member({"obf_rfid": synthetic_obf_rfid(index % MEMBERS), "member_sponsor": str(index)})
+                counts[thread_index] += 1
+                index += thread_count
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=writer, args=(thread_index,)) for thread_index in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        db.close()
+        elapsed = time.perf_counter() - start
+        return sum(counts), saves[0], elapsed
+
+def main():
+    logging.disable(logging.INFO)
+    print(f"Updating a {MEMBERS}-member JsonDatabase for {DURATION:.0f} s, commit_delay {COMMIT_DELAY * 1000:.0f} ms")
+    for thread_count in THREAD_COUNTS:
+        for durability in ("sync", "group", "deferred"):
+            updates, saves, elapsed = run(durability, thread_count)
+            print(f"  {thread_count} writer(s)  {durability:<8} {updates / elapsed:10,.0f} updates/s   "
+                  f"{saves:5} file writes   {updates / max(saves, 1):8.1f} updates/write")
+
+if __name__ == "__main__":
+    main()
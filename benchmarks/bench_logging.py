@@ -0,0 +1,70 @@
+"""
+Latency of a DoorActuator unlock followed by an immediate lock (two log
+records per cycle at DEBUG level) with synchronous logging versus the async
+queue-based logging pipeline, writing to a temporary log file. The slow
+storage rows add a 2 ms stall to every handler flush to mimic an SD card
+under write pressure.
+
+Run from the repository root:
+    python -m benchmarks.bench_logging
+"""
+import contextlib
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.managers.implementations.door_actuator import DoorActuator
+from src.utils.logging_utils import get_dropped_log_records, setup_logging, shutdown_logging
+from src.utils.timer_scheduler import TimerScheduler
+
+RUNS = 5_000
+STORAGE_STALL = 0.002
+
+class DoorLatch:
+    def set_status(self, status):
+        self.status = status
+
+def time_unlocks(door_actuator):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        door_actuator.unlock_door()
+        door_actuator.lock_door()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99)]
+
+def stalled_flush(self):
+    time.sleep(STORAGE_STALL)
+    unstalled_flush(self)
+
+unstalled_flush = logging.StreamHandler.flush
+
+def main():
+    scheduler = TimerScheduler("bench_logging_timers")
+    scheduler.start()
+    door_actuator = DoorActuator({"name": "ADA", "door_latch": DoorLatch(), "scheduler": scheduler})
+    results = []
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        for slow_storage in (False, True):
+            logging.StreamHandler.flush = stalled_flush if slow_storage else unstalled_flush
+            for async_logging in (False, True):
+                log_file = Path(directory) / f"ada_{slow_storage}_{async_logging}.log"
+                setup_logging(logging.DEBUG, async_logging=async_logging, log_file=log_file, force=True)
+                p50, p99 = time_unlocks(door_actuator)
+                dropped = get_dropped_log_records()
+                shutdown_logging()
+                results.append((slow_storage, async_logging, p50, p99, dropped))
+        logging.StreamHandler.flush = unstalled_flush
+    scheduler.stop()
+
+    for slow_storage, async_logging, p50, p99, dropped in results:
+        storage = "slow storage" if slow_storage else "local disk"
+        mode = "async" if async_logging else "sync"
+        print(f"{storage:<13} {mode:<6} p50 {p50 * 1e6:9.1f} us   p99 {p99 * 1e6:9.1f} us   dropped {dropped}")
+
+if __name__ == "__main__":
+    main()
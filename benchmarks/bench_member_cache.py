@@ -0,0 +1,53 @@
+"""
+Scan-to-decision latency for SqliteDatabase with and without a
+CachingDatabase in front of it. Scans come from a working set of regular
+members plus unknown fobs that are tapped several times in a row.
+
+Run from the repository root:
+    python -m benchmarks.bench_member_cache
+"""
+import logging
+import random
+import tempfile
+from pathlib import Path
+
+from src.database.implementations.caching_database import CachingDatabase
+from src.database.implementations.sqlite_database import SqliteDatabase
+from benchmarks.bench_scan_to_decision import report, time_scans
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+MEMBER_COUNT = 100_000
+SCANS = 20_000
+REGULARS = 300
+
+def scan_pattern():
+    scans = []
+    while len(scans) < SCANS:
+        if random.random() < 0.3:
+            # Unknown fob tapped 1-4 times
+            scans.extend([synthetic_obf_rfid(MEMBER_COUNT + random.randrange(10_000))] * random.randint(1, 4))
+        else:
+            scans.append(synthetic_obf_rfid(random.randrange(REGULARS)))
+    return scans[:SCANS]
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    scans = scan_pattern()
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "db.json"
+        write_member_file(json_path, MEMBER_COUNT)
+        sqlite_db = SqliteDatabase({
+            "name": "bench_cache_sqlite",
+            "connection_info": Path(directory) / "db.sqlite",
+            "migrate_from": json_path
+        })
+        cached_db = CachingDatabase({"name": "bench_member_cache", "database": sqlite_db})
+
+        report("SqliteDatabase", MEMBER_COUNT, time_scans(sqlite_db, scans))
+        report("CachingDatabase", MEMBER_COUNT, time_scans(cached_db, scans))
+        print(f"Cache stats: {cached_db.stats()}")
+        sqlite_db.close()
+
+if __name__ == "__main__":
+    main()
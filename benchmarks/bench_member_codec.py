@@ -0,0 +1,66 @@
+"""
+The 100,000 member table in each member file codec: file size, time to
+load it, and the memory the loaded table holds (measured with tracemalloc,
+so only the member dicts and their strings count).
+
+Run from the repository root:
+    python -m benchmarks.bench_member_codec
+"""
+import gc
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.database.member_codec import MEMBER_CODECS
+from benchmarks.synthetic_members import synthetic_member
+
+MEMBERS = 100_000
+INTERVALS = ("R/2024-02-08T11:00:00/PT9H", "R/2024-01-01T06:00:00/PT16H", "R5/2024-03-01T18:00:00/PT3H")
+
+def member_table():
+    data = {}
+    for index in range(MEMBERS):
+        member = synthetic_member(index, member_level="guest" if index % 10 == 0 else "member",
+                                  access_interval=INTERVALS[index % len(INTERVALS)])
+        data[member["obf_rfid"]] = member
+    return data
+
+def load(codec, filepath):
+    with open(filepath, "rb") as file:
+        return codec.load(file)
+
+def main():
+    data = member_table()
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{MEMBERS} members")
+        for name, codec_class in MEMBER_CODECS.items():
+            codec = codec_class()
+            filepath = Path(directory) / f"members.{name}"
+            mode = "wb" if codec.binary else "w"
+            start = time.perf_counter()
+            with open(filepath, mode) as file:
+                codec.dump(data, file)
+            dumped = time.perf_counter() - start
+
+            durations = []
+            for _ in range(3):
+                start = time.perf_counter()
+                loaded = load(codec, filepath)
+                durations.append(time.perf_counter() - start)
+                assert loaded == data
+                del loaded
+
+            gc.collect()
+            tracemalloc.start()
+            loaded = load(codec, filepath)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del loaded
+
+            print(f"  {name:<7} file {filepath.stat().st_size / 1e6:6.1f} MB   load {statistics.median(durations) * 1000:7.1f} ms   "
+                  f"save {dumped * 1000:7.1f} ms   loaded table {retained / 1e6:6.1f} MB (peak {peak / 1e6:6.1f} MB)")
+
+if __name__ == "__main__":
+    main()
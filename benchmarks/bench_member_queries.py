@@ -0,0 +1,76 @@
+"""
+find_members() on a 100,000 member JsonDatabase (90% members, 10% guests
+with random sponsors, 10% inactive) through the member index versus the
+DatabaseInterface linear scan, plus the index's build time and memory.
+The index is built by the first query, so queries are timed after it.
+
+Run from the repository root:
+    python -m benchmarks.bench_member_queries
+"""
+import json
+import logging
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.database.interfaces.database_interface import DatabaseInterface
+from src.database.implementations.json_database import JsonDatabase
+from src.database.member_index import MemberIndex
+from benchmarks.synthetic_members import synthetic_member, synthetic_obf_rfid
+
+MEMBERS = 100_000
+GUEST_SHARE = 10
+
+def write_members(filepath):
+    rng = random.Random(1)
+    data = {}
+    for index in range(MEMBERS):
+        member_info = synthetic_member(index, member_level="guest" if index % GUEST_SHARE == 0 else "member")
+        member_info["member_sponsor"] = synthetic_obf_rfid(rng.randrange(MEMBERS)) if index % GUEST_SHARE == 0 else ""
+        member_info["membership_status"] = "inactive" if index % 10 == 3 else "active"
+        data[member_info["obf_rfid"]] = member_info
+    with open(filepath, "w") as file:
+        json.dump(data, file)
+    return data
+
+def timed(function, runs=5):
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+def main():
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = Path(directory) / "db.json"
+        data = write_members(filepath)
+        db = JsonDatabase({"name": "bench_json", "connection_info": filepath})
+        sponsor = next(member_info["member_sponsor"] for member_info in data.values() if member_info["member_sponsor"])
+
+        built, _ = timed(lambda: MemberIndex().rebuild(db.data))
+        tracemalloc.start()
+        index = MemberIndex()
+        index.rebuild(db.data)
+        index_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{MEMBERS} members, index built on the first query in {built * 1000:.0f} ms, holding {index_memory / 1e6:.1f} MB")
+
+        queries = [
+            ("guests of one sponsor", {"member_sponsor": sponsor, "member_level": "guest"}),
+            ("active guests", {"member_level": "guest", "membership_status": "active"}),
+            ("inactive members", {"membership_status": "inactive"}),
+        ]
+        for label, criteria in queries:
+            indexed, members = timed(lambda: db.find_members(criteria))
+            scanned, scanned_members = timed(lambda: DatabaseInterface.find_members(db, criteria))
+            assert len(members) == len(scanned_members)
+            print(f"  {label:<22} {len(members):6} rows   indexed {indexed * 1000:8.3f} ms   "
+                  f"linear scan {scanned * 1000:7.1f} ms   ({scanned / indexed:,.0f}x)")
+
+if __name__ == "__main__":
+    main()
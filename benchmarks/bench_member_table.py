@@ -0,0 +1,61 @@
+"""
+Memory and lookup cost of the in-memory member table at 10k, 100k and 1M
+members: member dicts, as JsonDatabase holds them by default, versus
+MemberRecord objects ("compact_members"). Tables are built from decoded
+JSON so every field starts as its own string, as after a file load.
+Memory is what tracemalloc sees the finished table holding.
+
+Run from the repository root:
+    python -m benchmarks.bench_member_table
+"""
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from src.database.member_record import MemberRecord
+from benchmarks.synthetic_members import synthetic_member
+
+SIZES = (10_000, 100_000, 1_000_000)
+LOOKUPS = 200_000
+
+def build_table(member_count, compact):
+    table = {}
+    for index in range(member_count):
+        member_info = json.loads(json.dumps(synthetic_member(index)))
+        obf_rfid = member_info["obf_rfid"]
+        table[obf_rfid] = MemberRecord(member_info, obf_rfid=obf_rfid) if compact else member_info
+    return table
+
+def time_lookups(table, keys):
+    start = time.perf_counter()
+    for key in keys:
+        member_info = table.get(key)
+        if member_info["membership_status"] == "active":
+            member_info["member_level"]
+            member_info["access_interval"]
+    return (time.perf_counter() - start) / len(keys)
+
+def main():
+    for member_count in SIZES:
+        print(f"{member_count} members")
+        results = {}
+        for compact in (False, True):
+            gc.collect()
+            tracemalloc.start()
+            table = build_table(member_count, compact)
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            keys = random.Random(1).choices(list(table), k=LOOKUPS)
+            lookup = time_lookups(table, keys)
+            results[compact] = retained
+            label = "MemberRecord" if compact else "dict"
+            print(f"  {label:<13} {retained / 1e6:8.1f} MB ({retained / member_count:5.0f} B/member)   "
+                  f"lookup + 3 fields {lookup * 1e9:6.0f} ns")
+            del table, keys
+        print(f"  MemberRecord table is {results[True] / results[False]:.0%} of the dict table")
+
+if __name__ == "__main__":
+    main()
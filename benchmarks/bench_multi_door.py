@@ -0,0 +1,138 @@
+"""
+Simulated 16-door load: every door has a reader polled every 50 ms, a reed
+switch and a latch. Compares one thread per monitor with all monitors and
+relock timers on one shared TimerScheduler, reporting scan-to-unlock
+latency, thread count and CPU use.
+
+Run from the repository root:
+    python -m benchmarks.bench_multi_door
+"""
+import logging
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from src.hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
+from src.hardware.implementations.continuous_switch_monitor import ContinuousSwitchMonitor
+from src.hardware.implementations.simulated_rfid_scanner import SimulatedRFIDScanner
+from src.managers.implementations.access_control_manager import AccessControlManager
+from src.managers.implementations.door_actuator import DoorActuator
+from src.managers.implementations.event_manager import EventManager
+from src.utils.timer_scheduler import TimerScheduler
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+DOORS = 16
+MEMBER_COUNT = 10_000
+DURATION = 5
+SCANS_PER_SECOND = 20
+
+class FakeLatch:
+    def __init__(self):
+        self.unlocked_at = None
+
+    def set_status(self, new_state):
+        if new_state == "active":
+            self.unlocked_at = time.perf_counter()
+
+class FakeSwitch:
+    def initialize(self):
+        pass
+
+    def get_status(self):
+        return "inactive"
+
+def build_doors(event_manager, scheduler, shared):
+    doors = {}
+    for index in range(DOORS):
+        name = f"door_{index}"
+        reader = SimulatedRFIDScanner({"name": f"{name}_reader_{shared}"})
+        latch = FakeLatch()
+        monitors = [
+            RFIDContinuousMonitor({
+                "name": f"{name}_rfid_monitor_{shared}",
+                "monitoring_interval": 0.05,
+                "adaptive_polling": False,
+                "event_manager": event_manager,
+                "mfrc522_reader": reader,
+                "scheduler": scheduler if shared else None,
+                "access_point": name
+            }),
+            ContinuousSwitchMonitor({
+                "name": f"{name}_door_monitor_{shared}",
+                "monitoring_interval": 1,
+                "event_manager": event_manager,
+                "switch_reader": FakeSwitch(),
+                "scheduler": scheduler if shared else None,
+                "access_point": name
+            })
+        ]
+        actuator = DoorActuator({"name": f"{name}_actuator_{shared}", "door_latch": latch, "scheduler": scheduler, "unlock_duration": 0.2})
+        doors[name] = (reader, latch, monitors, actuator)
+    return doors
+
+def run(db, shared):
+    event_manager = EventManager({"name": f"bench_events_{shared}"})
+    scheduler = TimerScheduler(f"bench_scheduler_{shared}")
+    scheduler.start()
+    access_control = AccessControlManager({"name": f"bench_access_control_{shared}", "database": db})
+    doors = build_doors(event_manager, scheduler, shared)
+
+    def handle_rfid_scanned(event_data):
+        if access_control.validate_access(event_data["obf_rfid"], event_data["access_point"]):
+            doors[event_data["access_point"]][3].unlock_door()
+
+    event_manager.subscribe_to_event("rfid_scanned", handle_rfid_scanned)
+    stop_event = threading.Event()
+    dispatcher = threading.Thread(target=event_manager.run, args=(stop_event, 0.1))
+    dispatcher.start()
+    for _, _, monitors, _ in doors.values():
+        for monitor in monitors:
+            monitor.start_monitoring()
+    time.sleep(0.2)
+    threads = threading.active_count()
+
+    latencies = []
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    while time.perf_counter() - wall_start < DURATION:
+        reader, latch, _, actuator = doors[f"door_{random.randrange(DOORS)}"]
+        if actuator.is_unlocked():
+            continue
+        latch.unlocked_at = None
+        presented_at = time.perf_counter()
+        reader.present_card(synthetic_obf_rfid(random.randrange(MEMBER_COUNT)), duration=0.3)
+        time.sleep(1 / SCANS_PER_SECOND)
+        if latch.unlocked_at is not None:
+            latencies.append(latch.unlocked_at - presented_at)
+    cpu = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+    for _, _, monitors, actuator in doors.values():
+        for monitor in monitors:
+            monitor.stop_monitoring()
+        actuator.lock_door()
+    stop_event.set()
+    dispatcher.join()
+    scheduler.stop()
+    access_control.close()
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p99 = latencies_ms[int(len(latencies_ms) * 0.99) - 1]
+    mode = "shared scheduler" if shared else "thread per monitor"
+    print(f"{mode:<19} threads={threads:>3}  cpu={cpu:6.1%}  unlocks={len(latencies):>4}  "
+          f"p50={statistics.median(latencies_ms):6.1f} ms  p99={p99:6.1f} ms")
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "db.json"
+        write_member_file(json_path, MEMBER_COUNT)
+        db = JsonDatabase({"name": "bench_multi_door_db", "connection_info": json_path})
+        for shared in (False, True):
+            run(db, shared)
+
+if __name__ == "__main__":
+    main()
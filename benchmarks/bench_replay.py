@@ -0,0 +1,189 @@
+"""
+Replays realistic badge traffic through the full ada.main pipeline on
+simulated hardware (virtual GPIO pins and MFRC522 readers), at accelerated
+time, and reports scan-to-unlock latency percentiles, lost scans and CPU per
+scan.
+
+Workloads:
+- morning_rush: members arriving at two doors over half an hour, peaking
+  mid-way, plus a few unknown cards.
+- event_night: a few members and many guests arriving in small groups over
+  an hour, some with expired guest access.
+
+Every ADA timing (polling intervals, windows, unlock duration) is divided by
+SPEED along with the trace, so the run behaves like real time, only faster.
+A scan is lost when the card leaves the field before the reader polls it.
+
+Run from the repository root:
+    python -m benchmarks.bench_replay
+"""
+import json
+import logging
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.hardware.simulation.simulated_hardware import SimulatedHardware
+from src.hardware.simulation.scan_trace import TraceReplayer
+from src.utils.obfuscated_id_hasher import ObfuscatedIdHasher
+
+SPEED = 30
+SECRET_KEY = "bench_replay_secret"
+ALWAYS_INTERVAL = "R/2024-01-01T00:00:00/PT24H"
+EXPIRED_INTERVAL = "R1/2024-01-01T00:00:00/PT1H"
+DOORS = {
+    "front_door": {"spi_device": 0, "latch_pin": 21, "reed_pin": 4, "mode_pin": 18},
+    "side_door": {"spi_device": 1, "latch_pin": 20, "reed_pin": 5, "mode_pin": 19}
+}
+
+def access_point_config():
+    scaled = lambda seconds: seconds / SPEED
+    return {"access_points": [{
+        "name": name,
+        "unlock_duration": scaled(7),
+        "reader": {"spi_bus": 0, "spi_device": door["spi_device"], "pin_rst": 25},
+        "latch": {"pin_number": door["latch_pin"]},
+        "reed_switch": {"pin_number": door["reed_pin"]},
+        "mode_switch": {"pin_number": door["mode_pin"]},
+        "rfid_monitor": {
+            "monitoring_interval": scaled(5),
+            "fast_interval": scaled(0.05),
+            "active_window": scaled(10),
+            "duplicate_window": scaled(2)
+        },
+        "door_monitor": {"monitoring_interval": scaled(30), "detection_mode": "edge", "debounce_time": scaled(0.05)},
+        "mode_monitor": {"monitoring_interval": scaled(1)}
+    } for name, door in DOORS.items()]}
+
+def member(obf_rfid, member_level, access_interval):
+    return {
+        "obf_rfid": obf_rfid,
+        "member_level": member_level,
+        "membership_status": "active",
+        "access_interval": access_interval,
+        "member_sponsor": "",
+        "created": "2024-01-01T00:00:00",
+        "last_updated": "2024-01-01T00:00:00"
+    }
+
+def morning_rush():
+    """
+    300 members over 30 minutes, arrivals normally distributed around the
+    15 minute mark, 5% unknown cards.
+    """
+    people = [(uid, "member", ALWAYS_INTERVAL) for uid in range(1, 301)]
+    scans = []
+    for uid, _, _ in people:
+        t = min(max(random.gauss(900, 300), 0), 1800)
+        scans.append({"t": t, "access_point": random.choice(list(DOORS)), "uid": uid, "hold": random.uniform(1, 3), "authorized": True})
+    for uid in range(10_001, 10_016):
+        scans.append({"t": random.uniform(0, 1800), "access_point": random.choice(list(DOORS)), "uid": uid, "hold": random.uniform(1, 3), "authorized": False})
+    return people, sorted(scans, key=lambda scan: scan["t"])
+
+def event_night():
+    """
+    20 members and 150 guests over an hour at the front door, arriving in
+    groups of 2 to 6 a few seconds apart; 10% of guests have expired access.
+    """
+    people = [(uid, "member", ALWAYS_INTERVAL) for uid in range(1, 21)]
+    for uid in range(1001, 1151):
+        people.append((uid, "guest", EXPIRED_INTERVAL if random.random() < 0.1 else ALWAYS_INTERVAL))
+
+    arrivals = [person for person in people]
+    random.shuffle(arrivals)
+    scans = []
+    while arrivals:
+        t = random.uniform(0, 3600)
+        for _ in range(random.randint(2, 6)):
+            if not arrivals:
+                break
+            uid, _, access_interval = arrivals.pop()
+            t += random.uniform(2, 6)
+            scans.append({"t": t, "access_point": "front_door", "uid": uid, "hold": random.uniform(1, 3), "authorized": access_interval == ALWAYS_INTERVAL})
+    return people, sorted(scans, key=lambda scan: scan["t"])
+
+def level_at(transitions, moment):
+    level = 0
+    for changed_at, new_level in transitions:
+        if changed_at > moment:
+            break
+        level = new_level
+    return level
+
+def summarize(name, hardware, records, cpu_seconds):
+    lost = [record for record in records if record["read_at"] is None]
+    latencies, extended, missing_unlocks = [], 0, 0
+    for record in records:
+        if not record["authorized"] or record["read_at"] is None:
+            continue
+        transitions = hardware.gpio.transitions(DOORS[record["access_point"]]["latch_pin"])
+        if level_at(transitions, record["read_at"]):
+            extended += 1
+            continue
+        unlock = next((moment for moment, level in transitions if level and moment >= record["read_at"]), None)
+        if unlock is None:
+            missing_unlocks += 1
+        else:
+            latencies.append((unlock - record["presented_at"]) * SPEED * 1000)
+
+    latencies.sort()
+    percentile = lambda p: latencies[min(int(len(latencies) * p), len(latencies) - 1)]
+    print(f"{name}: {len(records)} scans, {len(lost)} lost ({len(lost) / len(records):.1%}), "
+          f"{len(latencies)} unlocks, {extended} while already unlocked, {missing_unlocks} authorized scans without unlock")
+    if latencies:
+        print(f"  scan-to-unlock (real time): p50={statistics.median(latencies):.0f} ms  "
+              f"p95={percentile(0.95):.0f} ms  p99={percentile(0.99):.0f} ms  max={latencies[-1]:.0f} ms")
+    print(f"  CPU per scan: {cpu_seconds / len(records) * 1000:.2f} ms")
+
+def run_workload(ada, hardware, name, workload, directory):
+    people, scans = workload()
+    hasher = ObfuscatedIdHasher(SECRET_KEY)
+    members = {}
+    for uid, member_level, access_interval in people:
+        obf_rfid = hasher.hash_id(str(uid))
+        members[obf_rfid] = member(obf_rfid, member_level, access_interval)
+    db_path = Path(directory) / f"{name}.json"
+    db_path.write_text(json.dumps(members))
+    os.environ["JSON_DB_CONNECTION_INFO"] = str(db_path)
+
+    stop_event = threading.Event()
+    ada_thread = threading.Thread(target=ada.main, args=(stop_event,))
+    ada_thread.start()
+    time.sleep(0.5)
+
+    replayer = TraceReplayer(hardware, {access_point: (0, door["spi_device"]) for access_point, door in DOORS.items()}, speed=SPEED)
+    cpu_start = time.process_time()
+    records = replayer.replay(scans)
+    time.sleep(max(record["removed_at"] for record in records) - time.monotonic() + 0.2)
+    cpu_seconds = time.process_time() - cpu_start
+
+    stop_event.set()
+    ada_thread.join()
+    summarize(name, hardware, records, cpu_seconds)
+
+def main():
+    random.seed(1)
+    hardware = SimulatedHardware()
+    hardware.install()
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = Path(directory) / "access_points.json"
+        config_path.write_text(json.dumps(access_point_config()))
+        os.environ.update({
+            "ACCESS_POINTS_CONFIG": str(config_path),
+            "HMAC_SECRET_KEY": SECRET_KEY,
+            "LOG_ASYNC": "True"
+        })
+
+        import ada
+        logging.disable(logging.INFO)
+        print(f"Replaying at {SPEED}x speed")
+        for name, workload in (("morning_rush", morning_rush), ("event_night", event_night)):
+            run_workload(ada, hardware, name, workload, directory)
+    hardware.uninstall()
+
+if __name__ == "__main__":
+    main()
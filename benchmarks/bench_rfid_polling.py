@@ -0,0 +1,58 @@
+"""
+Time-to-first-detection versus CPU wakeups per minute for fixed and adaptive
+RFIDContinuousMonitor polling, using SimulatedRFIDScanner.
+
+Cards are presented at random times separated by idle gaps, half of them
+shortly after an earlier card (a queue of people badging in).
+
+Run from the repository root:
+    python -m benchmarks.bench_rfid_polling
+"""
+import logging
+import random
+import statistics
+import time
+
+from src.hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
+from src.hardware.implementations.simulated_rfid_scanner import SimulatedRFIDScanner
+from src.utils.threading_event_queue import EventQueue
+
+PRESENTATIONS = 12
+IDLE_INTERVAL = 2
+
+STRATEGIES = {
+    "fixed 2 s": {"adaptive_polling": False, "monitoring_interval": IDLE_INTERVAL},
+    "fixed 50 ms": {"adaptive_polling": False, "monitoring_interval": 0.05},
+    "adaptive": {"adaptive_polling": True, "monitoring_interval": IDLE_INTERVAL, "fast_interval": 0.05, "active_window": 3},
+}
+
+def run(name, config, schedule):
+    reader = SimulatedRFIDScanner({"name": f"bench_reader_{name}"})
+    event_queue = EventQueue()
+    monitor = RFIDContinuousMonitor(dict(config, name=f"bench_monitor_{name}", event_queue=event_queue, mfrc522_reader=reader, duplicate_window=0.5))
+    monitor.start_monitoring()
+
+    started = time.monotonic()
+    detection_times = []
+    for index, gap in enumerate(schedule):
+        time.sleep(gap)
+        presented_at = time.perf_counter()
+        reader.present_card(f"card_{index}", duration=IDLE_INTERVAL + 0.5)
+        if event_queue.get(timeout=IDLE_INTERVAL + 1) is not None:
+            detection_times.append(time.perf_counter() - presented_at)
+        reader.remove_card()
+    elapsed_minutes = (time.monotonic() - started) / 60
+    monitor.stop_monitoring()
+
+    print(f"{name:<12} detection p50={statistics.median(detection_times) * 1000:7.1f} ms  "
+          f"max={max(detection_times) * 1000:7.1f} ms  wakeups/min={monitor.wakeups / elapsed_minutes:7.0f}")
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    schedule = [random.choice((random.uniform(0.5, 1.5), random.uniform(4, 8))) for _ in range(PRESENTATIONS)]
+    for name, config in STRATEGIES.items():
+        run(name, config, schedule)
+
+if __name__ == "__main__":
+    main()
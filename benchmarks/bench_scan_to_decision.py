@@ -0,0 +1,67 @@
+"""
+Scan-to-decision latency (member lookup plus status/level check) for
+JsonDatabase versus SqliteDatabase.
+
+Run from the repository root:
+    python -m benchmarks.bench_scan_to_decision
+"""
+import logging
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.sqlite_database import SqliteDatabase
+from benchmarks.synthetic_members import synthetic_obf_rfid, write_member_file
+
+MEMBER_COUNTS = (10_000, 100_000)
+SCANS = 5_000
+
+def decide(db, obf_rfid):
+    member_info = db.get_member({"obf_rfid": obf_rfid})
+    return bool(member_info) and member_info["membership_status"] == "active" and member_info["member_level"] in ("member", "admin")
+
+def random_scans(member_count):
+    # Mix of known cards and unknown fobs
+    return [synthetic_obf_rfid(random.randrange(member_count * 2)) for _ in range(SCANS)]
+
+def time_scans(db, scans):
+    latencies = []
+    for obf_rfid in scans:
+        start = time.perf_counter()
+        decide(db, obf_rfid)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def report(name, member_count, latencies):
+    latencies_us = sorted(latency * 1_000_000 for latency in latencies)
+    p99 = latencies_us[int(len(latencies_us) * 0.99) - 1]
+    print(f"{name:<15} members={member_count:>7}  p50={statistics.median(latencies_us):8.1f} us  p99={p99:8.1f} us")
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    for member_count in MEMBER_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "db.json"
+            write_member_file(json_path, member_count)
+
+            start = time.perf_counter()
+            json_db = JsonDatabase({"name": f"bench_json_{member_count}", "connection_info": json_path})
+            print(f"JsonDatabase load: {time.perf_counter() - start:.2f} s")
+            report("JsonDatabase", member_count, time_scans(json_db, random_scans(member_count)))
+
+            start = time.perf_counter()
+            sqlite_db = SqliteDatabase({
+                "name": f"bench_sqlite_{member_count}",
+                "connection_info": Path(directory) / "db.sqlite",
+                "migrate_from": json_path
+            })
+            print(f"SqliteDatabase migration: {time.perf_counter() - start:.2f} s")
+            report("SqliteDatabase", member_count, time_scans(sqlite_db, random_scans(member_count)))
+            sqlite_db.close()
+
+if __name__ == "__main__":
+    main()
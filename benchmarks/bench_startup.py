@@ -0,0 +1,96 @@
+"""
+Cold-start cost of ADA: `python -X importtime` of `import ada` broken down
+by module, and the time from interpreter start until every door's reader
+has been polled once, on simulated hardware.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RUNS = 5
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Simulated hardware so both measurements run off a Pi
+IMPORT_SCRIPT = "from src.hardware.simulation.simulated_hardware import SimulatedHardware; SimulatedHardware().install(); import ada"
+
+READY_SCRIPT = """
+import time
+start = time.perf_counter()
+import threading
+from src.hardware.simulation.simulated_hardware import SimulatedHardware
+hardware = SimulatedHardware()
+hardware.install()
+import ada
+imported = time.perf_counter()
+stop_event = threading.Event()
+thread = threading.Thread(target=ada.main, args=(stop_event,))
+thread.start()
+while hardware.card_field().read_count == 0:
+    time.sleep(0.0005)
+ready = time.perf_counter()
+stop_event.set()
+thread.join()
+print((imported - start) * 1000, (ready - start) * 1000)
+"""
+
+def parse_importtime(stderr):
+    """
+    Return {module: (self_us, cumulative_us)} from -X importtime output.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def import_times(env, directory):
+    return [
+        parse_importtime(subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+            cwd=directory, env=env, capture_output=True, text=True, check=True
+        ).stderr)
+        for _ in range(RUNS)
+    ]
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        # Run from the temporary directory with only these variables, so a
+        # developer's .env and the project's logs/ada.log are left alone
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "PYTHONPATH": str(REPO_ROOT),
+            "JSON_DB_CONNECTION_INFO": str(Path(directory) / "db.json"),
+            "LOG_FILE": str(Path(directory) / "ada.log"),
+            "LOG_ASYNC": "True"
+        }
+        Path(env["JSON_DB_CONNECTION_INFO"]).write_text(json.dumps({}))
+
+        runs = import_times(env, directory)
+        fastest = min(runs, key=lambda modules: modules["ada"][1])
+        print(f"import ada: min {fastest['ada'][1] / 1000:.1f} ms, "
+              f"median {statistics.median(modules['ada'][1] for modules in runs) / 1000:.1f} ms over {RUNS} runs")
+        print("Slowest imports (cumulative ms):")
+        for name, (_, cumulative_us) in sorted(fastest.items(), key=lambda item: -item[1][1])[1:11]:
+            print(f"  {cumulative_us / 1000:7.1f}  {name}")
+
+        ready = []
+        for _ in range(RUNS):
+            output = subprocess.run(
+                [sys.executable, "-c", READY_SCRIPT],
+                cwd=directory, env=env, capture_output=True, text=True, check=True
+            ).stdout.split()
+            ready.append((float(output[-2]), float(output[-1])))
+        print(f"imports done: median {statistics.median(imported for imported, _ in ready):.1f} ms, "
+              f"first reader poll: median {statistics.median(done for _, done in ready):.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+"Who's allowed in tonight" report over 10k scheduled members, evaluating
+every member's compiled schedule versus ORing TimeBucketIndex bitsets, and
+the cost of an incremental index update.
+
+Run from the repository root:
+    python -m benchmarks.bench_time_bucket_index
+"""
+import json
+import logging
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from src.database.implementations.json_database import JsonDatabase
+from src.utils.access_schedule import access_schedule_cache
+from src.managers.implementations.time_bucket_index import TimeBucketIndex
+from benchmarks.synthetic_members import synthetic_member
+
+UTC = ZoneInfo("UTC")
+MEMBER_COUNT = 10_000
+
+def write_members(filepath, now):
+    data = {}
+    for index in range(MEMBER_COUNT):
+        start = now.replace(tzinfo=None, minute=0, second=0, microsecond=0) - timedelta(days=random.randrange(30), hours=random.randrange(24))
+        interval = f"R{random.choice(('', 7, 30))}/{start.isoformat()}/PT{random.randint(1, 9)}H"
+        member = synthetic_member(index, member_level=random.choice(("guest", "philanthropist")), access_interval=interval)
+        data[member["obf_rfid"]] = member
+    with open(filepath, "w") as file:
+        json.dump(data, file)
+
+def scan_report(db, start, end):
+    # Sample every 5 minutes, as the index does
+    allowed = []
+    for member_info in db.iter_members():
+        schedule = access_schedule_cache.get(member_info["access_interval"])
+        moment = start
+        while moment <= end:
+            if schedule.contains(moment):
+                allowed.append(member_info["obf_rfid"])
+                break
+            moment += timedelta(minutes=5)
+    return allowed
+
+def main():
+    logging.disable(logging.INFO)
+    random.seed(1)
+    now = datetime.now(UTC)
+    tonight = (now.replace(hour=18, minute=0, second=0, microsecond=0) + timedelta(days=1),
+               now.replace(hour=23, minute=0, second=0, microsecond=0) + timedelta(days=1))
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "db.json"
+        write_members(json_path, now)
+        db = JsonDatabase({"name": "bench_time_bucket_db", "connection_info": json_path})
+
+        start = time.perf_counter()
+        index = TimeBucketIndex({"name": "bench_time_bucket_index", "database": db})
+        print(f"Index build: {time.perf_counter() - start:.2f} s, {index.stats()['bytes'] / 1024:.0f} KiB")
+
+        start = time.perf_counter()
+        expected = scan_report(db, *tonight)
+        print(f"Per-member report:  {(time.perf_counter() - start) * 1000:8.2f} ms ({len(expected)} members)")
+
+        start = time.perf_counter()
+        allowed = index.members_allowed_between(*tonight)
+        print(f"Bitmap index report: {(time.perf_counter() - start) * 1000:7.2f} ms ({len(allowed)} members)")
+
+        member_info = dict(next(iter(db.iter_members())))
+        member_info["access_interval"] = f"R/{now.replace(tzinfo=None, microsecond=0).isoformat()}/PT2H"
+        start = time.perf_counter()
+        index._on_member_changed(member_info["obf_rfid"], member_info)
+        print(f"Incremental update of one member: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Time from process start to the first access decision (JsonDatabase load,
+AccessControlManager build, one validate_access) with and without a
+warm-start snapshot, at 10k and 100k members. A third of the members are
+guests spread over a year of visit intervals. Each run is a fresh
+interpreter so no schedule cache survives between runs.
+
+Run from the repository root:
+    python -m benchmarks.bench_warm_start
+"""
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic_members import synthetic_member, synthetic_obf_rfid
+
+MEMBER_COUNTS = (10_000, 100_000)
+RUNS = 3
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.access_control_manager import AccessControlManager
+db = JsonDatabase({"name": "bench_db", "connection_info": sys.argv[1], "warm_start_path": sys.argv[2] or None})
+loaded = time.perf_counter()
+manager = AccessControlManager({"name": "bench_access_control", "database": db})
+manager.validate_access(sys.argv[3])
+done = time.perf_counter()
+print((loaded - start) * 1000, (done - start) * 1000)
+"""
+
+def write_members(filepath, member_count):
+    data = {}
+    for index in range(member_count):
+        if index % 3:
+            member = synthetic_member(index)
+        else:
+            day = 1 + index % 365
+            member = synthetic_member(index, "guest", f"R1/2024-{1 + day // 31:02d}-{1 + day % 28:02d}T11:00:00/PT9H")
+        data[member["obf_rfid"]] = member
+    filepath.write_text(json.dumps(data, indent=4))
+
+def time_startup(db_path, warm_start_path, run_count=RUNS):
+    runs = []
+    for _ in range(run_count):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT, str(db_path), str(warm_start_path or ""), synthetic_obf_rfid(1)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.split()
+        runs.append((float(output[-2]), float(output[-1])))
+    return statistics.median(loaded for loaded, _ in runs), statistics.median(done for _, done in runs)
+
+def report(label, timings):
+    loaded, done = timings
+    print(f"  {label:<34} load {loaded:8.1f} ms   first decision {done:8.1f} ms")
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for member_count in MEMBER_COUNTS:
+            db_path = Path(directory) / f"members_{member_count}.json"
+            warm_start_path = Path(f"{db_path}.warm")
+            write_members(db_path, member_count)
+            print(f"{member_count} members ({db_path.stat().st_size / 1e6:.1f} MB JSON)")
+
+            report("full parse, no snapshot", time_startup(db_path, None))
+            report("cold start, writes snapshot", time_startup(db_path, warm_start_path, run_count=1))
+            report("warm start", time_startup(db_path, warm_start_path))
+            print(f"  snapshot size {warm_start_path.stat().st_size / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
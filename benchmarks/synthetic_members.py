@@ -0,0 +1,31 @@
+import hashlib
+import json
+
+def synthetic_obf_rfid(index):
+    """
+    A deterministic 64 character hex ID shaped like an MFRC522Reader HMAC.
+    """
+    return hashlib.sha256(f"card-{index}".encode("utf-8")).hexdigest()
+
+def synthetic_member(index, member_level="member", access_interval="R/2024-02-08T11:00:00/PT9H"):
+    return {
+        "obf_rfid": synthetic_obf_rfid(index),
+        "member_level": member_level,
+        "membership_status": "active",
+        "access_interval": access_interval,
+        "member_sponsor": synthetic_obf_rfid(0),
+        "created": "2024-02-08T11:00:00",
+        "last_updated": "2024-02-08T11:00:00"
+    }
+
+def write_member_file(filepath, member_count):
+    """
+    Write a JsonDatabase file holding member_count synthetic members.
+    """
+    data = {}
+    for index in range(member_count):
+        member = synthetic_member(index)
+        data[member["obf_rfid"]] = member
+    with open(filepath, "w") as file:
+        json.dump(data, file, indent=4)
+    return data
@@ -1,9 +1,5 @@
 import logging
 from abc import ABC, abstractmethod
-from src.utils.logging_utils import setup_logging
-
-# Initialize logging for the entire application
-setup_logging()
 
 class ADAInterface(ABC):
     """
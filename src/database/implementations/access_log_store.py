@@ -0,0 +1,454 @@
+import json
+import logging
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+UTC = ZoneInfo("UTC")
+SEGMENT_PATTERN = re.compile(r"access-(\d{4}-\d{2}-\d{2})\.log")
+
+# One entry per block of records: first and last timestamp (ms), byte offset
+# and length of the block, result and access point masks, member Bloom filter
+INDEX_ENTRY = struct.Struct("<qqQIQQ256s")
+BLOOM_BITS = 256 * 8
+
+# Fields stored as columns; any other keys of an attempt are kept as details
+ATTEMPT_FIELDS = ("timestamp", "obf_rfid", "access_point", "result")
+
+def _value_bit(value):
+    return 1 << (zlib.crc32(str(value).encode("utf-8")) & 63)
+
+def _member_bits(obf_rfid):
+    # Two Bloom filter bits from one CRC32
+    crc = zlib.crc32(str(obf_rfid).encode("utf-8"))
+    return crc % BLOOM_BITS, (crc >> 11) % BLOOM_BITS
+
+def _to_ms(moment):
+    """
+    Milliseconds since the epoch of a datetime or ISO 8601 string. Naive
+    times are taken as UTC.
+    """
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return int(moment.timestamp() * 1000)
+
+def _format_ms(ms):
+    return datetime.fromtimestamp(ms / 1000, UTC).isoformat(timespec="milliseconds")
+
+class AccessLogStore:
+    """
+    An append-only store of access attempts in daily segment files.
+
+    log_access_attempt() only appends to an in-memory buffer, so the door
+    decision path never waits on storage. A writer thread flushes the
+    buffer in batches, every flush_interval seconds or as soon as
+    batch_size attempts are waiting. A batch that can't be written goes
+    back to the front of the buffer for the next flush. If the buffer
+    reaches max_buffered (storage failing or far too slow), the oldest
+    attempts are dropped and counted rather than blocking.
+
+    Storage:
+    - One segment per UTC day, access-YYYY-MM-DD.log, of compact JSON lines
+      sorted by timestamp within each batch.
+    - Each segment has an index, access-YYYY-MM-DD.idx, with one fixed-size
+      entry per block of block_size records: the block's time range, byte
+      range, a mask of its result and access point values and a Bloom
+      filter of its members. Queries read only the blocks the index can't
+      rule out, then filter their records exactly.
+    - Queries use the index kept in memory, which is extended as soon as
+      the records are written. An index file that failed to write is
+      rewritten whole by the next flush of its day. On startup records past
+      the end of the index (a crash between the segment and index writes)
+      are indexed again and a torn last line is cut off.
+    - Segments older than retention_days are deleted by the writer thread.
+
+    Queries use the DatabaseManagerInterface criteria of SqliteDatabase:
+    start and end (inclusive, ISO 8601 or datetime, naive taken as UTC),
+    obf_rfid, access_point, result and limit.
+
+    Configuration:
+    - path: Directory holding the segments.
+    - name: Logger name (default "AccessLogStore").
+    - batch_size: Waiting attempts that wake the writer early (default 512).
+    - flush_interval: Seconds between flushes (default 1).
+    - block_size: Records per index entry (default 128).
+    - max_buffered: Attempts held in memory before the oldest are dropped (default 100000).
+    - retention_days: Days of segments kept, 0 keeps everything (default 90).
+    - fsync: fsync segments after every flush (default False).
+    """
+    def __init__(self, config):
+        self.path = Path(config["path"])
+        self.logger = logging.getLogger(config.get("name", "AccessLogStore"))
+        self.batch_size = config.get("batch_size", 512)
+        self.flush_interval = config.get("flush_interval", 1)
+        self.block_size = config.get("block_size", 128)
+        self.max_buffered = config.get("max_buffered", 100_000)
+        self.retention_days = config.get("retention_days", 90)
+        self.fsync = config.get("fsync", False)
+
+        self.buffer = deque(maxlen=self.max_buffered)  # (time logged, attempt) pairs
+        self.dropped = 0
+        self.written = 0
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()  # Serializes flushes, pruning and index reads
+        self.indexes = {}  # day -> [index entries], loaded on first use
+        self.stale_indexes = set()  # Days whose index file is behind self.indexes
+        self.pruned_through = None
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        for day in self._segment_days():
+            self._recover(day)
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+        self.logger.info(f"AccessLogStore opened at {self.path}")
+
+    def log_access_attempt(self, attempt_data):
+        """
+        Buffer an access attempt. Recognized keys are timestamp (ISO 8601 or
+        datetime, defaults to now), obf_rfid, access_point and result; any
+        other keys are kept as details. attempt_data is written later by the
+        writer thread and should not be changed after the call.
+        :return: True
+        """
+        if len(self.buffer) == self.max_buffered:
+            self.dropped += 1
+        # Timestamps are parsed and formatted by the writer thread
+        self.buffer.append((time.time(), attempt_data))
+        if len(self.buffer) >= self.batch_size:
+            self.wake_event.set()
+        return True
+
+    def _writer_loop(self):
+        while not self.stop_event.is_set():
+            self.wake_event.wait(self.flush_interval)
+            self.wake_event.clear()
+            try:
+                self.flush()
+                self.prune()
+            except Exception as e:
+                self.logger.error(f"Error writing access log: {e}")
+
+    def flush(self):
+        """
+        Write every buffered attempt to its segment. If a segment write
+        fails, the attempts not yet written are buffered again and the
+        error is raised.
+        :return: The number of attempts written.
+        """
+        with self.lock:
+            batch = []
+            while self.buffer:
+                batch.append(self.buffer.popleft())
+            if not batch:
+                return 0
+
+            by_day = {}
+            for logged_at, attempt in batch:
+                timestamp = attempt.get("timestamp")
+                try:
+                    timestamp_ms = int(logged_at * 1000) if timestamp is None else _to_ms(timestamp)
+                except (TypeError, ValueError) as e:
+                    self.dropped += 1
+                    self.logger.warning(f"Dropped access attempt with unreadable timestamp {timestamp!r}: {e}")
+                    continue
+                day = datetime.fromtimestamp(timestamp_ms / 1000, UTC).date()
+                by_day.setdefault(day, []).append((timestamp_ms, logged_at, attempt))
+
+            written = 0
+            try:
+                for day in list(by_day):
+                    attempts = sorted(by_day[day], key=lambda item: item[0])
+                    self._append(day, [self._encode(timestamp_ms, attempt) for timestamp_ms, _, attempt in attempts])
+                    del by_day[day]
+                    written += len(attempts)
+            except Exception:
+                self._requeue(sorted((item for attempts in by_day.values() for item in attempts), key=lambda item: item[0]))
+                raise
+            finally:
+                self.written += written
+        self.logger.debug(f"Flushed {written} access attempts")
+        return written
+
+    def _requeue(self, attempts):
+        """
+        Put (timestamp ms, time logged, attempt) triples back at the front of
+        the buffer, dropping the oldest if it has no room for them all.
+        """
+        room = self.max_buffered - len(self.buffer)
+        if len(attempts) > room:
+            self.dropped += len(attempts) - room
+            attempts = attempts[len(attempts) - room:]
+        self.buffer.extendleft((logged_at, attempt) for _, logged_at, attempt in reversed(attempts))
+
+    @staticmethod
+    def _encode(timestamp_ms, attempt):
+        record = {
+            "timestamp": _format_ms(timestamp_ms),
+            "obf_rfid": attempt.get("obf_rfid"),
+            "access_point": attempt.get("access_point"),
+            "result": attempt.get("result")
+        }
+        for key, value in attempt.items():
+            if key not in ATTEMPT_FIELDS:
+                record[key] = value
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        return timestamp_ms, record, line.encode("utf-8")
+
+    def _segment_path(self, day):
+        return self.path / f"access-{day.isoformat()}.log"
+
+    def _index_path(self, day):
+        return self.path / f"access-{day.isoformat()}.idx"
+
+    def _segment_days(self):
+        days = []
+        for entry in self.path.iterdir():
+            match = SEGMENT_PATTERN.fullmatch(entry.name)
+            if match:
+                days.append(date.fromisoformat(match.group(1)))
+        return sorted(days)
+
+    def _build_entries(self, encoded, offset):
+        """
+        Split encoded records into blocks and return (data, index entries).
+        """
+        data = bytearray()
+        entries = []
+        for start in range(0, len(encoded), self.block_size):
+            block = encoded[start:start + self.block_size]
+            result_mask = 0
+            access_point_mask = 0
+            bloom = bytearray(BLOOM_BITS // 8)
+            block_start = offset + len(data)
+            for _, record, line in block:
+                result_mask |= _value_bit(record["result"])
+                access_point_mask |= _value_bit(record["access_point"])
+                for bit in _member_bits(record["obf_rfid"]):
+                    bloom[bit >> 3] |= 1 << (bit & 7)
+                data += line
+            entries.append((
+                min(item[0] for item in block), max(item[0] for item in block),
+                block_start, offset + len(data) - block_start,
+                result_mask, access_point_mask, bytes(bloom)
+            ))
+        return data, entries
+
+    def _append(self, day, encoded):
+        index = self._load_index(day)
+        segment_path = self._segment_path(day)
+        with open(segment_path, "ab") as segment:
+            offset = segment.tell()
+            data, entries = self._build_entries(encoded, offset)
+            try:
+                segment.write(data)
+                segment.flush()
+                if self.fsync:
+                    os.fsync(segment.fileno())
+            except OSError:
+                # Leave no partial records for the retry to append after
+                segment.truncate(offset)
+                raise
+        # Queryable as soon as they are written, whatever happens to the index file
+        index.extend(entries)
+
+        # The index file is written after the records it covers, see _recover()
+        try:
+            if day in self.stale_indexes:
+                self._write_index(day, index, "wb")
+                self.stale_indexes.discard(day)
+            else:
+                self._write_index(day, entries, "ab")
+        except OSError as e:
+            self.stale_indexes.add(day)
+            self.logger.error(f"Error writing access log index for {day}, rewriting it on the next flush: {e}")
+
+    def _write_index(self, day, entries, mode):
+        with open(self._index_path(day), mode) as index_file:
+            index_file.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+            if self.fsync:
+                index_file.flush()
+                os.fsync(index_file.fileno())
+
+    def _load_index(self, day):
+        index = self.indexes.get(day)
+        if index is None:
+            index_path = self._index_path(day)
+            raw = index_path.read_bytes() if index_path.exists() else b""
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            index = self.indexes[day] = [entry for entry in INDEX_ENTRY.iter_unpack(raw[:usable])]
+        return index
+
+    def _recover(self, day):
+        """
+        Make the index of a segment cover exactly its complete records.
+        """
+        index = self._load_index(day)
+        segment_path = self._segment_path(day)
+        size = segment_path.stat().st_size
+        while index and index[-1][2] + index[-1][3] > size:
+            index.pop()
+        covered = index[-1][2] + index[-1][3] if index else 0
+        index_size = len(index) * INDEX_ENTRY.size
+        index_path = self._index_path(day)
+        if covered == size and (not index_path.exists() or index_path.stat().st_size == index_size):
+            return
+
+        with open(segment_path, "rb") as segment:
+            segment.seek(covered)
+            tail = segment.read()
+        complete = tail[:tail.rfind(b"\n") + 1]
+        encoded = []
+        for line in complete.splitlines(keepends=True):
+            try:
+                record = json.loads(line)
+                encoded.append((_to_ms(record["timestamp"]), record, line))
+            except (ValueError, KeyError):
+                self.logger.warning(f"Skipping unreadable access log record in {segment_path}")
+        _, entries = self._build_entries(encoded, covered)
+        # Lines that could not be read are dropped with the torn tail
+        kept = sum(len(line) for _, _, line in encoded)
+        if kept != len(complete):
+            with open(segment_path, "r+b") as segment:
+                segment.seek(covered)
+                segment.write(b"".join(line for _, _, line in encoded))
+                segment.truncate()
+        else:
+            os.truncate(segment_path, covered + len(complete))
+        index.extend(entries)
+        with open(index_path, "wb") as index_file:
+            index_file.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in index))
+        self.logger.info(f"Recovered {len(encoded)} access log records in {segment_path}")
+
+    def query_access_logs(self, criteria):
+        """
+        Query access attempts, including buffered ones.
+        Supported criteria: start and end (inclusive), obf_rfid, access_point,
+        result and limit. Results are ordered by timestamp.
+        :return: A list of attempts, or None if none match.
+        """
+        self.flush()
+        start_ms = _to_ms(criteria["start"]) if criteria.get("start") else None
+        end_ms = _to_ms(criteria["end"]) if criteria.get("end") else None
+        obf_rfid = criteria.get("obf_rfid")
+        access_point = criteria.get("access_point")
+        result = criteria.get("result")
+        limit = int(criteria["limit"]) if criteria.get("limit") else None
+
+        # Records are compact JSON, so a matching record contains these bytes;
+        # lines without them are skipped before being decoded
+        needles = [
+            f'"{key}":{json.dumps(value)}'.encode("utf-8")
+            for key, value in (("obf_rfid", obf_rfid), ("access_point", access_point), ("result", result))
+            if value is not None
+        ]
+        member_bits = _member_bits(obf_rfid) if obf_rfid is not None else ()
+        result_bit = _value_bit(result) if result is not None else 0
+        access_point_bit = _value_bit(access_point) if access_point is not None else 0
+
+        with self.lock:
+            days = self._segment_days()
+            if start_ms is not None:
+                first_day = datetime.fromtimestamp(start_ms / 1000, UTC).date()
+                days = [day for day in days if day >= first_day]
+            if end_ms is not None:
+                last_day = datetime.fromtimestamp(end_ms / 1000, UTC).date()
+                days = [day for day in days if day <= last_day]
+            segments = [(day, list(self._load_index(day))) for day in days]
+
+        logs = []
+        for day, index in segments:
+            matches = []
+            try:
+                segment = open(self._segment_path(day), "rb")
+            except FileNotFoundError:
+                # Pruned since the index was read
+                continue
+            with segment:
+                for first_ms, last_ms, offset, length, result_mask, access_point_mask, bloom in index:
+                    if (start_ms is not None and last_ms < start_ms) or (end_ms is not None and first_ms > end_ms):
+                        continue
+                    if result_bit and not result_mask & result_bit:
+                        continue
+                    if access_point_bit and not access_point_mask & access_point_bit:
+                        continue
+                    if any(not bloom[bit >> 3] & (1 << (bit & 7)) for bit in member_bits):
+                        continue
+                    segment.seek(offset)
+                    for line in segment.read(length).splitlines():
+                        if needles and not all(needle in line for needle in needles):
+                            continue
+                        record = json.loads(line)
+                        if obf_rfid is not None and record["obf_rfid"] != obf_rfid:
+                            continue
+                        if result is not None and record["result"] != result:
+                            continue
+                        if access_point is not None and record["access_point"] != access_point:
+                            continue
+                        if start_ms is not None or end_ms is not None:
+                            timestamp_ms = _to_ms(record["timestamp"])
+                            if (start_ms is not None and timestamp_ms < start_ms) or (end_ms is not None and timestamp_ms > end_ms):
+                                continue
+                        matches.append(record)
+            # Blocks of different batches can overlap in time
+            matches.sort(key=lambda record: record["timestamp"])
+            logs.extend(matches)
+            if limit and len(logs) >= limit:
+                break
+        if limit:
+            logs = logs[:limit]
+        return logs or None
+
+    def prune(self, today=None):
+        """
+        Delete segments older than retention_days.
+        :return: The number of segments deleted.
+        """
+        if not self.retention_days:
+            return 0
+        today = today or datetime.now(UTC).date()
+        oldest_kept = today - timedelta(days=self.retention_days - 1)
+        if self.pruned_through == oldest_kept:
+            return 0
+
+        deleted = 0
+        with self.lock:
+            for day in self._segment_days():
+                if day >= oldest_kept:
+                    break
+                self._segment_path(day).unlink()
+                self._index_path(day).unlink(missing_ok=True)
+                self.indexes.pop(day, None)
+                self.stale_indexes.discard(day)
+                deleted += 1
+            self.pruned_through = oldest_kept
+        if deleted:
+            self.logger.info(f"Pruned {deleted} access log segments before {oldest_kept}")
+        return deleted
+
+    def stats(self):
+        return {
+            "buffered": len(self.buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "segments": len(self._segment_days())
+        }
+
+    def close(self):
+        """
+        Stop the writer thread and write any buffered attempts.
+        """
+        self.stop_event.set()
+        self.wake_event.set()
+        self.writer_thread.join()
+        self.flush()
+        self.logger.info("AccessLogStore closed")
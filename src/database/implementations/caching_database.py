@@ -0,0 +1,229 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from ..interfaces.database_interface import DatabaseInterface
+
+# Cached marker for IDs the wrapped database does not know
+_NOT_FOUND = object()
+
+class CachingDatabase(DatabaseInterface):
+    """
+    Wraps any DatabaseInterface implementation with a bounded in-memory LRU
+    cache of member lookups so slower storage can sit behind code that
+    reads members one at a time. ada.main decides badge scans from
+    AccessControlManager's verdict table instead, so there the cache serves
+    Add Member mode and the guest expiry sweeper, not the door.
+
+    - Members are cached for ttl seconds after they are read or written.
+    - Unknown IDs are cached for negative_ttl seconds, so a random fob or a
+      repeated tap doesn't reach the wrapped database on every read.
+    - add_member, update_member and delete_member write through to the
+      wrapped database and refresh or drop the cached entry. Bulk writes
+      go straight to the wrapped database and drop the cached entries they
+      change.
+    - Change listeners and any other attribute (iter_members,
+      log_access_attempt, close, ...) are forwarded to the wrapped database.
+
+    Changes made through the wrapped database in this process drop the
+    cached entry through its change notifications. Changes made by another
+    process are picked up once the cached entry expires.
+
+    A miss reads the wrapped database without holding the cache lock. Each
+    ID being read has a generation that invalidate() bumps, and the record
+    read is only cached if its generation didn't change meanwhile, so a
+    concurrent change can't be overwritten by the stale record.
+
+    Configuration:
+    - database: The DatabaseInterface implementation to wrap.
+    - max_size: Maximum number of cached entries, positive and negative (default 1024).
+    - ttl: Seconds a member lookup is cached (default 60).
+    - negative_ttl: Seconds an unknown ID is cached, 0 disables negative caching (default 5).
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        if self.database is None:
+            raise ValueError("database must be provided in the config")
+        super().__init__({**config, "connection_info": self.database.connection_info})
+        self.max_size = config.get("max_size", 1024)
+        self.ttl = config.get("ttl", 60)
+        self.negative_ttl = config.get("negative_ttl", 5)
+
+        self.entries = OrderedDict()  # obf_rfid -> (expires_at, member_info or _NOT_FOUND)
+        self.reads = {}  # obf_rfid -> [generation, readers] while a miss reads the wrapped database
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.database.add_change_listener(self._on_member_changed)
+        self.logger.debug(f"CachingDatabase initialized in front of {type(self.database).__name__}")
+
+    def initialize(self):
+        self.clear()
+        self.database.initialize()
+
+    def __getattr__(self, name):
+        # Only called for attributes CachingDatabase does not define itself
+        if name == "database":
+            raise AttributeError(name)
+        return getattr(self.database, name)
+
+    def iter_members(self):
+        return self.database.iter_members()
+
+    def precompiled_verdicts(self, time_zone=None):
+        return self.database.precompiled_verdicts(time_zone)
+
+    def add_change_listener(self, callback):
+        self.database.add_change_listener(callback)
+
+    def remove_change_listener(self, callback):
+        self.database.remove_change_listener(callback)
+
+    def _on_member_changed(self, obf_rfid, member_info):
+        self.invalidate(obf_rfid)
+
+    @staticmethod
+    def _obf_rfid(member_info):
+        if isinstance(member_info, str):
+            return member_info
+        # Any mapping, e.g. the MemberRecord a compact_members JsonDatabase returns
+        return member_info.get("obf_rfid") if isinstance(member_info, Mapping) else None
+
+    def _store(self, obf_rfid, value, read=None, generation=None):
+        """
+        Cache value for obf_rfid. With the read entry and generation of a
+        miss, the value is dropped if obf_rfid was invalidated since.
+        """
+        ttl = self.negative_ttl if value is _NOT_FOUND else self.ttl
+        with self.lock:
+            if read is not None and not self._end_read(obf_rfid, read, generation):
+                return
+            if ttl <= 0 or self.max_size <= 0:
+                self.entries.pop(obf_rfid, None)
+                return
+            self.entries[obf_rfid] = (time.monotonic() + ttl, value)
+            self.entries.move_to_end(obf_rfid)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def _end_read(self, obf_rfid, read, generation):
+        """
+        Finish a miss's read of the wrapped database. Caller holds self.lock.
+        :return: True if obf_rfid was not invalidated during the read.
+        """
+        read[1] -= 1
+        if not read[1]:
+            del self.reads[obf_rfid]
+        return read[0] == generation
+
+    def get_member(self, member_info):
+        """
+        Retrieve a member's details, from the cache when possible.
+        Returns a copy of the member information, or None if not found.
+        """
+        obf_rfid = self._obf_rfid(member_info)
+        if not obf_rfid:
+            # Let the wrapped database report the invalid request
+            return self.database.get_member(member_info)
+
+        with self.lock:
+            entry = self.entries.get(obf_rfid)
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(obf_rfid)
+                if entry[1] is _NOT_FOUND:
+                    self.negative_hits += 1
+                    return None
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+            read = self.reads.get(obf_rfid)
+            if read is None:
+                read = self.reads[obf_rfid] = [0, 0]
+            read[1] += 1
+            generation = read[0]
+
+        try:
+            member = self.database.get_member(member_info)
+        except Exception:
+            with self.lock:
+                self._end_read(obf_rfid, read, generation)
+            raise
+        self._store(obf_rfid, _NOT_FOUND if member is None else dict(member), read, generation)
+        return None if member is None else dict(member)
+
+    def add_member(self, member_info):
+        """
+        Add a new member to the wrapped database and cache it.
+        Raises ValueError if the member already exists.
+        """
+        member = self.database.add_member(member_info)
+        self._store(self._obf_rfid(member), dict(member))
+        return member
+
+    def update_member(self, member_info, *args, **kwargs):
+        """
+        Update a member in the wrapped database and cache the updated record.
+        Raises KeyError if the member does not exist.
+        """
+        obf_rfid = self._obf_rfid(member_info)
+        try:
+            member = self.database.update_member(member_info, *args, **kwargs)
+        except Exception:
+            self.invalidate(obf_rfid)
+            raise
+        self._store(obf_rfid, dict(member))
+        return member
+
+    def bulk_add_members(self, members):
+        # Cached entries are dropped through the wrapped database's change notifications
+        return self.database.bulk_add_members(members)
+
+    def bulk_update_members(self, updates, expected=None):
+        return self.database.bulk_update_members(updates, expected)
+
+    def find_members(self, criteria):
+        # Query results are not cached; the wrapped database answers from its indexes
+        return self.database.find_members(criteria)
+
+    def delete_member(self, member_id):
+        """
+        Delete a member from the wrapped database and drop the cached entry.
+        """
+        try:
+            return self.database.delete_member(member_id)
+        finally:
+            self.invalidate(self._obf_rfid(member_id))
+
+    def invalidate(self, obf_rfid):
+        """
+        Drop the cached entry for obf_rfid, e.g. after changing the wrapped
+        database directly.
+        """
+        with self.lock:
+            self.entries.pop(obf_rfid, None)
+            read = self.reads.get(obf_rfid)
+            if read is not None:
+                read[0] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            for read in self.reads.values():
+                read[0] += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "cached": len(self.entries),
+                "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0
+            }
@@ -0,0 +1,221 @@
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from .json_database import JsonDatabase
+from ...utils.atomic_file import atomic_write
+
+class JournaledJsonDatabase(JsonDatabase):
+    """
+    A JsonDatabase that appends each mutation to a journal instead of rewriting
+    the whole JSON file.
+
+    Storage:
+    - connection_info is the snapshot file, a normal JsonDatabase file in its codec.
+    - Every add/update appends the full member record as one compact JSON line
+      to the journal (default: <snapshot>.journal). Bulk writes append all
+      their records with one flush.
+    - On startup the member table is rebuilt by loading the snapshot and
+      replaying the journal. Records are full member states so replay is
+      idempotent and the last record for an obf_rfid wins.
+
+    Compaction:
+    - A background thread periodically folds the journal into a new snapshot
+      that is written to a temporary file and atomically renamed into place.
+    - While the snapshot is written the journal being folded is kept as
+      <journal>.compacting, so a crash at any point can be recovered by
+      replaying it before the active journal. If writing the snapshot fails,
+      the next compaction appends the active journal to <journal>.compacting
+      rather than replacing it.
+
+    Configuration:
+    - journal_path: Journal file location (optional).
+    - compaction_interval: Seconds between compaction checks (default 300).
+    - compaction_threshold: Minimum journal records before compacting (default 1000).
+    - fsync_journal: fsync after every journal append (default False).
+    """
+    def __init__(self, config):
+        connection_info = Path(config["connection_info"])
+        self.journal_path = Path(config.get("journal_path", f"{connection_info}.journal"))
+        self.compacting_path = Path(f"{self.journal_path}.compacting")
+        self.compaction_interval = config.get("compaction_interval", 300)
+        self.compaction_threshold = config.get("compaction_threshold", 1000)
+        self.fsync_journal = config.get("fsync_journal", False)
+        self.lock = threading.RLock()
+        self.journal_file = None
+        self.journal_records = 0
+        self.compaction_stop_event = threading.Event()
+        self.compaction_thread = None
+        super().__init__(config)
+
+    def initialize(self):
+        super().initialize()
+
+        # Replay a journal left behind by an interrupted compaction first
+        replayed = self._replay_journal(self.compacting_path)
+        replayed += self._replay_journal(self.journal_path)
+        self.journal_records = replayed
+        if replayed:
+            self.member_index.invalidate()
+            if self.warm_start is not None:
+                self.warm_start.discard_verdicts()
+        self.logger.info(f"Replayed {replayed} journal records from {self.journal_path}")
+
+        # Finish the interrupted compaction so the next rotation can't overwrite it
+        if self.compacting_path.exists():
+            self._write_snapshot({obf_rfid: dict(member_info) for obf_rfid, member_info in self.data.items()})
+            self.compacting_path.unlink()
+            self.logger.info("Recovered interrupted journal compaction")
+
+        self.journal_file = open(self.journal_path, "a", encoding="utf-8")
+        if self._journal_has_torn_tail():
+            # Terminate the torn record so the next append starts on its own line
+            self.journal_file.write("\n")
+            self.journal_file.flush()
+
+        if self.compaction_interval and self.compaction_thread is None:
+            self.compaction_thread = threading.Thread(target=self._compaction_loop, daemon=True)
+            self.compaction_thread.start()
+
+    def _replay_journal(self, journal_path):
+        """
+        Apply the records in journal_path to self.data.
+        A torn final line (power cut during an append) is skipped.
+        """
+        if not journal_path.exists():
+            return 0
+
+        count = 0
+        with open(journal_path, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Skipping unreadable journal record {line_number} in {journal_path}")
+                    continue
+                member_info = record.get("member")
+                if record.get("op") == "put" and member_info and member_info.get("obf_rfid"):
+                    self.data[member_info["obf_rfid"]] = self._member_record(member_info)
+                    count += 1
+        return count
+
+    def _journal_has_torn_tail(self):
+        if self.journal_path.stat().st_size == 0:
+            return False
+        with open(self.journal_path, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) != b"\n"
+
+    def _record_change(self, obf_rfid):
+        """
+        Append the current state of a member record to the journal.
+        """
+        line = json.dumps({"op": "put", "member": dict(self.data[obf_rfid])}, separators=(",", ":"))
+        with self.lock:
+            self.journal_file.write(line + "\n")
+            self.journal_file.flush()
+            if self.fsync_journal:
+                os.fsync(self.journal_file.fileno())
+            self.journal_records += 1
+        self.logger.debug(f"Journaled change for member {obf_rfid}")
+
+    def _record_changes(self, obf_rfids):
+        """
+        Append the current state of many member records with one flush.
+        """
+        lines = "".join(
+            json.dumps({"op": "put", "member": dict(self.data[obf_rfid])}, separators=(",", ":")) + "\n"
+            for obf_rfid in obf_rfids
+        )
+        with self.lock:
+            self.journal_file.write(lines)
+            self.journal_file.flush()
+            if self.fsync_journal:
+                os.fsync(self.journal_file.fileno())
+            self.journal_records += len(obf_rfids)
+        self.logger.debug(f"Journaled changes for {len(obf_rfids)} members")
+
+    def add_member(self, member_info):
+        with self.lock:
+            return super().add_member(member_info)
+
+    def update_member(self, member_info):
+        with self.lock:
+            return super().update_member(member_info)
+
+    def bulk_add_members(self, members):
+        with self.lock:
+            return super().bulk_add_members(members)
+
+    def bulk_update_members(self, updates, expected=None):
+        with self.lock:
+            return super().bulk_update_members(updates, expected)
+
+    def compact(self):
+        """
+        Fold the journal into a new snapshot.
+        Only the in-memory copy of the table is taken under the lock; the
+        snapshot itself is serialized and written without blocking writers.
+        """
+        with self.lock:
+            if self.journal_records == 0:
+                return False
+            snapshot = {obf_rfid: dict(member_info) for obf_rfid, member_info in self.data.items()}
+            self.journal_file.close()
+            try:
+                if self.compacting_path.exists():
+                    # A failed compaction left records that are in no snapshot yet;
+                    # keep them and fold this journal in after them
+                    with open(self.compacting_path, "a", encoding="utf-8") as compacting, \
+                            open(self.journal_path, "r", encoding="utf-8") as journal:
+                        shutil.copyfileobj(journal, compacting)
+                    self.journal_path.unlink()
+                else:
+                    os.replace(self.journal_path, self.compacting_path)
+            finally:
+                self.journal_file = open(self.journal_path, "a", encoding="utf-8")
+            journal_records, self.journal_records = self.journal_records, 0
+
+        try:
+            self._write_snapshot(snapshot)
+        except Exception:
+            # The records stay in <journal>.compacting for the next compaction
+            with self.lock:
+                self.journal_records += journal_records
+            raise
+        self.compacting_path.unlink()
+        self.logger.info(f"Journal compacted into {self.filepath}")
+        return True
+
+    def _write_snapshot(self, snapshot):
+        atomic_write(self.filepath, lambda file: self.codec.dump(snapshot, file), binary=self.codec.binary)
+        if self.warm_start is not None:
+            self.warm_start.save(self.filepath, snapshot)
+
+    def _compaction_loop(self):
+        while not self.compaction_stop_event.wait(self.compaction_interval):
+            if self.journal_records >= self.compaction_threshold:
+                try:
+                    self.compact()
+                except Exception as e:
+                    self.logger.error(f"Error compacting journal {self.journal_path}: {e}")
+
+    def close(self):
+        """
+        Stop the compactor, fold any outstanding journal records and close the journal.
+        """
+        self.compaction_stop_event.set()
+        if self.compaction_thread:
+            self.compaction_thread.join()
+            self.compaction_thread = None
+        self.compact()
+        with self.lock:
+            if self.journal_file:
+                self.journal_file.close()
+                self.journal_file = None
+        super().close()
@@ -1,13 +1,84 @@
-import json
+import io
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
 
 from ..interfaces.database_interface import DatabaseInterface
+from ..member_codec import get_member_codec, member_codec_for, sniff_member_codec
+from ..member_index import INDEXED_FIELDS, MemberIndex
+from ..member_record import MemberRecord
+from ...utils.access_schedule import access_schedule_cache
+from ...utils.atomic_file import atomic_write
+from ...utils.warm_start_snapshot import WarmStartSnapshot
+
+DURABILITY_MODES = ("sync", "group", "deferred")
 
 class JsonDatabase(DatabaseInterface):
+    """
+    Member records in one JSON file, keyed by obf_rfid.
+
+    The file is replaced atomically: the table is written to a temporary
+    file, fsynced and renamed over it, so a power cut leaves either the old
+    or the new file, never a truncated one. A file that can't be parsed is
+    reported instead of being treated as an empty table.
+
+    Durability ("durability" config):
+    - "sync" (default): every mutation is written and fsynced before it
+      returns. Simplest, but one full-file write per mutation.
+    - "group": a committer thread waits commit_delay seconds after the first
+      pending mutation, then writes once for every mutation made meanwhile.
+      Writers block until the write containing their mutation is durable,
+      so they see write errors, and concurrent writers share one fsync.
+    - "deferred": like "group", but writers don't wait. Mutations made in
+      the last commit_delay seconds before a power cut are lost, and write
+      errors are only logged. close() writes anything still pending.
+
+    The file is written with the "codec" config, "json" (default) or
+    "binary" (a compact BinaryMemberCodec file), and read with whichever
+    codec wrote it, so changing codec converts the file on the next save.
+
+    With config "compact_members" True, members are held as MemberRecord
+    objects instead of dicts, for a fraction of the memory of a loaded
+    table. Either way get_member() and iter_members() return mappings.
+
+    find_members() answers queries on member_sponsor, member_level and
+    membership_status (config "indexed_fields") from a MemberIndex, built
+    on the first query and kept current on every add and update.
+
+    With config "warm_start_path" set, the decoded member table and its
+    compiled access schedules and verdicts are also kept in a
+    WarmStartSnapshot there. Startup loads the snapshot instead of parsing
+    the JSON file when the snapshot still matches the file, and rewrites it
+    when it doesn't. Saves don't touch the snapshot: the first save starts a
+    timer, and warm_start_delay seconds (default 300) later, or on close(),
+    the snapshot is rebuilt from the file on a background thread. The
+    verdicts are handed to the access table through precompiled_verdicts().
+    """
     def __init__(self, config):
         self.filepath = Path(config["connection_info"])
+        warm_start_path = config.get("warm_start_path")
+        self.warm_start_delay = config.get("warm_start_delay", 300)
+        self.warm_start_timer = None
+        self.warm_start_stale = False        # The file was saved since the snapshot was written
+        self.codec = get_member_codec(config.get("codec", "json"))
+        self.compact_members = config.get("compact_members", False)
+        self.member_index = MemberIndex(config.get("indexed_fields", INDEXED_FIELDS))
+        self.durability = config.get("durability", "sync")
+        if self.durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY_MODES)}")
+        self.commit_delay = config.get("commit_delay", 0.02)
+        self.write_lock = threading.RLock()  # Held while the member table changes or is copied
+        self.save_lock = threading.Lock()    # Orders file writes
+        self.commit_condition = threading.Condition()
+        self.commits_requested = 0           # Mutations numbered in commit order
+        self.commits_attempted = 0           # Highest mutation a write was attempted for
+        self.commits_durable = 0             # Highest mutation known to be on disk
+        self.commit_error = None
+        self.committer_thread = None
+        self.closing = False
         super().__init__(config)
+        self.warm_start = WarmStartSnapshot(warm_start_path, logger=self.logger) if warm_start_path else None
 
         self.logger.debug(f"JsonDatabase initialized with config: {config}")
         self.initialize()
@@ -16,42 +87,209 @@ class JsonDatabase(DatabaseInterface):
         if not self.filepath.exists():
             self.logger.info(f"{self.filepath} not found. Creating a new one.")
             self.filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.filepath, "w") as file:
-                json.dump({}, file, indent=4)
+            atomic_write(self.filepath, lambda file: self.codec.dump({}, file), binary=self.codec.binary)
             self.logger.info(f"JSON Database file created.")
         else:
             self.logger.info("JSON database file exists.")
 
         self.data = self._load_data()
+        if self.compact_members:
+            # The record's obf_rfid shares the table key's string
+            self.data = {obf_rfid: MemberRecord(member_info, obf_rfid=obf_rfid) for obf_rfid, member_info in self.data.items()}
+        self.member_index.invalidate()
         self.logger.info(f"JsonDatabase loaded with file: {self.filepath}")
 
     def _load_data(self):
         """ 
-        Load data from the JSON file
-        Raises Exceptions for JSON parsing and general read error
+        Load data from the member file, with the codec that wrote it
+        Raises Exceptions for parsing and general read error, rather than
+        starting with an empty table that the next save would write over the file
         """       
+        if self.warm_start is not None:
+            data = self.warm_start.load(self.filepath)
+            if data is not None:
+                return data
+
         try:
-            with open(self.filepath, "r") as file:
-                self.logger.debug("Loading data from JSON file.")
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Error decoding JSON from {self.filepath}: {e}")
-            return {}
+            codec = sniff_member_codec(self.filepath)
+            with open(self.filepath, "rb") as file:
+                self.logger.debug(f"Loading data from {codec.name} member file.")
+                data = codec.load(file)
+        except ValueError as e:
+            self.logger.critical(f"Error decoding {self.filepath}: {e}")
+            raise ValueError(f"Member file {self.filepath} can't be decoded: {e}")
         except Exception as e:
-            self.logger.error(f"Error loading data from {self.filepath}: {e}")
-            return {}
+            self.logger.critical(f"Error loading data from {self.filepath}: {e}")
+            raise
+        if self.warm_start is not None:
+            self.warm_start.save(self.filepath, data)
+        return data
         
     def _save_data(self):
         """
-        Save data to the JSON file
-        Raises Exception for write error
+        Atomically replace the member file with the member table.
+        Raises Exception for write error; the file is left as it was
         """
-        try:
-            with open(self.filepath, "w") as file:
-                json.dump(self.data, file, indent=4)
+        with self.save_lock:
+            # Copied so writers only wait for the copy, not the file write
+            with self.write_lock:
+                data = {obf_rfid: dict(member_info) for obf_rfid, member_info in self.data.items()}
+            try:
+                atomic_write(self.filepath, lambda file: self.codec.dump(data, file), binary=self.codec.binary)
+            except Exception as e:
+                self.logger.error(f"Error saving data to {self.filepath}: {e}")
+                raise
             self.logger.info(f"Data successfully saved to {self.filepath}")
+        if self.warm_start is not None:
+            self._schedule_warm_start_save()
+
+    def _schedule_warm_start_save(self):
+        with self.commit_condition:
+            self.warm_start_stale = True
+            if self.warm_start_timer is None and not self.closing:
+                self.warm_start_timer = threading.Timer(self.warm_start_delay, self._save_warm_start)
+                self.warm_start_timer.daemon = True
+                self.warm_start_timer.start()
+
+    def _save_warm_start(self):
+        """
+        Rebuild the warm-start snapshot from the member file as it is on disk,
+        so the snapshot always matches the file it fingerprints. Only reading
+        the file holds up saves; decoding and compiling don't.
+        """
+        with self.commit_condition:
+            self.warm_start_timer = None
+            self.warm_start_stale = False
+        try:
+            with self.save_lock:
+                with open(self.filepath, "rb") as file:
+                    content = file.read()
+                    mtime_ns = os.fstat(file.fileno()).st_mtime_ns
+            data = member_codec_for(content).load(io.BytesIO(content))
         except Exception as e:
-            self.logger.error(f"Error saving data to {self.filepath}: {e}")
+            self.logger.error(f"Error reading {self.filepath} for the warm-start snapshot: {e}")
+            return
+        self.warm_start.save(self.filepath, data, self.warm_start.content_fingerprint(content, mtime_ns))
+
+    def _member_record(self, member_info):
+        """
+        Return member_info as it is held in self.data.
+        """
+        return MemberRecord(member_info) if self.compact_members else member_info
+
+    def _record_change(self, obf_rfid):
+        """
+        Persist a change to a single member record.
+        JsonDatabase rewrites the whole file; subclasses can override this
+        to persist only the changed record.
+        """
+        self._commit()
+
+    def _record_changes(self, obf_rfids):
+        """
+        Persist a bulk change to many member records with one write.
+        """
+        self._commit()
+
+    def _undo_changes(self, added=(), previous=None):
+        """
+        Put the member table back as it was before a change that couldn't be
+        written: drop the members added and restore, in place, the previous
+        records of those updated. The member index is rebuilt on the next query.
+        """
+        with self.write_lock:
+            for obf_rfid in added:
+                self.data.pop(obf_rfid, None)
+            for obf_rfid, member_info in (previous or {}).items():
+                record = self.data[obf_rfid]
+                record.clear()
+                record.update(member_info)
+            self.member_index.invalidate()
+
+    def _commit(self):
+        """
+        Write the member table as durability asks: now, with the next group
+        commit (waiting for it), or with the next group commit in the background.
+        Must be called without holding write_lock.
+        """
+        if self.durability == "sync":
+            self._save_data()
+            return
+
+        with self.commit_condition:
+            self.commits_requested += 1
+            ticket = self.commits_requested
+            if self.committer_thread is None:
+                self.committer_thread = threading.Thread(target=self._committer_loop, daemon=True)
+                self.committer_thread.start()
+            self.commit_condition.notify_all()
+            if self.durability == "deferred":
+                return
+            while self.commits_attempted < ticket:
+                self.commit_condition.wait()
+            if self.commits_durable < ticket:
+                raise self.commit_error
+
+    def _committer_loop(self):
+        while True:
+            with self.commit_condition:
+                while self.commits_requested == self.commits_attempted and not self.closing:
+                    self.commit_condition.wait()
+                if self.commits_requested == self.commits_attempted:
+                    return
+                # Gather the mutations arriving within commit_delay into one write
+                if not self.closing:
+                    self.commit_condition.wait(self.commit_delay)
+                target = self.commits_requested
+
+            error = None
+            try:
+                self._save_data()
+            except Exception as e:
+                error = e
+            with self.commit_condition:
+                self.commits_attempted = target
+                if error is None:
+                    self.commits_durable = target
+                else:
+                    self.commit_error = error
+                self.commit_condition.notify_all()
+
+    def close(self):
+        """
+        Stop the committer, writing any mutations not yet on disk.
+        """
+        with self.commit_condition:
+            self.closing = True
+            self.commit_condition.notify_all()
+            committer_thread = self.committer_thread
+        if committer_thread is not None:
+            committer_thread.join()
+        if self.commits_durable < self.commits_requested:
+            self._save_data()
+            self.commits_durable = self.commits_requested
+
+        # Write a pending warm-start snapshot now rather than losing it
+        with self.commit_condition:
+            warm_start_timer, self.warm_start_timer = self.warm_start_timer, None
+        if warm_start_timer is not None:
+            warm_start_timer.cancel()
+        if self.warm_start_stale:
+            self._save_warm_start()
+
+    def iter_members(self):
+        return iter(list(self.data.values()))
+
+    def precompiled_verdicts(self, time_zone=None):
+        if self.warm_start is None:
+            return None
+        return self.warm_start.take_verdicts(time_zone)
+
+    def _notify_change(self, obf_rfid, member_info):
+        # Verdicts loaded with the snapshot no longer match the member table
+        if self.warm_start is not None:
+            self.warm_start.discard_verdicts()
+        super()._notify_change(obf_rfid, member_info)
 
     def _validate_member_info(self, member_info):
         """
@@ -68,23 +306,50 @@ class JsonDatabase(DatabaseInterface):
         """
         Add a new member to the database
         Raises ValueError if member already exists in database
+        If the change can't be written the member isn't added and the error is raised
         """
 
         # validate an obfuscated RFID is in member_info
         obf_rfid = self._validate_member_info(member_info)
         
-        # validate obfuscated RFID is unique
-        if obf_rfid in self.data:
-            self.logger.error(f"Attempt to add existing member with ID {obf_rfid}")
-            raise ValueError(f"Member with RFID {obf_rfid} already exists")
-        
-        member_info["created"] = datetime.now().replace(microsecond=0).isoformat()
-        member_info["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
-        self.data[obf_rfid] = member_info
-        self._save_data()
+        with self.write_lock:
+            # validate obfuscated RFID is unique
+            if obf_rfid in self.data:
+                self.logger.error(f"Attempt to add existing member with ID {obf_rfid}")
+                raise ValueError(f"Member with RFID {obf_rfid} already exists")
+
+            member_info["created"] = datetime.now().replace(microsecond=0).isoformat()
+            member_info["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
+            self.data[obf_rfid] = member_info = self._member_record(member_info)
+            self.member_index.add(obf_rfid, member_info)
+        try:
+            self._record_change(obf_rfid)
+        except Exception:
+            self._undo_changes(added=[obf_rfid])
+            raise
+        self._notify_change(obf_rfid, member_info)
         self.logger.info(f"Member added with RFID {obf_rfid}")
         return member_info
 
+    def find_members(self, criteria):
+        """
+        Return the members matching criteria, through the member index when
+        criteria names an indexed field.
+        """
+        self._validate_criteria(criteria)
+        with self.write_lock:
+            self.member_index.ensure_built(self.data)
+            candidates = self.member_index.lookup(criteria)
+            if candidates is None:
+                return super().find_members(criteria)
+            remaining = [(field, value) for field, value in criteria.items() if field not in self.member_index.postings]
+            members = (self.data[obf_rfid] for obf_rfid in candidates)
+            # Copies, so callers can't change the table behind the index
+            return [
+                dict(member_info) for member_info in members
+                if all(member_info.get(field) == value for field, value in remaining)
+            ]
+
     def get_member(self, member_info):
         """
         Retrieve a member's details from the database.
@@ -117,18 +382,104 @@ class JsonDatabase(DatabaseInterface):
     def update_member(self, member_info):
         """
         Update a member's record in the database.
+        If the change can't be written the record is restored and the error is raised
         """
 
         # validate an obfuscated RFID is in member_info
         obf_rfid = self._validate_member_info(member_info)
         
-        # validate an obfuscated RFID is in database
-        if obf_rfid not in self.data:
-            self.logger.error(f"Cannot update: Member with ID {obf_rfid} does not exist in the database")
-            raise KeyError(f"Member with ID {obf_rfid} not found")
-        
-        member_info["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
-        self.data[obf_rfid].update(member_info)
-        self._save_data()
+        with self.write_lock:
+            # validate an obfuscated RFID is in database
+            if obf_rfid not in self.data:
+                self.logger.error(f"Cannot update: Member with ID {obf_rfid} does not exist in the database")
+                raise KeyError(f"Member with ID {obf_rfid} not found")
+
+            # Drop the compiled schedule for an interval this update replaces
+            old_interval = self.data[obf_rfid].get("access_interval")
+            if "access_interval" in member_info and member_info["access_interval"] != old_interval:
+                access_schedule_cache.invalidate(old_interval)
+
+            member_info["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
+            previous = {obf_rfid: dict(self.data[obf_rfid])}
+            indexed_values = self.member_index.values(self.data[obf_rfid])
+            self.data[obf_rfid].update(member_info)
+            self.member_index.move(obf_rfid, indexed_values, self.data[obf_rfid])
+        try:
+            self._record_change(obf_rfid)
+        except Exception:
+            self._undo_changes(previous=previous)
+            raise
+        self._notify_change(obf_rfid, self.data[obf_rfid])
         self.logger.info(f"Member with RFID {obf_rfid} updated.")
-        return self.data[obf_rfid]
\ No newline at end of file
+        return self.data[obf_rfid]
+
+    def bulk_add_members(self, members):
+        """
+        Add many new members with one validation pass and one file write.
+        Raises ValueError, adding nothing, if any record is invalid or exists
+        """
+        records = self._validate_members(members)
+        with self.write_lock:
+            existing = [obf_rfid for obf_rfid in records if obf_rfid in self.data]
+            self._raise_bulk_errors("members already exist", existing)
+
+            now = datetime.now().replace(microsecond=0).isoformat()
+            for obf_rfid, member_info in records.items():
+                member_info["created"] = now
+                member_info["last_updated"] = now
+                records[obf_rfid] = member_info = self._member_record(member_info)
+                self.member_index.add(obf_rfid, member_info)
+            self.data.update(records)
+        try:
+            self._record_changes(records)
+        except Exception:
+            self._undo_changes(added=records)
+            raise
+        for obf_rfid, member_info in records.items():
+            self._notify_change(obf_rfid, member_info)
+        self.logger.info(f"{len(records)} members added in bulk")
+        return len(records)
+
+    def bulk_update_members(self, updates, expected=None):
+        """
+        Update many members with one validation pass and one file write.
+        Raises ValueError or KeyError, updating nothing, if any update is
+        invalid or names an unknown member. Updates to members that no longer
+        hold their expected values are skipped.
+        """
+        records = self._validate_members(updates, partial=True)
+        with self.write_lock:
+            if expected is not None:
+                records = {
+                    obf_rfid: member_info for obf_rfid, member_info in records.items()
+                    if obf_rfid not in expected or self._has_fields(self.data.get(obf_rfid), expected[obf_rfid])
+                }
+                if not records:
+                    return 0
+            missing = [obf_rfid for obf_rfid in records if obf_rfid not in self.data]
+            self._raise_bulk_errors("members not found", missing, KeyError)
+
+            # Drop the compiled schedules for intervals these updates replace
+            replaced_intervals = []
+            for obf_rfid, member_info in records.items():
+                old_interval = self.data[obf_rfid].get("access_interval")
+                if "access_interval" in member_info and member_info["access_interval"] != old_interval:
+                    replaced_intervals.append(old_interval)
+            access_schedule_cache.invalidate_many(replaced_intervals)
+
+            now = datetime.now().replace(microsecond=0).isoformat()
+            previous = {obf_rfid: dict(self.data[obf_rfid]) for obf_rfid in records}
+            for obf_rfid, member_info in records.items():
+                indexed_values = self.member_index.values(self.data[obf_rfid])
+                self.data[obf_rfid].update(member_info)
+                self.data[obf_rfid]["last_updated"] = now
+                self.member_index.move(obf_rfid, indexed_values, self.data[obf_rfid])
+        try:
+            self._record_changes(records)
+        except Exception:
+            self._undo_changes(previous=previous)
+            raise
+        for obf_rfid in records:
+            self._notify_change(obf_rfid, self.data[obf_rfid])
+        self.logger.info(f"{len(records)} members updated in bulk")
+        return len(records)
@@ -0,0 +1,361 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from ..interfaces.database_interface import DatabaseInterface
+from ...managers.interfaces.database_manager_interface import DatabaseManagerInterface
+from ...schemas.member_schema import member_schema
+from ...utils.access_schedule import access_schedule_cache
+
+MEMBER_COLUMNS = tuple(member_schema.keys())
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    obf_rfid TEXT PRIMARY KEY,
+    member_level TEXT NOT NULL,
+    membership_status TEXT NOT NULL,
+    access_interval TEXT NOT NULL DEFAULT '',
+    member_sponsor TEXT NOT NULL DEFAULT '',
+    created TEXT NOT NULL DEFAULT '',
+    last_updated TEXT NOT NULL DEFAULT ''
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_members_sponsor ON members (member_sponsor);
+CREATE INDEX IF NOT EXISTS idx_members_status ON members (membership_status);
+CREATE INDEX IF NOT EXISTS idx_members_level ON members (member_level);
+
+CREATE TABLE IF NOT EXISTS access_logs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    obf_rfid TEXT,
+    access_point TEXT,
+    result TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_access_logs_timestamp ON access_logs (timestamp);
+CREATE INDEX IF NOT EXISTS idx_access_logs_member ON access_logs (obf_rfid, timestamp);
+"""
+
+SELECT_MEMBER = f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members WHERE obf_rfid = ?"
+SELECT_ALL_MEMBERS = f"SELECT {', '.join(MEMBER_COLUMNS)} FROM members"
+INSERT_MEMBER = f"INSERT INTO members ({', '.join(MEMBER_COLUMNS)}) VALUES ({', '.join('?' for _ in MEMBER_COLUMNS)})"
+INSERT_MEMBER_IF_NEW = INSERT_MEMBER.replace("INSERT INTO", "INSERT OR IGNORE INTO")
+UPDATE_MEMBER = f"UPDATE members SET {', '.join(f'{column} = ?' for column in MEMBER_COLUMNS[1:])} WHERE obf_rfid = ?"
+DELETE_MEMBER = "DELETE FROM members WHERE obf_rfid = ?"
+INSERT_ACCESS_LOG = "INSERT INTO access_logs (timestamp, obf_rfid, access_point, result, details) VALUES (?, ?, ?, ?, ?)"
+
+class SqliteDatabase(DatabaseInterface, DatabaseManagerInterface):
+    """
+    A SQLite backed member store and access log.
+
+    Members and access attempts live in indexed tables so lookups are
+    O(log N) without holding the member table in memory. The database runs in
+    WAL mode so the door decision path can read while a write is in progress.
+    All statements are constant, parameterized SQL so sqlite3 reuses its
+    prepared statement cache.
+
+    Both DatabaseInterface (member_info dicts) and DatabaseManagerInterface
+    (member_id strings) call styles are accepted.
+
+    Configuration:
+    - connection_info: Path to the SQLite file.
+    - migrate_from: Optional JsonDatabase file to import when the members table is empty.
+    """
+    def __init__(self, config):
+        self.filepath = Path(config["connection_info"])
+        super().__init__(config)
+        self.connection = None
+        self.lock = threading.Lock()
+
+        self.logger.debug(f"SqliteDatabase initialized with config: {config}")
+        self.initialize()
+
+    def initialize(self):
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.filepath, check_same_thread=False, cached_statements=128)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.logger.info(f"SqliteDatabase loaded with file: {self.filepath}")
+
+        migrate_from = self.config.get("migrate_from")
+        if migrate_from and self.count_members() == 0 and Path(migrate_from).exists():
+            self.migrate_from_json(migrate_from)
+
+    def close(self):
+        with self.lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+    def _resolve_obf_rfid(self, member_info):
+        """
+        Accept either a member_info dict or an obfuscated RFID string.
+        Raises ValueError if no obfuscated RFID is provided.
+        """
+        obf_rfid = member_info if isinstance(member_info, str) else member_info.get("obf_rfid")
+        if not obf_rfid:
+            self.logger.error("Member RFID is required")
+            raise ValueError("Member RFID is required")
+        return obf_rfid
+
+    @staticmethod
+    def _member_row(member_info):
+        return tuple(member_info.get(column, "") for column in MEMBER_COLUMNS)
+
+    def count_members(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+    def iter_members(self):
+        """
+        Return an iterator over every member record.
+        """
+        with self.lock:
+            rows = self.connection.execute(SELECT_ALL_MEMBERS).fetchall()
+        return (dict(row) for row in rows)
+
+    def find_members(self, criteria):
+        """
+        Return the members matching criteria, through the column indexes.
+        """
+        self._validate_criteria(criteria)
+        query = SELECT_ALL_MEMBERS
+        if criteria:
+            # Field names are checked against member_schema, so only values are parameters
+            query += " WHERE " + " AND ".join(f"{field} = ?" for field in criteria)
+        with self.lock:
+            rows = self.connection.execute(query, tuple(criteria.values())).fetchall()
+        return [dict(row) for row in rows]
+
+    def add_member(self, member_info):
+        """
+        Add a new member to the database
+        Raises ValueError if member already exists in database
+        """
+        obf_rfid = self._resolve_obf_rfid(member_info)
+
+        member_info["created"] = datetime.now().replace(microsecond=0).isoformat()
+        member_info["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
+        try:
+            with self.lock, self.connection:
+                self.connection.execute(INSERT_MEMBER, self._member_row(member_info))
+        except sqlite3.IntegrityError:
+            self.logger.error(f"Attempt to add existing member with ID {obf_rfid}")
+            raise ValueError(f"Member with RFID {obf_rfid} already exists")
+        self._notify_change(obf_rfid, member_info)
+        self.logger.info(f"Member added with RFID {obf_rfid}")
+        return member_info
+
+    def get_member(self, member_info):
+        """
+        Retrieve a member's details from the database.
+
+        Args:
+            member_info (dict or str): Dictionary containing the member's information,
+                            with 'obf_rfid' key being mandatory, or the obfuscated RFID.
+
+        Returns:
+            dict: The member information if found, None otherwise.
+        """
+        try:
+            obf_rfid = self._resolve_obf_rfid(member_info)
+        except ValueError as e:
+            self.logger.error(f"Error retrieving member: {e}")
+            return None
+
+        with self.lock:
+            row = self.connection.execute(SELECT_MEMBER, (obf_rfid,)).fetchone()
+        if row is None:
+            self.logger.debug(f"Member with ID {obf_rfid} not found")
+            return None
+        self.logger.debug(f"Retrieved member with ID {obf_rfid}")
+        return dict(row)
+
+    def update_member(self, member_info, updates=None):
+        """
+        Update a member's record in the database.
+        Accepts update_member(member_info) or update_member(member_id, updates).
+        Raises KeyError if the member does not exist.
+        """
+        obf_rfid = self._resolve_obf_rfid(member_info)
+        updates = dict(member_info if updates is None else updates)
+        updates["obf_rfid"] = obf_rfid
+
+        with self.lock, self.connection:
+            row = self.connection.execute(SELECT_MEMBER, (obf_rfid,)).fetchone()
+            if row is None:
+                self.logger.error(f"Cannot update: Member with ID {obf_rfid} does not exist in the database")
+                raise KeyError(f"Member with ID {obf_rfid} not found")
+
+            if "access_interval" in updates and updates["access_interval"] != row["access_interval"]:
+                access_schedule_cache.invalidate(row["access_interval"])
+
+            updates["last_updated"] = datetime.now().replace(microsecond=0).isoformat()
+            member = dict(row)
+            member.update(updates)
+            row_values = self._member_row(member)
+            self.connection.execute(UPDATE_MEMBER, row_values[1:] + row_values[:1])
+
+        self._notify_change(obf_rfid, member)
+        self.logger.info(f"Member with RFID {obf_rfid} updated.")
+        return member
+
+    def bulk_add_members(self, members):
+        """
+        Add many new members with one validation pass and one transaction.
+        Raises ValueError, adding nothing, if any record is invalid or exists
+        """
+        records = self._validate_members(members)
+
+        now = datetime.now().replace(microsecond=0).isoformat()
+        for member_info in records.values():
+            member_info["created"] = now
+            member_info["last_updated"] = now
+        try:
+            with self.lock, self.connection:
+                self.connection.executemany(INSERT_MEMBER, (self._member_row(member_info) for member_info in records.values()))
+        except sqlite3.IntegrityError:
+            with self.lock:
+                existing = [
+                    obf_rfid for obf_rfid in records
+                    if self.connection.execute(SELECT_MEMBER, (obf_rfid,)).fetchone() is not None
+                ]
+            self._raise_bulk_errors("members already exist", existing)
+            raise
+
+        for obf_rfid, member_info in records.items():
+            self._notify_change(obf_rfid, member_info)
+        self.logger.info(f"{len(records)} members added in bulk")
+        return len(records)
+
+    def bulk_update_members(self, updates, expected=None):
+        """
+        Update many members with one validation pass and one transaction.
+        Raises ValueError or KeyError, updating nothing, if any update is
+        invalid or names an unknown member. Updates to members that no longer
+        hold their expected values are skipped.
+        """
+        records = self._validate_members(updates, partial=True)
+
+        now = datetime.now().replace(microsecond=0).isoformat()
+        members = {}
+        replaced_intervals = []
+        with self.lock, self.connection:
+            missing = []
+            for obf_rfid, updates in records.items():
+                row = self.connection.execute(SELECT_MEMBER, (obf_rfid,)).fetchone()
+                if expected is not None and obf_rfid in expected:
+                    if not self._has_fields(dict(row) if row is not None else None, expected[obf_rfid]):
+                        continue
+                if row is None:
+                    missing.append(obf_rfid)
+                    continue
+                if "access_interval" in updates and updates["access_interval"] != row["access_interval"]:
+                    replaced_intervals.append(row["access_interval"])
+                member = dict(row)
+                member.update(updates)
+                member["last_updated"] = now
+                members[obf_rfid] = member
+            # Raising inside the transaction rolls it back
+            self._raise_bulk_errors("members not found", missing, KeyError)
+            self.connection.executemany(UPDATE_MEMBER, (
+                row_values[1:] + row_values[:1] for row_values in map(self._member_row, members.values())
+            ))
+        access_schedule_cache.invalidate_many(replaced_intervals)
+
+        for obf_rfid, member in members.items():
+            self._notify_change(obf_rfid, member)
+        self.logger.info(f"{len(members)} members updated in bulk")
+        return len(members)
+
+    def delete_member(self, member_id):
+        """
+        Delete a member from the database.
+        Returns True if a member was deleted.
+        """
+        obf_rfid = self._resolve_obf_rfid(member_id)
+        with self.lock, self.connection:
+            deleted = self.connection.execute(DELETE_MEMBER, (obf_rfid,)).rowcount > 0
+        if deleted:
+            self._notify_change(obf_rfid, None)
+            self.logger.info(f"Member with RFID {obf_rfid} deleted.")
+        return deleted
+
+    def log_access_attempt(self, attempt_data):
+        """
+        Record an access attempt.
+        Recognized keys are timestamp (ISO 8601, defaults to now), obf_rfid,
+        access_point and result; any other keys are stored as JSON details.
+        """
+        attempt = dict(attempt_data)
+        timestamp = attempt.pop("timestamp", None) or datetime.now().isoformat()
+        obf_rfid = attempt.pop("obf_rfid", None)
+        access_point = attempt.pop("access_point", None)
+        result = attempt.pop("result", None)
+        details = json.dumps(attempt) if attempt else None
+        try:
+            with self.lock, self.connection:
+                self.connection.execute(INSERT_ACCESS_LOG, (timestamp, obf_rfid, access_point, result, details))
+            return True
+        except sqlite3.Error as e:
+            self.logger.error(f"Error logging access attempt: {e}")
+            return False
+
+    def query_access_logs(self, criteria):
+        """
+        Query access attempts.
+        Supported criteria: start and end (inclusive ISO 8601 bounds), obf_rfid,
+        access_point, result and limit. Results are ordered by timestamp.
+        Returns None if no attempts match.
+        """
+        clauses = []
+        params = []
+        if criteria.get("start"):
+            clauses.append("timestamp >= ?")
+            params.append(criteria["start"])
+        if criteria.get("end"):
+            clauses.append("timestamp <= ?")
+            params.append(criteria["end"])
+        for column in ("obf_rfid", "access_point", "result"):
+            if criteria.get(column) is not None:
+                clauses.append(f"{column} = ?")
+                params.append(criteria[column])
+
+        query = "SELECT timestamp, obf_rfid, access_point, result, details FROM access_logs"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp"
+        if criteria.get("limit"):
+            query += " LIMIT ?"
+            params.append(int(criteria["limit"]))
+
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+
+        logs = []
+        for row in rows:
+            entry = dict(row)
+            details = entry.pop("details")
+            if details:
+                entry.update(json.loads(details))
+            logs.append(entry)
+        return logs or None
+
+    def migrate_from_json(self, json_path):
+        """
+        One-shot import of a JsonDatabase file.
+        Members already present in SQLite are left untouched.
+        Returns the number of members imported.
+        """
+        with open(json_path, "r") as file:
+            data = json.load(file)
+
+        with self.lock, self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(INSERT_MEMBER_IF_NEW, (self._member_row(member) for member in data.values()))
+            imported = self.connection.total_changes - before
+        self.logger.info(f"Migrated {imported} members from {json_path}")
+        return imported
@@ -1,5 +1,10 @@
+import threading
 from abc import abstractmethod
 from ...ada_interface import ADAInterface
+from ...schemas.member_schema import member_schema, member_schema_errors
+
+# Invalid records listed in a bulk error message
+MAX_REPORTED_ERRORS = 10
 
 class DatabaseInterface(ADAInterface):
     """
@@ -17,6 +22,26 @@ class DatabaseInterface(ADAInterface):
     - get_member(obf_rfid): Retrieve a member's details from the database.
     - update_member(obf_rfid, member_info): Update a member's record in the database.
 
+    Change Notification:
+    - Components that keep derived state (e.g. access decision tables) register
+      with add_change_listener(callback). Implementations call
+      _notify_change(obf_rfid, member_info) after every successful write, with
+      member_info None when a member is deleted.
+    - iter_members() yields every member record so derived state can be built
+      in one pass. Implementations that cannot enumerate members raise
+      NotImplementedError.
+    - precompiled_verdicts(time_zone) hands out access verdicts compiled ahead
+      of time (e.g. from a warm-start snapshot) so the access table does not
+      have to be compiled again. Implementations without them return None.
+    - find_members(criteria) returns the members matching field values, by
+      scanning iter_members() unless the implementation keeps indexes.
+
+    Bulk Operations:
+    - bulk_add_members(members) and bulk_update_members(updates) validate a
+      whole batch against member_schema in one pass and persist it with one
+      write. A batch with any invalid record is rejected as a whole.
+    - export_members() yields a copy of every member record, one at a time.
+
     Usage:
     - Subclasses should provide concrete implementations for each abstract method.
     - Ensure that database connections are managed efficiently, with proper handling
@@ -50,6 +75,8 @@ class DatabaseInterface(ADAInterface):
         super().__init__(config)
         self.config = config
         self.connection_info = config["connection_info"]
+        self.change_listeners = ()
+        self.change_listeners_lock = threading.Lock()
 
     @abstractmethod
     def initialize(self):
@@ -92,4 +119,138 @@ class DatabaseInterface(ADAInterface):
         :return: member_info object or error if the database was not updated.
         :raises ValueError: if obf_rfid is not included in request.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def iter_members(self):
+        """
+        Yield every member record in the database.
+        :raises NotImplementedError: if the implementation cannot enumerate members.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support iterating members")
+
+    def find_members(self, criteria):
+        """
+        Return copies of the members whose fields equal every value in
+        criteria, e.g. {"member_sponsor": obf_rfid, "member_level": "guest"},
+        in no particular order. This default scans iter_members();
+        implementations with indexes override it.
+        :raises ValueError: for a field outside member_schema.
+        :raises NotImplementedError: if the implementation cannot enumerate members.
+        """
+        self._validate_criteria(criteria)
+        criteria = criteria.items()
+        return [
+            dict(member_info) for member_info in self.iter_members()
+            if all(member_info.get(field) == value for field, value in criteria)
+        ]
+
+    def _validate_criteria(self, criteria):
+        unknown = [field for field in criteria if field not in member_schema]
+        if unknown:
+            raise ValueError(f"Unknown member fields {', '.join(map(str, unknown))}")
+
+    def bulk_add_members(self, members):
+        """
+        Add many new members with one validation pass and one write.
+        Nothing is added if any record is invalid or already exists.
+        :param members: Iterable of member_info dicts, consumed once.
+        :return: The number of members added.
+        :raises ValueError: listing invalid records and existing members.
+        :raises NotImplementedError: if the implementation has no bulk writes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support bulk writes")
+
+    def bulk_update_members(self, updates, expected=None):
+        """
+        Update many members with one validation pass and one write. Each
+        update holds obf_rfid and the fields to change; later updates to the
+        same member are applied over earlier ones.
+        Nothing is updated if any update is invalid.
+        :param updates: Iterable of partial member_info dicts, consumed once.
+        :param expected: Optional {obf_rfid: {field: value}}. The update to a
+            listed member is only applied if its record still holds those
+            values when written; otherwise, or if the member is gone, it is
+            skipped. Lets a caller act on what it read without racing writers.
+        :return: The number of members updated.
+        :raises ValueError: listing invalid updates.
+        :raises KeyError: if a member does not exist.
+        :raises NotImplementedError: if the implementation has no bulk writes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support bulk writes")
+
+    def export_members(self):
+        """
+        Yield a copy of every member record, e.g. for member_io.write_members().
+        :raises NotImplementedError: if the implementation cannot enumerate members.
+        """
+        for member_info in self.iter_members():
+            yield dict(member_info)
+
+    def _validate_members(self, members, partial=False):
+        """
+        Check a batch of member records against member_schema in one pass.
+        With partial (updates), records for the same member are merged.
+        :return: {obf_rfid: member_info} in batch order.
+        :raises ValueError: listing the invalid records by position.
+        """
+        records = {}
+        errors = []
+        for position, member_info in enumerate(members, start=1):
+            problems = member_schema_errors(member_info, partial)
+            if problems:
+                errors.append(f"record {position}: {', '.join(problems)}")
+                continue
+            obf_rfid = member_info["obf_rfid"]
+            if obf_rfid not in records:
+                records[obf_rfid] = member_info
+            elif partial:
+                records[obf_rfid] = {**records[obf_rfid], **member_info}
+            else:
+                errors.append(f"record {position}: {obf_rfid} appears more than once")
+        self._raise_bulk_errors("invalid member records", errors)
+        return records
+
+    @staticmethod
+    def _has_fields(member_info, fields):
+        """
+        Return whether member_info exists and holds every field value in fields.
+        """
+        return member_info is not None and all(member_info.get(field) == value for field, value in fields.items())
+
+    def _raise_bulk_errors(self, description, errors, exception=ValueError):
+        if not errors:
+            return
+        listed = "; ".join(errors[:MAX_REPORTED_ERRORS])
+        if len(errors) > MAX_REPORTED_ERRORS:
+            listed += f"; and {len(errors) - MAX_REPORTED_ERRORS} more"
+        self.logger.error(f"Bulk write rejected, {len(errors)} {description}: {listed}")
+        raise exception(f"{len(errors)} {description}: {listed}")
+
+    def precompiled_verdicts(self, time_zone=None):
+        """
+        Return access verdicts compiled ahead of time for the current member
+        records, once, or None if there are none for time_zone.
+        :return: {obf_rfid: (access, level, schedule)} or None.
+        """
+        return None
+
+    def add_change_listener(self, callback):
+        """
+        Register callback(obf_rfid, member_info) to be called after a member is
+        added, updated or deleted (member_info is None for deletes).
+        Callbacks run on the writing thread and should return quickly.
+        """
+        with self.change_listeners_lock:
+            # Copy on write so notification can iterate without holding the lock
+            self.change_listeners = self.change_listeners + (callback,)
+
+    def remove_change_listener(self, callback):
+        with self.change_listeners_lock:
+            self.change_listeners = tuple(listener for listener in self.change_listeners if listener != callback)
+
+    def _notify_change(self, obf_rfid, member_info):
+        for callback in self.change_listeners:
+            try:
+                callback(obf_rfid, member_info)
+            except Exception as e:
+                self.logger.error(f"Error in change listener for member {obf_rfid}: {e}")
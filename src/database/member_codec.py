@@ -0,0 +1,202 @@
+import json
+import struct
+import zlib
+from datetime import datetime, timedelta
+
+from ..schemas.member_schema import member_schema
+
+class JsonMemberCodec:
+    """
+    The member table as one pretty-printed JSON object keyed by obf_rfid.
+    Readable and hand-editable, but every record repeats its key names and
+    hex digests.
+    """
+    name = "json"
+    binary = False
+
+    def dump(self, data, file):
+        json.dump(data, file, indent=4)
+
+    def load(self, file):
+        return json.load(file)
+
+class BinaryMemberCodec:
+    """
+    The member table as fixed-width records, about a seventh of the JSON size:
+    - obf_rfid: the 32 raw bytes of its 64 character hex HMAC.
+    - member_level, membership_status: one byte each, indexing a table of
+      the distinct values in the file.
+    - access_interval, member_sponsor: four bytes each, indexing a table of
+      distinct strings. Members sharing an interval or sponsor share one
+      string object once loaded.
+    - created, last_updated: epoch seconds.
+
+    A field that doesn't fit its fixed form (an ID that isn't a hex digest,
+    a timestamp with an offset or microseconds, a missing field) is kept in
+    a JSON object of leftover fields, so any table round-trips exactly.
+
+    Layout: HEADER, the string tables as a JSON array, then one RECORD per
+    member. The CRC32 covers everything after the header.
+    """
+    name = "binary"
+    binary = True
+
+    MAGIC = b"ADAMEMB\x00"
+    VERSION = 1
+    # magic, version, member count, string table length, crc32
+    HEADER = struct.Struct("<8sHIII")
+    # fixed-form field flags, obf_rfid digest, level, status, interval, sponsor, created, last_updated, leftovers
+    RECORD = struct.Struct("<H32sBBIIqqI")
+    FIELDS = tuple(member_schema)
+    EPOCH = datetime(1970, 1, 1)
+    MAX_CODES = 256
+
+    def dump(self, data, file):
+        strings = []
+        string_indexes = {}
+        enum_codes = {"member_level": {}, "membership_status": {}}
+        timestamps = {}
+
+        def string_index(value):
+            index = string_indexes.get(value)
+            if index is None:
+                index = string_indexes[value] = len(strings)
+                strings.append(value)
+            return index
+
+        records = []
+        for obf_rfid, member_info in data.items():
+            if member_info.get("obf_rfid") != obf_rfid:
+                raise ValueError(f"Member stored under {obf_rfid} has obf_rfid {member_info.get('obf_rfid')}")
+            flags = 0
+            values = [b"", 0, 0, 0, 0, 0, 0]
+            leftovers = {}
+            for bit, field in enumerate(self.FIELDS):
+                if field not in member_info:
+                    continue
+                value = member_info[field]
+                fixed = self._fixed_value(field, value, enum_codes, timestamps, string_index)
+                if fixed is None:
+                    leftovers[field] = value
+                else:
+                    flags |= 1 << bit
+                    values[bit] = fixed
+            for field, value in member_info.items():
+                if field not in member_schema:
+                    leftovers[field] = value
+            leftover_index = string_index(json.dumps(leftovers)) + 1 if leftovers else 0
+            records.append(self.RECORD.pack(flags, *values, leftover_index))
+
+        tables = json.dumps([strings, list(enum_codes["member_level"]), list(enum_codes["membership_status"])]).encode("utf-8")
+        body = tables + b"".join(records)
+        file.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(records), len(tables), zlib.crc32(body)))
+        file.write(body)
+
+    def _fixed_value(self, field, value, enum_codes, timestamps, string_index):
+        """
+        Return value in its fixed form, or None to keep it with the leftovers.
+        """
+        if not isinstance(value, str):
+            return None
+        if field == "obf_rfid":
+            if len(value) == 64 and value == value.lower():
+                try:
+                    return bytes.fromhex(value)
+                except ValueError:
+                    return None
+            return None
+        if field in enum_codes:
+            codes = enum_codes[field]
+            code = codes.get(value)
+            if code is None and len(codes) < self.MAX_CODES:
+                code = codes[value] = len(codes)
+            return code
+        if field in ("created", "last_updated"):
+            if value not in timestamps:
+                timestamps[value] = self._epoch_seconds(value)
+            return timestamps[value]
+        return string_index(value)
+
+    def _epoch_seconds(self, timestamp):
+        """
+        Epoch seconds for a naive whole-second ISO timestamp, None for
+        anything that wouldn't format back to the same string.
+        """
+        try:
+            moment = datetime.fromisoformat(timestamp)
+        except ValueError:
+            return None
+        if moment.tzinfo is not None or moment.microsecond or moment.isoformat() != timestamp:
+            return None
+        return (moment - self.EPOCH) // timedelta(seconds=1)
+
+    def load(self, file):
+        content = file.read()
+        if len(content) < self.HEADER.size:
+            raise ValueError("truncated member file")
+        magic, version, count, tables_length, crc = self.HEADER.unpack_from(content)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("not a binary member file of a known version")
+        body = memoryview(content)[self.HEADER.size:]
+        if len(body) != tables_length + count * self.RECORD.size or zlib.crc32(body) != crc:
+            raise ValueError("member file is corrupt")
+        strings, levels, statuses = json.loads(bytes(body[:tables_length]))
+
+        timestamps = {}
+        def timestamp(seconds):
+            text = timestamps.get(seconds)
+            if text is None:
+                text = timestamps[seconds] = (self.EPOCH + timedelta(seconds=seconds)).isoformat()
+            return text
+
+        data = {}
+        fields = self.FIELDS
+        complete = (1 << len(fields)) - 1
+        for flags, digest, level, status, interval, sponsor, created, last_updated, leftover_index in self.RECORD.iter_unpack(body[tables_length:]):
+            if flags == complete:
+                member_info = {
+                    "obf_rfid": digest.hex(),
+                    "member_level": levels[level],
+                    "membership_status": statuses[status],
+                    "access_interval": strings[interval],
+                    "member_sponsor": strings[sponsor],
+                    "created": timestamp(created),
+                    "last_updated": timestamp(last_updated)
+                }
+            else:
+                decoded = (digest.hex(), levels[level] if levels else None, statuses[status] if statuses else None,
+                           strings[interval] if strings else None, strings[sponsor] if strings else None,
+                           timestamp(created), timestamp(last_updated))
+                member_info = {field: decoded[bit] for bit, field in enumerate(fields) if flags & (1 << bit)}
+            if leftover_index:
+                member_info.update(json.loads(strings[leftover_index - 1]))
+                member_info = {field: member_info[field] for field in sorted(member_info, key=self._field_order)}
+            data[member_info["obf_rfid"]] = member_info
+        return data
+
+    def _field_order(self, field):
+        return self.FIELDS.index(field) if field in member_schema else len(self.FIELDS)
+
+MEMBER_CODECS = {codec.name: codec for codec in (JsonMemberCodec, BinaryMemberCodec)}
+
+def get_member_codec(name):
+    """
+    Return a codec instance by name, "json" or "binary".
+    :raises ValueError: if the codec is unknown.
+    """
+    if name not in MEMBER_CODECS:
+        raise ValueError(f"Unknown member codec {name}, use one of {', '.join(MEMBER_CODECS)}")
+    return MEMBER_CODECS[name]()
+
+def sniff_member_codec(filepath):
+    """
+    Return the codec that wrote filepath, judged by its first bytes.
+    """
+    with open(filepath, "rb") as file:
+        return member_codec_for(file.read(len(BinaryMemberCodec.MAGIC)))
+
+def member_codec_for(content):
+    """
+    Return the codec that wrote content, the bytes of a member file or its start.
+    """
+    return BinaryMemberCodec() if content.startswith(BinaryMemberCodec.MAGIC) else JsonMemberCodec()
@@ -0,0 +1,84 @@
+INDEXED_FIELDS = ("member_sponsor", "member_level", "membership_status")
+
+class MemberIndex:
+    """
+    Secondary indexes over an in-memory member table: for each indexed
+    field, the set of obf_rfids holding each value. A query on indexed
+    fields intersects their sets, smallest first, instead of scanning the
+    table.
+
+    The index is built on the first query rather than at startup, so
+    databases that are never queried don't pay for it. Once built, the
+    database holding it keeps it current: it takes values() of a member
+    before changing it and passes them to move() afterwards. Not thread
+    safe; the database serializes changes and queries.
+    """
+    def __init__(self, fields=INDEXED_FIELDS):
+        self.fields = tuple(fields)
+        self.postings = None  # Not built
+
+    def invalidate(self):
+        """
+        Drop the index, e.g. after the table was replaced, until the next ensure_built().
+        """
+        self.postings = None
+
+    def ensure_built(self, data):
+        if self.postings is None:
+            self.rebuild(data)
+
+    def values(self, member_info):
+        """
+        Return the indexed field values of member_info, for move().
+        """
+        return tuple(member_info.get(field) for field in self.fields)
+
+    def rebuild(self, data):
+        """
+        Index every member of an {obf_rfid: member_info} table from scratch.
+        """
+        postings = {}
+        for field in self.fields:
+            postings[field] = field_postings = {}
+            for obf_rfid, member_info in data.items():
+                value = member_info.get(field)
+                holders = field_postings.get(value)
+                if holders is None:
+                    field_postings[value] = {obf_rfid}
+                else:
+                    holders.add(obf_rfid)
+        self.postings = postings
+
+    def add(self, obf_rfid, member_info):
+        if self.postings is None:
+            return
+        for field, value in zip(self.fields, self.values(member_info)):
+            self.postings[field].setdefault(value, set()).add(obf_rfid)
+
+    def move(self, obf_rfid, old_values, member_info):
+        """
+        Re-index a member whose indexed values were old_values.
+        """
+        if self.postings is None:
+            return
+        for field, old_value, value in zip(self.fields, old_values, self.values(member_info)):
+            if value == old_value:
+                continue
+            postings = self.postings[field]
+            holders = postings.get(old_value)
+            if holders is not None:
+                holders.discard(obf_rfid)
+                if not holders:
+                    del postings[old_value]
+            postings.setdefault(value, set()).add(obf_rfid)
+
+    def lookup(self, criteria):
+        """
+        Return the set of obf_rfids matching the indexed fields of criteria,
+        or None if criteria names no indexed field. The index must be built.
+        """
+        matches = [self.postings[field].get(value, set()) for field, value in criteria.items() if field in self.postings]
+        if not matches:
+            return None
+        matches.sort(key=len)
+        return matches[0].intersection(*matches[1:])
@@ -0,0 +1,72 @@
+import csv
+import json
+from pathlib import Path
+
+from ..schemas.member_schema import member_schema
+
+# Column order of CSV exports
+MEMBER_FIELDS = tuple(member_schema)
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+def member_file_format(path, file_format=None):
+    """
+    Return "csv" or "jsonl" for path, from file_format or the file suffix.
+    :raises ValueError: if the format is unknown.
+    """
+    file_format = file_format or FORMATS.get(Path(path).suffix.lower())
+    if file_format not in FORMATS.values():
+        raise ValueError(f"Unknown member file format for {path}, use .csv or .jsonl")
+    return file_format
+
+def read_members(file, file_format, skip_empty=False):
+    """
+    Yield member records from an open text file one at a time, so a roster
+    is only held in memory by whatever consumes it. Records are not
+    validated; DatabaseInterface.bulk_add_members() does that.
+
+    CSV files need a header row naming the member fields. JSON Lines files
+    hold one member object per line; blank lines are skipped.
+    :param file: Open text file (CSV files opened with newline="").
+    :param file_format: "csv" or "jsonl".
+    :param skip_empty: Leave out empty CSV cells, e.g. for partial updates.
+    :raises ValueError: on a line that is not valid JSON.
+    """
+    if file_format == "csv":
+        for row in csv.DictReader(file):
+            # Cells past the header end up under None and fail validation as an unknown field
+            yield {
+                key: value for key, value in row.items()
+                if not (skip_empty and value == "")
+            }
+        return
+
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number} is not valid JSON: {e}")
+
+def write_members(file, members, file_format):
+    """
+    Write member records to an open text file one at a time.
+    :param file: Open text file (CSV files opened with newline="").
+    :param members: Iterable of member records, e.g. DatabaseInterface.export_members().
+    :param file_format: "csv" or "jsonl".
+    :return: The number of members written.
+    """
+    count = 0
+    if file_format == "csv":
+        writer = csv.DictWriter(file, fieldnames=MEMBER_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for member_info in members:
+            writer.writerow(member_info)
+            count += 1
+        return count
+
+    for member_info in members:
+        file.write(json.dumps(member_info, separators=(",", ":")) + "\n")
+        count += 1
+    return count
@@ -1,30 +1,77 @@
 import threading
 import time
 from src.hardware.interfaces.continuous_monitoring_interface import ContinuousMonitoringInterface
+from src.utils.adaptive_polling import AdaptivePollingScheduler
+from src.utils.scheduled_poller import ScheduledPoller
 
 class RFIDContinuousMonitor(ContinuousMonitoringInterface):
+    """
+    Polls an RFID reader and publishes scanned IDs.
+
+    Polling is adaptive by default: the reader is polled every fast_interval
+    seconds while a card was read (or notify_activity() was called) within the
+    last active_window seconds, and backs off by backoff_factor up to
+    monitoring_interval while idle. Set "adaptive_polling" to False to poll at a
+    fixed monitoring_interval.
+
+    A card held in the field is published once; further reads of the same ID
+    are suppressed until it has been out of the field for duplicate_window
+    seconds.
+
+    By default the monitor polls from its own thread. With a TimerScheduler
+    in config "scheduler" it is polled from the scheduler thread instead, so
+    one thread can serve the readers of every door. Config "access_point" is
+    added to published event data to tell doors apart.
+    """
     def __init__(self, config):
         self.monitoring_interval = config.get("monitoring_interval", 1)  # Default to 1 second
         self.shared_state = config.get("threading_shared_var")
+        self.event_queue = config.get("event_queue")
+        self.event_manager = config.get("event_manager")
+        self.event_name = config.get("event_name", "rfid_scanned")
         self.mfrc522_reader = config.get("mfrc522_reader")
+        self.adaptive_polling = config.get("adaptive_polling", True)
+        self.duplicate_window = config.get("duplicate_window", 2)
+        self.scheduler = config.get("scheduler")
+        self.access_point = config.get("access_point")
+        self.polling_scheduler = AdaptivePollingScheduler(
+            fast_interval=min(config.get("fast_interval", 0.05), self.monitoring_interval),
+            max_interval=self.monitoring_interval,
+            backoff_factor=config.get("backoff_factor", 2),
+            active_window=config.get("active_window", 10)
+        )
         super().__init__(config)
 
         self.monitoring_thread = None
+        self.poller = None
         self.running = False
+        self.wake_event = threading.Event()
+        self.last_rfid_id = None
+        self.last_read_time = 0
+        self.wakeups = 0
+        self.suppressed_reads = 0
         self.logger.info("RFIDContinuousMonitor initialized")
 
     def initialize(self):
         return super().initialize()
-    
+
     def start_monitoring(self):
         if not self.running:
             self.running = True
-            self.monitoring_thread = threading.Thread(target=self._monitor_rfid)
-            self.monitoring_thread.start()
+            self.wake_event.clear()
+            if self.scheduler is not None:
+                self.poller = ScheduledPoller(self.scheduler, self.poll_once)
+                self.poller.start()
+            else:
+                self.monitoring_thread = threading.Thread(target=self._monitor_rfid)
+                self.monitoring_thread.start()
             self.logger.info("RFID monitoring started")
 
     def stop_monitoring(self):
         self.running = False
+        self.wake_event.set()
+        if self.poller:
+            self.poller.stop()
         if self.monitoring_thread:
             self.monitoring_thread.join()
             self.logger.info("RFID monitoring thread joined")
@@ -34,12 +81,60 @@ class RFIDContinuousMonitor(ContinuousMonitoringInterface):
         #     self.mfrc522_reader.cleanup()
         #     self.logger.debug("MFRC522 reader cleanup called")
 
+    def notify_activity(self):
+        """
+        Switch to fast polling, e.g. when the door area becomes active.
+        Safe to call from any thread.
+        """
+        self.polling_scheduler.record_activity()
+        self.wake_event.set()
+        if self.poller:
+            self.poller.poll_soon()
+
+    def _publish(self, rfid_id):
+        if self.shared_state is not None:
+            self.shared_state.set(rfid_id)
+        if self.event_queue is not None:
+            self.event_queue.put(rfid_id)
+        if self.event_manager is not None:
+            event_data = {"obf_rfid": rfid_id}
+            if self.access_point is not None:
+                event_data["access_point"] = self.access_point
+            self.event_manager.publish_event(self.event_name, event_data)
+
+    def _is_duplicate_read(self, rfid_id, now):
+        is_duplicate = rfid_id == self.last_rfid_id and now - self.last_read_time <= self.duplicate_window
+        self.last_rfid_id = rfid_id
+        self.last_read_time = now
+        return is_duplicate
+
+    def _next_interval(self):
+        if self.adaptive_polling:
+            return self.polling_scheduler.next_interval()
+        return self.monitoring_interval
+
+    def poll_once(self):
+        """
+        Read the reader once and publish a new card.
+        :return: Seconds until the next poll.
+        """
+        self.wakeups += 1
+        rfid_id = self.mfrc522_reader.scan_for_obf_id()
+        if rfid_id:
+            now = time.monotonic()
+            self.polling_scheduler.record_activity(now)
+            if self._is_duplicate_read(rfid_id, now):
+                self.suppressed_reads += 1
+            else:
+                self._publish(rfid_id)
+                self.logger.debug(f"RFID ID scanned and set: {rfid_id}")
+        return self._next_interval()
+
     def _monitor_rfid(self):
         while self.running:
-            rfid_id = self.mfrc522_reader.scan_for_obf_id()
-            if rfid_id:
-                self.shared_state.set(rfid_id)
-                self.logger.debug(f"RFID ID scanned and set: {rfid_id}")
-                # Optionally, add a break here if you want to stop monitoring after the first successful scan
-            time.sleep(self.monitoring_interval)
-        self.logger.info("RFID monitoring loop has stopped")
\ No newline at end of file
+            interval = self.poll_once()
+
+            # Sleep until the next poll, waking early on notify_activity() or stop
+            if self.wake_event.wait(interval):
+                self.wake_event.clear()
+        self.logger.info("RFID monitoring loop has stopped")
@@ -1,24 +1,58 @@
 import threading
 import time
 from src.hardware.interfaces.toggle_monitoring_interface import ToggleMonitoringInterface
+from src.utils.scheduled_poller import ScheduledPoller
 
 class ContinuousSwitchMonitor(ToggleMonitoringInterface):
+    """
+    Monitors a switch reader and publishes state changes to a shared variable
+    (config "threading_shared_var"), an EventQueue (config "event_queue") and/or
+    an EventManager (config "event_manager", published as config "event_name"
+    with data {"state": state}).
+
+    Detection modes (config "detection_mode"):
+    - "poll" (default): read the switch every monitoring_interval seconds.
+    - "edge": sleep until the switch reader reports a GPIO edge, wait for the
+      contacts to go quiet for debounce_time seconds (further edges restart
+      the wait), wait settle_time seconds more, then read and publish the
+      state. monitoring_interval is used as a resync period in case an edge
+      is missed. Requires a switch reader with add_edge_callback(); otherwise
+      the monitor falls back to polling.
+
+    By default the monitor runs its own thread. With a TimerScheduler in
+    config "scheduler" it is polled (and edge-debounced) from the scheduler
+    thread instead, so one thread can serve the switches of every door.
+    Config "access_point" is added to published event data.
+    """
     def __init__(self, config):
         # Extract monitoring interval from config, with a default value
         self.monitoring_interval = config.get("monitoring_interval", 1)  # Default to 1 second
         self.shared_state = config.get("threading_shared_var")
+        self.event_queue = config.get("event_queue")
+        self.event_manager = config.get("event_manager")
+        self.event_name = config.get("event_name", "switch_state_changed")
         self.switch_reader = config.get("switch_reader")
+        self.detection_mode = config.get("detection_mode", "poll")
+        self.debounce_time = config.get("debounce_time", 0.05)
+        self.settle_time = config.get("settle_time", 0)
+        self.scheduler = config.get("scheduler")
+        self.access_point = config.get("access_point")
         self.last_state = None
         super().__init__(config)
 
-        # Validate 
-        if self.shared_state is None:
-            raise ValueError("threading_shared_var must be provided in the config")
+        # Validate
+        if self.shared_state is None and self.event_queue is None and self.event_manager is None:
+            raise ValueError("threading_shared_var, event_queue or event_manager must be provided in the config")
         if self.switch_reader is None:
             raise ValueError("switch_reader must be provided in the config")
+        if self.detection_mode not in ("poll", "edge"):
+            raise ValueError("detection_mode must be 'poll' or 'edge'")
 
         self.monitoring_thread = None
+        self.poller = None
         self.running = False
+        self.edge_event = threading.Event()
+        self.edge_callback_registered = False
         self.logger.info("ContinuousSwitchMonitor initialized")
         self.switch_reader.initialize()
 
@@ -28,26 +62,92 @@ class ContinuousSwitchMonitor(ToggleMonitoringInterface):
     def start_monitoring(self):
         if not self.running:
             self.running = True
-            self.monitoring_thread = threading.Thread(target=self._monitor_switch)
-            self.monitoring_thread.start()
-            self.logger.info("Switch monitoring started")
+            use_edges = self.detection_mode == "edge" and hasattr(self.switch_reader, "add_edge_callback")
+            if self.detection_mode == "edge" and not use_edges:
+                self.logger.warning("Switch reader does not support edge detection, falling back to polling")
+
+            if self.scheduler is not None:
+                self.poller = ScheduledPoller(self.scheduler, self.poll_once)
+                if use_edges:
+                    self.switch_reader.add_edge_callback(self._on_scheduled_edge)
+                    self.edge_callback_registered = True
+                self.poller.start()
+            else:
+                target = self._monitor_switch
+                if use_edges:
+                    self.edge_event.clear()
+                    self.switch_reader.add_edge_callback(self._on_edge)
+                    self.edge_callback_registered = True
+                    target = self._monitor_switch_edges
+                self.monitoring_thread = threading.Thread(target=target)
+                self.monitoring_thread.start()
+            self.logger.info(f"Switch monitoring started ({self.detection_mode} mode)")
 
     def stop_monitoring(self):
         self.running = False
+        self.edge_event.set()  # Wake an edge monitor waiting for the next edge
+        if self.poller:
+            self.poller.stop()
         if self.monitoring_thread:
             self.monitoring_thread.join()
             self.logger.info("Switch monitoring thread joined")
+        if self.edge_callback_registered:
+            self.switch_reader.remove_edge_callback()
+            self.edge_callback_registered = False
         # self.switch_reader.cleanup()
 
     def _read_current_state(self):
         return self.switch_reader.get_status()
 
+    def _publish_if_changed(self):
+        current_state = self._read_current_state()
+        if current_state != self.last_state:
+            if self.shared_state is not None:
+                self.shared_state.set(current_state)
+            if self.event_queue is not None:
+                self.event_queue.put(current_state)
+            if self.event_manager is not None:
+                event_data = {"state": current_state}
+                if self.access_point is not None:
+                    event_data["access_point"] = self.access_point
+                self.event_manager.publish_event(self.event_name, event_data)
+            self.logger.debug(f"Switch state changed from {self.last_state} to {current_state}")
+            self.last_state = current_state  # Update the last state
+
+    def poll_once(self):
+        """
+        Read the switch once and publish a change.
+        :return: Seconds until the next poll (the resync period in edge mode).
+        """
+        self._publish_if_changed()
+        return self.monitoring_interval
+
+    def _on_scheduled_edge(self):
+        # Each edge restarts the debounce delay before the switch is read
+        self.poller.poll_soon(self.debounce_time + self.settle_time)
+
     def _monitor_switch(self):
         while self.running:
-            current_state = self._read_current_state()
-            if current_state != self.last_state:
-                self.shared_state.set(current_state)
-                self.logger.debug(f"Switch state changed from {self.last_state} to {current_state}")
-                self.last_state = current_state  # Update the last state
+            self._publish_if_changed()
             time.sleep(self.monitoring_interval)
-        self.logger.info("Switch Monitor loop has stopped")
\ No newline at end of file
+        self.logger.info("Switch Monitor loop has stopped")
+
+    def _on_edge(self):
+        # Runs on the GPIO event thread, so only signal the monitor thread
+        self.edge_event.set()
+
+    def _monitor_switch_edges(self):
+        while self.running:
+            self._publish_if_changed()
+
+            # Sleep until an edge arrives, or resync after monitoring_interval
+            if not self.edge_event.wait(self.monitoring_interval):
+                continue
+            self.edge_event.clear()
+
+            # Debounce: wait until the contacts stop bouncing
+            while self.running and self.edge_event.wait(self.debounce_time):
+                self.edge_event.clear()
+            if self.settle_time:
+                time.sleep(self.settle_time)
+        self.logger.info("Switch Monitor loop has stopped")
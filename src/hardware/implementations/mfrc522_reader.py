@@ -1,20 +1,25 @@
-import hmac
-import base64
-import os
-import RPi.GPIO as GPIO
-from mfrc522 import SimpleMFRC522
+from mfrc522 import MFRC522, SimpleMFRC522
 from src.hardware.interfaces.rfid_reader_interface import RFIDScanner
 
 class MFRC522Reader(RFIDScanner):
     """
     A basic implementation of an RFID reader using an MFRC522 chip on a 
     Raspberry Pi GPIO.
+
+    Readers beyond the first are selected with the optional "spi_bus",
+    "spi_device" and "pin_rst" config values. Only the selected chip is
+    opened: SimpleMFRC522's constructor, which would open and reset the
+    chip on bus 0, device 0, is bypassed and the reader injected instead.
     """
     def __init__(self, config):
         self.config = config
         super().__init__(config)
-        self.reader = SimpleMFRC522()
-        self.secret_key = config.get('hmac_secret_key', os.getenv('HMAC_SECRET_KEY', 'default_secret_key'))
+        self.reader = SimpleMFRC522.__new__(SimpleMFRC522)
+        self.reader.READER = MFRC522(
+            bus=config.get("spi_bus", 0),
+            device=config.get("spi_device", 0),
+            pin_rst=config.get("pin_rst", -1)
+        )
         self.initialize()
 
     def initialize(self):
@@ -29,12 +34,6 @@ class MFRC522Reader(RFIDScanner):
             return hashed_id
         return None
 
-    # Hash ID using sha256 and encode in base64
-    # this could be updated to hex if needed
-    def _hash_id(self, raw_id):
-        hmac_obj = hmac.new(self.secret_key.encode("utf-8"), msg=raw_id.encode("utf-8"), digestmod="sha256")
-        return hmac_obj.hexdigest()
-    
     def cleanup(self):
         # Cleanup GPIO resources
         # GPIO.cleanup()
@@ -52,6 +52,18 @@ class PiGPIOSwitchReader(ToggleReaderInterface):
             self.logger.debug(f"Read status from pin {self.pin_number}: {status}")
             return status
         
+    def add_edge_callback(self, callback):
+        """
+        Call callback (with no arguments) from the GPIO event thread whenever
+        the pin changes level in either direction.
+        """
+        GPIO.add_event_detect(self.pin_number, GPIO.BOTH, callback=lambda channel: callback())
+        self.logger.debug(f"Edge detection enabled on pin {self.pin_number}")
+
+    def remove_edge_callback(self):
+        GPIO.remove_event_detect(self.pin_number)
+        self.logger.debug(f"Edge detection disabled on pin {self.pin_number}")
+
     def cleanup(self):
         # GPIO.cleanup(self.pin_number)
         self.logger.info(f"Cleaned up GPIO pin {self.pin_number}.")
\ No newline at end of file
@@ -0,0 +1,38 @@
+from src.hardware.interfaces.rfid_reader_interface import RFIDScanner
+from src.hardware.simulation.virtual_mfrc522 import CardField
+
+class SimulatedRFIDScanner(RFIDScanner):
+    """
+    An RFIDScanner stand-in for development and benchmarking without an MFRC522.
+
+    Cards are placed in the reader field with present_card(); every
+    scan_for_obf_id() call while a card is in the field returns its
+    obfuscated ID, like a badge held against a real reader. The field is the
+    same CardField that SimulatedHardware gives each virtual MFRC522, so both
+    simulators share one model of card presence. Reads are counted so polling
+    strategies can be compared.
+    """
+    def __init__(self, config):
+        super().__init__(config)
+        self.field = CardField()
+        self.initialize()
+
+    def initialize(self):
+        self.logger.info("SimulatedRFIDScanner initialized")
+
+    @property
+    def read_count(self):
+        return self.field.read_count
+
+    def present_card(self, obf_id, duration=0.5):
+        """
+        Hold a card in the field for duration seconds.
+        :return: The CardField presentation record.
+        """
+        return self.field.present_card(obf_id, hold=duration)
+
+    def remove_card(self):
+        self.field.remove_card()
+
+    def scan_for_obf_id(self):
+        return self.field.read_uid()
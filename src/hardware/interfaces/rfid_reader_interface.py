@@ -1,5 +1,7 @@
+import os
 from abc import abstractmethod
 from src.hardware.interfaces.hardware_interface import HardwareInterface
+from src.utils.obfuscated_id_hasher import ObfuscatedIdHasher
 
 class RFIDScanner(HardwareInterface):
     """
@@ -23,13 +25,37 @@ class RFIDScanner(HardwareInterface):
     - scan_for_obf_id() should be implemented to read an RFID tag, apply a hashing algorithm to
       its ID, and return the hashed value. This method should return None if no ID was scanned.
 
+    Hashing:
+    - _hash_id(raw_id) returns the HMAC-SHA256 hex digest of a raw tag ID using the
+      'hmac_secret_key' config value (or the HMAC_SECRET_KEY environment variable).
+      Recent results are cached ('hash_cache_size' config, default 256) so a tag held
+      in the field is not re-hashed on every read.
+    - rotate_secret_key(secret_key) switches keys and invalidates the cache.
+
     Note:
-    - The choice of hashing algorithm and its implementation details are left to the subclass.
+    - Subclasses may override _hash_id() to use a different hashing scheme.
     - Ensure that the hashing method is consistent and secure to protect the identities associated
       with RFID tags.
     """
     def __init__(self, config):
         super().__init__(config)
+        self.id_hasher = ObfuscatedIdHasher(
+            config.get("hmac_secret_key", os.getenv("HMAC_SECRET_KEY", "default_secret_key")),
+            cache_size=config.get("hash_cache_size", 256)
+        )
+
+    def _hash_id(self, raw_id):
+        """
+        Return the obfuscated (HMAC) form of a raw tag ID.
+        """
+        return self.id_hasher.hash_id(raw_id)
+
+    def rotate_secret_key(self, secret_key):
+        """
+        Switch to a new HMAC secret key, invalidating cached obfuscated IDs.
+        """
+        self.id_hasher.set_secret_key(secret_key)
+        self.logger.info("HMAC secret key rotated")
 
     @abstractmethod
     def initialize(self):
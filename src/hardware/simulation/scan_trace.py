@@ -0,0 +1,74 @@
+import json
+import time
+
+def load_trace(filepath):
+    """
+    Load a scan trace from a JSON lines file. Each line is one scan:
+    {"t": seconds from trace start, "access_point": name, "uid": card UID,
+    "hold": seconds the card is held at the reader}. Other keys are kept.
+    :return: The scans sorted by time.
+    """
+    scans = []
+    with open(filepath, "r") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                scan = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid scan on line {line_number} of {filepath}: {e}")
+            if "t" not in scan or "uid" not in scan:
+                raise ValueError(f"Scan on line {line_number} of {filepath} needs t and uid")
+            scans.append(scan)
+    return sorted(scans, key=lambda scan: scan["t"])
+
+def save_trace(filepath, scans):
+    with open(filepath, "w") as file:
+        for scan in scans:
+            file.write(json.dumps(scan) + "\n")
+
+class TraceReplayer:
+    """
+    Presents the cards of a scan trace to the virtual readers of a
+    SimulatedHardware at their recorded times.
+
+    Time is accelerated by speed: scan times and hold times are divided by
+    it, so a speed of 10 replays an hour of traffic in six minutes. The
+    system under test should have its own timings scaled the same way.
+
+    Configuration:
+    - hardware: The installed SimulatedHardware.
+    - readers: {access_point: (spi_bus, spi_device)} of each door's reader.
+      Scans without an access point go to the reader on (0, 0).
+    - speed: Time acceleration factor (default 1).
+    """
+    def __init__(self, hardware, readers=None, speed=1):
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.hardware = hardware
+        self.readers = readers or {}
+        self.speed = speed
+
+    def replay(self, scans, stop_event=None):
+        """
+        Present every scan, blocking until the last one has been presented.
+        :return: One record per scan: the scan's keys plus "presented_at" and
+                 "removed_at" (time.monotonic()) and "read_at" (None if the
+                 reader never saw the card). read_at is filled in as the
+                 reader reads, so check it once the last card is removed.
+        """
+        records = []
+        start = time.monotonic()
+        for scan in scans:
+            delay = start + scan["t"] / self.speed - time.monotonic()
+            if delay > 0:
+                if stop_event is not None and stop_event.wait(delay):
+                    break
+                if stop_event is None:
+                    time.sleep(delay)
+
+            bus, device = self.readers.get(scan.get("access_point"), (0, 0))
+            presentation = self.hardware.card_field(bus, device).present_card(scan["uid"], scan.get("hold", 1) / self.speed)
+            presentation.update({key: value for key, value in scan.items() if key not in presentation})
+            records.append(presentation)
+        return records
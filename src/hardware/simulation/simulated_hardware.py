@@ -0,0 +1,78 @@
+import functools
+import sys
+import threading
+import types
+
+from .virtual_gpio import VirtualGPIO
+from .virtual_mfrc522 import CardField, VirtualMFRC522, VirtualSimpleMFRC522
+
+SIMULATED_MODULES = ("RPi", "RPi.GPIO", "mfrc522")
+
+class SimulatedHardware:
+    """
+    A fake hardware backend that lets the Pi code paths (ada.main,
+    PiGPIOSwitchReader, PiGPIOSwitchOperator, MFRC522Reader) run on any
+    machine.
+
+    install() registers virtual "RPi.GPIO" and "mfrc522" modules in
+    sys.modules. It must run before those modules are first imported, since
+    the hardware classes bind them at import time. Pins live in one
+    VirtualGPIO and each (SPI bus, device) pair gets its own CardField.
+
+    Usage:
+    hardware = SimulatedHardware()
+    hardware.install()
+    import ada
+    hardware.card_field(0, 0).present_card(123456789, hold=1)
+    """
+    def __init__(self):
+        self.gpio = VirtualGPIO()
+        self.card_fields = {}
+        self.lock = threading.Lock()
+        self.saved_modules = None
+
+    def card_field(self, bus=0, device=0):
+        """
+        Return the field of the reader on the given SPI bus and device.
+        """
+        with self.lock:
+            field = self.card_fields.get((bus, device))
+            if field is None:
+                field = self.card_fields[(bus, device)] = CardField()
+            return field
+
+    def modules(self):
+        """
+        Build the virtual modules, keyed by their import names.
+        """
+        gpio_module = types.ModuleType("RPi.GPIO")
+        for name in dir(self.gpio):
+            if not name.startswith("_"):
+                setattr(gpio_module, name, getattr(self.gpio, name))
+        rpi_module = types.ModuleType("RPi")
+        rpi_module.GPIO = gpio_module
+
+        mfrc522_module = types.ModuleType("mfrc522")
+        mfrc522_module.MFRC522 = functools.partial(VirtualMFRC522, self)
+        # A class, so MFRC522Reader can create it without its constructor
+        mfrc522_module.SimpleMFRC522 = type("SimpleMFRC522", (VirtualSimpleMFRC522,), {"hardware": self})
+        return {"RPi": rpi_module, "RPi.GPIO": gpio_module, "mfrc522": mfrc522_module}
+
+    def install(self):
+        if self.saved_modules is not None:
+            return
+        self.saved_modules = {name: sys.modules.get(name) for name in SIMULATED_MODULES}
+        sys.modules.update(self.modules())
+
+    def uninstall(self):
+        """
+        Restore the modules replaced by install().
+        """
+        if self.saved_modules is None:
+            return
+        for name, module in self.saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        self.saved_modules = None
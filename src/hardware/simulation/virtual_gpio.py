@@ -0,0 +1,77 @@
+import threading
+import time
+
+class VirtualGPIO:
+    """
+    A stand-in for the RPi.GPIO module that keeps pin levels in memory.
+
+    Tests and simulations drive input pins with inject(), which delivers
+    edges to add_event_detect callbacks. Every level change is recorded in
+    history as (time.monotonic(), pin, level) so a simulation can see when
+    a latch was driven.
+    """
+    BCM = "BCM"
+    BOARD = "BOARD"
+    IN = "IN"
+    OUT = "OUT"
+    HIGH = 1
+    LOW = 0
+    PUD_UP = "PUD_UP"
+    PUD_DOWN = "PUD_DOWN"
+    RISING = "RISING"
+    FALLING = "FALLING"
+    BOTH = "BOTH"
+
+    def __init__(self):
+        self.levels = {}
+        self.callbacks = {}
+        self.history = []
+        self.lock = threading.Lock()
+
+    def setmode(self, mode):
+        pass
+
+    def setwarnings(self, flag):
+        pass
+
+    def setup(self, pin, direction, pull_up_down=None, initial=None):
+        # Pull-ups idle HIGH, pull-downs idle LOW
+        with self.lock:
+            if initial is not None:
+                self.levels[pin] = initial
+            self.levels.setdefault(pin, self.HIGH if pull_up_down == self.PUD_UP else self.LOW)
+
+    def input(self, pin):
+        return self.levels.get(pin, self.LOW)
+
+    def output(self, pin, level):
+        self.inject(pin, level)
+
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=None):
+        self.callbacks[pin] = callback
+
+    def remove_event_detect(self, pin):
+        self.callbacks.pop(pin, None)
+
+    def cleanup(self, pin=None):
+        pass
+
+    def inject(self, pin, level):
+        """
+        Drive a pin to level, firing its edge callback if the level changed.
+        """
+        with self.lock:
+            changed = self.levels.get(pin) != level
+            self.levels[pin] = level
+            if changed:
+                self.history.append((time.monotonic(), pin, level))
+            callback = self.callbacks.get(pin)
+        if changed and callback:
+            callback(pin)
+
+    def transitions(self, pin, since=0):
+        """
+        Return the (time, level) changes of a pin at or after since.
+        """
+        with self.lock:
+            return [(moment, level) for moment, changed_pin, level in self.history if changed_pin == pin and moment >= since]
@@ -0,0 +1,94 @@
+import threading
+import time
+
+class CardField:
+    """
+    The RF field of one virtual MFRC522 reader.
+
+    A card is placed in the field with present_card() and stays there for
+    its hold time; every read while it is there returns its UID, like a
+    badge held against a real reader. Each presentation is recorded with the
+    time it was first read, so a simulation can tell which scans the reader
+    missed.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.presentations = []
+        self.current = None
+        self.read_count = 0
+
+    def present_card(self, uid, hold=0.5):
+        """
+        Hold a card with the given uid in the field for hold seconds. An
+        MFRC522 reads integer UIDs; SimulatedRFIDScanner uses obfuscated IDs.
+        :return: The presentation record, updated when the card is first read.
+        """
+        now = time.monotonic()
+        presentation = {"uid": uid, "presented_at": now, "removed_at": now + hold, "read_at": None}
+        with self.lock:
+            self.current = presentation
+            self.presentations.append(presentation)
+        return presentation
+
+    def remove_card(self):
+        """
+        Take the card out of the field before its hold time is up.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if self.current is not None:
+                self.current["removed_at"] = min(self.current["removed_at"], now)
+                self.current = None
+
+    def read_uid(self):
+        """
+        Return the UID of the card in the field, or None.
+        """
+        now = time.monotonic()
+        with self.lock:
+            self.read_count += 1
+            presentation = self.current
+            if presentation is None or now >= presentation["removed_at"]:
+                self.current = None
+                return None
+            if presentation["read_at"] is None:
+                presentation["read_at"] = now
+            return presentation["uid"]
+
+class VirtualMFRC522:
+    """
+    Stand-in for mfrc522.MFRC522, one reader on an SPI bus/device pair.
+    The field is looked up by (bus, device) from the hardware it belongs to.
+    """
+    def __init__(self, hardware, bus=0, device=0, spd=1000000, pin_mode=10, pin_rst=-1, debugLevel="WARNING"):
+        self.bus = bus
+        self.device = device
+        self.pin_rst = pin_rst
+        self.field = hardware.card_field(bus, device)
+
+    def read_id_no_block(self):
+        return self.field.read_uid()
+
+    def Close_MFRC522(self):
+        pass
+
+class VirtualSimpleMFRC522:
+    """
+    Stand-in for mfrc522.SimpleMFRC522. Reads go to self.READER, which
+    MFRC522Reader sets itself instead of calling the constructor.
+    SimulatedHardware subclasses it with its hardware bound.
+    """
+    hardware = None
+
+    def __init__(self):
+        self.READER = VirtualMFRC522(self.hardware)
+
+    def read_id_no_block(self):
+        return self.READER.read_id_no_block()
+
+    def read_id(self):
+        uid = self.read_id_no_block()
+        while not uid:
+            time.sleep(0.01)
+            uid = self.read_id_no_block()
+        return uid
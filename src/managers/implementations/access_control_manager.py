@@ -0,0 +1,199 @@
+import logging
+import threading
+from datetime import datetime
+from enum import IntEnum
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+from ..interfaces.access_control_manager_interface import AccessControlManagerInterface
+from ...schemas.member_schema import member_schema
+from ...utils.access_schedule import AccessSchedule, access_schedule_cache
+
+UTC = ZoneInfo("UTC")
+
+class MemberLevel(IntEnum):
+    """
+    member_level values ordered by privilege.
+    """
+    GUEST = 1
+    PHILANTHROPIST = 2
+    MEMBER = 3
+    ADMIN = 4
+
+# Levels at or above this have 24/7 access; lower levels follow their access_interval
+UNRESTRICTED_LEVEL = MemberLevel.MEMBER
+
+# Member verdicts
+DENY = 0
+SCHEDULED = 1
+ALWAYS = 2
+
+class MemberVerdict(NamedTuple):
+    """
+    A member record compiled into the parts an access decision needs.
+    access is DENY, SCHEDULED (check schedule against the scan time) or ALWAYS.
+    """
+    access: int
+    level: int
+    schedule: Optional[AccessSchedule]
+
+DENIED = MemberVerdict(DENY, 0, None)
+
+def compile_member(member_info, time_zone=None):
+    """
+    Compile a member record into a MemberVerdict. Records that don't follow
+    member_schema, are inactive, have an unknown level or an unparsable
+    interval compile to DENIED.
+    :return: (verdict, reason) where reason explains a DENIED verdict, else None.
+    """
+    for key, expected_type in member_schema.items():
+        if not isinstance(member_info.get(key), expected_type):
+            return DENIED, f"invalid member data for {key}"
+    if member_info["membership_status"] != "active":
+        return DENIED, None
+
+    try:
+        level = MemberLevel[member_info["member_level"].upper()]
+    except KeyError:
+        return DENIED, f"unknown member level {member_info['member_level']}"
+    if level >= UNRESTRICTED_LEVEL:
+        return MemberVerdict(ALWAYS, level, None), None
+
+    try:
+        schedule = access_schedule_cache.get(member_info["access_interval"], time_zone)
+    except Exception as e:
+        return DENIED, f"invalid access interval: {e}"
+    return MemberVerdict(SCHEDULED, level, schedule), None
+
+class AccessControlManager(AccessControlManagerInterface):
+    """
+    Decides access from a table of compiled member verdicts keyed by obf_rfid.
+
+    Each member record is compiled once (schema check, level enum, status and
+    compiled access schedule) when the table is built, and again only when
+    the database reports a change to it, so a decision is a dict lookup and
+    an integer comparison; scheduled members add one O(1) schedule check.
+
+    The table is built from database.iter_members(), reusing verdicts from
+    database.precompiled_verdicts() where the database has them, and kept
+    current through database.add_change_listener(). Call refresh() to rebuild it after the
+    database was changed by another process; changes reported while it
+    rebuilds are replayed onto the new table.
+
+    Access points can be limited to some member levels, e.g. a workshop door
+    for members and admins only. Each rule is a bitmask over MemberLevel so
+    it adds one shift and mask to a decision. Access points without a rule
+    admit every level.
+
+    Configuration:
+    - database: The DatabaseInterface implementation holding member records.
+    - name: Logger name (default "AccessControlManager").
+    - time_zone: IANA time zone for access intervals, defaults to SCANNER_TIME_ZONE or UTC.
+    - access_point_levels: Optional {access_point: [member_level, ...]} rules.
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        if self.database is None:
+            raise ValueError("database must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "AccessControlManager"))
+        self.time_zone = config.get("time_zone")
+        self.verdicts = {}
+        self.access_point_masks = {}
+        self.lock = threading.Lock()
+        self.refreshing = 0
+        self.missed_changes = {}  # obf_rfid: verdict or None, changed while refreshing
+        for access_point, levels in config.get("access_point_levels", {}).items():
+            self.set_access_point_levels(access_point, levels)
+
+        self.database.add_change_listener(self._on_member_changed)
+        self.refresh()
+
+    def refresh(self):
+        """
+        Rebuild the verdict table from every member in the database.
+        :return: The number of members compiled.
+        """
+        with self.lock:
+            self.refreshing += 1
+        # Verdicts from a warm start are reused, members without one are compiled
+        precompiled = self.database.precompiled_verdicts(self.time_zone) or {}
+        shared = {}
+        verdicts = {}
+        for member_info in self.database.iter_members():
+            obf_rfid = member_info["obf_rfid"]
+            verdict = precompiled.get(obf_rfid)
+            if verdict is None:
+                verdicts[obf_rfid] = self._compile(member_info)
+            else:
+                # Members sharing a precompiled tuple share one MemberVerdict
+                made = shared.get(id(verdict))
+                if made is None:
+                    made = shared[id(verdict)] = MemberVerdict._make(verdict)
+                verdicts[obf_rfid] = made
+        with self.lock:
+            # Replay changes reported while the table was built, which it may have missed
+            for obf_rfid, verdict in self.missed_changes.items():
+                if verdict is None:
+                    verdicts.pop(obf_rfid, None)
+                else:
+                    verdicts[obf_rfid] = verdict
+            self.refreshing -= 1
+            if not self.refreshing:
+                self.missed_changes = {}
+            self.verdicts = verdicts
+        self.logger.info(f"Access table built for {len(verdicts)} members")
+        return len(verdicts)
+
+    def set_access_point_levels(self, access_point, levels):
+        """
+        Limit access_point to the given member levels, or remove its rule if
+        levels is None.
+        :raises ValueError: if a level is unknown.
+        """
+        if levels is None:
+            self.access_point_masks.pop(access_point, None)
+            return
+        mask = 0
+        for level in levels:
+            try:
+                mask |= 1 << MemberLevel[level.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown member level {level} for access point {access_point}")
+        self.access_point_masks[access_point] = mask
+
+    def close(self):
+        self.database.remove_change_listener(self._on_member_changed)
+
+    def _compile(self, member_info):
+        verdict, reason = compile_member(member_info, self.time_zone)
+        if reason:
+            self.logger.error(f"Member {member_info.get('obf_rfid')} denied: {reason}")
+        return verdict
+
+    def _on_member_changed(self, obf_rfid, member_info):
+        verdict = None if member_info is None else self._compile(member_info)
+        with self.lock:
+            if verdict is None:
+                self.verdicts.pop(obf_rfid, None)
+            else:
+                self.verdicts[obf_rfid] = verdict
+            if self.refreshing:
+                self.missed_changes[obf_rfid] = verdict
+
+    def validate_access(self, member_id, access_point=None, moment=None):
+        """
+        Validates whether a member has access rights to an access point.
+        :param member_id: The obfuscated RFID that was scanned.
+        :param access_point: The access point where access is requested.
+        :param moment: Timezone aware scan time, defaults to now.
+        :return: True if access is granted, False otherwise.
+        """
+        verdict = self.verdicts.get(member_id, DENIED)
+        if verdict.access == DENY:
+            return False
+        mask = self.access_point_masks.get(access_point)
+        if mask is not None and not (mask >> verdict.level) & 1:
+            return False
+        if verdict.access == ALWAYS:
+            return True
+        return verdict.schedule.contains(moment or datetime.now(UTC))
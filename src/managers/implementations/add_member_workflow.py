@@ -0,0 +1,82 @@
+import logging
+
+def is_valid_sponsor(member_info):
+    """
+    Only active members and admins can sponsor guests.
+    """
+    return member_info["membership_status"] == "active" and member_info["member_level"] in ("member", "admin")
+
+class AddMemberWorkflow:
+    """
+    The Add Member mode sponsor/guest workflow, fed one scan at a time by
+    whichever runtime owns the reader: a thread in ada.main or a task in
+    AsyncRuntime.
+
+    A valid sponsor scans first, then the guest. A new guest is added with a
+    temporary access interval and the sponsor recorded in member_sponsor. A
+    known guest is renewed: given a new temporary interval and reactivated,
+    keeping their original sponsor. Any other member scanned as the guest is
+    left unchanged. Either way the workflow then waits for the next sponsor.
+
+    handle_scan() makes blocking database calls and is not thread safe; each
+    access point in Add Member mode needs its own workflow.
+
+    Configuration:
+    - database: The DatabaseInterface implementation holding member records.
+    - get_temp_access_interval: Callable returning a guest's access interval.
+    - name: Logger name (default "AddMemberWorkflow").
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        self.get_temp_access_interval = config.get("get_temp_access_interval")
+        if self.database is None or self.get_temp_access_interval is None:
+            raise ValueError("database and get_temp_access_interval must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "AddMemberWorkflow"))
+        self.sponsor_obf_id = None
+
+    def reset(self):
+        """
+        Forget a scanned sponsor, so the next scan is taken as a sponsor.
+        """
+        self.sponsor_obf_id = None
+
+    def handle_scan(self, obf_id):
+        """
+        Take obf_id as the sponsor or, once a valid sponsor has scanned, as their guest.
+        A database error is raised after resetting to wait for a sponsor.
+        """
+        if self.sponsor_obf_id is None:
+            self.logger.info(f"Sponsor RFID scanned: {obf_id}")
+            sponsor_member_info = self.database.get_member({"obf_rfid": obf_id})
+            if sponsor_member_info is not None and is_valid_sponsor(sponsor_member_info):
+                self.sponsor_obf_id = obf_id
+                self.logger.info("Sponsor is authorized")
+            else:
+                self.logger.info("Sponsor not authorized")
+            return
+
+        sponsor_obf_id = self.sponsor_obf_id
+        self.sponsor_obf_id = None
+        self.logger.info(f"Guest RFID scanned: {obf_id}")
+        guest_member_info = self.database.get_member({"obf_rfid": obf_id})
+        if guest_member_info is None:
+            guest_member_info = {
+                "obf_rfid": obf_id,
+                "member_level": "guest",
+                "membership_status": "active",
+                "access_interval": self.get_temp_access_interval(),
+                "member_sponsor": sponsor_obf_id,
+                "created": "",
+                "last_updated": ""
+            }
+            self.database.add_member(guest_member_info)
+            self.logger.info(f"Guest added: {guest_member_info}")
+        elif guest_member_info["member_level"] == "guest":
+            self.database.update_member({
+                "obf_rfid": obf_id,
+                "membership_status": "active",
+                "access_interval": self.get_temp_access_interval()
+            })
+            self.logger.info(f"Renewing guest temp access: {obf_id}")
+        else:
+            self.logger.info(f"Not a guest, access unchanged: {obf_id}")
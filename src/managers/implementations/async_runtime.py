@@ -0,0 +1,271 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from .add_member_workflow import AddMemberWorkflow
+from .door_actuator import DoorActuator
+from ...hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
+from ...hardware.implementations.continuous_switch_monitor import ContinuousSwitchMonitor
+from ...utils.loop_timer_scheduler import LoopTimerScheduler
+
+# Events published by the monitors, as in ada.main
+RFID_SCANNED = "rfid_scanned"
+DOOR_STATE_CHANGED = "door_state_changed"
+MODE_STATE_CHANGED = "mode_state_changed"
+
+class AsyncAccessPoint:
+    """
+    The monitors, door actuator and Add Member mode of one access point in
+    an AsyncRuntime. The monitors and DoorActuator are the ones ada.main
+    uses, driven by the runtime's LoopTimerScheduler.
+    """
+    def __init__(self, spec, runtime):
+        self.name = spec["name"]
+        self.logger = logging.getLogger(f"{self.name}_async")
+        self.monitors = []
+        self.rfid_monitor = RFIDContinuousMonitor({
+            "name": f"{self.name}_rfid_monitor",
+            **spec.get("rfid_monitor", {}),
+            "event_manager": runtime,
+            "event_name": RFID_SCANNED,
+            "mfrc522_reader": spec["reader"],
+            "scheduler": runtime.scheduler,
+            "access_point": self.name
+        })
+        self.monitors.append(self.rfid_monitor)
+
+        self.door_actuator = DoorActuator({
+            "name": f"{self.name}_door_actuator",
+            "door_latch": spec["latch"],
+            "scheduler": runtime.scheduler,
+            "unlock_duration": spec.get("unlock_duration", 7)
+        })
+
+        for device, monitor, event_name in (("reed_switch", "door_monitor", DOOR_STATE_CHANGED), ("mode_switch", "mode_monitor", MODE_STATE_CHANGED)):
+            if spec.get(device) is not None:
+                self.monitors.append(ContinuousSwitchMonitor({
+                    "name": f"{self.name}_{monitor}",
+                    **spec.get(monitor, {}),
+                    "event_manager": runtime,
+                    "event_name": event_name,
+                    "switch_reader": spec[device],
+                    "scheduler": runtime.scheduler,
+                    "access_point": self.name
+                }))
+
+        self.add_member_workflow = AddMemberWorkflow({
+            "name": f"{self.name}_add_member",
+            "database": runtime.database,
+            "get_temp_access_interval": runtime.get_temp_access_interval
+        })
+        self.add_member_task = None
+        self.add_member_scans = asyncio.Queue()
+
+    def start(self):
+        for monitor in self.monitors:
+            monitor.start_monitoring()
+
+    def stop(self):
+        for monitor in self.monitors:
+            monitor.stop_monitoring()
+
+    def stats(self):
+        return {**self.door_actuator.stats(), "add_member_mode": self.add_member_task is not None}
+
+class AsyncRuntime:
+    """
+    Runs ADA's monitors, door control and Add Member mode on one asyncio
+    event loop, an alternative to the thread-per-monitor runtime in ada.main.
+
+    Both runtimes share their components: the RFIDContinuousMonitor and
+    ContinuousSwitchMonitor instances polling each door's devices, the
+    DoorActuator relocking it and the AddMemberWorkflow. Here they are timed
+    by a LoopTimerScheduler, which runs their blocking hardware calls in a
+    small bounded ThreadPoolExecutor, and their events are dispatched on the
+    loop in publish order.
+
+    - Access decisions run on the loop; unlocks and database calls run in
+      the executor.
+    - Add Member mode is a task per access point, started when its mode
+      switch turns active and cancelled when it turns inactive. While it runs,
+      scans at that door go to its AddMemberWorkflow instead of access control.
+    - stop() may be called from any thread. Shutdown stops every monitor and
+      task, waits for in-flight hardware calls and relocks every door, so
+      run() returns only when nothing is left running.
+
+    Configuration:
+    - access_control: AccessControlManager deciding access.
+    - database: DatabaseInterface used by Add Member mode.
+    - access_points: List of access point dicts with "name", device objects
+      "reader", "latch" and optionally "reed_switch" and "mode_switch", plus
+      "unlock_duration" and "rfid_monitor"/"door_monitor"/"mode_monitor"
+      settings dicts as produced by normalize_access_point().
+    - get_temp_access_interval: Callable returning a new guest's access interval.
+    - access_log: Optional AccessLogStore recording every access decision,
+      with reason "unlock_failed" when a granted unlock raised.
+    - name: Logger name (default "AsyncRuntime").
+    - max_workers: Executor threads for blocking calls (default 2).
+    """
+    def __init__(self, config):
+        self.access_control = config.get("access_control")
+        self.database = config.get("database")
+        if self.access_control is None or self.database is None:
+            raise ValueError("access_control and database must be provided in the config")
+        self.access_point_specs = config.get("access_points") or []
+        if not self.access_point_specs:
+            raise ValueError("access_points must be provided in the config")
+        self.get_temp_access_interval = config.get("get_temp_access_interval")
+        self.access_log = config.get("access_log")
+        self.name = config.get("name", "AsyncRuntime")
+        self.logger = logging.getLogger(self.name)
+        self.max_workers = config.get("max_workers", 2)
+
+        self.loop = None
+        self.executor = None
+        self.scheduler = None
+        self.events = None
+        self.stop_event = None
+        self.access_points = {}
+        self.handlers = {
+            RFID_SCANNED: self._on_rfid_scanned,
+            DOOR_STATE_CHANGED: self._on_door_state_changed,
+            MODE_STATE_CHANGED: self._on_mode_state_changed
+        }
+
+    def stop(self):
+        """
+        Ask run() to shut down. Safe to call from any thread or from the loop.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+
+    def publish_event(self, event_name, event_data):
+        """
+        Queue an event for dispatch on the loop. Called by the monitors from
+        executor threads, as they would call EventManager.publish_event().
+        """
+        self.loop.call_soon_threadsafe(self.events.put_nowait, (event_name, event_data))
+
+    async def call(self, function, *args):
+        """
+        Run a blocking function in the executor and await its result.
+        """
+        return await self.loop.run_in_executor(self.executor, functools.partial(function, *args))
+
+    async def run(self):
+        """
+        Run until stop() is called, then shut down.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        self.events = asyncio.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        self.scheduler = LoopTimerScheduler(self.loop, self.executor, f"{self.name}_scheduler")
+        self.access_points = {spec["name"]: AsyncAccessPoint(spec, self) for spec in self.access_point_specs}
+
+        dispatcher = asyncio.create_task(self._dispatch_events())
+        for access_point in self.access_points.values():
+            access_point.start()
+        self.logger.info(f"Async runtime started for {', '.join(self.access_points)}")
+
+        try:
+            await self.stop_event.wait()
+        finally:
+            await self._shutdown(dispatcher)
+
+    async def _shutdown(self, dispatcher):
+        for access_point in self.access_points.values():
+            access_point.stop()
+        dispatcher.cancel()
+        await asyncio.gather(dispatcher, return_exceptions=True)
+        for access_point in self.access_points.values():
+            await self._stop_add_member_mode(access_point)
+        await self.scheduler.stop()
+        # Waits for hardware calls still running in the executor, such as an
+        # unlock, so nothing can reopen a door once it is relocked below
+        self.executor.shutdown(wait=True)
+        for access_point in self.access_points.values():
+            try:
+                access_point.door_actuator.lock_door()
+            except Exception as e:
+                access_point.logger.error(f"Error relocking door on shutdown: {e}")
+        self.logger.info("Async runtime stopped")
+
+    async def _dispatch_events(self):
+        while True:
+            event_name, event_data = await self.events.get()
+            handler = self.handlers.get(event_name)
+            if handler is None:
+                continue
+            try:
+                await handler(self.access_points[event_data["access_point"]], event_data)
+            except Exception as e:
+                self.logger.error(f"Error handling {event_name}: {e}")
+
+    async def _on_rfid_scanned(self, access_point, event_data):
+        obf_id = event_data["obf_rfid"]
+        # Scans at a door in Add Member mode belong to the sponsor/guest workflow
+        if access_point.add_member_task is not None:
+            access_point.add_member_scans.put_nowait(obf_id)
+            return
+
+        access_point.logger.info(f"RFID scanned: {obf_id}")
+        granted = self.access_control.validate_access(obf_id, access_point.name)
+        attempt = {"obf_rfid": obf_id, "access_point": access_point.name, "result": "granted" if granted else "denied"}
+        try:
+            if granted:
+                access_point.logger.info("Access authorized")
+                await self.call(access_point.door_actuator.unlock_door)
+            else:
+                access_point.logger.info("Access not authorized")
+        except Exception:
+            # The attempt is recorded even when the door wouldn't open
+            attempt["reason"] = "unlock_failed"
+            raise
+        finally:
+            if self.access_log is not None:
+                # Only buffers the attempt
+                self.access_log.log_access_attempt(attempt)
+
+    async def _on_door_state_changed(self, access_point, event_data):
+        access_point.logger.info(f"Door State Updated: {event_data['state']}")
+        # Someone is at the door, poll the reader quickly
+        access_point.rfid_monitor.notify_activity()
+
+    async def _on_mode_state_changed(self, access_point, event_data):
+        mode_state = event_data["state"].lower()
+        if mode_state == "active":
+            if access_point.add_member_task is None:
+                access_point.add_member_scans = asyncio.Queue()
+                access_point.add_member_workflow.reset()
+                access_point.add_member_task = asyncio.create_task(self._add_member_mode(access_point))
+                access_point.logger.info("Add Member Mode started")
+        elif mode_state == "inactive":
+            if await self._stop_add_member_mode(access_point):
+                access_point.logger.info("Add Member mode stopped")
+        else:
+            access_point.logger.warning("Unknown mode state")
+
+    async def _stop_add_member_mode(self, access_point):
+        task = access_point.add_member_task
+        if task is None:
+            return False
+        access_point.add_member_task = None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return True
+
+    async def _add_member_mode(self, access_point):
+        """
+        Feed the door's scans to its AddMemberWorkflow until cancelled.
+        """
+        while True:
+            obf_id = await access_point.add_member_scans.get()
+            try:
+                await self.call(access_point.add_member_workflow.handle_scan, obf_id)
+            except Exception as e:
+                access_point.logger.error(f"Error in Add Member mode: {e}")
+
+    def stats(self):
+        return {name: access_point.stats() for name, access_point in self.access_points.items()}
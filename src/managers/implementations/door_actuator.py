@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+
+class DoorActuator:
+    """
+    Unlocks a door latch for a period without a thread per unlock.
+
+    Unlocks are driven by a shared TimerScheduler:
+    - The first authorization unlocks the latch and schedules one relock timer.
+    - Further authorizations while the door is unlocked only push the relock
+      deadline out; they don't touch the latch or add timers.
+    - When the timer fires before the (extended) deadline it re-arms itself
+      for the deadline, so each unlock period ends with exactly one relock.
+
+    All latch writes happen under one lock, so concurrent callers can never
+    interleave set_status() calls.
+
+    A relock that fails (set_status() raises) is logged and retried every
+    relock_retry_interval seconds until it succeeds, so a latch error never
+    leaves the door unlocked.
+
+    Configuration:
+    - door_latch: ToggleOperatorInterface controlling the latch ('active' unlocks).
+    - scheduler: A started TimerScheduler.
+    - name: Logger name (default "DoorActuator").
+    - unlock_duration: Seconds the door stays unlocked after an authorization (default 7).
+    - relock_retry_interval: Seconds between attempts to relock after a failure (default 0.5).
+    """
+    def __init__(self, config):
+        self.door_latch = config.get("door_latch")
+        self.scheduler = config.get("scheduler")
+        if self.door_latch is None or self.scheduler is None:
+            raise ValueError("door_latch and scheduler must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "DoorActuator"))
+        self.unlock_duration = config.get("unlock_duration", 7)
+        self.relock_retry_interval = config.get("relock_retry_interval", 0.5)
+
+        self.lock = threading.Lock()
+        self.unlocked = False
+        self.deadline = 0
+        self.timer = None
+
+        # Counters
+        self.unlocks = 0
+        self.extensions = 0
+        self.relocks = 0
+        self.relock_failures = 0
+
+    def unlock_door(self, duration=None):
+        """
+        Unlock the door, or keep it unlocked, for duration seconds from now.
+        Returns immediately.
+        """
+        deadline = time.monotonic() + (self.unlock_duration if duration is None else duration)
+        with self.lock:
+            if self.unlocked:
+                self.deadline = max(self.deadline, deadline)
+                self.extensions += 1
+                self.logger.debug("Door unlock extended")
+                return
+            self.door_latch.set_status("active")
+            self.unlocked = True
+            self.deadline = deadline
+            self.unlocks += 1
+            self.timer = self.scheduler.call_at(deadline, self._on_timer)
+        self.logger.info("Door unlocked")
+
+    def lock_door(self):
+        """
+        Relock the door now if it is unlocked.
+        Raises the latch's error if the relock fails; it is retried in the background.
+        """
+        with self.lock:
+            if not self._relock():
+                return
+        self.logger.info("Door locked")
+
+    def _relock(self):
+        # Caller holds self.lock
+        if not self.unlocked:
+            return False
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        try:
+            self.door_latch.set_status("inactive")
+        except Exception as e:
+            self.relock_failures += 1
+            self.logger.error(f"Error relocking door, retrying in {self.relock_retry_interval} s: {e}")
+            self.timer = self.scheduler.call_later(self.relock_retry_interval, self._on_timer)
+            raise
+        self.unlocked = False
+        self.relocks += 1
+        return True
+
+    def _on_timer(self):
+        with self.lock:
+            if not self.unlocked:
+                return
+            if time.monotonic() < self.deadline:
+                # Extended since this timer was scheduled
+                self.timer = self.scheduler.call_at(self.deadline, self._on_timer)
+                return
+            try:
+                self._relock()
+            except Exception:
+                # Logged and retried by _relock()
+                return
+        self.logger.info("Door locked")
+
+    def is_unlocked(self):
+        with self.lock:
+            return self.unlocked
+
+    def stats(self):
+        with self.lock:
+            return {
+                "unlocks": self.unlocks,
+                "extensions": self.extensions,
+                "relocks": self.relocks,
+                "relock_failures": self.relock_failures,
+                "unlocked": self.unlocked
+            }
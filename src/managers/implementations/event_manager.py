@@ -0,0 +1,83 @@
+import logging
+import threading
+
+from ..interfaces.event_manager_interface import EventManagerInterface
+from ...utils.threading_event_queue import EventQueue
+
+class EventManager(EventManagerInterface):
+    """
+    A thread-safe publish/subscribe dispatcher for ADA events.
+
+    Any thread can publish; events are queued on a bounded EventQueue and
+    delivered, in publish order, by whichever single thread runs dispatch()
+    or run(). The dispatching thread sleeps until an event is published, so
+    there is no polling interval between a hardware event and its handler.
+
+    Subscribers are called with the event data dict. An exception raised by
+    one subscriber is logged and does not prevent delivery to the others.
+
+    When the queue is full an event is dropped, by default the oldest one
+    queued, and a warning is logged either way.
+
+    Configuration (all optional):
+    - name: Logger name (default "EventManager").
+    - max_queued_events: Bound on undelivered events (default 256).
+    - overflow_policy: "drop_oldest" (default) or "drop_newest", see EventQueue.
+    """
+    def __init__(self, config=None):
+        config = config or {}
+        self.logger = logging.getLogger(config.get("name", "EventManager"))
+        self.event_queue = EventQueue(
+            maxsize=config.get("max_queued_events", 256),
+            overflow_policy=config.get("overflow_policy", "drop_oldest")
+        )
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    def publish_event(self, event_name, event_data):
+        dropped = self.event_queue.dropped
+        if not self.event_queue.put((event_name, event_data)):
+            self.logger.warning(f"Event queue full, dropped {event_name}")
+        elif self.event_queue.dropped != dropped:
+            self.logger.warning(f"Event queue full, dropped the oldest event to queue {event_name}")
+
+    def subscribe_to_event(self, event_name, callback):
+        with self.lock:
+            # Copy on write so dispatch can iterate without holding the lock
+            self.subscribers[event_name] = self.subscribers.get(event_name, ()) + (callback,)
+
+    def unsubscribe_from_event(self, event_name, callback):
+        with self.lock:
+            callbacks = list(self.subscribers.get(event_name, ()))
+            if callback in callbacks:
+                callbacks.remove(callback)
+                self.subscribers[event_name] = tuple(callbacks)
+
+    def dispatch(self, timeout=None):
+        """
+        Wait for the next event and deliver it to its subscribers.
+        :param timeout: Seconds to wait, or None to wait forever.
+        :return: True if an event was dispatched, False if the timeout expired.
+        """
+        event = self.event_queue.get(timeout=timeout)
+        if event is None:
+            return False
+
+        event_name, event_data = event
+        for callback in self.subscribers.get(event_name, ()):
+            try:
+                callback(event_data)
+            except Exception as e:
+                self.logger.error(f"Error handling {event_name}: {e}")
+        return True
+
+    def run(self, stop_event, timeout=1):
+        """
+        Dispatch events until stop_event is set.
+        :param timeout: How often to check stop_event while idle.
+        """
+        while not stop_event.is_set():
+            self.dispatch(timeout=timeout)
+
+    def stats(self):
+        return self.event_queue.stats()
@@ -0,0 +1,186 @@
+import heapq
+import logging
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from ...utils.access_schedule import access_schedule_cache
+
+UTC = ZoneInfo("UTC")
+
+class GuestExpirySweeper:
+    """
+    Marks active guests inactive once the last occurrence of their
+    access_interval has ended, so lapsed guests stop counting as members.
+
+    Active guests are kept in a heap ordered by when their final occurrence
+    ends (AccessSchedule.final_end()); guests whose interval repeats forever
+    are never due. A sweep pops the due guests, rechecks each against the
+    database and deactivates them with one bulk_update_members() call. The
+    update only applies to guests whose record still holds the
+    access_interval that was checked, so a guest renewed in between stays
+    active. The heap is built from database.find_members() and kept current through
+    database.add_change_listener(). A guest whose interval changed is
+    re-queued under its new end; its old heap entry is skipped when popped.
+
+    Sweeps run on the sweeper's own thread, off the door decision path, each
+    handling at most batch_size guests. A full batch is followed by the next
+    one after batch_pause seconds so a backlog drains in bounded steps;
+    otherwise the thread sleeps for sweep_interval.
+
+    Configuration:
+    - database: The DatabaseInterface implementation holding member records.
+    - name: Logger name (default "GuestExpirySweeper").
+    - time_zone: IANA time zone for access intervals, defaults to SCANNER_TIME_ZONE or UTC.
+    - sweep_interval: Seconds between sweeps (default 3600).
+    - batch_size: Most guests deactivated per sweep (default 500).
+    - batch_pause: Seconds between sweeps while a backlog remains (default 1).
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        if self.database is None:
+            raise ValueError("database must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "GuestExpirySweeper"))
+        self.time_zone = config.get("time_zone")
+        self.sweep_interval = config.get("sweep_interval", 3600)
+        self.batch_size = config.get("batch_size", 500)
+        self.batch_pause = config.get("batch_pause", 1)
+        self.heap = []       # (final end timestamp, obf_rfid)
+        self.deadlines = {}  # obf_rfid: final end timestamp of its live heap entry
+        self.swept = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """
+        Start sweeping on a background thread, which first queues the active guests.
+        """
+        self.database.add_change_listener(self._on_member_changed)
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="GuestExpirySweeper", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        self.database.remove_change_listener(self._on_member_changed)
+
+    def rebuild(self):
+        """
+        Queue every active guest in the database by expiry.
+        :return: The number of guests queued.
+        """
+        guests = self.database.find_members({"member_level": "guest", "membership_status": "active"})
+        heap = []
+        deadlines = {}
+        for member_info in guests:
+            deadline = self._deadline(member_info)
+            if deadline is not None:
+                deadlines[member_info["obf_rfid"]] = deadline
+                heap.append((deadline, member_info["obf_rfid"]))
+        heapq.heapify(heap)
+        with self.lock:
+            # Keep guests queued by change notifications that arrived meanwhile
+            deadlines.update(self.deadlines)
+            heap.extend((deadline, obf_rfid) for obf_rfid, deadline in self.deadlines.items())
+            heapq.heapify(heap)
+            self.heap = heap
+            self.deadlines = deadlines
+        self.logger.info(f"Queued {len(deadlines)} expiring guests")
+        return len(deadlines)
+
+    def sweep(self, now=None):
+        """
+        Deactivate up to batch_size guests whose access has ended by now.
+        :param now: Timezone aware datetime, defaults to the current time.
+        :return: The number of guests deactivated.
+        """
+        now = (now or datetime.now(UTC)).timestamp()
+        due = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now and len(due) < self.batch_size:
+                deadline, obf_rfid = heapq.heappop(self.heap)
+                # Skip entries superseded by a later change to the guest
+                if self.deadlines.get(obf_rfid) == deadline:
+                    del self.deadlines[obf_rfid]
+                    due.append(obf_rfid)
+
+        updates = []
+        expected = {}
+        for obf_rfid in due:
+            member_info = self.database.get_member({"obf_rfid": obf_rfid})
+            if member_info is None or not self._is_active_guest(member_info):
+                continue
+            deadline = self._deadline(member_info)
+            if deadline is None or deadline > now:
+                self._queue(obf_rfid, deadline)
+                continue
+            updates.append({"obf_rfid": obf_rfid, "membership_status": "inactive"})
+            expected[obf_rfid] = {
+                "member_level": "guest",
+                "membership_status": "active",
+                "access_interval": member_info.get("access_interval")
+            }
+
+        if not updates:
+            return 0
+        try:
+            # Guests changed since they were read are skipped; the change requeued them
+            count = self.database.bulk_update_members(updates, expected)
+        except Exception as e:
+            self.logger.error(f"Error deactivating {len(updates)} lapsed guests: {e}")
+            for update in updates:
+                self._queue(update["obf_rfid"], now)
+            return 0
+        self.swept += count
+        self.logger.info(f"Deactivated {count} lapsed guests")
+        return count
+
+    def stats(self):
+        with self.lock:
+            return {"queued": len(self.deadlines), "swept": self.swept}
+
+    def _run(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            self.logger.error(f"Error queueing expiring guests: {e}")
+        delay = self.sweep_interval
+        while not self.stop_event.wait(delay):
+            try:
+                full_batch = self.sweep() >= self.batch_size
+            except Exception as e:
+                self.logger.error(f"Error sweeping lapsed guests: {e}")
+                full_batch = False
+            delay = self.batch_pause if full_batch else self.sweep_interval
+
+    def _on_member_changed(self, obf_rfid, member_info):
+        if member_info is None or not self._is_active_guest(member_info):
+            return
+        self._queue(obf_rfid, self._deadline(member_info))
+
+    def _queue(self, obf_rfid, deadline):
+        if deadline is None:
+            return
+        with self.lock:
+            if self.deadlines.get(obf_rfid) != deadline:
+                self.deadlines[obf_rfid] = deadline
+                heapq.heappush(self.heap, (deadline, obf_rfid))
+
+    @staticmethod
+    def _is_active_guest(member_info):
+        return member_info.get("member_level") == "guest" and member_info.get("membership_status") == "active"
+
+    def _deadline(self, member_info):
+        """
+        Return the timestamp the guest's final occurrence ends, or None if
+        their access never ends or can't be read.
+        """
+        try:
+            final_end = access_schedule_cache.get(member_info.get("access_interval"), self.time_zone).final_end()
+        except (TypeError, ValueError):
+            return None
+        return final_end.timestamp() if final_end is not None else None
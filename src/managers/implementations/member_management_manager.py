@@ -0,0 +1,94 @@
+import logging
+
+from ..interfaces.member_management_manager_interface import MemberManagementManagerInterface
+
+class MemberManagementManager(MemberManagementManagerInterface):
+    """
+    Member administration on top of a DatabaseInterface.
+
+    Deactivating a member, through change_member_status() or
+    update_member_details(), also deactivates the active guests they
+    sponsored. The guests are found with database.find_members(), which the
+    JSON and SQLite databases answer from their member_sponsor index, and
+    deactivated with one bulk update. Their member_sponsor links are kept,
+    so the guests can be traced back to the sponsor. The sponsor's change
+    stands even if deactivating their guests fails; the failure is logged.
+
+    Methods report failures as False (or None for queries) and log them, as
+    MemberManagementManagerInterface specifies.
+
+    Configuration:
+    - database: The DatabaseInterface implementation holding member records.
+    - name: Logger name (default "MemberManagementManager").
+    - cascade_deactivation: Deactivate a deactivated member's guests (default True).
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        if self.database is None:
+            raise ValueError("database must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "MemberManagementManager"))
+        self.cascade_deactivation = config.get("cascade_deactivation", True)
+
+    def add_new_member(self, member_data):
+        try:
+            self.database.add_member(dict(member_data))
+            return True
+        except (KeyError, ValueError) as e:
+            self.logger.error(f"Member not added: {e}")
+            return False
+
+    def update_member_details(self, member_id, updates):
+        try:
+            self.database.update_member({**updates, "obf_rfid": member_id})
+        except (KeyError, ValueError) as e:
+            self.logger.error(f"Member {member_id} not updated: {e}")
+            return False
+        if self.cascade_deactivation and updates.get("membership_status") == "inactive":
+            self.deactivate_sponsored_guests(member_id)
+        return True
+
+    def change_member_status(self, member_id, new_status):
+        return self.update_member_details(member_id, {"membership_status": new_status})
+
+    def adjust_member_access_level(self, member_id, new_level):
+        return self.update_member_details(member_id, {"member_level": new_level})
+
+    def list_members_by_status(self, status):
+        return self.database.find_members({"membership_status": status}) or None
+
+    def list_sponsored_guests(self, sponsor_id):
+        """
+        Return the guests sponsored by sponsor_id, or None if there are none.
+        """
+        return self.database.find_members({"member_sponsor": sponsor_id, "member_level": "guest"}) or None
+
+    def deactivate_sponsored_guests(self, sponsor_id):
+        """
+        Deactivate every active guest sponsored by sponsor_id.
+        :return: The number of guests deactivated, 0 if that failed.
+        """
+        guests = self.database.find_members({
+            "member_sponsor": sponsor_id,
+            "member_level": "guest",
+            "membership_status": "active"
+        })
+        if not guests:
+            return 0
+        try:
+            count = self.database.bulk_update_members(
+                {"obf_rfid": guest["obf_rfid"], "membership_status": "inactive"} for guest in guests
+            )
+        except (KeyError, ValueError) as e:
+            self.logger.error(f"Guests sponsored by {sponsor_id} not deactivated: {e}")
+            return 0
+        self.logger.info(f"Deactivated {count} guests sponsored by {sponsor_id}")
+        return count
+
+    def renew_member_membership(self, member_id, renewal_terms):
+        """
+        Reactivate a member, with a new access_interval if renewal_terms has one.
+        """
+        updates = {"membership_status": "active"}
+        if "access_interval" in renewal_terms:
+            updates["access_interval"] = renewal_terms["access_interval"]
+        return self.update_member_details(member_id, updates)
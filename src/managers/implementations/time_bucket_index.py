@@ -0,0 +1,265 @@
+import logging
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from .access_control_manager import SCHEDULED, compile_member
+
+UTC = ZoneInfo("UTC")
+
+class TimeBucketIndex:
+    """
+    A rolling "who can enter when" index for members with scheduled access
+    (guests and philanthropists).
+
+    Time is split into fixed buckets (5 minutes by default) over a rolling
+    horizon (a week by default). Each bucket holds a bitset with one bit per
+    indexed member, set when one of the member's access occurrences overlaps
+    the bucket. Members are given dense numbers so the bitsets stay compact,
+    and numbers freed by removed members are reused.
+
+    - is_allowed() tests one bit, then confirms with the member's compiled
+      schedule so bucket edges are exact.
+    - members_allowed_between() ORs the buckets of a time range, e.g. for
+      "who's allowed in tonight".
+    - The index follows the database through its change listeners, updating
+      only the changed member's bits. advance() rolls the window forward and
+      fills the buckets that enter the horizon; a long-lived index is kept
+      current by start(), which advances it from its own thread after each
+      bucket.
+
+    Members with 24/7 access are not indexed. Nothing in ADA uses the index
+    yet: AccessControlManager's compiled schedules already decide a scan in
+    O(1), and a one-off query such as an ada_members.py report costs less as
+    a scan of the member table than as an index built for it. It is meant
+    for a long-lived process answering repeated range queries.
+
+    Configuration:
+    - database: The DatabaseInterface implementation holding member records.
+    - name: Logger name (default "TimeBucketIndex").
+    - bucket_minutes: Bucket width in minutes (default 5).
+    - horizon_days: Days covered by the rolling window (default 7).
+    - time_zone: IANA time zone for access intervals, defaults to SCANNER_TIME_ZONE or UTC.
+    - start: Timezone aware start of the window (default now).
+    """
+    def __init__(self, config):
+        self.database = config.get("database")
+        if self.database is None:
+            raise ValueError("database must be provided in the config")
+        self.logger = logging.getLogger(config.get("name", "TimeBucketIndex"))
+        self.bucket_seconds = int(config.get("bucket_minutes", 5) * 60)
+        if self.bucket_seconds <= 0:
+            raise ValueError("bucket_minutes must be at least a second")
+        self.bucket_count = int(config.get("horizon_days", 7) * 86400 // self.bucket_seconds)
+        self.time_zone = config.get("time_zone")
+        if self.bucket_count <= 0:
+            raise ValueError("horizon_days must be positive")
+
+        self.lock = threading.RLock()
+        self.first_bucket = 0
+        self.capacity = 0
+        self.buckets = []           # Ring of bytearray bitsets, bucket b lives at b % bucket_count
+        self.member_numbers = {}    # obf_rfid -> dense member number
+        self.member_ids = []        # dense member number -> obf_rfid, None when free
+        self.schedules = []         # dense member number -> compiled AccessSchedule
+        self.free_numbers = []
+        self.stop_event = threading.Event()
+        self.thread = None
+
+        self.database.add_change_listener(self._on_member_changed)
+        self.refresh(config.get("start"))
+
+    def start(self):
+        """
+        Advance the window on a background thread as time passes.
+        """
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="TimeBucketIndex", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def close(self):
+        self.stop()
+        self.database.remove_change_listener(self._on_member_changed)
+
+    def _run(self):
+        while not self.stop_event.wait(self.bucket_seconds - datetime.now(UTC).timestamp() % self.bucket_seconds):
+            try:
+                self.advance()
+            except Exception as e:
+                self.logger.error(f"Error advancing time bucket index: {e}")
+
+    def _bucket(self, moment):
+        return int(moment.timestamp()) // self.bucket_seconds
+
+    def _bucket_start(self, bucket):
+        return datetime.fromtimestamp(bucket * self.bucket_seconds, UTC)
+
+    def refresh(self, now=None):
+        """
+        Rebuild the index from every member in the database, with the window
+        starting at the bucket containing now.
+        :return: The number of members indexed.
+        """
+        with self.lock:
+            self.first_bucket = self._bucket(now or datetime.now(UTC))
+            self.capacity = 0
+            self.buckets = [bytearray() for _ in range(self.bucket_count)]
+            self.member_numbers = {}
+            self.member_ids = []
+            self.schedules = []
+            self.free_numbers = []
+            for member_info in self.database.iter_members():
+                self._index_member(member_info["obf_rfid"], member_info)
+            indexed = len(self.member_numbers)
+        self.logger.info(f"Time bucket index built for {indexed} scheduled members")
+        return indexed
+
+    def advance(self, now=None):
+        """
+        Roll the window forward so it starts at the bucket containing now,
+        filling the buckets that enter the horizon.
+        """
+        with self.lock:
+            new_first = self._bucket(now or datetime.now(UTC))
+            if new_first <= self.first_bucket:
+                return
+            if new_first - self.first_bucket >= self.bucket_count:
+                self.refresh(now)
+                return
+
+            old_end = self.first_bucket + self.bucket_count
+            self.first_bucket = new_first
+            for bucket in range(old_end, new_first + self.bucket_count):
+                self.buckets[bucket % self.bucket_count] = bytearray(self.capacity // 8)
+            for number, schedule in enumerate(self.schedules):
+                if schedule is not None:
+                    self._mark(number, schedule, old_end, new_first + self.bucket_count, True)
+
+    def _on_member_changed(self, obf_rfid, member_info):
+        with self.lock:
+            self._unindex_member(obf_rfid)
+            if member_info is not None:
+                self._index_member(obf_rfid, member_info)
+
+    def _index_member(self, obf_rfid, member_info):
+        verdict, _ = compile_member(member_info, self.time_zone)
+        if verdict.access != SCHEDULED:
+            return
+
+        if self.free_numbers:
+            number = self.free_numbers.pop()
+            self.member_ids[number] = obf_rfid
+            self.schedules[number] = verdict.schedule
+        else:
+            number = len(self.member_ids)
+            self.member_ids.append(obf_rfid)
+            self.schedules.append(verdict.schedule)
+            if number >= self.capacity:
+                self._grow()
+        self.member_numbers[obf_rfid] = number
+        self._mark(number, verdict.schedule, self.first_bucket, self.first_bucket + self.bucket_count, True)
+
+    def _unindex_member(self, obf_rfid):
+        number = self.member_numbers.pop(obf_rfid, None)
+        if number is None:
+            return
+        self._mark(number, self.schedules[number], self.first_bucket, self.first_bucket + self.bucket_count, False)
+        self.member_ids[number] = None
+        self.schedules[number] = None
+        self.free_numbers.append(number)
+
+    def _grow(self):
+        extra = max(self.capacity, 64)
+        for bitset in self.buckets:
+            bitset.extend(bytes(extra // 8))
+        self.capacity += extra
+
+    def _mark(self, number, schedule, first_bucket, end_bucket, value):
+        """
+        Set (or clear) the member's bit in every bucket in [first_bucket,
+        end_bucket) overlapped by one of the schedule's occurrences.
+        """
+        byte_index, mask = number >> 3, 1 << (number & 7)
+        window_start = self._bucket_start(first_bucket)
+        window_end = self._bucket_start(end_bucket)
+
+        # Start from the earliest occurrence that can still overlap the window
+        latest = schedule.occurrence_start(window_start)
+        index = 0 if latest is None else (latest - schedule.start) // schedule.period
+        span = (schedule.start + schedule.duration) - schedule.start
+        index = max(0, index - span // schedule.period)
+
+        while schedule.count is None or index < schedule.count:
+            occurrence_start = schedule.start + index * schedule.period
+            if occurrence_start >= window_end:
+                break
+            occurrence_end = occurrence_start + schedule.duration
+            if occurrence_end >= window_start:
+                first = max(self._bucket(occurrence_start), first_bucket)
+                last = min(self._bucket(occurrence_end), end_bucket - 1)
+                for bucket in range(first, last + 1):
+                    bitset = self.buckets[bucket % self.bucket_count]
+                    if value:
+                        bitset[byte_index] |= mask
+                    else:
+                        bitset[byte_index] &= ~mask
+            index += 1
+
+    def is_allowed(self, obf_rfid, moment=None):
+        """
+        Check if an indexed member is allowed in at the timezone aware moment.
+        Moments outside the window fall back to the member's schedule.
+        """
+        moment = moment or datetime.now(UTC)
+        with self.lock:
+            number = self.member_numbers.get(obf_rfid)
+            if number is None:
+                return False
+            schedule = self.schedules[number]
+            bucket = self._bucket(moment)
+            if self.first_bucket <= bucket < self.first_bucket + self.bucket_count:
+                if not self.buckets[bucket % self.bucket_count][number >> 3] & (1 << (number & 7)):
+                    return False
+        return schedule.contains(moment)
+
+    def _allowed_bits(self, start, end):
+        first = max(self._bucket(start), self.first_bucket)
+        last = min(self._bucket(end), self.first_bucket + self.bucket_count - 1)
+        combined = 0
+        for bucket in range(first, last + 1):
+            combined |= int.from_bytes(self.buckets[bucket % self.bucket_count], "little")
+        return combined
+
+    def members_allowed_between(self, start, end):
+        """
+        Return the obf_rfids of indexed members with access at any time
+        between the timezone aware start and end, at bucket resolution.
+        The range is clipped to the index window.
+        """
+        with self.lock:
+            combined = self._allowed_bits(start, end)
+            allowed = []
+            while combined:
+                low_bit = combined & -combined
+                allowed.append(self.member_ids[low_bit.bit_length() - 1])
+                combined ^= low_bit
+        return allowed
+
+    def count_allowed_between(self, start, end):
+        with self.lock:
+            return self._allowed_bits(start, end).bit_count()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "members": len(self.member_numbers),
+                "buckets": self.bucket_count,
+                "bucket_seconds": self.bucket_seconds,
+                "bytes": self.bucket_count * self.capacity // 8
+            }
@@ -6,4 +6,33 @@ member_schema = {
     "member_sponsor": str,      # member who sponsored this member (their obfuscated RFID)
     "created": str,             # Read only, should be set by the DB (follows ISO 8601 timestamp format)
     "last_updated": str         # Read only, should be set by the DB (follows ISO 8601 timestamp format)
-}
\ No newline at end of file
+}
+
+# Set by the database on every write, not accepted from callers
+READ_ONLY_FIELDS = ("created", "last_updated")
+
+def member_schema_errors(member_info, partial=False):
+    """
+    Check a member record against member_schema.
+    :param member_info: The member record to check.
+    :param partial: Only check the fields present, as in an update. obf_rfid
+                    is always required.
+    :return: A list of problems, empty if the record is valid.
+    """
+    if not isinstance(member_info, dict):
+        return ["not a member record"]
+    errors = []
+    if not member_info.get("obf_rfid"):
+        errors.append("obf_rfid is required")
+    for key, expected_type in member_schema.items():
+        if key in READ_ONLY_FIELDS:
+            continue
+        if key not in member_info:
+            if not partial:
+                errors.append(f"{key} is missing")
+        elif not isinstance(member_info[key], expected_type):
+            errors.append(f"{key} must be {expected_type.__name__}")
+    unknown = [key for key in member_info if key not in member_schema]
+    if unknown:
+        errors.append(f"unknown fields {', '.join(map(str, unknown))}")
+    return errors
@@ -0,0 +1,75 @@
+import json
+
+# Device sections of an access point and whether they are required
+DEVICE_SECTIONS = {
+    "reader": True,
+    "latch": True,
+    "reed_switch": False,
+    "mode_switch": False
+}
+
+# Monitor section for each device that is watched for changes
+MONITOR_SECTIONS = {
+    "reader": "rfid_monitor",
+    "reed_switch": "door_monitor",
+    "mode_switch": "mode_monitor"
+}
+
+def normalize_access_point(spec):
+    """
+    Validate one access point description and fill in defaults.
+
+    An access point has a unique "name", a "reader" and a "latch", and
+    optionally a "reed_switch" and a "mode_switch". Each device section is the
+    config dict for that device; its "name" defaults to "<access point>_<section>".
+    Each watched device can have a monitor section ("rfid_monitor",
+    "door_monitor", "mode_monitor") with the monitor's config. "unlock_duration"
+    (seconds) and "allowed_levels" (member levels admitted, default all) are
+    optional.
+    :raises ValueError: if the description is incomplete.
+    """
+    name = spec.get("name")
+    if not name:
+        raise ValueError("Each access point needs a name")
+
+    access_point = dict(spec)
+    for section, required in DEVICE_SECTIONS.items():
+        device = access_point.get(section)
+        if device is None:
+            if required:
+                raise ValueError(f"Access point {name} needs a {section} section")
+            continue
+        if not isinstance(device, dict):
+            raise ValueError(f"Access point {name} {section} section must be an object")
+        access_point[section] = {"name": f"{name}_{section}", **device}
+
+        monitor = MONITOR_SECTIONS.get(section)
+        if monitor:
+            access_point[monitor] = {"name": f"{name}_{monitor}", **access_point.get(monitor, {})}
+
+    access_point.setdefault("unlock_duration", 7)
+    access_point.setdefault("allowed_levels", None)
+    return access_point
+
+def load_access_points(filepath):
+    """
+    Load access point descriptions from a JSON file of the form
+    {"access_points": [{"name": "front_door", "reader": {...}, "latch": {...}}, ...]}.
+    :return: A list of normalized access point dicts.
+    :raises ValueError: if the file is invalid or names are not unique.
+    """
+    with open(filepath, "r") as file:
+        try:
+            data = json.load(file)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid access point config {filepath}: {e}")
+
+    access_points = [normalize_access_point(spec) for spec in data.get("access_points", [])]
+    if not access_points:
+        raise ValueError(f"No access points defined in {filepath}")
+
+    names = [access_point["name"] for access_point in access_points]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate access point names: {', '.join(duplicates)}")
+    return access_points
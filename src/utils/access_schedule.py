@@ -0,0 +1,166 @@
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+UTC = ZoneInfo("UTC")
+INTERVAL_PATTERN = re.compile(r"R(\d*)/(.*?)/(P.*)")
+# Day and time durations (e.g. PT9H, P1DT30M), parsed without isodate
+DURATION_PATTERN = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?")
+
+class AccessSchedule(NamedTuple):
+    """
+    An access_interval string compiled into plain datetime arithmetic.
+
+    Occurrences start at start + n * period for n in [0, count) (count of
+    None repeats forever) and last for duration. Membership checks are O(1)
+    regardless of how long ago the schedule started.
+    """
+    start: object
+    period: timedelta
+    duration: object
+    count: Optional[int]
+
+    def occurrence_start(self, moment):
+        """
+        Return the start of the latest occurrence at or before moment, or
+        None if the schedule has not started yet.
+        """
+        elapsed = moment - self.start
+        if elapsed < timedelta(0) or self.count == 0:
+            return None
+        index = elapsed // self.period
+        if self.count is not None and index >= self.count:
+            index = self.count - 1
+        return self.start + index * self.period
+
+    def contains(self, moment):
+        """
+        Check if the timezone aware moment falls within an occurrence.
+        """
+        start = self.occurrence_start(moment)
+        if start is None:
+            return False
+        return start <= moment <= start + self.duration
+
+    def final_end(self):
+        """
+        Return when the last occurrence ends, or None if it repeats forever.
+        """
+        if self.count is None:
+            return None
+        if self.count == 0:
+            return self.start
+        return self.start + (self.count - 1) * self.period + self.duration
+
+def compile_access_interval(interval_str, time_zone=None):
+    """
+    Compile an ISO 8601 repeating interval (R<n>/<start>/<duration>) into an
+    AccessSchedule. The start is interpreted in the scanner's local timezone
+    and repeats daily.
+    :param interval_str: The access_interval string from a member record.
+    :param time_zone: IANA time zone name, defaults to SCANNER_TIME_ZONE or UTC.
+    :raises ValueError: if the interval string cannot be parsed.
+    """
+    match = INTERVAL_PATTERN.match(interval_str or "")
+    if not match:
+        raise ValueError("Invalid interval string format")
+
+    repeat_count, start_str, duration_str = match.groups()
+
+    # If repeat_count is empty, it means infinite repetitions
+    repeat_count = int(repeat_count) if repeat_count else None
+
+    # Parse the start time in the scanner's local timezone and convert to UTC
+    local_tz = ZoneInfo(time_zone or os.getenv("SCANNER_TIME_ZONE", "UTC"))
+    start_time_utc = _parse_start(start_str).replace(tzinfo=local_tz).astimezone(UTC)
+
+    return AccessSchedule(start_time_utc, timedelta(days=1), _parse_duration(duration_str), repeat_count)
+
+def _parse_start(start_str):
+    # dateutil is only imported for forms datetime.fromisoformat() rejects
+    try:
+        return datetime.fromisoformat(start_str)
+    except ValueError:
+        pass
+    from dateutil import parser
+    return parser.isoparse(start_str)
+
+def _parse_duration(duration_str):
+    # isodate is only imported for forms DURATION_PATTERN does not cover,
+    # such as weeks, months and years
+    match = DURATION_PATTERN.fullmatch(duration_str)
+    if match and duration_str not in ("P", "PT") and not duration_str.endswith("T"):
+        days, hours, minutes, seconds = (float(value or 0) for value in match.groups())
+        return timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+    import isodate
+    try:
+        return isodate.parse_duration(duration_str)
+    except isodate.ISO8601Error as e:
+        raise ValueError(f"Invalid interval duration: {e}")
+
+class AccessScheduleCache:
+    """
+    Thread-safe memo of compiled access schedules keyed by interval string and
+    time zone. Entries for an interval string can be invalidated when a member
+    record changes it; the oldest entries are evicted past maxsize.
+    """
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.schedules = {}
+        self.lock = threading.Lock()
+
+    def get(self, interval_str, time_zone=None):
+        """
+        Return the compiled schedule for interval_str, compiling it on first use.
+        :raises ValueError: if the interval string cannot be parsed.
+        """
+        key = (interval_str, time_zone or os.getenv("SCANNER_TIME_ZONE", "UTC"))
+        schedule = self.schedules.get(key)
+        if schedule is None:
+            schedule = compile_access_interval(interval_str, key[1])
+            with self.lock:
+                if len(self.schedules) >= self.maxsize:
+                    self.schedules.pop(next(iter(self.schedules)))
+                self.schedules[key] = schedule
+        return schedule
+
+    def preload(self, schedules):
+        """
+        Add already compiled schedules, e.g. from a warm-start snapshot.
+        :param schedules: {(interval_str, time_zone): AccessSchedule}
+        """
+        with self.lock:
+            for key, schedule in schedules.items():
+                if len(self.schedules) >= self.maxsize:
+                    break
+                self.schedules[key] = schedule
+
+    def invalidate(self, interval_str):
+        """
+        Drop every compiled schedule for interval_str.
+        """
+        with self.lock:
+            for key in [key for key in self.schedules if key[0] == interval_str]:
+                del self.schedules[key]
+
+    def invalidate_many(self, interval_strs):
+        """
+        Drop every compiled schedule for any of interval_strs in one pass.
+        """
+        interval_strs = set(interval_strs)
+        if not interval_strs:
+            return
+        with self.lock:
+            for key in [key for key in self.schedules if key[0] in interval_strs]:
+                del self.schedules[key]
+
+    def clear(self):
+        with self.lock:
+            self.schedules.clear()
+
+# Shared cache used by the access decision path and invalidated by the databases
+access_schedule_cache = AccessScheduleCache()
@@ -0,0 +1,48 @@
+import time
+
+class AdaptivePollingScheduler:
+    """
+    Chooses how long a polling loop should sleep before its next read.
+
+    While there has been activity within active_window seconds (a card was
+    read, or the caller reported activity such as the door opening) the loop
+    polls every fast_interval seconds. Once idle, the interval grows by
+    backoff_factor on each poll until it reaches max_interval.
+
+    Example:
+    scheduler = AdaptivePollingScheduler(fast_interval=0.05, max_interval=5)
+    while running:
+        if read_something():
+            scheduler.record_activity()
+        time.sleep(scheduler.next_interval())
+    """
+    def __init__(self, fast_interval=0.05, max_interval=5, backoff_factor=2, active_window=10):
+        if fast_interval <= 0 or max_interval < fast_interval:
+            raise ValueError("Intervals must satisfy 0 < fast_interval <= max_interval")
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1")
+
+        self.fast_interval = fast_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.active_window = active_window
+        self.current_interval = max_interval
+        self.last_activity = None
+
+    def record_activity(self, now=None):
+        self.last_activity = time.monotonic() if now is None else now
+        self.current_interval = self.fast_interval
+
+    def is_active(self, now=None):
+        now = time.monotonic() if now is None else now
+        return self.last_activity is not None and now - self.last_activity <= self.active_window
+
+    def next_interval(self, now=None):
+        """
+        Return the number of seconds to sleep before the next poll.
+        """
+        if self.is_active(now):
+            self.current_interval = self.fast_interval
+        else:
+            self.current_interval = min(self.current_interval * self.backoff_factor, self.max_interval)
+        return self.current_interval
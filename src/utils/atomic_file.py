@@ -0,0 +1,59 @@
+import os
+import tempfile
+from pathlib import Path
+
+def _read_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+# Read once at import, since reading it means briefly changing it for every thread
+UMASK = _read_umask()
+
+def atomic_write(filepath, write_fn, binary=False):
+    """
+    Atomically replace the contents of filepath.
+    write_fn is called with an open temporary file in the same directory. The
+    temporary file is flushed, fsynced and renamed over filepath so readers
+    (and the next boot after a power cut) see either the old or the new file,
+    never a partially written one. The new file keeps the permissions of the
+    one it replaces, or gets the usual umask default if there was none.
+    :param filepath: The file to replace.
+    :param write_fn: Callable that writes the new contents to the file it is given.
+    :param binary: Open the temporary file in binary mode.
+    """
+    filepath = Path(filepath)
+    try:
+        mode = os.stat(filepath).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if binary else "w") as file:
+            write_fn(file)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file readable by its owner only
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    fsync_directory(filepath.parent)
+
+def fsync_directory(directory):
+    """
+    Flush a directory entry so a rename inside it survives a power cut.
+    Not every platform supports opening directories, so failures are ignored.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
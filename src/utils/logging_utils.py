@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import time
 from pathlib import Path
 
@@ -18,25 +21,65 @@ class MillisecondFormatter(logging.Formatter):
         # record.name = record.name.split('.')[-1] # not needed if using ada_interface
         return super(MillisecondFormatter, self).format(record)
 
-def setup_logging(level=None):
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records without blocking.
+    Records that don't fit in the bounded queue are counted and discarded so
+    a slow SD card can never stall the thread that logged them. The inherited
+    prepare() still merges each record's arguments into its message before it
+    is queued, so arguments changed after the call can't alter what is written.
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped_records = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+_queue_handler = None
+_queue_listener = None
+
+def setup_logging(level=None, async_logging=False, log_file=None, max_bytes=0, backup_count=0, queue_size=10000, force=False):
     """
     Sets up logging for the application with an optional log level.
     :param level: The logging level, e.g., logging.DEBUG, logging.INFO, etc.
                   Defaults to logging.INFO if none is provided.
+    :param async_logging: If True, loggers only enqueue records on a bounded queue and
+                  a background thread formats and writes them.
+    :param log_file: Log file path, defaults to logs/ada.log in the project directory.
+    :param max_bytes: Rotate the log file when it reaches this size (0 disables rotation).
+    :param backup_count: Number of rotated log files to keep.
+    :param queue_size: Maximum number of records waiting to be written in async mode.
+    :param force: Replace handlers installed by an earlier setup_logging call.
     """
+    global _queue_handler, _queue_listener
+
     if level is None:
         level = logging.INFO
 
     logger = logging.getLogger()
+    if force:
+        shutdown_logging()
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
     if not logger.handlers:  # Check if handlers already exist
         # Define log file path
-        script_directory = Path(__file__).resolve().parent.parent.parent
-        log_directory = script_directory / "logs"
-        log_directory.mkdir(parents=True, exist_ok=True)
-        log_file_path = log_directory / "ada.log"
+        if log_file is None:
+            script_directory = Path(__file__).resolve().parent.parent.parent
+            log_file = script_directory / "logs" / "ada.log"
+        log_file_path = Path(log_file)
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create file handler
-        file_handler = logging.FileHandler(log_file_path)
+        # Create file handler, rotating by size if requested
+        if max_bytes:
+            file_handler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=max_bytes, backupCount=backup_count)
+        else:
+            file_handler = logging.FileHandler(log_file_path)
         console_handler = logging.StreamHandler()  # For console output
 
         # Create formatter and add it to handlers
@@ -44,9 +87,40 @@ def setup_logging(level=None):
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        # Add handlers to the logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        if async_logging:
+            # Hot threads only enqueue; the listener thread formats and writes
+            log_queue = queue.Queue(maxsize=queue_size)
+            _queue_handler = DroppingQueueHandler(log_queue)
+            _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+            _queue_listener.start()
+            atexit.register(shutdown_logging)
+            logger.addHandler(_queue_handler)
+        else:
+            # Add handlers to the logger
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
 
         # Set the logging level
-        logger.setLevel(level)
\ No newline at end of file
+        logger.setLevel(level)
+
+def shutdown_logging():
+    """
+    Stop the async logging thread after writing every queued record.
+    Safe to call when async logging is not in use.
+    """
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+        # setup_logging registers this again for the next listener
+        atexit.unregister(shutdown_logging)
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+def get_dropped_log_records():
+    """
+    Number of log records discarded because the async logging queue was full.
+    """
+    return _queue_handler.dropped_records if _queue_handler is not None else 0
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+
+from .timer_scheduler import Timer
+
+class LoopTimerScheduler:
+    """
+    A TimerScheduler stand-in that times callbacks on an asyncio event loop
+    and runs them in an executor, so components written for TimerScheduler
+    (ScheduledPoller-driven monitors, DoorActuator) work unchanged under
+    asyncio while their blocking hardware calls stay off the loop.
+
+    call_at() and call_later() take the same time.monotonic() deadlines,
+    return the same cancellable Timer and are safe to call from any thread.
+    Callbacks may run concurrently on different executor threads; the
+    components above each serialize their own callbacks. An exception raised
+    by a callback is logged.
+
+    Usage, on the loop:
+    scheduler = LoopTimerScheduler(asyncio.get_running_loop(), executor)
+    timer = scheduler.call_later(7, relock)
+    await scheduler.stop()
+    """
+    def __init__(self, loop, executor, name="LoopTimerScheduler"):
+        self.loop = loop
+        self.executor = executor
+        self.logger = logging.getLogger(name)
+        self.running = True
+        self.handles = set()  # Loop timer handles not yet fired
+        self.pending = set()  # Callbacks running in the executor
+
+    def call_at(self, deadline, callback):
+        """
+        Run callback() in the executor at the time.monotonic() deadline.
+        :return: A Timer that can be cancelled.
+        """
+        timer = Timer(deadline, callback)
+        self.loop.call_soon_threadsafe(self._schedule, timer)
+        return timer
+
+    def call_later(self, delay, callback):
+        return self.call_at(time.monotonic() + delay, callback)
+
+    async def stop(self):
+        """
+        Discard timers that have not fired and wait for running callbacks.
+        Must be awaited on the loop.
+        """
+        self.running = False
+        for handle in self.handles:
+            handle.cancel()
+        self.handles.clear()
+        if self.pending:
+            await asyncio.gather(*self.pending, return_exceptions=True)
+
+    def _schedule(self, timer):
+        if not self.running or timer.cancelled:
+            return
+        when = self.loop.time() + timer.deadline - time.monotonic()
+        handle = None
+
+        def fire():
+            self.handles.discard(handle)
+            self._fire(timer)
+        handle = self.loop.call_at(when, fire)
+        self.handles.add(handle)
+
+    def _fire(self, timer):
+        if not self.running or timer.cancelled:
+            return
+        future = self.loop.run_in_executor(self.executor, self._run_callback, timer)
+        self.pending.add(future)
+        future.add_done_callback(self.pending.discard)
+
+    def _run_callback(self, timer):
+        if timer.cancelled:
+            return
+        try:
+            timer.callback()
+        except Exception as e:
+            self.logger.error(f"Error in timer callback: {e}")
@@ -0,0 +1,73 @@
+import hmac
+import threading
+from collections import OrderedDict
+
+class ObfuscatedIdHasher:
+    """
+    Computes the HMAC used to obfuscate raw RFID card IDs.
+
+    The keyed inner/outer state is computed once per secret key and each hash
+    starts from a copy of that primed HMAC object instead of re-encoding the key.
+    Recent raw ID -> obfuscated ID results are kept in a bounded LRU cache, so a
+    card sitting in the reader field is hashed once. Rotating the secret key
+    clears the cache.
+
+    Usage:
+    hasher = ObfuscatedIdHasher("secret", cache_size=256)
+    obf_id = hasher.hash_id("123456789")
+    hasher.set_secret_key("new secret")
+    """
+    def __init__(self, secret_key, cache_size=256, digestmod="sha256"):
+        self.cache_size = cache_size
+        self.digestmod = digestmod
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.set_secret_key(secret_key)
+
+    def set_secret_key(self, secret_key):
+        """
+        Replace the secret key and invalidate every cached ID.
+        """
+        primed = hmac.new(secret_key.encode("utf-8"), digestmod=self.digestmod)
+        with self.lock:
+            self.primed_hmac = primed
+            self.cache.clear()
+
+    def hash_id(self, raw_id):
+        """
+        Return the hex HMAC digest of raw_id.
+        """
+        with self.lock:
+            obf_id = self.cache.get(raw_id)
+            if obf_id is not None:
+                self.cache.move_to_end(raw_id)
+                self.hits += 1
+                return obf_id
+            self.misses += 1
+            primed = self.primed_hmac
+            hmac_obj = primed.copy()
+
+        hmac_obj.update(raw_id.encode("utf-8"))
+        obf_id = hmac_obj.hexdigest()
+
+        if self.cache_size:
+            with self.lock:
+                # Don't cache a digest made with a key rotated out meanwhile
+                if primed is not self.primed_hmac:
+                    return obf_id
+                self.cache[raw_id] = obf_id
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return obf_id
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "cached": len(self.cache)
+            }
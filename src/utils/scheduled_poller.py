@@ -0,0 +1,83 @@
+import threading
+
+class ScheduledPoller:
+    """
+    Runs a poll function repeatedly on a shared TimerScheduler instead of a
+    dedicated thread, so any number of devices can be polled by one thread.
+
+    poll() is called on the scheduler thread and returns the number of
+    seconds until it should be called again. poll_soon() brings the next call
+    forward, e.g. from a GPIO edge callback or when a door opens; calling it
+    again before the poll runs restarts the delay, which debounces bursts.
+    If poll() raises, it is retried after error_delay seconds.
+
+    Only one poll timer is ever pending and polls never overlap: each timer
+    carries the generation it was scheduled in, and one that fires after
+    being replaced (popped by the scheduler just as poll_soon() rescheduled)
+    does nothing.
+    """
+    def __init__(self, scheduler, poll, error_delay=1):
+        self.scheduler = scheduler
+        self.poll = poll
+        self.error_delay = error_delay
+        self.lock = threading.Lock()
+        self.running = False
+        self.polling = False
+        self.requested_delay = None
+        self.timer = None
+        self.generation = 0
+
+    def start(self, delay=0):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+            self._schedule(delay)
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def poll_soon(self, delay=0):
+        """
+        Poll after delay seconds instead of at the next scheduled time.
+        Safe to call from any thread.
+        """
+        with self.lock:
+            if not self.running:
+                return
+            if self.polling:
+                # Picked up when the running poll reschedules itself
+                self.requested_delay = delay if self.requested_delay is None else min(delay, self.requested_delay)
+                return
+            if self.timer is not None:
+                self.timer.cancel()
+            self._schedule(delay)
+
+    def _schedule(self, delay):
+        # Called with the lock held
+        self.generation += 1
+        generation = self.generation
+        self.timer = self.scheduler.call_later(delay, lambda: self._run(generation))
+
+    def _run(self, generation):
+        with self.lock:
+            if not self.running or generation != self.generation:
+                return
+            self.polling = True
+            self.timer = None
+
+        delay = self.error_delay
+        try:
+            delay = self.poll()
+        finally:
+            with self.lock:
+                self.polling = False
+                if self.running:
+                    if self.requested_delay is not None:
+                        delay = self.requested_delay
+                        self.requested_delay = None
+                    self._schedule(delay)
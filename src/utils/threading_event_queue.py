@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+
+class EventQueue:
+    """
+    EventQueue is a thread-safe, bounded FIFO used to hand events from hardware
+    monitors to the main thread without losing them. Unlike SharedVariable,
+    which holds a single value that the next write overwrites, every published
+    event is kept until it is consumed or an overflow policy discards it.
+
+    Overflow Policies:
+    - "drop_oldest" (default): discard the oldest queued event to make room.
+    - "drop_newest": reject the incoming event.
+
+    Coalescing:
+    - With coalesce=True an event equal to the most recently queued event is
+      merged into it instead of being queued again, e.g. a badge held in the
+      reader field or a repeated switch state.
+
+    Usage:
+    - Publish with event_queue.put(event)
+    - Block for the next event with event = event_queue.get(timeout=0.5);
+      None is returned if the timeout expires.
+    - Counters are available from event_queue.stats()
+
+    Example:
+    event_queue = EventQueue(maxsize=32, coalesce=True)
+    event_queue.put('obf_rfid')
+    obf_rfid = event_queue.get(timeout=1)
+
+    Note:
+    - None cannot be published, it is reserved to signal a get() timeout.
+    """
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+    def __init__(self, maxsize=64, overflow_policy="drop_oldest", coalesce=False):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {self.OVERFLOW_POLICIES}")
+
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.coalesce = coalesce
+        self.events = deque()
+        self.condition = threading.Condition(threading.Lock())
+
+        # Counters
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.high_water = 0
+
+    def put(self, event):
+        """
+        Publish an event.
+        :return: True if the event was queued or coalesced, False if it was dropped.
+        """
+        if event is None:
+            raise ValueError("None cannot be published to an EventQueue")
+
+        with self.condition:
+            self.published += 1
+            if self.coalesce and self.events and self.events[-1] == event:
+                self.coalesced += 1
+                return True
+
+            if len(self.events) >= self.maxsize:
+                self.dropped += 1
+                if self.overflow_policy == "drop_newest":
+                    return False
+                self.events.popleft()
+
+            self.events.append(event)
+            self.high_water = max(self.high_water, len(self.events))
+            self.condition.notify()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest event, blocking until one is available.
+        :param timeout: Seconds to wait, or None to wait forever.
+        :return: The event, or None if the timeout expired.
+        """
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.events, timeout):
+                return None
+            self.delivered += 1
+            return self.events.popleft()
+
+    def get_nowait(self):
+        """
+        Remove and return the oldest event, or None if the queue is empty.
+        """
+        return self.get(timeout=0)
+
+    def clear(self):
+        """
+        Discard queued events, e.g. scans left over from a previous mode.
+        :return: The number of events discarded.
+        """
+        with self.condition:
+            discarded = len(self.events)
+            self.events.clear()
+            return discarded
+
+    def __len__(self):
+        with self.condition:
+            return len(self.events)
+
+    def stats(self):
+        with self.condition:
+            return {
+                "published": self.published,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "queued": len(self.events),
+                "high_water": self.high_water
+            }
@@ -0,0 +1,114 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+class Timer:
+    """
+    Handle for a callback scheduled on a TimerScheduler.
+    """
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Prevent the callback from running. Has no effect once it has run.
+        """
+        self.cancelled = True
+
+class TimerScheduler:
+    """
+    Runs delayed callbacks on one background thread.
+
+    Timers are kept in a heap ordered by deadline (time.monotonic() seconds)
+    and the thread sleeps until the earliest one is due, or until an earlier
+    timer is scheduled. Scheduling and cancelling are O(log n) and O(1) and
+    never create a thread. Callbacks run on the scheduler thread one at a time,
+    so they should return quickly. An exception raised by a callback is logged
+    and does not stop the scheduler.
+
+    Usage:
+    scheduler = TimerScheduler("DoorTimers")
+    scheduler.start()
+    timer = scheduler.call_later(7, relock)
+    timer.cancel()
+    scheduler.stop()
+    """
+    def __init__(self, name="TimerScheduler"):
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self.timers = []
+        self.sequence = itertools.count()  # Keeps equal deadlines in scheduling order
+        self.condition = threading.Condition(threading.Lock())
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self.thread.start()
+        self.logger.info("Timer scheduler started")
+
+    def stop(self):
+        """
+        Stop the scheduler thread. Timers that have not fired are discarded.
+        """
+        with self.condition:
+            self.running = False
+            self.timers.clear()
+            self.condition.notify()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.logger.info("Timer scheduler stopped")
+
+    def call_at(self, deadline, callback):
+        """
+        Run callback() at the time.monotonic() deadline.
+        :return: A Timer that can be cancelled.
+        """
+        timer = Timer(deadline, callback)
+        with self.condition:
+            heapq.heappush(self.timers, (deadline, next(self.sequence), timer))
+            # Only wake the thread if this timer is now the earliest
+            if self.timers[0][2] is timer:
+                self.condition.notify()
+        return timer
+
+    def call_later(self, delay, callback):
+        """
+        Run callback() after delay seconds.
+        :return: A Timer that can be cancelled.
+        """
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def __len__(self):
+        with self.condition:
+            return len(self.timers)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.running:
+                    if self.timers and self.timers[0][2].cancelled:
+                        heapq.heappop(self.timers)
+                        continue
+                    timeout = self.timers[0][0] - time.monotonic() if self.timers else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self.condition.wait(timeout)
+                if not self.running:
+                    return
+                timer = heapq.heappop(self.timers)[2]
+
+            try:
+                timer.callback()
+            except Exception as e:
+                self.logger.error(f"Error in timer callback: {e}")
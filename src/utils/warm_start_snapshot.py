@@ -0,0 +1,229 @@
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from .access_schedule import AccessSchedule, access_schedule_cache
+from .atomic_file import atomic_write
+
+UTC = ZoneInfo("UTC")
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND = timedelta(microseconds=1)
+
+MAGIC = b"ADAWARM\0"
+# Bump when the payload layout or the way members compile into verdicts changes
+FORMAT_VERSION = 1
+# magic, format version, Python version (marshal's format follows it), source
+# size, source mtime_ns, source CRC32, payload CRC32, payload length
+HEADER = struct.Struct("<8sHIQqIIQ")
+
+class WarmStartSnapshot:
+    """
+    A binary snapshot of a JSON member file's decoded member table, the
+    compiled access schedules of its members and their compiled access
+    verdicts, so a restart can skip parsing JSON and interval strings and
+    compiling the access table.
+
+    The snapshot records the source file's size, mtime and CRC32 and is
+    ignored (load() returns None) when any of them, the snapshot format or
+    the Python version no longer match, or when its own CRC32 fails.
+    Callers then parse the source and save() a fresh snapshot.
+
+    The file is memory-mapped and decoded with marshal straight from the
+    mapping. Only the member store writes it, and it should be protected
+    like the member file itself.
+
+    Verdicts are kept as (access, level, schedule) tuples for the time zone
+    they were compiled in; members whose records compile with an error are
+    left out so they are compiled, and logged, again.
+
+    Usage:
+    snapshot = WarmStartSnapshot("db.json.warm")
+    data = snapshot.load("db.json")
+    if data is None:
+        data = json.load(...)
+        snapshot.save("db.json", data)
+    verdicts = snapshot.take_verdicts(time_zone)
+    """
+    def __init__(self, filepath, time_zone=None, logger=None):
+        self.filepath = Path(filepath)
+        self.time_zone = time_zone
+        self.logger = logger or logging.getLogger("WarmStartSnapshot")
+        self.verdicts = None
+        self.verdicts_time_zone = None
+
+    @staticmethod
+    def fingerprint(source_path):
+        """
+        Return (size, mtime_ns, crc32) of the source file.
+        """
+        with open(source_path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            crc = 0
+            if stat.st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    crc = zlib.crc32(mapped)
+        return stat.st_size, stat.st_mtime_ns, crc
+
+    def _resolve_time_zone(self, time_zone=None):
+        return time_zone or self.time_zone or os.getenv("SCANNER_TIME_ZONE", "UTC")
+
+    @staticmethod
+    def content_fingerprint(content, mtime_ns):
+        """
+        Return the fingerprint of source file bytes already read, with the
+        mtime_ns of the file they were read from.
+        """
+        return len(content), mtime_ns, zlib.crc32(content)
+
+    def save(self, source_path, data, fingerprint=None):
+        """
+        Write a snapshot of data, the decoded contents of source_path.
+        Members are compiled into verdicts (their schedules taken from the
+        schedule cache where possible) so the snapshot carries them.
+        Errors are logged, not raised.
+        :param fingerprint: The fingerprint of the source bytes data was
+                            decoded from, if the file may have changed since.
+        """
+        # Imported here: the access table is built by the manager layer
+        from ..managers.implementations.access_control_manager import compile_member
+
+        try:
+            time_zone = self._resolve_time_zone()
+            schedules = []
+            schedule_indexes = {}
+            verdict_indexes = {}
+            member_verdicts = {}
+            for obf_rfid, member_info in data.items():
+                if not isinstance(member_info, dict):
+                    continue
+                verdict, reason = compile_member(member_info, time_zone)
+                if reason:
+                    continue
+                access, level, schedule = verdict
+                schedule_index = -1
+                if schedule is not None:
+                    schedule_index = schedule_indexes.get(schedule)
+                    if schedule_index is None:
+                        if not isinstance(schedule.duration, timedelta):
+                            # Calendar durations (months, years) are recompiled on load
+                            continue
+                        schedule_index = schedule_indexes[schedule] = len(schedules)
+                        schedules.append((
+                            member_info["access_interval"],
+                            (schedule.start - EPOCH) // MICROSECOND,
+                            schedule.period // MICROSECOND,
+                            schedule.duration // MICROSECOND,
+                            schedule.count
+                        ))
+                key = (access, int(level), schedule_index)
+                member_verdicts[obf_rfid] = verdict_indexes.setdefault(key, len(verdict_indexes))
+
+            payload = marshal.dumps({
+                "members": data,
+                "time_zone": time_zone,
+                "schedules": schedules,
+                "verdicts": list(verdict_indexes),
+                "member_verdicts": member_verdicts
+            })
+            size, mtime_ns, source_crc = fingerprint or self.fingerprint(source_path)
+            header = HEADER.pack(MAGIC, FORMAT_VERSION, sys.hexversion, size, mtime_ns, source_crc, zlib.crc32(payload), len(payload))
+
+            def write(file):
+                file.write(header)
+                file.write(payload)
+
+            atomic_write(self.filepath, write, binary=True)
+            self.logger.info(f"Warm-start snapshot saved to {self.filepath} ({len(data)} members, {len(schedules)} schedules)")
+        except Exception as e:
+            self.logger.error(f"Error saving warm-start snapshot {self.filepath}: {e}")
+
+    def load(self, source_path):
+        """
+        Load the member table if the snapshot matches source_path, adding its
+        compiled schedules to the shared schedule cache and keeping its
+        verdicts for take_verdicts().
+        :return: The member data dict, or None if the snapshot is missing or stale.
+        """
+        self.discard_verdicts()
+        try:
+            with open(self.filepath, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    decoded = self._decode(mapped, source_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable warm-start snapshot {self.filepath}: {e}")
+            return None
+        if decoded is None:
+            return None
+
+        time_zone = decoded["time_zone"]
+        schedules = [
+            AccessSchedule(EPOCH + start_us * MICROSECOND, period_us * MICROSECOND, duration_us * MICROSECOND, count)
+            for _, start_us, period_us, duration_us, count in decoded["schedules"]
+        ]
+        access_schedule_cache.preload({
+            (entry[0], time_zone): schedule for entry, schedule in zip(decoded["schedules"], schedules)
+        })
+
+        # Members with the same verdict share one tuple
+        table = [
+            (access, level, schedules[schedule_index] if schedule_index >= 0 else None)
+            for access, level, schedule_index in decoded["verdicts"]
+        ]
+        self.verdicts = {obf_rfid: table[index] for obf_rfid, index in decoded["member_verdicts"].items()}
+        self.verdicts_time_zone = time_zone
+
+        data = decoded["members"]
+        self.logger.info(f"Warm start from {self.filepath} ({len(data)} members)")
+        return data
+
+    def take_verdicts(self, time_zone=None):
+        """
+        Hand out the verdicts of the last load() once, if they were compiled
+        for time_zone (default SCANNER_TIME_ZONE or UTC).
+        :return: {obf_rfid: (access, level, schedule)} or None.
+        """
+        verdicts, verdicts_time_zone = self.verdicts, self.verdicts_time_zone
+        self.discard_verdicts()
+        if verdicts is None or verdicts_time_zone != self._resolve_time_zone(time_zone):
+            return None
+        return verdicts
+
+    def discard_verdicts(self):
+        """
+        Drop loaded verdicts, e.g. once the member table has changed.
+        """
+        self.verdicts = None
+        self.verdicts_time_zone = None
+
+    def _decode(self, mapped, source_path):
+        if len(mapped) < HEADER.size:
+            raise ValueError("truncated header")
+        magic, version, python_version, size, mtime_ns, source_crc, crc, length = HEADER.unpack_from(mapped)
+        if magic != MAGIC:
+            raise ValueError("not a warm-start snapshot")
+        if version != FORMAT_VERSION or python_version != sys.hexversion:
+            self.logger.info("Warm-start snapshot was written by another version, rebuilding")
+            return None
+
+        stat = os.stat(source_path)
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns) or self.fingerprint(source_path)[2] != source_crc:
+            self.logger.info(f"Warm-start snapshot is stale for {source_path}, rebuilding")
+            return None
+
+        with memoryview(mapped) as view:
+            payload = view[HEADER.size:HEADER.size + length]
+            try:
+                if len(payload) != length or zlib.crc32(payload) != crc:
+                    raise ValueError("checksum mismatch")
+                return marshal.loads(payload)
+            finally:
+                payload.release()
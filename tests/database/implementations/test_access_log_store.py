@@ -0,0 +1,123 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+import pytest
+from src.database.implementations.access_log_store import INDEX_ENTRY, AccessLogStore
+
+UTC = ZoneInfo("UTC")
+START = datetime(2024, 3, 1, tzinfo=UTC)
+
+@pytest.fixture
+def store(tmp_path):
+    log_store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "block_size": 4, "retention_days": 0})
+    yield log_store
+    log_store.close()
+
+def log_attempts(store, count, days=1):
+    for index in range(count):
+        store.log_access_attempt({
+            "timestamp": START + timedelta(days=days) * index / count,
+            "obf_rfid": f"member{index % 5}",
+            "access_point": "front_door" if index % 2 else "workshop",
+            "result": "denied" if index % 3 == 0 else "granted",
+            "reason": "test"
+        })
+
+def test_query_by_range_member_result_and_access_point(store):
+    log_attempts(store, 60, days=3)
+    logs = store.query_access_logs({"start": START + timedelta(days=1), "end": START + timedelta(days=2)})
+    assert len(logs) == 21
+    assert [log["timestamp"] for log in logs] == sorted(log["timestamp"] for log in logs)
+    assert logs[0]["reason"] == "test"
+
+    member_logs = store.query_access_logs({"obf_rfid": "member3"})
+    assert len(member_logs) == 12 and {log["obf_rfid"] for log in member_logs} == {"member3"}
+    denied = store.query_access_logs({"result": "denied", "access_point": "workshop"})
+    assert {(log["result"], log["access_point"]) for log in denied} == {("denied", "workshop")}
+    assert len(store.query_access_logs({"limit": 5})) == 5
+    assert store.query_access_logs({"obf_rfid": "unknown"}) is None
+
+def test_queries_only_read_blocks_the_index_allows(store, tmp_path):
+    log_attempts(store, 40, days=2)
+    store.flush()
+    # Overwrite the first day's records; a query for the second day must not read them
+    segment = tmp_path / "access-2024-03-01.log"
+    segment.write_bytes(b"x" * segment.stat().st_size)
+    logs = store.query_access_logs({"start": "2024-03-02T00:00:00+00:00"})
+    assert len(logs) == 20
+
+def test_logging_never_blocks_when_the_buffer_is_full(tmp_path):
+    store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "batch_size": 1000, "max_buffered": 10})
+    log_attempts(store, 15)
+    assert store.stats()["dropped"] == 5
+    store.close()
+    assert store.stats()["written"] == 10
+
+def test_recovers_unindexed_records_and_torn_line(tmp_path):
+    store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "block_size": 4, "retention_days": 0})
+    log_attempts(store, 8)
+    store.close()
+
+    # A crash after the segment write but before the index write, mid-line
+    segment = tmp_path / "access-2024-03-01.log"
+    index = tmp_path / "access-2024-03-01.idx"
+    index.write_bytes(index.read_bytes()[:INDEX_ENTRY.size + 10])
+    with open(segment, "ab") as file:
+        file.write(b'{"timestamp":"2024-03-01T23:00')
+
+    reopened = AccessLogStore({"path": tmp_path, "flush_interval": 60, "block_size": 4, "retention_days": 0})
+    assert len(reopened.query_access_logs({})) == 8
+    assert segment.read_bytes().endswith(b"\n")
+    assert index.stat().st_size == 2 * INDEX_ENTRY.size
+    reopened.close()
+
+def test_prune_deletes_segments_past_retention(tmp_path):
+    store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "retention_days": 2})
+    log_attempts(store, 30, days=3)
+    store.flush()
+    assert store.prune(today=date(2024, 3, 3)) == 1
+    assert store.query_access_logs({"end": "2024-03-01T23:59:59"}) is None
+    assert store.stats()["segments"] == 2
+    store.close()
+
+def test_failed_flush_keeps_the_batch(store, monkeypatch):
+    log_attempts(store, 6)
+    append = store._append
+    def failing_append(day, encoded):
+        monkeypatch.setattr(store, "_append", append)
+        raise OSError("disk full")
+    monkeypatch.setattr(store, "_append", failing_append)
+
+    with pytest.raises(OSError):
+        store.flush()
+    assert store.stats()["buffered"] == 6
+    assert store.flush() == 6
+    assert len(store.query_access_logs({})) == 6
+    assert store.stats()["dropped"] == 0
+
+def test_failed_index_write_keeps_records_queryable(tmp_path, monkeypatch):
+    store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "block_size": 4, "retention_days": 0})
+    write_index = store._write_index
+    def failing_write_index(day, entries, mode):
+        monkeypatch.setattr(store, "_write_index", write_index)
+        raise OSError("disk full")
+    monkeypatch.setattr(store, "_write_index", failing_write_index)
+    log_attempts(store, 6)
+    assert store.flush() == 6
+    assert len(store.query_access_logs({})) == 6
+
+    # The next flush of the day rewrites the whole index
+    log_attempts(store, 3)
+    store.close()
+    assert (tmp_path / "access-2024-03-01.idx").stat().st_size == INDEX_ENTRY.size * 3
+    store = AccessLogStore({"path": tmp_path, "flush_interval": 60, "block_size": 4, "retention_days": 0})
+    assert len(store.query_access_logs({})) == 9
+    store.close()
+
+def test_query_skips_segments_pruned_meanwhile(store, tmp_path, monkeypatch):
+    log_attempts(store, 20, days=2)
+    store.flush()
+    # The segment disappears between the index snapshot and the read
+    days = store._segment_days()
+    (tmp_path / "access-2024-03-01.log").unlink()
+    monkeypatch.setattr(store, "_segment_days", lambda: days)
+    assert len(store.query_access_logs({})) == 10
@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import MagicMock
+from src.database.implementations.caching_database import CachingDatabase
+from src.database.implementations.json_database import JsonDatabase
+from tests.helpers import make_member
+
+@pytest.fixture
+def backend(tmp_path):
+    database = JsonDatabase({
+        "name": "test_cached_json_db",
+        "connection_info": tmp_path / "db.json"
+    })
+    database.get_member = MagicMock(wraps=database.get_member)
+    return database
+
+@pytest.fixture
+def cache(backend):
+    return CachingDatabase({
+        "name": "test_member_cache",
+        "database": backend,
+        "max_size": 2,
+        "ttl": 60,
+        "negative_ttl": 60
+    })
+
+def test_requires_database():
+    with pytest.raises(ValueError):
+        CachingDatabase({"name": "test_member_cache_no_db"})
+
+def test_repeated_lookups_hit_cache(cache, backend):
+    cache.add_member(make_member("1234567890"))
+    for _ in range(3):
+        assert cache.get_member({"obf_rfid": "1234567890"})["membership_status"] == "active"
+    backend.get_member.assert_not_called()
+    assert cache.stats()["hits"] == 3
+
+def test_unknown_ids_are_negatively_cached(cache, backend):
+    for _ in range(3):
+        assert cache.get_member({"obf_rfid": "unknown"}) is None
+    assert backend.get_member.call_count == 1
+    assert cache.stats()["negative_hits"] == 2
+
+def test_add_member_replaces_negative_entry(cache):
+    assert cache.get_member({"obf_rfid": "1234567890"}) is None
+    cache.add_member(make_member("1234567890"))
+    assert cache.get_member({"obf_rfid": "1234567890"}) is not None
+
+def test_update_member_writes_through(cache, backend):
+    cache.add_member(make_member("1234567890"))
+    cache.update_member({"obf_rfid": "1234567890", "membership_status": "inactive"})
+    assert cache.get_member({"obf_rfid": "1234567890"})["membership_status"] == "inactive"
+    assert backend.data["1234567890"]["membership_status"] == "inactive"
+
+def test_failed_update_is_not_cached(cache):
+    with pytest.raises(KeyError):
+        cache.update_member(make_member("1234567890"))
+    assert cache.get_member({"obf_rfid": "1234567890"}) is None
+
+def test_cached_members_cannot_be_mutated_by_callers(cache):
+    cache.add_member(make_member("1234567890"))
+    cache.get_member({"obf_rfid": "1234567890"})["membership_status"] = "inactive"
+    assert cache.get_member({"obf_rfid": "1234567890"})["membership_status"] == "active"
+
+def test_entries_expire(cache, backend, mocker):
+    monotonic = mocker.patch("src.database.implementations.caching_database.time.monotonic", return_value=100.0)
+    assert cache.get_member({"obf_rfid": "unknown"}) is None
+    monotonic.return_value = 161.0
+    assert cache.get_member({"obf_rfid": "unknown"}) is None
+    assert backend.get_member.call_count == 2
+
+def test_least_recently_used_entry_is_evicted(cache, backend):
+    for obf_rfid in ("a", "b"):
+        cache.get_member({"obf_rfid": obf_rfid})
+    cache.get_member({"obf_rfid": "a"})
+    cache.get_member({"obf_rfid": "c"})
+    assert cache.stats()["evictions"] == 1
+
+    backend.get_member.reset_mock()
+    cache.get_member({"obf_rfid": "a"})
+    backend.get_member.assert_not_called()
+    cache.get_member({"obf_rfid": "b"})
+    backend.get_member.assert_called_once()
+
+def test_other_methods_are_forwarded(cache, backend):
+    assert cache.filepath == backend.filepath
+
+def test_change_during_a_miss_is_not_overwritten(cache, backend):
+    backend.add_member(make_member("card_a"))
+    read_member = JsonDatabase.get_member.__get__(backend)
+
+    def read_then_change(member_info):
+        # Another thread changes the member while this lookup is reading it
+        stale = dict(read_member(member_info))
+        backend.update_member({"obf_rfid": "card_a", "membership_status": "inactive"})
+        return stale
+    backend.get_member.side_effect = read_then_change
+
+    assert cache.get_member({"obf_rfid": "card_a"})["membership_status"] == "active"
+    backend.get_member.side_effect = None
+    assert cache.get_member({"obf_rfid": "card_a"})["membership_status"] == "inactive"
+    assert cache.reads == {}
+
+def test_member_records_of_a_compact_database_are_cached(tmp_path):
+    backend = JsonDatabase({"name": "test_cached_compact_db", "connection_info": tmp_path / "db.json", "compact_members": True})
+    backend.get_member = MagicMock(wraps=backend.get_member)
+    cache = CachingDatabase({"name": "test_compact_member_cache", "database": backend, "ttl": 60})
+    cache.add_member(make_member("1234567890"))
+    assert None not in cache.entries
+    assert cache.get_member({"obf_rfid": "1234567890"})["membership_status"] == "active"
+    backend.get_member.assert_not_called()
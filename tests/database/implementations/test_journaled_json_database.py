@@ -0,0 +1,96 @@
+import json
+import pytest
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from tests.helpers import make_member
+
+@pytest.fixture
+def db_config(tmp_path):
+    return {
+        "name": "test_journaled_db",
+        "connection_info": tmp_path / "db.json",
+        "compaction_interval": 0  # Compaction is triggered explicitly in tests
+    }
+
+def test_mutations_are_journaled_not_rewritten(db_config):
+    db = JournaledJsonDatabase(db_config)
+    db.add_member(make_member("1234567890"))
+    db.update_member({"obf_rfid": "1234567890", "membership_status": "inactive"})
+
+    # Snapshot is untouched, journal holds one record per mutation
+    assert json.loads(db.filepath.read_text()) == {}
+    assert len(db.journal_path.read_text().splitlines()) == 2
+    db.close()
+
+def test_replay_rebuilds_member_table(db_config):
+    db = JournaledJsonDatabase(db_config)
+    db.add_member(make_member("1234567890"))
+    db.add_member(make_member("1234567891"))
+    db.update_member({"obf_rfid": "1234567890", "membership_status": "inactive"})
+    db.journal_file.close()
+
+    reopened = JournaledJsonDatabase(db_config)
+    assert reopened.get_member({"obf_rfid": "1234567890"})["membership_status"] == "inactive"
+    assert reopened.get_member({"obf_rfid": "1234567891"})["membership_status"] == "active"
+    reopened.close()
+
+def test_torn_journal_record_is_skipped(db_config):
+    db = JournaledJsonDatabase(db_config)
+    db.add_member(make_member("1234567890"))
+    db.journal_file.write('{"op":"put","member":{"obf_rf')
+    db.journal_file.close()
+
+    reopened = JournaledJsonDatabase(db_config)
+    assert reopened.get_member({"obf_rfid": "1234567890"}) is not None
+
+    # Appends after a torn record must still be replayable
+    reopened.add_member(make_member("1234567891"))
+    reopened.journal_file.close()
+    assert JournaledJsonDatabase(db_config).get_member({"obf_rfid": "1234567891"}) is not None
+
+def test_compact_folds_journal_into_snapshot(db_config):
+    db = JournaledJsonDatabase(db_config)
+    db.add_member(make_member("1234567890"))
+    assert db.compact()
+
+    assert "1234567890" in json.loads(db.filepath.read_text())
+    assert db.journal_path.read_text() == ""
+    assert not db.compacting_path.exists()
+    db.close()
+
+def test_interrupted_compaction_is_recovered(db_config):
+    db = JournaledJsonDatabase(db_config)
+    db.add_member(make_member("1234567890"))
+    db.journal_file.close()
+
+    # Simulate a crash after the journal was rotated but before the snapshot was written
+    db.journal_path.rename(db.compacting_path)
+
+    reopened = JournaledJsonDatabase(db_config)
+    assert reopened.get_member({"obf_rfid": "1234567890"}) is not None
+    assert "1234567890" in json.loads(reopened.filepath.read_text())
+    assert not reopened.compacting_path.exists()
+    reopened.close()
+
+def test_failed_compaction_keeps_its_records_for_the_next(db_config, monkeypatch):
+    db = JournaledJsonDatabase(db_config)
+    def failing_write_snapshot(snapshot):
+        raise OSError("disk full")
+    monkeypatch.setattr(db, "_write_snapshot", failing_write_snapshot)
+    db.add_member(make_member("1234567890"))
+    with pytest.raises(OSError):
+        db.compact()
+    # Rotating again must not overwrite the records left in .compacting
+    db.add_member(make_member("1234567891"))
+    with pytest.raises(OSError):
+        db.compact()
+    assert db.journal_records == 2
+    assert len(db.compacting_path.read_text().splitlines()) == 2
+
+    monkeypatch.undo()
+    assert db.compact()
+    assert not db.compacting_path.exists()
+    db.close()
+    reopened = JournaledJsonDatabase(db_config)
+    assert reopened.get_member({"obf_rfid": "1234567890"}) is not None
+    assert reopened.get_member({"obf_rfid": "1234567891"}) is not None
+    reopened.close()
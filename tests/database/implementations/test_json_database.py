@@ -1,6 +1,14 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
 import pytest
 from src.database.implementations.json_database import JsonDatabase
 from pathlib import Path
+from tests.helpers import make_member
 
 @pytest.fixture
 def db():
@@ -73,4 +81,161 @@ def test_update_member(db):
         db.update_member(member_info)
     
     db.add_member(member_info)
-    assert db.update_member(member_update_info) == member_update_info
\ No newline at end of file
+    assert db.update_member(member_update_info) == member_update_info
+
+def test_update_member_invalidates_access_schedule(db):
+    from src.utils.access_schedule import access_schedule_cache
+
+    member_info = {
+        "obf_rfid": "1234567892",
+        "member_level": "guest",
+        "membership_status": "active",
+        "access_interval": "R5/2024-02-08T11:00:00+00:00/PT9H",
+        "member_sponsor": "sponsor_obf_rfid",
+        "created": "",
+        "last_updated":""
+    }
+    db.add_member(member_info)
+    schedule = access_schedule_cache.get(member_info["access_interval"])
+
+    db.update_member({"obf_rfid": "1234567892", "access_interval": "R5/2024-03-08T11:00:00+00:00/PT9H"})
+    assert access_schedule_cache.get("R5/2024-02-08T11:00:00+00:00/PT9H") is not schedule
+
+def test_change_listeners_and_iter_members(db):
+    changes = []
+    db.add_change_listener(lambda obf_rfid, member_info: changes.append((obf_rfid, member_info["membership_status"])))
+
+    member_info = {
+        "obf_rfid": "1234567893",
+        "member_level": "member",
+        "membership_status": "active",
+        "access_interval": "",
+        "member_sponsor": "",
+        "created": "",
+        "last_updated":""
+    }
+    db.add_member(member_info)
+    db.update_member({"obf_rfid": "1234567893", "membership_status": "inactive"})
+
+    assert changes == [("1234567893", "active"), ("1234567893", "inactive")]
+    assert [member["obf_rfid"] for member in db.iter_members()] == ["1234567893"]
+
+def test_failed_save_leaves_file_intact(tmp_path, monkeypatch):
+    db_path = tmp_path / "db.json"
+    database = JsonDatabase({"name": "test_json_db", "connection_info": db_path})
+    database.add_member(make_member("id0"))
+    before = db_path.read_bytes()
+
+    # Fail halfway through writing the new file
+    def failing_dump(data, file, **kwargs):
+        file.write('{"id0": {')
+        raise OSError("disk full")
+    monkeypatch.setattr("src.database.member_codec.json.dump", failing_dump)
+    with pytest.raises(OSError):
+        database.add_member(make_member("id1"))
+    assert db_path.read_bytes() == before
+    assert [path.name for path in tmp_path.iterdir()] == ["db.json"]
+
+def test_failed_save_undoes_the_change(tmp_path, monkeypatch):
+    database = JsonDatabase({"name": "test_json_db", "connection_info": tmp_path / "db.json"})
+    database.add_member(make_member("id0"))
+    database.find_members({"membership_status": "active"})
+    changes = []
+    database.add_change_listener(lambda obf_rfid, member_info: changes.append(obf_rfid))
+
+    def failing_write(filepath, write_fn, binary=False):
+        raise OSError("disk full")
+    monkeypatch.setattr("src.database.implementations.json_database.atomic_write", failing_write)
+    with pytest.raises(OSError):
+        database.add_member(make_member("id1"))
+    with pytest.raises(OSError):
+        database.update_member({"obf_rfid": "id0", "membership_status": "inactive"})
+    with pytest.raises(OSError):
+        database.bulk_add_members([make_member("id2")])
+    with pytest.raises(OSError):
+        database.bulk_update_members([{"obf_rfid": "id0", "membership_status": "inactive"}])
+
+    # Memory still matches the file, and listeners never heard of the changes
+    assert changes == []
+    assert [member["obf_rfid"] for member in database.iter_members()] == ["id0"]
+    assert database.get_member({"obf_rfid": "id0"})["membership_status"] == "active"
+    assert [member["obf_rfid"] for member in database.find_members({"membership_status": "active"})] == ["id0"]
+    assert database.find_members({"membership_status": "inactive"}) == []
+
+def test_unreadable_file_is_not_treated_as_empty(tmp_path):
+    db_path = tmp_path / "db.json"
+    db_path.write_text('{"id0": {"obf_rfid": ')
+    with pytest.raises(ValueError):
+        JsonDatabase({"name": "test_json_db", "connection_info": db_path})
+    assert db_path.read_text() == '{"id0": {"obf_rfid": '
+
+def test_invalid_durability_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        JsonDatabase({"name": "test_json_db", "connection_info": tmp_path / "db.json", "durability": "never"})
+
+def test_group_commit_shares_writes_between_writers(tmp_path):
+    db_path = tmp_path / "db.json"
+    database = JsonDatabase({"name": "test_json_db", "connection_info": db_path, "durability": "group", "commit_delay": 0.05})
+    saves = []
+    save_data = database._save_data
+    database._save_data = lambda: saves.append(1) or save_data()
+
+    def add_members(thread_index):
+        for index in range(5):
+            database.add_member(make_member(f"id{thread_index}_{index}"))
+    threads = [threading.Thread(target=add_members, args=(thread_index,)) for thread_index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every add returned only once durable, and concurrent adds shared writes
+    assert len(json.loads(db_path.read_text())) == 40
+    assert len(saves) < 40
+    database.close()
+
+def test_group_commit_reports_write_errors(tmp_path, monkeypatch):
+    database = JsonDatabase({"name": "test_json_db", "connection_info": tmp_path / "db.json", "durability": "group", "commit_delay": 0})
+    def failing_write(filepath, write_fn, binary=False):
+        raise OSError("disk full")
+    monkeypatch.setattr("src.database.implementations.json_database.atomic_write", failing_write)
+    with pytest.raises(OSError):
+        database.add_member(make_member("id0"))
+    monkeypatch.undo()
+    database.close()
+
+def test_deferred_changes_are_written_on_close(tmp_path):
+    db_path = tmp_path / "db.json"
+    database = JsonDatabase({"name": "test_json_db", "connection_info": db_path, "durability": "deferred", "commit_delay": 60})
+    database.add_member(make_member("id0"))
+    database.update_member({"obf_rfid": "id0", "membership_status": "inactive"})
+    assert json.loads(db_path.read_text()) == {}
+    database.close()
+    assert json.loads(db_path.read_text())["id0"]["membership_status"] == "inactive"
+
+CRASH_WRITER = """
+import sys
+from src.database.implementations.json_database import JsonDatabase
+database = JsonDatabase({"name": "crash", "connection_info": sys.argv[1], "durability": sys.argv[2], "commit_delay": 0.001})
+database.add_member({"obf_rfid": "counter", "member_level": "member", "membership_status": "active",
+                     "access_interval": "R/2024-01-01T00:00:00+00:00/PT24H", "member_sponsor": "0"})
+for index in range(1, 100000):
+    database.update_member({"obf_rfid": "counter", "member_sponsor": str(index)})
+    print(index, flush=True)
+"""
+
+@pytest.mark.parametrize("durability", ["sync", "group"])
+def test_killed_writer_leaves_every_acknowledged_update(tmp_path, durability):
+    for attempt in range(5):
+        db_path = tmp_path / f"db{attempt}.json"
+        writer = subprocess.Popen([sys.executable, "-c", CRASH_WRITER, str(db_path), durability], stdout=subprocess.PIPE, text=True)
+        # Kill the writer at a different point of its write loop each time
+        acknowledged = 0
+        for _ in range(20 + attempt * 7):
+            acknowledged = int(writer.stdout.readline())
+        time.sleep(0.001 * attempt)
+        os.kill(writer.pid, signal.SIGKILL)
+        writer.wait()
+
+        data = json.loads(db_path.read_text())
+        assert int(data["counter"]["member_sponsor"]) >= acknowledged
@@ -0,0 +1,83 @@
+import json
+import pytest
+from src.database.implementations.sqlite_database import SqliteDatabase
+from tests.helpers import make_member
+
+@pytest.fixture
+def db(tmp_path):
+    database = SqliteDatabase({
+        "name": "test_sqlite_db",
+        "connection_info": tmp_path / "db.sqlite"
+    })
+    yield database
+    database.close()
+
+def test_add_and_get_member(db):
+    member_info = make_member("1234567890")
+    assert db.add_member(member_info) == member_info
+    assert db.get_member({"obf_rfid": "1234567890"}) == member_info
+    assert db.get_member("1234567890") == member_info
+    assert db.get_member({"obf_rfid": "unknown"}) is None
+
+def test_add_existing_member(db):
+    db.add_member(make_member("1234567890"))
+    with pytest.raises(ValueError):
+        db.add_member(make_member("1234567890"))
+
+def test_update_member(db):
+    with pytest.raises(KeyError):
+        db.update_member(make_member("1234567890"))
+
+    db.add_member(make_member("1234567890"))
+    updated = db.update_member({"obf_rfid": "1234567890", "membership_status": "inactive"})
+    assert updated["membership_status"] == "inactive"
+    assert updated["member_level"] == "guest"
+
+    # DatabaseManagerInterface call style
+    db.update_member("1234567890", {"member_level": "member"})
+    assert db.get_member("1234567890")["member_level"] == "member"
+
+def test_delete_member(db):
+    db.add_member(make_member("1234567890"))
+    assert db.delete_member("1234567890")
+    assert not db.delete_member("1234567890")
+    assert db.get_member("1234567890") is None
+
+def test_change_listeners_and_iter_members(db):
+    changes = []
+    db.add_change_listener(lambda obf_rfid, member_info: changes.append((obf_rfid, member_info and member_info["membership_status"])))
+    db.add_member(make_member("1234567890"))
+    db.update_member("1234567890", {"membership_status": "inactive"})
+    assert [member["obf_rfid"] for member in db.iter_members()] == ["1234567890"]
+    db.delete_member("1234567890")
+    assert changes == [("1234567890", "active"), ("1234567890", "inactive"), ("1234567890", None)]
+
+def test_access_logs(db):
+    assert db.log_access_attempt({"timestamp": "2024-02-08T10:00:00", "obf_rfid": "a", "result": "granted"})
+    assert db.log_access_attempt({"timestamp": "2024-02-08T11:00:00", "obf_rfid": "b", "result": "denied", "reason": "inactive"})
+    assert db.log_access_attempt({"timestamp": "2024-02-08T12:00:00", "obf_rfid": "a", "result": "denied"})
+
+    assert len(db.query_access_logs({})) == 3
+    assert [log["timestamp"] for log in db.query_access_logs({"obf_rfid": "a"})] == ["2024-02-08T10:00:00", "2024-02-08T12:00:00"]
+    window = db.query_access_logs({"start": "2024-02-08T10:30:00", "end": "2024-02-08T11:30:00"})
+    assert window == [{"timestamp": "2024-02-08T11:00:00", "obf_rfid": "b", "access_point": None, "result": "denied", "reason": "inactive"}]
+    assert db.query_access_logs({"result": "unknown"}) is None
+
+def test_migrate_from_json(tmp_path):
+    json_path = tmp_path / "db.json"
+    json_path.write_text(json.dumps({
+        "1234567890": make_member("1234567890"),
+        "1234567891": make_member("1234567891", status="inactive")
+    }))
+
+    db = SqliteDatabase({
+        "name": "test_sqlite_migration",
+        "connection_info": tmp_path / "db.sqlite",
+        "migrate_from": json_path
+    })
+    assert db.count_members() == 2
+    assert db.get_member("1234567891")["membership_status"] == "inactive"
+
+    # Migration is one-shot and never overwrites existing rows
+    assert db.migrate_from_json(json_path) == 0
+    db.close()
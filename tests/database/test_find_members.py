@@ -0,0 +1,76 @@
+import pytest
+from src.database.implementations.caching_database import CachingDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.sqlite_database import SqliteDatabase
+from src.database.member_index import MemberIndex
+from tests.helpers import make_member
+
+@pytest.fixture(params=["json", "journaled", "compact", "sqlite", "caching"])
+def db(request, tmp_path):
+    if request.param == "json":
+        database = JsonDatabase({"name": "find_json_db", "connection_info": tmp_path / "db.json"})
+    elif request.param == "journaled":
+        database = JournaledJsonDatabase({"name": "find_journaled_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0})
+    elif request.param == "compact":
+        database = JsonDatabase({"name": "find_compact_db", "connection_info": tmp_path / "db.json", "compact_members": True})
+    elif request.param == "sqlite":
+        database = SqliteDatabase({"name": "find_sqlite_db", "connection_info": tmp_path / "db.sqlite"})
+    else:
+        database = CachingDatabase({
+            "name": "find_cache",
+            "database": JsonDatabase({"name": "find_cached_json_db", "connection_info": tmp_path / "db.json"})
+        })
+    yield database
+    close = getattr(database, "close", None)
+    if close:
+        close()
+
+def ids(members):
+    return sorted(member_info["obf_rfid"] for member_info in members)
+
+def test_find_members_follows_adds_and_updates(db):
+    db.add_member(make_member("host", level="member", sponsor=""))
+    db.bulk_add_members(make_member(f"guest{index}", sponsor="host" if index < 3 else "other") for index in range(5))
+    assert ids(db.find_members({"member_sponsor": "host"})) == ["guest0", "guest1", "guest2"]
+
+    db.update_member({"obf_rfid": "guest0", "membership_status": "inactive"})
+    db.bulk_update_members([{"obf_rfid": "guest3", "member_sponsor": "host"}])
+    assert ids(db.find_members({"member_sponsor": "host", "membership_status": "active"})) == ["guest1", "guest2", "guest3"]
+    assert ids(db.find_members({"membership_status": "inactive"})) == ["guest0"]
+    assert ids(db.find_members({"member_level": "member"})) == ["host"]
+    assert ids(db.find_members({"access_interval": "R5/2024-02-08T11:00:00/PT9H", "member_sponsor": "other"})) == ["guest4"]
+    assert db.find_members({"member_sponsor": "nobody"}) == []
+    with pytest.raises(ValueError):
+        db.find_members({"favourite_colour": "blue"})
+
+@pytest.mark.parametrize("criteria", [{"member_level": "guest"}, {"access_interval": "R5/2024-02-08T11:00:00/PT9H"}])
+def test_found_members_are_copies(db, criteria):
+    db.add_member(make_member("guest0"))
+    found = db.find_members(criteria)
+    found[0]["member_level"] = "admin"
+    assert db.get_member({"obf_rfid": "guest0"})["member_level"] == "guest"
+    assert ids(db.find_members({"member_level": "guest"})) == ["guest0"]
+
+def test_index_is_rebuilt_on_reopen(tmp_path):
+    config = {"name": "find_journaled_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0}
+    database = JournaledJsonDatabase(config)
+    database.add_member(make_member("guest0", sponsor="host"))
+    database.update_member({"obf_rfid": "guest0", "membership_status": "inactive"})
+    # Left without closing, so reopening replays the journal
+    database.journal_file.close()
+    reopened = JournaledJsonDatabase(config)
+    assert ids(reopened.find_members({"member_sponsor": "host", "membership_status": "inactive"})) == ["guest0"]
+    reopened.close()
+
+def test_member_index_drops_emptied_values():
+    index = MemberIndex()
+    index.rebuild({})
+    member_info = make_member("guest0")
+    index.add("guest0", member_info)
+    old_values = index.values(member_info)
+    member_info["membership_status"] = "inactive"
+    index.move("guest0", old_values, member_info)
+    assert "active" not in index.postings["membership_status"]
+    assert index.lookup({"membership_status": "inactive", "member_level": "guest"}) == {"guest0"}
+    assert index.lookup({"access_interval": "R5/2024-02-08T11:00:00/PT9H"}) is None
@@ -0,0 +1,73 @@
+import io
+import json
+import pytest
+from src.database.member_codec import BinaryMemberCodec, JsonMemberCodec, get_member_codec
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from tests.helpers import make_member
+
+DIGEST = "ab" * 32
+CREATED = "2024-02-08T11:00:00"
+UPDATED = "2024-02-09T12:30:05"
+
+def round_trip(data):
+    file = io.BytesIO()
+    BinaryMemberCodec().dump(data, file)
+    file.seek(0)
+    return BinaryMemberCodec().load(file), file.getvalue()
+
+def test_binary_round_trip_is_smaller_than_json():
+    data = {}
+    for index in range(100):
+        obf_rfid = f"{index:064x}"
+        data[obf_rfid] = make_member(obf_rfid, level="member" if index % 2 else "guest", sponsor=DIGEST, created=CREATED, last_updated=UPDATED)
+    decoded, encoded = round_trip(data)
+    assert decoded == data
+    assert list(decoded) == list(data)
+    assert len(encoded) * 3 < len(json.dumps(data, indent=4))
+    # Members sharing an interval share the decoded string
+    assert decoded[f"{0:064x}"]["access_interval"] is decoded[f"{1:064x}"]["access_interval"]
+
+def test_binary_round_trips_fields_without_a_fixed_form():
+    data = {
+        "1234567890": make_member("1234567890", sponsor=DIGEST, created="", last_updated=UPDATED),
+        DIGEST.upper(): make_member(DIGEST.upper(), sponsor=DIGEST, created=CREATED, last_updated="2024-02-09T12:30:05+00:00"),
+        DIGEST: {"obf_rfid": DIGEST, "member_level": 3, "created": "2024-02-08T11:00:00.500000"},
+    }
+    decoded, _ = round_trip(data)
+    assert decoded == data
+    assert list(decoded[DIGEST]) == list(data[DIGEST])
+
+def test_binary_rejects_corrupt_files():
+    _, encoded = round_trip({DIGEST: make_member(DIGEST, sponsor=DIGEST)})
+    corrupt = bytearray(encoded)
+    corrupt[-3] ^= 0xFF
+    with pytest.raises(ValueError):
+        BinaryMemberCodec().load(io.BytesIO(bytes(corrupt)))
+    with pytest.raises(ValueError):
+        BinaryMemberCodec().load(io.BytesIO(encoded[:-1]))
+    with pytest.raises(ValueError):
+        get_member_codec("yaml")
+
+def test_changing_codec_converts_the_file(tmp_path):
+    db_path = tmp_path / "db.json"
+    JsonDatabase({"name": "test", "connection_info": db_path}).add_member(make_member(DIGEST, sponsor=DIGEST))
+
+    database = JsonDatabase({"name": "test", "connection_info": db_path, "codec": "binary"})
+    database.update_member({"obf_rfid": DIGEST, "membership_status": "inactive"})
+    assert db_path.read_bytes().startswith(BinaryMemberCodec.MAGIC)
+
+    reopened = JsonDatabase({"name": "test", "connection_info": db_path})
+    assert reopened.get_member({"obf_rfid": DIGEST})["membership_status"] == "inactive"
+    reopened.update_member({"obf_rfid": DIGEST, "membership_status": "active"})
+    assert json.loads(db_path.read_text())[DIGEST]["membership_status"] == "active"
+
+def test_journaled_snapshot_uses_the_codec(tmp_path):
+    db_path = tmp_path / "db.bin"
+    database = JournaledJsonDatabase({"name": "test", "connection_info": db_path, "codec": "binary", "compaction_interval": 0})
+    database.add_member(make_member(DIGEST, sponsor=DIGEST))
+    database.close()
+    assert db_path.read_bytes().startswith(BinaryMemberCodec.MAGIC)
+    with open(db_path, "rb") as file:
+        assert BinaryMemberCodec().load(file)[DIGEST]["member_level"] == "guest"
+    assert isinstance(get_member_codec("json"), JsonMemberCodec)
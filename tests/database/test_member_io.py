@@ -0,0 +1,117 @@
+import io
+import json
+import pytest
+from src.database.implementations.caching_database import CachingDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.sqlite_database import SqliteDatabase
+from src.database.member_io import member_file_format, read_members, write_members
+from tests.helpers import make_member
+
+@pytest.fixture(params=["json", "journaled", "compact", "sqlite", "caching"])
+def db(request, tmp_path):
+    if request.param == "json":
+        database = JsonDatabase({"name": "bulk_json_db", "connection_info": tmp_path / "db.json"})
+    elif request.param == "journaled":
+        database = JournaledJsonDatabase({"name": "bulk_journaled_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0})
+    elif request.param == "compact":
+        database = JournaledJsonDatabase({"name": "bulk_compact_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0, "compact_members": True})
+    elif request.param == "sqlite":
+        database = SqliteDatabase({"name": "bulk_sqlite_db", "connection_info": tmp_path / "db.sqlite"})
+    else:
+        database = CachingDatabase({
+            "name": "bulk_cache",
+            "database": JsonDatabase({"name": "bulk_cached_json_db", "connection_info": tmp_path / "db.json"})
+        })
+    yield database
+    close = getattr(database, "close", None)
+    if close:
+        close()
+
+def test_bulk_add_and_export(db):
+    changes = []
+    db.add_change_listener(lambda obf_rfid, member_info: changes.append(obf_rfid))
+    assert db.bulk_add_members(make_member(f"id{index}") for index in range(5)) == 5
+    assert changes == [f"id{index}" for index in range(5)]
+
+    exported = list(db.export_members())
+    assert sorted(member["obf_rfid"] for member in exported) == [f"id{index}" for index in range(5)]
+    assert all(member["created"] and member["last_updated"] for member in exported)
+
+def test_bulk_add_is_all_or_nothing(db):
+    db.add_member(make_member("existing"))
+    with pytest.raises(ValueError, match="1 members already exist"):
+        db.bulk_add_members([make_member("new"), make_member("existing")])
+    with pytest.raises(ValueError, match="2 invalid member records"):
+        db.bulk_add_members([make_member("new"), {"obf_rfid": "partial"}, {**make_member("extra"), "email": "x@example.com"}])
+    with pytest.raises(ValueError, match="appears more than once"):
+        db.bulk_add_members([make_member("new"), make_member("new")])
+    assert db.get_member({"obf_rfid": "new"}) is None
+
+def test_bulk_update(db):
+    db.bulk_add_members(make_member(f"id{index}") for index in range(3))
+    assert db.bulk_update_members([
+        {"obf_rfid": "id0", "membership_status": "inactive"},
+        {"obf_rfid": "id1", "member_level": "member"},
+        {"obf_rfid": "id0", "member_sponsor": "other"}
+    ]) == 2
+    assert db.get_member({"obf_rfid": "id0"})["membership_status"] == "inactive"
+    assert db.get_member({"obf_rfid": "id0"})["member_sponsor"] == "other"
+    assert db.get_member({"obf_rfid": "id1"})["member_level"] == "member"
+
+    with pytest.raises(KeyError):
+        db.bulk_update_members([{"obf_rfid": "id2", "membership_status": "inactive"}, {"obf_rfid": "unknown"}])
+    assert db.get_member({"obf_rfid": "id2"})["membership_status"] == "active"
+
+def test_bulk_update_skips_members_changed_since_read(db):
+    db.bulk_add_members(make_member(f"id{index}") for index in range(3))
+    db.update_member({"obf_rfid": "id1", "member_level": "member"})
+    assert db.bulk_update_members([
+        {"obf_rfid": "id0", "membership_status": "inactive"},
+        {"obf_rfid": "id1", "membership_status": "inactive"},
+        {"obf_rfid": "gone", "membership_status": "inactive"}
+    ], expected={
+        "id0": {"member_level": "guest"},
+        "id1": {"member_level": "guest"},
+        "gone": {"member_level": "guest"}
+    }) == 1
+    assert db.get_member({"obf_rfid": "id0"})["membership_status"] == "inactive"
+    assert db.get_member({"obf_rfid": "id1"})["membership_status"] == "active"
+
+def test_bulk_writes_survive_reopen(tmp_path):
+    config = {"name": "reopen_journaled_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0}
+    db = JournaledJsonDatabase(config)
+    db.bulk_add_members(make_member(f"id{index}") for index in range(3))
+    db.bulk_update_members([{"obf_rfid": "id1", "membership_status": "inactive"}])
+    db.close()
+
+    reopened = JournaledJsonDatabase(config)
+    assert len(reopened.data) == 3
+    assert reopened.data["id1"]["membership_status"] == "inactive"
+    reopened.close()
+
+@pytest.mark.parametrize("file_format", ["csv", "jsonl"])
+def test_write_and_read_round_trip(file_format):
+    members = [{**make_member(f"id{index}"), "created": "c", "last_updated": "u"} for index in range(3)]
+    file = io.StringIO(newline="")
+    assert write_members(file, iter(members), file_format) == 3
+    file.seek(0)
+    assert list(read_members(file, file_format)) == members
+
+def test_read_csv_skips_empty_cells_for_updates():
+    file = io.StringIO("obf_rfid,membership_status,member_level\nid0,inactive,\n", newline="")
+    assert list(read_members(file, "csv", skip_empty=True)) == [{"obf_rfid": "id0", "membership_status": "inactive"}]
+
+def test_read_invalid_jsonl():
+    file = io.StringIO(json.dumps(make_member("id0")) + "\n\nnot json\n")
+    members = read_members(file, "jsonl")
+    assert next(members)["obf_rfid"] == "id0"
+    with pytest.raises(ValueError, match="Line 3"):
+        next(members)
+
+def test_member_file_format():
+    assert member_file_format("roster.CSV") == "csv"
+    assert member_file_format("roster.ndjson") == "jsonl"
+    assert member_file_format("-", "jsonl") == "jsonl"
+    with pytest.raises(ValueError):
+        member_file_format("roster.xlsx")
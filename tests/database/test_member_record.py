@@ -0,0 +1,51 @@
+import json
+import pytest
+from src.database.member_record import MemberRecord
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from tests.helpers import make_member
+
+def test_record_behaves_like_a_member_dict():
+    member_info = make_member("id0")
+    del member_info["created"], member_info["last_updated"]
+    record = MemberRecord(member_info)
+    assert record == member_info and member_info == record
+    assert dict(record) == member_info and list(record) == list(member_info)
+    assert record["member_level"] == "guest" and record.get("created") is None
+    assert "created" not in record and len(record) == 5
+
+    record.update({"created": "2024-02-08T11:00:00", "note": "front desk"})
+    assert record["note"] == "front desk" and "note" in record
+    del record["member_sponsor"]
+    with pytest.raises(KeyError):
+        record["member_sponsor"]
+    assert json.loads(json.dumps(dict(record))) == record
+
+def test_records_share_field_strings():
+    first = MemberRecord(json.loads(json.dumps(make_member("id0"))))
+    second = MemberRecord(json.loads(json.dumps(make_member("id1"))))
+    assert first["access_interval"] is second["access_interval"]
+    assert first["membership_status"] is second["membership_status"]
+
+def test_compact_database_persists_and_reloads(tmp_path):
+    db_path = tmp_path / "db.json"
+    database = JsonDatabase({"name": "test", "connection_info": db_path, "compact_members": True})
+    database.add_member(make_member("id0"))
+    database.update_member({"obf_rfid": "id0", "membership_status": "inactive"})
+    assert isinstance(database.get_member({"obf_rfid": "id0"}), MemberRecord)
+    assert json.loads(db_path.read_text())["id0"]["membership_status"] == "inactive"
+
+    reopened = JsonDatabase({"name": "test", "connection_info": db_path, "compact_members": True})
+    member_info = reopened.get_member({"obf_rfid": "id0"})
+    assert isinstance(member_info, MemberRecord) and member_info["membership_status"] == "inactive"
+    assert next(reopened.iter_members()) is member_info
+
+def test_compact_journal_replay(tmp_path):
+    config = {"name": "test", "connection_info": tmp_path / "db.json", "compaction_interval": 0, "compact_members": True}
+    database = JournaledJsonDatabase(config)
+    database.add_member(make_member("id0"))
+    # Left without closing, so reopening replays the journal
+    database.journal_file.close()
+    reopened = JournaledJsonDatabase(config)
+    assert isinstance(reopened.get_member({"obf_rfid": "id0"}), MemberRecord)
+    reopened.close()
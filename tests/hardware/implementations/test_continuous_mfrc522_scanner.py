@@ -1,6 +1,10 @@
 import unittest
 from unittest.mock import Mock, patch
 from src.hardware.implementations.continuous_mfrc522_scanner import RFIDContinuousMonitor
+from src.hardware.implementations.simulated_rfid_scanner import SimulatedRFIDScanner
+from src.managers.implementations.event_manager import EventManager
+from src.utils.threading_event_queue import EventQueue
+from src.utils.timer_scheduler import TimerScheduler
 import time
 
 class TestRFIDContinuousMonitor(unittest.TestCase):
@@ -33,6 +37,101 @@ class TestRFIDContinuousMonitor(unittest.TestCase):
         self.rfid_monitor.monitoring_thread.join()  # Ensure the thread has finished
         self.assertFalse(self.rfid_monitor.running, "Monitoring should be stopped")
 
+    def test_publishes_to_event_queue(self):
+        event_queue = EventQueue()
+        self.mock_mfrc522_reader.scan_for_obf_id.side_effect = ["card_a", "card_b"] + [None] * 100
+        rfid_monitor = RFIDContinuousMonitor({
+            "name": "Mock_mfrc522_queue_reader",
+            "monitoring_interval": 0.01,
+            "event_queue": event_queue,
+            "mfrc522_reader": self.mock_mfrc522_reader
+        })
+
+        rfid_monitor.start_monitoring()
+        self.assertEqual(event_queue.get(timeout=1), "card_a")
+        self.assertEqual(event_queue.get(timeout=1), "card_b")
+        rfid_monitor.stop_monitoring()
+
+    def make_adaptive_monitor(self, reader, event_queue, monitoring_interval=1):
+        return RFIDContinuousMonitor({
+            "name": "Simulated_rfid_monitor",
+            "monitoring_interval": monitoring_interval,
+            "fast_interval": 0.01,
+            "duplicate_window": 0.1,
+            "event_queue": event_queue,
+            "mfrc522_reader": reader
+        })
+
+    def test_card_held_in_field_is_published_once(self):
+        reader = SimulatedRFIDScanner({"name": "Simulated_rfid_reader"})
+        event_queue = EventQueue()
+        rfid_monitor = self.make_adaptive_monitor(reader, event_queue)
+        rfid_monitor.notify_activity()
+        rfid_monitor.start_monitoring()
+
+        reader.present_card("card_a", duration=0.3)
+        time.sleep(0.4)
+        rfid_monitor.stop_monitoring()
+
+        self.assertEqual(event_queue.get_nowait(), "card_a")
+        self.assertIsNone(event_queue.get_nowait())
+        self.assertGreater(rfid_monitor.suppressed_reads, 0)
+
+    def test_card_presented_again_after_leaving_field_is_published(self):
+        reader = SimulatedRFIDScanner({"name": "Simulated_rfid_reader"})
+        event_queue = EventQueue()
+        rfid_monitor = self.make_adaptive_monitor(reader, event_queue)
+        rfid_monitor.notify_activity()
+        rfid_monitor.start_monitoring()
+
+        reader.present_card("card_a", duration=0.05)
+        time.sleep(0.3)
+        reader.present_card("card_a", duration=0.05)
+        time.sleep(0.1)
+        rfid_monitor.stop_monitoring()
+
+        self.assertEqual([event_queue.get_nowait(), event_queue.get_nowait()], ["card_a", "card_a"])
+
+    def test_notify_activity_wakes_idle_monitor(self):
+        reader = SimulatedRFIDScanner({"name": "Simulated_rfid_reader"})
+        event_queue = EventQueue()
+        rfid_monitor = self.make_adaptive_monitor(reader, event_queue, monitoring_interval=30)
+        rfid_monitor.start_monitoring()
+        time.sleep(0.05)
+
+        # Idle monitor is sleeping for 30 s; activity wakes it into fast polling
+        reader.present_card("card_a", duration=1)
+        rfid_monitor.notify_activity()
+        self.assertEqual(event_queue.get(timeout=0.5), "card_a")
+        rfid_monitor.stop_monitoring()
+
+    def test_scheduled_monitor_publishes_access_point(self):
+        scheduler = TimerScheduler("test_rfid_scheduler")
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        reader = SimulatedRFIDScanner({"name": "Simulated_rfid_reader"})
+        event_manager = EventManager({"name": "test_rfid_events"})
+        received = []
+        event_manager.subscribe_to_event("rfid_scanned", received.append)
+
+        rfid_monitor = RFIDContinuousMonitor({
+            "name": "Scheduled_rfid_monitor",
+            "monitoring_interval": 30,
+            "event_manager": event_manager,
+            "mfrc522_reader": reader,
+            "scheduler": scheduler,
+            "access_point": "front_door"
+        })
+        rfid_monitor.start_monitoring()
+        time.sleep(0.05)
+        reader.present_card("card_a", duration=1)
+        rfid_monitor.notify_activity()
+        self.assertTrue(event_manager.dispatch(timeout=0.5))
+        rfid_monitor.stop_monitoring()
+
+        self.assertIsNone(rfid_monitor.monitoring_thread)
+        self.assertEqual(received, [{"obf_rfid": "card_a", "access_point": "front_door"}])
+
     # Additional tests can be added here to further verify the behavior of RFIDContinuousMonitor
 
 if __name__ == '__main__':
@@ -1,8 +1,18 @@
+import sys
+import threading
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, MagicMock, patch
 from src.hardware.implementations.continuous_switch_monitor import ContinuousSwitchMonitor
+from src.utils.timer_scheduler import TimerScheduler
+from src.hardware.simulation.virtual_gpio import VirtualGPIO
 import time
 
+# Mock RPi.GPIO module
+sys.modules.setdefault('RPi', MagicMock())
+sys.modules.setdefault('RPi.GPIO', MagicMock())
+
+from src.hardware.implementations.pi_gpio_switch_reader import PiGPIOSwitchReader
+
 class TestContinuousSwitchMonitor(unittest.TestCase):
     def setUp(self):
         self.mock_switch_reader = Mock()
@@ -37,5 +47,105 @@ class TestContinuousSwitchMonitor(unittest.TestCase):
 
     # Additional tests can be added here to further verify the behavior of ContinuousSwitchMonitor
 
+class RecordingSharedVariable:
+    """
+    Records when values are published so tests can measure notification latency.
+    """
+    def __init__(self):
+        self.values = []
+        self.updated = threading.Event()
+
+    def set(self, value):
+        self.values.append((time.perf_counter(), value))
+        self.updated.set()
+
+class TestContinuousSwitchMonitorDetectionModes(unittest.TestCase):
+    PIN = 4
+
+    def setUp(self):
+        self.fake_gpio = VirtualGPIO()
+        patcher = patch("src.hardware.implementations.pi_gpio_switch_reader.GPIO", self.fake_gpio)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.switch_reader = PiGPIOSwitchReader({"name": "Fake_reed_switch", "pin_number": self.PIN})
+
+    def make_monitor(self, detection_mode, monitoring_interval, scheduler=None):
+        shared_state = RecordingSharedVariable()
+        monitor = ContinuousSwitchMonitor({
+            "name": f"Fake_{detection_mode}_monitor",
+            "monitoring_interval": monitoring_interval,
+            "threading_shared_var": shared_state,
+            "switch_reader": self.switch_reader,
+            "detection_mode": detection_mode,
+            "debounce_time": 0.01,
+            "scheduler": scheduler
+        })
+        return monitor, shared_state
+
+    def measure_change_latency(self, monitor, shared_state):
+        monitor.start_monitoring()
+        self.addCleanup(monitor.stop_monitoring)
+
+        # Wait for the initial state, then open the door
+        self.assertTrue(shared_state.updated.wait(1))
+        shared_state.updated.clear()
+        time.sleep(0.05)
+        changed_at = time.perf_counter()
+        self.fake_gpio.inject(self.PIN, VirtualGPIO.LOW)
+
+        self.assertTrue(shared_state.updated.wait(2), "State change should be published")
+        notified_at, state = shared_state.values[-1]
+        self.assertEqual(state, "active")
+        return notified_at - changed_at
+
+    def test_edge_mode_registers_and_removes_callback(self):
+        monitor, shared_state = self.make_monitor("edge", 30)
+        monitor.start_monitoring()
+        self.assertIn(self.PIN, self.fake_gpio.callbacks)
+        monitor.stop_monitoring()
+        self.assertNotIn(self.PIN, self.fake_gpio.callbacks)
+
+    def test_edge_mode_debounces_bursts(self):
+        monitor, shared_state = self.make_monitor("edge", 30)
+        monitor.start_monitoring()
+        self.addCleanup(monitor.stop_monitoring)
+        self.assertTrue(shared_state.updated.wait(1))
+
+        # Contact bounce ending in the closed state publishes a single change
+        for level in (VirtualGPIO.LOW, VirtualGPIO.HIGH, VirtualGPIO.LOW, VirtualGPIO.HIGH, VirtualGPIO.LOW):
+            self.fake_gpio.inject(self.PIN, level)
+        time.sleep(0.2)
+        self.assertEqual([state for _, state in shared_state.values], ["inactive", "active"])
+
+    def test_change_to_notification_latency(self):
+        poll_monitor, poll_state = self.make_monitor("poll", 1)
+        poll_latency = self.measure_change_latency(poll_monitor, poll_state)
+        poll_monitor.stop_monitoring()
+        self.fake_gpio.inject(self.PIN, VirtualGPIO.HIGH)
+
+        edge_monitor, edge_state = self.make_monitor("edge", 30)
+        edge_latency = self.measure_change_latency(edge_monitor, edge_state)
+
+        self.assertLess(edge_latency, 0.2, "Edge mode should notify within the debounce window")
+        self.assertLess(edge_latency, poll_latency)
+
+    def test_scheduled_edge_mode_uses_no_thread(self):
+        scheduler = TimerScheduler("test_switch_scheduler")
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        threads_before = threading.active_count()
+
+        monitor, shared_state = self.make_monitor("edge", 30, scheduler)
+        latency = self.measure_change_latency(monitor, shared_state)
+        self.assertEqual(threading.active_count(), threads_before)
+        self.assertLess(latency, 0.2)
+
+        # Contact bounce is debounced on the scheduler as well
+        shared_state.updated.clear()
+        for level in (VirtualGPIO.HIGH, VirtualGPIO.LOW, VirtualGPIO.HIGH):
+            self.fake_gpio.inject(self.PIN, level)
+        time.sleep(0.2)
+        self.assertEqual([state for _, state in shared_state.values], ["inactive", "active", "inactive"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,22 @@
+import hmac
 import unittest
 import sys
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
+
+class FakeSimpleMFRC522:
+    constructed = 0
+
+    def __init__(self):
+        # The real constructor opens and resets the chip on bus 0, device 0
+        FakeSimpleMFRC522.constructed += 1
 
 # Mock RPi.GPIO module
 sys.modules['RPi'] = MagicMock()
 sys.modules['RPi.GPIO'] = MagicMock()
-sys.modules['mfrc522'] = MagicMock()
+sys.modules['mfrc522'] = MagicMock(SimpleMFRC522=FakeSimpleMFRC522)
 
 from src.hardware.implementations.mfrc522_reader import MFRC522Reader
+from src.hardware.implementations import mfrc522_reader
 
 
 
@@ -23,25 +32,42 @@ class TestMFRC522Reader(unittest.TestCase):
         self.rfid_reader.reader = Mock()
         self.rfid_reader.reader.read_id_no_block = Mock()
 
-    @patch("src.hardware.implementations.mfrc522_reader.hmac.new")
-    def test_scan_for_obf_id(self, mock_hmac_new):
+    def test_opens_only_the_configured_reader(self):
+        mfrc522_reader.MFRC522.reset_mock()
+        reader = MFRC522Reader({"name": "TestSecondRFIDReader", "spi_bus": 1, "spi_device": 2, "pin_rst": 16})
 
-        # Setup the mock for hmac
-        mock_hmac_obj = Mock()
-        mock_hmac_new.return_value = mock_hmac_obj
-        mock_hmac_obj.hexdigest.return_value = "hex_hashed_id"
+        mfrc522_reader.MFRC522.assert_called_once_with(bus=1, device=2, pin_rst=16)
+        self.assertIs(reader.reader.READER, mfrc522_reader.MFRC522.return_value)
+        self.assertEqual(FakeSimpleMFRC522.constructed, 0)
 
+    def test_scan_for_obf_id(self):
         # Simulate a successful RFID scan
         self.rfid_reader.reader.read_id_no_block.return_value = 123456789
         hashed_id = self.rfid_reader.scan_for_obf_id()
 
-        mock_hmac_new.assert_called_once_with(
+        expected_id = hmac.new(
             self.config["hmac_secret_key"].encode("utf-8"),
-            msg=str(123456789).encode("utf-8"), 
+            msg=str(123456789).encode("utf-8"),
             digestmod="sha256"
-        )
-        mock_hmac_obj.hexdigest.assert_called_once()
-        self.assertEqual(hashed_id, 'hex_hashed_id')
+        ).hexdigest()
+        self.assertEqual(hashed_id, expected_id)
+
+    def test_repeated_scans_use_cached_hash(self):
+        self.rfid_reader.reader.read_id_no_block.return_value = 123456789
+        first_id = self.rfid_reader.scan_for_obf_id()
+        second_id = self.rfid_reader.scan_for_obf_id()
+
+        self.assertEqual(first_id, second_id)
+        self.assertEqual(self.rfid_reader.id_hasher.stats()["hits"], 1)
+
+    def test_rotate_secret_key(self):
+        self.rfid_reader.reader.read_id_no_block.return_value = 123456789
+        old_id = self.rfid_reader.scan_for_obf_id()
+        self.rfid_reader.rotate_secret_key("rotated_secret_key")
+
+        expected_id = hmac.new(b"rotated_secret_key", msg=b"123456789", digestmod="sha256").hexdigest()
+        self.assertNotEqual(old_id, expected_id)
+        self.assertEqual(self.rfid_reader.scan_for_obf_id(), expected_id)
 
     def test_scan_for_obf_id_no_card(self):
         # Simulate no RFID card being scanned
@@ -0,0 +1,132 @@
+import json
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+import pytest
+from src.hardware.implementations.simulated_rfid_scanner import SimulatedRFIDScanner
+from src.hardware.simulation.simulated_hardware import SimulatedHardware
+from src.hardware.simulation.scan_trace import TraceReplayer, load_trace, save_trace
+from src.hardware.simulation.virtual_gpio import VirtualGPIO
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+def test_virtual_gpio_records_level_changes():
+    gpio = VirtualGPIO()
+    gpio.setup(21, gpio.OUT)
+    gpio.output(21, gpio.HIGH)
+    gpio.output(21, gpio.HIGH)
+    gpio.output(21, gpio.LOW)
+    assert [level for _, level in gpio.transitions(21)] == [gpio.HIGH, gpio.LOW]
+
+def test_card_field_reads_card_while_held():
+    field = SimulatedHardware().card_field()
+    assert field.read_uid() is None
+    presentation = field.present_card(1234, hold=0.05)
+    assert field.read_uid() == 1234
+    read_at = presentation["read_at"]
+    assert field.read_uid() == 1234
+    assert presentation["read_at"] == read_at  # First read is kept
+    time.sleep(0.06)
+    assert field.read_uid() is None
+
+def test_card_removed_before_a_read_is_lost():
+    field = SimulatedHardware().card_field()
+    presentation = field.present_card(1234, hold=0.01)
+    time.sleep(0.02)
+    assert field.read_uid() is None
+    assert presentation["read_at"] is None
+
+def test_simulated_scanner_uses_a_card_field():
+    reader = SimulatedRFIDScanner({"name": "test_simulated_reader"})
+    presentation = reader.present_card("card_a", duration=1)
+    assert reader.scan_for_obf_id() == "card_a"
+    assert presentation["read_at"] is not None
+    reader.remove_card()
+    assert reader.scan_for_obf_id() is None
+    assert presentation["removed_at"] - presentation["presented_at"] < 1
+    assert reader.read_count == 2
+
+def test_install_replaces_and_restores_modules():
+    hardware = SimulatedHardware()
+    before = sys.modules.get("mfrc522")
+    hardware.install()
+    try:
+        import mfrc522
+        reader = mfrc522.SimpleMFRC522()
+        reader.READER = mfrc522.MFRC522(bus=0, device=1)
+        hardware.card_field(0, 1).present_card(42)
+        assert reader.read_id_no_block() == 42
+        assert sys.modules["RPi.GPIO"].HIGH == 1
+    finally:
+        hardware.uninstall()
+    assert sys.modules.get("mfrc522") is before
+
+def test_trace_round_trip(tmp_path):
+    scans = [{"t": 2, "uid": 2, "access_point": "side_door"}, {"t": 1, "uid": 1, "hold": 2}]
+    save_trace(tmp_path / "trace.jsonl", scans)
+    assert [scan["uid"] for scan in load_trace(tmp_path / "trace.jsonl")] == [1, 2]
+
+def test_invalid_trace_raises(tmp_path):
+    (tmp_path / "trace.jsonl").write_text('{"t": 1}\n')
+    with pytest.raises(ValueError):
+        load_trace(tmp_path / "trace.jsonl")
+
+def test_replayer_presents_scans_at_accelerated_times():
+    hardware = SimulatedHardware()
+    replayer = TraceReplayer(hardware, {"side_door": (0, 1)}, speed=10)
+    start = time.monotonic()
+    records = replayer.replay([
+        {"t": 0, "uid": 1, "hold": 1},
+        {"t": 1, "uid": 2, "hold": 1, "access_point": "side_door"}
+    ])
+    assert 0.09 <= records[1]["presented_at"] - start < 0.5
+    assert records[0]["removed_at"] - records[0]["presented_at"] == pytest.approx(0.1)
+    assert hardware.card_field(0, 1).read_uid() == 2
+    assert records[1]["access_point"] == "side_door"
+
+def test_ada_main_runs_on_simulated_hardware(tmp_path):
+    # A fresh interpreter, since ada binds RPi.GPIO and mfrc522 when imported
+    script = textwrap.dedent("""
+        import json, os, sys, threading, time
+        from src.hardware.simulation.simulated_hardware import SimulatedHardware
+        from src.utils.obfuscated_id_hasher import ObfuscatedIdHasher
+
+        obf_rfid = ObfuscatedIdHasher("test_key").hash_id("1234")
+        with open(os.environ["JSON_DB_CONNECTION_INFO"], "w") as file:
+            json.dump({obf_rfid: {
+                "obf_rfid": obf_rfid, "member_level": "member", "membership_status": "active",
+                "access_interval": "R/2024-01-01T00:00:00/PT24H", "member_sponsor": "",
+                "created": "", "last_updated": ""
+            }}, file)
+
+        hardware = SimulatedHardware()
+        hardware.install()
+        import ada
+        stop_event = threading.Event()
+        thread = threading.Thread(target=ada.main, args=(stop_event,))
+        thread.start()
+        time.sleep(0.3)
+        hardware.card_field().present_card(1234, hold=0.5)
+        time.sleep(0.3)
+        stop_event.set()
+        thread.join()
+        print(json.dumps([level for _, level in hardware.gpio.transitions(21)]))
+    """)
+    # Run from tmp_path with only these variables, so neither a developer's
+    # .env nor the project's logs/ada.log is touched
+    env = {
+        "PATH": "",
+        "PYTHONPATH": str(REPO_ROOT),
+        "LOG_FILE": str(tmp_path / "ada.log"),
+        "HMAC_SECRET_KEY": "test_key",
+        "JSON_DB_CONNECTION_INFO": str(tmp_path / "db.json"),
+        "RFID_MONITOR_INTERVAL": "0.05",
+        "DOOR_UNLOCK_DURATION_SEC": "60"
+    }
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    assert "Door unlocked" in (tmp_path / "ada.log").read_text()
+    # Unlocked by the scan, relocked on shutdown
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == [1, 0]
@@ -0,0 +1,16 @@
+def make_member(obf_rfid, level="guest", status="active", access_interval="R5/2024-02-08T11:00:00/PT9H", sponsor="sponsor", **fields):
+    """
+    Return a member record with every member_schema field, for tests.
+    fields adds or overrides other fields, e.g. created and last_updated.
+    """
+    member_info = {
+        "obf_rfid": obf_rfid,
+        "member_level": level,
+        "membership_status": status,
+        "access_interval": access_interval,
+        "member_sponsor": sponsor,
+        "created": "",
+        "last_updated": ""
+    }
+    member_info.update(fields)
+    return member_info
@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.access_control_manager import (
+    ALWAYS, DENIED, SCHEDULED, AccessControlManager, MemberLevel, compile_member
+)
+from tests.helpers import make_member
+
+UTC = ZoneInfo("UTC")
+GUEST_INTERVAL = "R5/2024-02-08T11:00:00/PT9H"
+DURING_VISIT = datetime(2024, 2, 9, 12, 0, tzinfo=UTC)
+AFTER_HOURS = datetime(2024, 2, 9, 21, 0, tzinfo=UTC)
+
+@pytest.fixture
+def db(tmp_path):
+    database = JsonDatabase({
+        "name": "test_access_control_db",
+        "connection_info": tmp_path / "db.json"
+    })
+    database.add_member(make_member("member_card", level="member"))
+    database.add_member(make_member("guest_card", level="guest", access_interval=GUEST_INTERVAL))
+    return database
+
+@pytest.fixture
+def access_control(db):
+    manager = AccessControlManager({"name": "test_access_control", "database": db, "time_zone": "UTC"})
+    yield manager
+    manager.close()
+
+@pytest.mark.parametrize("member_info, expected_access", [
+    (make_member("a", level="admin"), ALWAYS),
+    (make_member("a", level="member"), ALWAYS),
+    (make_member("a", level="philanthropist", access_interval=GUEST_INTERVAL), SCHEDULED),
+    (make_member("a", level="guest", access_interval=GUEST_INTERVAL), SCHEDULED),
+    (make_member("a", level="member", status="inactive"), DENIED.access),
+    (make_member("a", level="visitor"), DENIED.access),
+    (make_member("a", level="guest", access_interval="not an interval"), DENIED.access),
+    ({"obf_rfid": "a", "member_level": "member"}, DENIED.access),
+])
+def test_compile_member(member_info, expected_access):
+    verdict, _ = compile_member(member_info, "UTC")
+    assert verdict.access == expected_access
+
+def test_levels_are_ordered():
+    assert MemberLevel.GUEST < MemberLevel.PHILANTHROPIST < MemberLevel.MEMBER < MemberLevel.ADMIN
+
+def test_validate_access(access_control):
+    assert access_control.validate_access("member_card", "front_door", AFTER_HOURS)
+    assert access_control.validate_access("guest_card", "front_door", DURING_VISIT)
+    assert not access_control.validate_access("guest_card", "front_door", AFTER_HOURS)
+    assert not access_control.validate_access("unknown_card", "front_door", DURING_VISIT)
+
+def test_table_follows_database_changes(access_control, db):
+    db.update_member({"obf_rfid": "member_card", "membership_status": "inactive"})
+    assert not access_control.validate_access("member_card", "front_door", DURING_VISIT)
+
+    db.add_member(make_member("new_card", level="admin"))
+    assert access_control.validate_access("new_card", "front_door", DURING_VISIT)
+
+def test_refresh_picks_up_external_changes(access_control, db):
+    db.data["member_card"]["membership_status"] = "inactive"
+    assert access_control.validate_access("member_card", "front_door", DURING_VISIT)
+    assert access_control.refresh() == 2
+    assert not access_control.validate_access("member_card", "front_door", DURING_VISIT)
+
+def test_changes_during_refresh_are_kept(access_control, db, monkeypatch):
+    iter_members = db.iter_members
+
+    def iter_members_then_change():
+        members = iter_members()
+        # Another thread changes members after the rebuild read them
+        db.update_member({"obf_rfid": "member_card", "membership_status": "inactive"})
+        db.add_member(make_member("new_card", level="admin"))
+        return members
+    monkeypatch.setattr(db, "iter_members", iter_members_then_change)
+    access_control.refresh()
+    assert not access_control.validate_access("member_card", "front_door", DURING_VISIT)
+    assert access_control.validate_access("new_card", "front_door", DURING_VISIT)
+    assert access_control.missed_changes == {}
+
+def test_access_point_levels(db):
+    manager = AccessControlManager({
+        "name": "test_access_control_doors",
+        "database": db,
+        "time_zone": "UTC",
+        "access_point_levels": {"workshop": ["member", "admin"]}
+    })
+    assert manager.validate_access("member_card", "workshop", DURING_VISIT)
+    assert not manager.validate_access("guest_card", "workshop", DURING_VISIT)
+    assert manager.validate_access("guest_card", "front_door", DURING_VISIT)
+
+    manager.set_access_point_levels("workshop", None)
+    assert manager.validate_access("guest_card", "workshop", DURING_VISIT)
+    with pytest.raises(ValueError):
+        manager.set_access_point_levels("workshop", ["visitor"])
+    manager.close()
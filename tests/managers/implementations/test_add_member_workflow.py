@@ -0,0 +1,54 @@
+import pytest
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.add_member_workflow import AddMemberWorkflow, is_valid_sponsor
+from tests.helpers import make_member
+
+OLD_INTERVAL = "R1/2024-02-08T11:00:00/PT9H"
+NEW_INTERVAL = "R1/2024-03-01T12:00:00/PT8H"
+
+@pytest.fixture
+def db(tmp_path):
+    database = JsonDatabase({"name": "test_add_member_db", "connection_info": tmp_path / "db.json"})
+    database.add_member(make_member("sponsor_card", level="member", access_interval=OLD_INTERVAL))
+    database.add_member(make_member("other_sponsor_card", level="admin", access_interval=OLD_INTERVAL))
+    return database
+
+@pytest.fixture
+def workflow(db):
+    return AddMemberWorkflow({"name": "test_add_member_workflow", "database": db, "get_temp_access_interval": lambda: NEW_INTERVAL})
+
+def test_sponsor_then_guest_adds_guest(db, workflow):
+    workflow.handle_scan("sponsor_card")
+    workflow.handle_scan("guest_card")
+    guest = db.get_member({"obf_rfid": "guest_card"})
+    assert (guest["member_level"], guest["access_interval"], guest["member_sponsor"]) == ("guest", NEW_INTERVAL, "sponsor_card")
+    # The next scan is a sponsor again
+    assert workflow.sponsor_obf_id is None
+
+def test_known_guest_is_renewed_and_reactivated(db, workflow):
+    db.add_member(make_member("guest_card", status="inactive", access_interval=OLD_INTERVAL, sponsor="sponsor_card"))
+    workflow.handle_scan("other_sponsor_card")
+    workflow.handle_scan("guest_card")
+    guest = db.get_member({"obf_rfid": "guest_card"})
+    assert (guest["membership_status"], guest["access_interval"]) == ("active", NEW_INTERVAL)
+    # The guest stays with the sponsor who first brought them
+    assert guest["member_sponsor"] == "sponsor_card"
+
+def test_member_scanned_as_guest_is_unchanged(db, workflow):
+    workflow.handle_scan("sponsor_card")
+    workflow.handle_scan("other_sponsor_card")
+    assert db.get_member({"obf_rfid": "other_sponsor_card"})["access_interval"] == OLD_INTERVAL
+
+@pytest.mark.parametrize("sponsor", [None, make_member("x", level="guest"), make_member("x", level="member", status="inactive")])
+def test_invalid_sponsor_cannot_add_guest(db, workflow, sponsor):
+    if sponsor is not None:
+        db.add_member({**sponsor, "obf_rfid": "bad_sponsor_card"})
+    workflow.handle_scan("bad_sponsor_card")
+    workflow.handle_scan("guest_card")
+    # guest_card was taken as the next sponsor, not as a guest
+    assert db.get_member({"obf_rfid": "guest_card"}) is None
+
+def test_is_valid_sponsor():
+    assert is_valid_sponsor(make_member("x", level="admin"))
+    assert not is_valid_sponsor(make_member("x", level="guest"))
+    assert not is_valid_sponsor(make_member("x", level="member", status="inactive"))
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import pytest
+from src.database.implementations.json_database import JsonDatabase
+from src.hardware.implementations.simulated_rfid_scanner import SimulatedRFIDScanner
+from src.managers.implementations.access_control_manager import AccessControlManager
+from src.managers.implementations.async_runtime import AsyncRuntime
+from tests.helpers import make_member
+
+GUEST_INTERVAL = "R1/2024-02-08T11:00:00/PT9H"
+
+class FakeSwitch:
+    def __init__(self, state="inactive"):
+        self.state = state
+
+    def initialize(self):
+        pass
+
+    def get_status(self):
+        return self.state
+
+class FakeLatch:
+    def __init__(self):
+        self.calls = []
+
+    def set_status(self, new_state):
+        self.calls.append(new_state)
+
+@pytest.fixture
+def db(tmp_path):
+    database = JsonDatabase({"name": "test_async_db", "connection_info": tmp_path / "db.json"})
+    database.add_member(make_member("member_card", level="member", sponsor=""))
+    return database
+
+@pytest.fixture
+def devices():
+    return {
+        "reader": SimulatedRFIDScanner({"name": "test_async_reader"}),
+        "latch": FakeLatch(),
+        "reed_switch": FakeSwitch(),
+        "mode_switch": FakeSwitch()
+    }
+
+def make_runtime(db, devices, monitoring_interval=0.01, unlock_duration=0.2, access_log=None):
+    access_control = AccessControlManager({"name": "test_async_access_control", "database": db})
+    return AsyncRuntime({
+        "name": "test_async_runtime",
+        "access_control": access_control,
+        "database": db,
+        "access_points": [{
+            "name": "front_door",
+            **devices,
+            "unlock_duration": unlock_duration,
+            "rfid_monitor": {"monitoring_interval": monitoring_interval, "adaptive_polling": False, "duplicate_window": 0.015},
+            "door_monitor": {"monitoring_interval": 0.01},
+            "mode_monitor": {"monitoring_interval": 0.01}
+        }],
+        "get_temp_access_interval": lambda: GUEST_INTERVAL,
+        "access_log": access_log
+    })
+
+def run_scenario(runtime, scenario):
+    async def main():
+        task = asyncio.create_task(runtime.run())
+        await asyncio.sleep(0.05)
+        try:
+            await scenario()
+        finally:
+            runtime.stop()
+            await task
+    asyncio.run(main())
+
+def test_authorized_scan_unlocks_then_relocks(db, devices):
+    runtime = make_runtime(db, devices)
+
+    async def scenario():
+        devices["reader"].present_card("member_card", duration=0.05)
+        await asyncio.sleep(0.1)
+        assert devices["latch"].calls == ["active"]
+        await asyncio.sleep(0.2)
+        assert devices["latch"].calls == ["active", "inactive"]
+
+    run_scenario(runtime, scenario)
+
+def test_unknown_card_is_denied(db, devices):
+    runtime = make_runtime(db, devices)
+
+    async def scenario():
+        devices["reader"].present_card("unknown_card", duration=0.05)
+        await asyncio.sleep(0.1)
+
+    run_scenario(runtime, scenario)
+    assert devices["latch"].calls == []
+
+def test_repeated_scans_extend_one_unlock(db, devices):
+    runtime = make_runtime(db, devices, unlock_duration=0.15)
+
+    async def scenario():
+        for _ in range(4):
+            devices["reader"].present_card("member_card", duration=0.02)
+            await asyncio.sleep(0.06)
+        assert runtime.access_points["front_door"].door_actuator.is_unlocked()
+        await asyncio.sleep(0.25)
+
+    run_scenario(runtime, scenario)
+    stats = runtime.stats()["front_door"]
+    assert devices["latch"].calls == ["active", "inactive"]
+    assert (stats["unlocks"], stats["relocks"]) == (1, 1)
+    assert stats["extensions"] >= 1
+
+def test_failed_unlock_is_still_logged(db, devices):
+    class FailingLatch:
+        def set_status(self, new_state):
+            raise OSError("latch write failed")
+
+    class FakeAccessLog:
+        def __init__(self):
+            self.attempts = []
+
+        def log_access_attempt(self, attempt_data):
+            self.attempts.append(attempt_data)
+
+    devices["latch"] = FailingLatch()
+    access_log = FakeAccessLog()
+    runtime = make_runtime(db, devices, access_log=access_log)
+
+    async def scenario():
+        devices["reader"].present_card("member_card", duration=0.05)
+        await asyncio.sleep(0.1)
+
+    run_scenario(runtime, scenario)
+    # The card may be read again while held, since the door never unlocked
+    assert access_log.attempts
+    assert all(attempt == {"obf_rfid": "member_card", "access_point": "front_door", "result": "granted", "reason": "unlock_failed"}
+               for attempt in access_log.attempts)
+
+def test_door_opening_wakes_idle_reader(db, devices):
+    # The reader idles at 5 seconds between polls
+    runtime = make_runtime(db, devices, monitoring_interval=5)
+
+    async def scenario():
+        devices["reader"].present_card("member_card", duration=1)
+        devices["reed_switch"].state = "active"
+        await asyncio.sleep(0.1)
+        assert devices["latch"].calls == ["active"]
+
+    run_scenario(runtime, scenario)
+
+def test_add_member_mode_adds_guest_and_is_cancelled_by_mode_switch(db, devices):
+    runtime = make_runtime(db, devices)
+    access_point = None
+
+    async def scenario():
+        nonlocal access_point
+        access_point = runtime.access_points["front_door"]
+        devices["mode_switch"].state = "active"
+        await asyncio.sleep(0.05)
+        assert access_point.add_member_task is not None
+
+        devices["reader"].present_card("member_card", duration=0.03)
+        await asyncio.sleep(0.06)
+        devices["reader"].present_card("guest_card", duration=0.03)
+        await asyncio.sleep(0.06)
+        # Scans in Add Member mode do not open the door
+        assert devices["latch"].calls == []
+        assert db.get_member({"obf_rfid": "guest_card"})["member_sponsor"] == "member_card"
+
+        task = access_point.add_member_task
+        devices["mode_switch"].state = "inactive"
+        await asyncio.sleep(0.05)
+        assert access_point.add_member_task is None
+        assert task.cancelled()
+
+        # Back to normal access control
+        devices["reader"].present_card("member_card", duration=0.03)
+        await asyncio.sleep(0.06)
+        assert devices["latch"].calls == ["active"]
+
+    run_scenario(runtime, scenario)
+
+def test_invalid_sponsor_cannot_add_guest(db, devices):
+    runtime = make_runtime(db, devices)
+
+    async def scenario():
+        devices["mode_switch"].state = "active"
+        await asyncio.sleep(0.05)
+        devices["reader"].present_card("unknown_sponsor", duration=0.03)
+        await asyncio.sleep(0.06)
+        devices["reader"].present_card("guest_card", duration=0.03)
+        await asyncio.sleep(0.06)
+
+    run_scenario(runtime, scenario)
+    assert db.get_member({"obf_rfid": "guest_card"}) is None
+
+def test_stop_relocks_and_leaves_no_threads(db, devices):
+    runtime = make_runtime(db, devices, unlock_duration=60)
+
+    async def scenario():
+        devices["mode_switch"].state = "active"
+        devices["reader"].present_card("member_card", duration=0.03)
+        await asyncio.sleep(0.05)
+        devices["mode_switch"].state = "inactive"
+        await asyncio.sleep(0.05)
+        devices["reader"].present_card("member_card", duration=0.03)
+        await asyncio.sleep(0.06)
+        assert devices["latch"].calls[-1] == "active"
+
+    run_scenario(runtime, scenario)
+    assert devices["latch"].calls[-1] == "inactive"
+    assert runtime.stats()["front_door"]["add_member_mode"] is False
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("test_async_runtime")]
+
+def test_requires_access_points(db):
+    access_control = AccessControlManager({"name": "test_async_access_control", "database": db})
+    with pytest.raises(ValueError):
+        AsyncRuntime({"access_control": access_control, "database": db, "access_points": []})
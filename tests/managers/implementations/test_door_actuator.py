@@ -0,0 +1,114 @@
+import random
+import threading
+import time
+import pytest
+from src.managers.implementations.door_actuator import DoorActuator
+from src.utils.timer_scheduler import TimerScheduler
+
+class FakeDoorLatch:
+    """
+    Records set_status() calls and flags overlapping writers.
+    """
+    def __init__(self):
+        self.calls = []
+        self.writing = threading.Lock()
+        self.overlapping_writes = 0
+
+    def set_status(self, new_state):
+        if not self.writing.acquire(blocking=False):
+            self.overlapping_writes += 1
+            return
+        try:
+            self.calls.append(new_state)
+        finally:
+            self.writing.release()
+
+@pytest.fixture
+def scheduler():
+    timer_scheduler = TimerScheduler("test_door_timers")
+    timer_scheduler.start()
+    yield timer_scheduler
+    timer_scheduler.stop()
+
+@pytest.fixture
+def door_latch():
+    return FakeDoorLatch()
+
+@pytest.fixture
+def door_actuator(door_latch, scheduler):
+    return DoorActuator({"name": "test_door_actuator", "door_latch": door_latch, "scheduler": scheduler, "unlock_duration": 0.05})
+
+def wait_for_relock(door_actuator, timeout=2):
+    deadline = time.monotonic() + timeout
+    while door_actuator.is_unlocked() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+def test_requires_latch_and_scheduler(door_latch):
+    with pytest.raises(ValueError):
+        DoorActuator({"name": "test_door_actuator_invalid", "door_latch": door_latch})
+
+def test_unlock_relocks_after_duration(door_actuator, door_latch):
+    door_actuator.unlock_door()
+    assert door_latch.calls == ["active"]
+    wait_for_relock(door_actuator)
+    assert door_latch.calls == ["active", "inactive"]
+
+def test_reauthorization_extends_deadline(door_actuator, door_latch):
+    start = time.monotonic()
+    door_actuator.unlock_door()
+    time.sleep(0.03)
+    door_actuator.unlock_door()  # second member badges in before the relock
+    wait_for_relock(door_actuator)
+
+    assert time.monotonic() - start >= 0.08
+    assert door_latch.calls == ["active", "inactive"]
+    assert door_actuator.stats()["extensions"] == 1
+
+def test_lock_door_relocks_immediately(door_actuator, door_latch):
+    door_actuator.unlock_door(duration=10)
+    door_actuator.lock_door()
+    door_actuator.lock_door()
+    assert door_latch.calls == ["active", "inactive"]
+    assert not door_actuator.is_unlocked()
+
+def test_stress_authorizations_relock_exactly_once(door_actuator, door_latch):
+    threads_before = threading.active_count()
+
+    def badge_in(count):
+        for _ in range(count):
+            door_actuator.unlock_door(duration=random.uniform(0.001, 0.02))
+            time.sleep(random.uniform(0, 0.004))
+
+    # Several hundred authorizations per second from concurrent callers
+    callers = [threading.Thread(target=badge_in, args=(100,)) for _ in range(4)]
+    for caller in callers:
+        caller.start()
+    assert threading.active_count() <= threads_before + len(callers)
+    for caller in callers:
+        caller.join()
+    wait_for_relock(door_actuator)
+
+    stats = door_actuator.stats()
+    assert stats["unlocks"] + stats["extensions"] == 400
+    assert stats["unlocks"] == stats["relocks"]
+    assert door_latch.overlapping_writes == 0
+    # Every unlock is followed by exactly one relock and the door ends locked
+    assert door_latch.calls == ["active", "inactive"] * stats["unlocks"]
+
+def test_failed_relock_is_retried(door_latch, scheduler):
+    failures = [OSError("GPIO write failed")]
+    set_status = door_latch.set_status
+
+    def flaky_set_status(new_state):
+        if new_state == "inactive" and failures:
+            raise failures.pop()
+        set_status(new_state)
+    door_latch.set_status = flaky_set_status
+
+    door_actuator = DoorActuator({"name": "test_door_actuator", "door_latch": door_latch, "scheduler": scheduler,
+                                  "unlock_duration": 0.02, "relock_retry_interval": 0.02})
+    door_actuator.unlock_door()
+    wait_for_relock(door_actuator)
+    assert not door_actuator.is_unlocked()
+    assert door_latch.calls == ["active", "inactive"]
+    assert door_actuator.stats()["relock_failures"] == 1
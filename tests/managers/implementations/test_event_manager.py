@@ -0,0 +1,80 @@
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from src.managers.implementations.event_manager import EventManager
+
+@pytest.fixture
+def event_manager():
+    return EventManager({"name": "test_event_manager"})
+
+def test_publish_and_dispatch(event_manager):
+    callback = Mock()
+    event_manager.subscribe_to_event("rfid_scanned", callback)
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_a"})
+
+    assert event_manager.dispatch(timeout=0)
+    callback.assert_called_once_with({"obf_rfid": "card_a"})
+
+def test_dispatch_times_out_without_events(event_manager):
+    assert not event_manager.dispatch(timeout=0.01)
+
+def test_events_are_dispatched_in_publish_order(event_manager):
+    received = []
+    event_manager.subscribe_to_event("mode_state_changed", lambda data: received.append(("mode", data["state"])))
+    event_manager.subscribe_to_event("rfid_scanned", lambda data: received.append(("rfid", data["obf_rfid"])))
+
+    event_manager.publish_event("mode_state_changed", {"state": "active"})
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_a"})
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_b"})
+    while event_manager.dispatch(timeout=0):
+        pass
+
+    assert received == [("mode", "active"), ("rfid", "card_a"), ("rfid", "card_b")]
+
+def test_unsubscribe(event_manager):
+    callback = Mock()
+    event_manager.subscribe_to_event("door_state_changed", callback)
+    event_manager.unsubscribe_from_event("door_state_changed", callback)
+    event_manager.publish_event("door_state_changed", {"state": "active"})
+
+    assert event_manager.dispatch(timeout=0)
+    callback.assert_not_called()
+
+def test_failing_subscriber_does_not_block_others(event_manager):
+    callback = Mock()
+    event_manager.subscribe_to_event("rfid_scanned", Mock(side_effect=RuntimeError("boom")))
+    event_manager.subscribe_to_event("rfid_scanned", callback)
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_a"})
+
+    event_manager.dispatch(timeout=0)
+    callback.assert_called_once()
+
+def test_run_wakes_on_publish(event_manager):
+    handled = threading.Event()
+    event_manager.subscribe_to_event("rfid_scanned", lambda data: handled.set())
+    stop_event = threading.Event()
+    dispatcher = threading.Thread(target=event_manager.run, args=(stop_event,))
+    dispatcher.start()
+
+    published_at = time.perf_counter()
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_a"})
+    assert handled.wait(1)
+    assert time.perf_counter() - published_at < 0.5
+
+    stop_event.set()
+    dispatcher.join()
+
+@pytest.mark.parametrize("overflow_policy, delivered", [("drop_oldest", "card_b"), ("drop_newest", "card_a")])
+def test_full_queue_drop_is_logged(caplog, overflow_policy, delivered):
+    event_manager = EventManager({"name": "test_event_manager_full", "max_queued_events": 1, "overflow_policy": overflow_policy})
+    callback = Mock()
+    event_manager.subscribe_to_event("rfid_scanned", callback)
+    event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_a"})
+    with caplog.at_level("WARNING", logger="test_event_manager_full"):
+        event_manager.publish_event("rfid_scanned", {"obf_rfid": "card_b"})
+
+    assert "Event queue full" in caplog.text
+    assert event_manager.stats()["dropped"] == 1
+    event_manager.dispatch(timeout=0)
+    callback.assert_called_once_with({"obf_rfid": delivered})
@@ -0,0 +1,87 @@
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pytest
+from src.database.implementations.json_database import JsonDatabase
+from src.database.implementations.journaled_json_database import JournaledJsonDatabase
+from src.managers.implementations.guest_expiry_sweeper import GuestExpirySweeper
+from tests.helpers import make_member
+
+UTC = ZoneInfo("UTC")
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+EXPIRED = "R3/2024-06-{day:02d}T10:00:00/PT8H"
+CURRENT = "R3/2099-01-01T10:00:00/PT8H"
+
+def test_sweeps_100k_expiring_guests_in_bounded_batches(tmp_path):
+    db = JournaledJsonDatabase({"name": "test_expiry_db", "connection_info": tmp_path / "db.json", "compaction_interval": 0})
+    db.bulk_add_members(
+        make_member(f"guest{index}", access_interval=EXPIRED.format(day=index % 28 + 1) if index % 2 == 0 else CURRENT)
+        for index in range(100_000)
+    )
+    db.bulk_add_members([
+        make_member("member", level="member", access_interval=EXPIRED.format(day=1)),
+        make_member("regular_guest", access_interval="R/2024-01-01T10:00:00/PT8H")
+    ])
+    sweeper = GuestExpirySweeper({"database": db, "time_zone": "UTC", "batch_size": 20_000})
+    assert sweeper.rebuild() == 100_000
+
+    counts = []
+    while True:
+        count = sweeper.sweep(NOW)
+        if not count:
+            break
+        counts.append(count)
+    assert counts == [20_000, 20_000, 10_000]
+    assert sweeper.stats() == {"queued": 50_000, "swept": 50_000}
+
+    inactive = db.find_members({"membership_status": "inactive"})
+    assert len(inactive) == 50_000
+    assert all(int(member_info["obf_rfid"][5:]) % 2 == 0 for member_info in inactive)
+    assert db.get_member({"obf_rfid": "member"})["membership_status"] == "active"
+    db.close()
+
+def test_changed_guests_are_requeued(tmp_path):
+    db = JsonDatabase({"name": "test_expiry_db", "connection_info": tmp_path / "db.json"})
+    db.add_member(make_member("renewed", access_interval=EXPIRED.format(day=1)))
+    sweeper = GuestExpirySweeper({"database": db, "time_zone": "UTC"})
+    sweeper.rebuild()
+    db.add_change_listener(sweeper._on_member_changed)
+
+    db.update_member({"obf_rfid": "renewed", "access_interval": CURRENT})
+    db.add_member(make_member("added", access_interval=EXPIRED.format(day=2)))
+    assert sweeper.sweep(NOW) == 1
+    assert db.get_member({"obf_rfid": "added"})["membership_status"] == "inactive"
+    assert db.get_member({"obf_rfid": "renewed"})["membership_status"] == "active"
+    assert sweeper.sweep(datetime(2100, 1, 1, tzinfo=UTC)) == 1
+
+def test_guest_renewed_during_a_sweep_stays_active(tmp_path):
+    db = JsonDatabase({"name": "test_expiry_db", "connection_info": tmp_path / "db.json"})
+    db.add_member(make_member("renewed", access_interval=EXPIRED.format(day=1)))
+    sweeper = GuestExpirySweeper({"database": db, "time_zone": "UTC"})
+    sweeper.rebuild()
+
+    # The guest is renewed right after the sweep reads the lapsed record
+    get_member = db.get_member
+    def get_member_then_renew(member_id):
+        member_info = dict(get_member(member_id))
+        db.update_member({"obf_rfid": "renewed", "access_interval": CURRENT})
+        return member_info
+    db.get_member = get_member_then_renew
+    assert sweeper.sweep(NOW) == 0
+    assert get_member({"obf_rfid": "renewed"})["membership_status"] == "active"
+    assert sweeper.stats()["swept"] == 0
+
+def test_background_thread_sweeps_new_guests(tmp_path):
+    db = JsonDatabase({"name": "test_expiry_db", "connection_info": tmp_path / "db.json"})
+    sweeper = GuestExpirySweeper({"database": db, "time_zone": "UTC", "sweep_interval": 0.01})
+    sweeper.start()
+    try:
+        db.add_member(make_member("guest", access_interval=EXPIRED.format(day=1)))
+        deadline = time.monotonic() + 5
+        while db.get_member({"obf_rfid": "guest"})["membership_status"] == "active" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert db.get_member({"obf_rfid": "guest"})["membership_status"] == "inactive"
+    finally:
+        sweeper.stop()
+    with pytest.raises(ValueError):
+        GuestExpirySweeper({})
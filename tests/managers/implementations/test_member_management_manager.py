@@ -0,0 +1,49 @@
+import pytest
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.member_management_manager import MemberManagementManager
+from tests.helpers import make_member
+
+@pytest.fixture
+def db(tmp_path):
+    database = JsonDatabase({"name": "test_member_management_db", "connection_info": tmp_path / "db.json"})
+    database.add_member(make_member("host", level="member", sponsor=""))
+    database.bulk_add_members([make_member("guest0", sponsor="host"), make_member("guest1", sponsor="host"), make_member("guest2", sponsor="other")])
+    return database
+
+def status(db, obf_rfid):
+    return db.get_member({"obf_rfid": obf_rfid})["membership_status"]
+
+def test_deactivating_a_sponsor_deactivates_their_guests(db):
+    manager = MemberManagementManager({"database": db})
+    assert manager.change_member_status("host", "inactive")
+    assert [status(db, obf_rfid) for obf_rfid in ("host", "guest0", "guest1", "guest2")] == ["inactive", "inactive", "inactive", "active"]
+    # The sponsor links are kept
+    assert len(manager.list_sponsored_guests("host")) == 2
+
+    assert manager.renew_member_membership("host", {"access_interval": "R/2024-01-01T00:00:00/PT24H"})
+    assert status(db, "host") == "active" and status(db, "guest0") == "inactive"
+    assert {member["obf_rfid"] for member in manager.list_members_by_status("inactive")} == {"guest0", "guest1"}
+
+def test_cascade_can_be_disabled(db):
+    manager = MemberManagementManager({"database": db, "cascade_deactivation": False})
+    assert manager.update_member_details("host", {"membership_status": "inactive"})
+    assert status(db, "guest0") == "active"
+
+def test_failures_are_reported_as_false(db):
+    manager = MemberManagementManager({"database": db})
+    assert not manager.change_member_status("unknown", "inactive")
+    assert not manager.add_new_member(make_member("host", level="member", sponsor=""))
+    assert manager.add_new_member(make_member("guest3", sponsor="host"))
+    assert manager.adjust_member_access_level("guest3", "member")
+    assert manager.list_sponsored_guests("nobody") is None
+    assert manager.list_members_by_status("suspended") is None
+
+def test_failed_cascade_keeps_the_sponsor_change(db, monkeypatch):
+    manager = MemberManagementManager({"database": db})
+    def bulk_update_members(updates):
+        # A guest deleted between the query and the bulk update
+        raise KeyError("guest0")
+    monkeypatch.setattr(db, "bulk_update_members", bulk_update_members)
+    assert manager.change_member_status("host", "inactive")
+    assert status(db, "host") == "inactive" and status(db, "guest0") == "active"
+    assert manager.deactivate_sponsored_guests("host") == 0
@@ -0,0 +1,89 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.time_bucket_index import TimeBucketIndex
+from tests.helpers import make_member
+
+UTC = ZoneInfo("UTC")
+NOW = datetime(2024, 2, 9, 8, 0, tzinfo=UTC)
+
+@pytest.fixture
+def db(tmp_path):
+    database = JsonDatabase({
+        "name": "test_time_bucket_db",
+        "connection_info": tmp_path / "db.json"
+    })
+    database.add_member(make_member("day_guest"))
+    database.add_member(make_member("night_guest", level="philanthropist", access_interval="R/2024-02-01T22:00:00/PT4H"))
+    database.add_member(make_member("member_card", level="member"))
+    database.add_member(make_member("inactive_guest", status="inactive"))
+    return database
+
+@pytest.fixture
+def index(db):
+    time_bucket_index = TimeBucketIndex({"name": "test_time_bucket_index", "database": db, "time_zone": "UTC"})
+    time_bucket_index.refresh(NOW)
+    yield time_bucket_index
+    time_bucket_index.close()
+
+def test_only_scheduled_members_are_indexed(index):
+    assert index.stats()["members"] == 2
+    assert index.stats()["buckets"] == 7 * 24 * 12
+
+@pytest.mark.parametrize("obf_rfid, moment, expected", [
+    ("day_guest", datetime(2024, 2, 9, 11, 0, tzinfo=UTC), True),
+    ("day_guest", datetime(2024, 2, 9, 20, 0, tzinfo=UTC), True),
+    ("day_guest", datetime(2024, 2, 9, 20, 1, tzinfo=UTC), False),
+    ("day_guest", datetime(2024, 2, 9, 10, 58, tzinfo=UTC), False),
+    ("day_guest", datetime(2024, 2, 13, 12, 0, tzinfo=UTC), False),  # after the fifth day
+    ("night_guest", datetime(2024, 2, 10, 1, 0, tzinfo=UTC), True),  # wraps past midnight
+    ("night_guest", datetime(2024, 2, 10, 12, 0, tzinfo=UTC), False),
+    ("member_card", datetime(2024, 2, 10, 12, 0, tzinfo=UTC), False),
+    ("day_guest", datetime(2024, 3, 20, 12, 0, tzinfo=UTC), False),  # past the window
+    ("night_guest", datetime(2024, 3, 20, 23, 0, tzinfo=UTC), True),
+])
+def test_is_allowed(index, obf_rfid, moment, expected):
+    assert index.is_allowed(obf_rfid, moment) == expected
+
+def test_members_allowed_between(index):
+    tonight = datetime(2024, 2, 9, 19, 0, tzinfo=UTC), datetime(2024, 2, 9, 23, 0, tzinfo=UTC)
+    assert sorted(index.members_allowed_between(*tonight)) == ["day_guest", "night_guest"]
+    assert index.count_allowed_between(datetime(2024, 2, 9, 21, 0, tzinfo=UTC), datetime(2024, 2, 9, 21, 30, tzinfo=UTC)) == 0
+
+def test_index_follows_database_changes(index, db):
+    during_visit = datetime(2024, 2, 9, 12, 0, tzinfo=UTC)
+    db.update_member({"obf_rfid": "day_guest", "membership_status": "inactive"})
+    assert not index.is_allowed("day_guest", during_visit)
+    assert index.members_allowed_between(during_visit, during_visit) == []
+
+    # The freed member number is reused
+    db.add_member(make_member("new_guest"))
+    assert index.is_allowed("new_guest", during_visit)
+    assert index.stats()["members"] == 2
+
+def test_advance_fills_new_buckets(index):
+    later = NOW + timedelta(days=3)
+    index.advance(later)
+    assert index.first_bucket == index._bucket(later)
+    next_week_night = datetime(2024, 2, 14, 23, 0, tzinfo=UTC)
+    assert index.members_allowed_between(next_week_night, next_week_night) == ["night_guest"]
+
+def test_bitsets_grow_with_members(db, index):
+    for number in range(100):
+        db.add_member(make_member(f"guest_{number}"))
+    assert index.stats()["members"] == 102
+    assert index.count_allowed_between(datetime(2024, 2, 9, 12, 0, tzinfo=UTC), datetime(2024, 2, 9, 12, 0, tzinfo=UTC)) == 101
+
+def test_started_index_advances_with_the_clock(db):
+    time_bucket_index = TimeBucketIndex({"name": "test_time_bucket_index_clock", "database": db, "bucket_minutes": 1 / 60, "horizon_days": 0.01, "start": NOW})
+    time_bucket_index.start()
+    try:
+        deadline = time.monotonic() + 3
+        while time_bucket_index.first_bucket == time_bucket_index._bucket(NOW) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert time_bucket_index.first_bucket >= time_bucket_index._bucket(datetime.now(UTC)) - 1
+    finally:
+        time_bucket_index.close()
+    assert time_bucket_index.thread is None
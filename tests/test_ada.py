@@ -0,0 +1,59 @@
+import time
+import ada
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.door_actuator import DoorActuator
+from src.utils.threading_event_queue import EventQueue
+from src.utils.timer_scheduler import TimerScheduler
+from tests.helpers import make_member
+
+class FakeLatch:
+    def __init__(self, fails=False):
+        self.fails = fails
+        self.calls = []
+
+    def set_status(self, new_state):
+        if self.fails and new_state == "inactive":
+            raise OSError("latch write failed")
+        self.calls.append(new_state)
+
+def make_access_point(name, latch, scheduler):
+    # An AccessPoint without hardware monitors
+    access_point = ada.AccessPoint.__new__(ada.AccessPoint)
+    access_point.name = name
+    access_point.monitors = []
+    access_point.door_actuator = DoorActuator({"name": f"{name}_door_actuator", "door_latch": latch, "scheduler": scheduler, "unlock_duration": 60})
+    return access_point
+
+def test_failed_relock_does_not_stop_the_other_doors_locking(caplog):
+    scheduler = TimerScheduler("test_ada_scheduler")
+    latches = [FakeLatch(fails=True), FakeLatch()]
+    access_points = [make_access_point(f"door{index}", latch, scheduler) for index, latch in enumerate(latches)]
+    for access_point in access_points:
+        access_point.door_actuator.unlock_door()
+
+    assert not ada.stop_access_points(access_points)
+    assert latches[1].calls == ["active", "inactive"]
+    assert not access_points[1].door_actuator.is_unlocked()
+    assert "Error stopping access point door0" in caplog.text
+    scheduler.stop()
+
+def test_doors_run_add_member_mode_independently(tmp_path):
+    db = JsonDatabase({"name": "test_ada_db", "connection_info": tmp_path / "db.json"})
+    db.bulk_add_members([make_member("sponsor_a", level="member"), make_member("sponsor_b", level="member")])
+    doors = {name: (ada.AddMemberModeManager(), EventQueue(maxsize=8)) for name in ("door_a", "door_b")}
+    for mode, scans in doors.values():
+        mode.start_add_member_mode(db, scans, lambda: "R1/2024-02-08T11:00:00/PT9H")
+    assert all(mode.is_active() for mode, _ in doors.values())
+
+    # Sponsors at both doors scan before either guest
+    doors["door_a"][1].put("sponsor_a")
+    doors["door_b"][1].put("sponsor_b")
+    doors["door_a"][1].put("guest_a")
+    doors["door_b"][1].put("guest_b")
+    deadline = time.monotonic() + 5
+    while (db.get_member({"obf_rfid": "guest_a"}) is None or db.get_member({"obf_rfid": "guest_b"}) is None) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for mode, _ in doors.values():
+        mode.stop_add_member_mode()
+    assert db.get_member({"obf_rfid": "guest_a"})["member_sponsor"] == "sponsor_a"
+    assert db.get_member({"obf_rfid": "guest_b"})["member_sponsor"] == "sponsor_b"
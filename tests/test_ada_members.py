@@ -0,0 +1,44 @@
+import json
+import pytest
+import ada_members
+
+@pytest.fixture
+def db_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("JSON_DB_CONNECTION_INFO", str(tmp_path / "db.json"))
+    monkeypatch.setenv("JSON_DB_WARM_START_PATH", "")
+    return tmp_path
+
+def test_import_update_export(db_env, capsys):
+    roster = db_env / "roster.csv"
+    roster.write_text(
+        "obf_rfid,member_level,membership_status,access_interval,member_sponsor\n"
+        "id0,member,active,R/2024-01-01T00:00:00/PT24H,\n"
+        "id1,guest,active,R5/2024-02-08T11:00:00/PT9H,id0\n"
+    )
+    assert ada_members.main(["import", str(roster)]) == 0
+    assert "2 members imported" in capsys.readouterr().out
+
+    changes = db_env / "changes.jsonl"
+    changes.write_text(json.dumps({"obf_rfid": "id1", "membership_status": "inactive"}) + "\n")
+    assert ada_members.main(["update", str(changes)]) == 0
+
+    assert ada_members.main(["export", str(db_env / "export.jsonl")]) == 0
+    exported = {member["obf_rfid"]: member for member in map(json.loads, (db_env / "export.jsonl").read_text().splitlines())}
+    assert exported["id1"]["membership_status"] == "inactive"
+    assert exported["id0"]["member_level"] == "member"
+
+def test_invalid_import_changes_nothing(db_env, capsys):
+    roster = db_env / "roster.jsonl"
+    roster.write_text(json.dumps({"obf_rfid": "id0", "member_level": 3}) + "\n")
+    assert ada_members.main(["import", str(roster)]) == 1
+    assert "1 invalid member records" in capsys.readouterr().err
+    assert json.loads((db_env / "db.json").read_text()) == {}
+
+def test_unreadable_files_are_reported_without_a_traceback(db_env, capsys):
+    assert ada_members.main(["import", str(db_env / "missing.csv")]) == 1
+    assert "No such file" in capsys.readouterr().err
+
+    (db_env / "db.json").write_text('{"id0": {"obf_rfid": ')
+    assert ada_members.main(["export", str(db_env / "export.csv")]) == 1
+    assert capsys.readouterr().err.startswith("export failed: ")
+    assert not (db_env / "export.csv").exists()
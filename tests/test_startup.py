@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Budget for `import ada` as reported by -X importtime, the fastest of a few
+# runs. Override with ADA_IMPORT_BUDGET_MS on slow machines.
+IMPORT_BUDGET_MS = float(os.getenv("ADA_IMPORT_BUDGET_MS", 150))
+
+# Loaded when the components using them are configured, not by `import ada`
+DEFERRED_MODULES = ("RPi", "mfrc522", "dotenv", "dateutil", "isodate", "src.hardware.implementations", "src.database.implementations")
+
+def run_python(*args):
+    result = subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    return result
+
+def test_import_ada_defers_hardware_and_optional_dependencies():
+    result = run_python("-c", "import json, sys, ada; print(json.dumps(sorted(sys.modules)))")
+    loaded = json.loads(result.stdout)
+    assert [name for name in loaded if name.startswith(DEFERRED_MODULES)] == []
+
+def test_import_does_not_configure_logging():
+    result = run_python("-c", "import logging, ada, src.ada_interface; print(len(logging.getLogger().handlers))")
+    assert result.stdout.strip() == "0"
+
+def test_import_ada_within_budget():
+    cumulative_ms = []
+    for _ in range(3):
+        stderr = run_python("-X", "importtime", "-c", "import ada").stderr
+        line = next(line for line in stderr.splitlines() if line.rstrip().endswith("| ada"))
+        cumulative_ms.append(int(line.split("|")[1]) / 1000)
+    assert min(cumulative_ms) < IMPORT_BUDGET_MS, f"import ada took {min(cumulative_ms):.1f} ms"
@@ -0,0 +1,42 @@
+import json
+import pytest
+from src.utils.access_point_config import load_access_points, normalize_access_point
+
+def write_config(tmp_path, access_points):
+    filepath = tmp_path / "access_points.json"
+    filepath.write_text(json.dumps({"access_points": access_points}))
+    return filepath
+
+def test_load_access_points_fills_defaults(tmp_path):
+    filepath = write_config(tmp_path, [
+        {"name": "front_door", "reader": {}, "latch": {"pin_number": 21}, "reed_switch": {"pin_number": 4},
+         "door_monitor": {"detection_mode": "edge"}},
+        {"name": "workshop", "reader": {"spi_device": 1}, "latch": {"pin_number": 20}, "allowed_levels": ["member", "admin"]}
+    ])
+    front_door, workshop = load_access_points(filepath)
+
+    assert front_door["reader"]["name"] == "front_door_reader"
+    assert front_door["door_monitor"] == {"name": "front_door_door_monitor", "detection_mode": "edge"}
+    assert front_door["unlock_duration"] == 7
+    assert front_door["allowed_levels"] is None
+    assert workshop.get("reed_switch") is None
+    assert "door_monitor" not in workshop
+    assert workshop["allowed_levels"] == ["member", "admin"]
+
+@pytest.mark.parametrize("spec", [
+    {"reader": {}, "latch": {}},
+    {"name": "front_door", "latch": {}},
+    {"name": "front_door", "reader": {}, "latch": 21},
+])
+def test_incomplete_access_points_are_rejected(spec):
+    with pytest.raises(ValueError):
+        normalize_access_point(spec)
+
+def test_duplicate_names_are_rejected(tmp_path):
+    door = {"name": "front_door", "reader": {}, "latch": {}}
+    with pytest.raises(ValueError):
+        load_access_points(write_config(tmp_path, [door, door]))
+
+def test_empty_config_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        load_access_points(write_config(tmp_path, []))
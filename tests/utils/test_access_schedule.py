@@ -0,0 +1,56 @@
+import pytest
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from dateutil import rrule
+from src.utils.access_schedule import AccessScheduleCache, compile_access_interval
+
+UTC = ZoneInfo("UTC")
+
+def test_compile_access_interval():
+    schedule = compile_access_interval("R5/2024-02-08T11:00:00/PT9H", "UTC")
+    assert schedule.start == datetime(2024, 2, 8, 11, tzinfo=UTC)
+    assert schedule.period == timedelta(days=1)
+    assert schedule.duration == timedelta(hours=9)
+    assert schedule.count == 5
+
+def test_compile_invalid_interval():
+    with pytest.raises(ValueError):
+        compile_access_interval("not an interval", "UTC")
+
+def test_start_is_interpreted_in_scanner_time_zone():
+    schedule = compile_access_interval("R/2024-02-08T11:00:00/PT1H", "America/Los_Angeles")
+    assert schedule.start == datetime(2024, 2, 8, 19, tzinfo=UTC)
+
+@pytest.mark.parametrize("interval_str", [
+    "R5/2024-02-08T11:00:00/PT9H",
+    "R/2024-02-08T11:00:00/PT9H",
+    "R1/2024-02-08T23:30:00/PT2H",
+])
+def test_contains_matches_rrule(interval_str):
+    schedule = compile_access_interval(interval_str, "UTC")
+    rule = rrule.rrule(rrule.DAILY, interval=1, dtstart=schedule.start, count=schedule.count)
+
+    moment = datetime(2024, 2, 7, 0, 15, tzinfo=UTC)
+    while moment < datetime(2024, 2, 16, tzinfo=UTC):
+        occurrence_start = rule.before(moment, inc=True)
+        expected = occurrence_start is not None and occurrence_start <= moment <= occurrence_start + schedule.duration
+        assert schedule.contains(moment) == expected, moment
+        moment += timedelta(minutes=45)
+
+def test_final_end():
+    assert compile_access_interval("R3/2024-02-08T11:00:00/PT9H", "UTC").final_end() == datetime(2024, 2, 10, 20, tzinfo=UTC)
+    assert compile_access_interval("R/2024-02-08T11:00:00/PT9H", "UTC").final_end() is None
+
+def test_cache_memoizes_and_invalidates():
+    cache = AccessScheduleCache()
+    schedule = cache.get("R5/2024-02-08T11:00:00/PT9H", "UTC")
+    assert cache.get("R5/2024-02-08T11:00:00/PT9H", "UTC") is schedule
+
+    cache.invalidate("R5/2024-02-08T11:00:00/PT9H")
+    assert cache.get("R5/2024-02-08T11:00:00/PT9H", "UTC") is not schedule
+
+def test_cache_is_bounded():
+    cache = AccessScheduleCache(maxsize=2)
+    for day in range(1, 5):
+        cache.get(f"R1/2024-02-0{day}T11:00:00/PT9H", "UTC")
+    assert len(cache.schedules) == 2
@@ -0,0 +1,24 @@
+import pytest
+from src.utils.adaptive_polling import AdaptivePollingScheduler
+
+def test_idle_scheduler_polls_at_max_interval():
+    scheduler = AdaptivePollingScheduler(fast_interval=0.05, max_interval=5)
+    assert scheduler.next_interval(now=0) == 5
+
+def test_activity_switches_to_fast_polling():
+    scheduler = AdaptivePollingScheduler(fast_interval=0.05, max_interval=5, active_window=10)
+    scheduler.record_activity(now=100)
+    assert scheduler.next_interval(now=105) == 0.05
+    assert scheduler.next_interval(now=110) == 0.05
+
+def test_backs_off_exponentially_when_idle():
+    scheduler = AdaptivePollingScheduler(fast_interval=0.05, max_interval=1, backoff_factor=2, active_window=10)
+    scheduler.record_activity(now=0)
+    intervals = [scheduler.next_interval(now=20) for _ in range(6)]
+    assert intervals == [0.1, 0.2, 0.4, 0.8, 1, 1]
+
+def test_invalid_intervals():
+    with pytest.raises(ValueError):
+        AdaptivePollingScheduler(fast_interval=2, max_interval=1)
+    with pytest.raises(ValueError):
+        AdaptivePollingScheduler(backoff_factor=0.5)
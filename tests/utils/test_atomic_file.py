@@ -0,0 +1,30 @@
+import os
+import stat
+import pytest
+from src.utils.atomic_file import UMASK, atomic_write
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_replaced_file_keeps_its_permissions(tmp_path):
+    path = tmp_path / "members.json"
+    path.write_text("{}")
+    os.chmod(path, 0o640)
+    atomic_write(path, lambda file: file.write('{"id0": {}}'))
+    assert path.read_text() == '{"id0": {}}'
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_new_file_gets_the_umask_default(tmp_path):
+    path = tmp_path / "members.json"
+    atomic_write(path, lambda file: file.write("{}"))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~UMASK
+
+def test_failed_write_leaves_the_file(tmp_path):
+    path = tmp_path / "members.json"
+    path.write_text("{}")
+    def failing_write(file):
+        file.write('{"id0": ')
+        raise OSError("disk full")
+    with pytest.raises(OSError):
+        atomic_write(path, failing_write)
+    assert path.read_text() == "{}"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["members.json"]
@@ -0,0 +1,73 @@
+import logging
+import queue
+from contextlib import contextmanager
+from unittest.mock import patch
+from src.utils.logging_utils import DroppingQueueHandler, get_dropped_log_records, setup_logging, shutdown_logging
+
+@contextmanager
+def unconfigured_root_logger():
+    # pytest attaches capture handlers to the root logger for each test phase,
+    # so hide them for the duration of the test and restore them afterwards
+    logger = logging.getLogger()
+    saved_level = logger.level
+    try:
+        with patch.object(logger, "handlers", []):
+            yield logger
+            shutdown_logging()
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
+    finally:
+        logger.setLevel(saved_level)
+
+def test_async_logging_writes_records(tmp_path):
+    log_file = tmp_path / "ada.log"
+    with unconfigured_root_logger() as root_logger:
+        setup_logging(logging.DEBUG, async_logging=True, log_file=log_file)
+        assert isinstance(root_logger.handlers[0], DroppingQueueHandler)
+
+        logging.getLogger("test_async").debug("Door unlocked")
+        assert get_dropped_log_records() == 0
+        shutdown_logging()
+
+    assert "[DEBUG] [test_async] Door unlocked" in log_file.read_text()
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    handler.handle(record)
+    handler.handle(record)
+    assert handler.dropped_records == 1
+
+def test_arguments_are_merged_when_logged():
+    log_queue = queue.Queue()
+    handler = DroppingQueueHandler(log_queue)
+    doors = ["front_door"]
+    handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "Doors %s", (doors,), None))
+    doors.append("back_door")
+    assert log_queue.get_nowait().getMessage() == "Doors ['front_door']"
+
+def test_reconfiguring_registers_one_exit_handler(tmp_path):
+    with unconfigured_root_logger(), patch("src.utils.logging_utils.atexit") as mock_atexit:
+        for _ in range(3):
+            setup_logging(logging.INFO, async_logging=True, log_file=tmp_path / "ada.log", force=True)
+        assert mock_atexit.register.call_count - mock_atexit.unregister.call_count == 1
+
+def test_size_based_rotation(tmp_path):
+    log_file = tmp_path / "ada.log"
+    with unconfigured_root_logger():
+        setup_logging(logging.INFO, async_logging=True, log_file=log_file, max_bytes=200, backup_count=2)
+        for index in range(20):
+            logging.getLogger("test_rotation").info(f"Record number {index}")
+        shutdown_logging()
+
+    assert (tmp_path / "ada.log.1").exists()
+    assert not (tmp_path / "ada.log.3").exists()
+
+def test_force_replaces_existing_handlers(tmp_path):
+    with unconfigured_root_logger() as root_logger:
+        setup_logging(logging.INFO, log_file=tmp_path / "first.log")
+        setup_logging(logging.DEBUG, log_file=tmp_path / "second.log", force=True)
+        assert root_logger.level == logging.DEBUG
+        assert len(root_logger.handlers) == 2
+        assert all("first.log" not in getattr(handler, "baseFilename", "") for handler in root_logger.handlers)
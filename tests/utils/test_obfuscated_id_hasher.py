@@ -0,0 +1,39 @@
+import hmac
+from src.utils.obfuscated_id_hasher import ObfuscatedIdHasher
+
+def reference_hash(secret_key, raw_id):
+    return hmac.new(secret_key.encode("utf-8"), msg=raw_id.encode("utf-8"), digestmod="sha256").hexdigest()
+
+def test_hash_matches_hmac_new():
+    hasher = ObfuscatedIdHasher("secret")
+    for raw_id in ("123456789", "987654321", "1"):
+        assert hasher.hash_id(raw_id) == reference_hash("secret", raw_id)
+
+def test_cache_hits_and_ratio():
+    hasher = ObfuscatedIdHasher("secret")
+    for _ in range(4):
+        hasher.hash_id("123456789")
+    stats = hasher.stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.75
+
+def test_cache_is_bounded_lru():
+    hasher = ObfuscatedIdHasher("secret", cache_size=2)
+    hasher.hash_id("a")
+    hasher.hash_id("b")
+    hasher.hash_id("a")  # "b" is now least recently used
+    hasher.hash_id("c")
+    assert list(hasher.cache) == ["a", "c"]
+
+def test_secret_rotation_invalidates_cache():
+    hasher = ObfuscatedIdHasher("secret")
+    hasher.hash_id("123456789")
+    hasher.set_secret_key("rotated")
+    assert hasher.stats()["cached"] == 0
+    assert hasher.hash_id("123456789") == reference_hash("rotated", "123456789")
+
+def test_cache_can_be_disabled():
+    hasher = ObfuscatedIdHasher("secret", cache_size=0)
+    hasher.hash_id("123456789")
+    assert hasher.stats()["cached"] == 0
@@ -0,0 +1,92 @@
+import threading
+import time
+import pytest
+from src.utils.scheduled_poller import ScheduledPoller
+from src.utils.timer_scheduler import Timer, TimerScheduler
+
+@pytest.fixture
+def scheduler():
+    timer_scheduler = TimerScheduler("test_poller_scheduler")
+    timer_scheduler.start()
+    yield timer_scheduler
+    timer_scheduler.stop()
+
+def test_polls_repeat_at_returned_interval(scheduler):
+    polls = []
+    poller = ScheduledPoller(scheduler, lambda: polls.append(time.monotonic()) or 0.01)
+    poller.start()
+    time.sleep(0.1)
+    poller.stop()
+    assert 4 <= len(polls) <= 12
+
+def test_poll_soon_brings_poll_forward(scheduler):
+    polled = threading.Event()
+    poller = ScheduledPoller(scheduler, lambda: polled.set() or 10)
+    poller.start(delay=10)
+    poller.poll_soon()
+    assert polled.wait(1)
+    poller.stop()
+
+def test_many_pollers_share_one_thread(scheduler):
+    threads_before = threading.active_count()
+    counts = [0] * 32
+
+    def make_poll(index):
+        def poll():
+            counts[index] += 1
+            return 0.01
+        return poll
+
+    pollers = [ScheduledPoller(scheduler, make_poll(index)) for index in range(len(counts))]
+    for poller in pollers:
+        poller.start()
+    time.sleep(0.1)
+    assert threading.active_count() == threads_before
+    for poller in pollers:
+        poller.stop()
+    assert all(count >= 3 for count in counts)
+
+def test_failing_poll_is_retried(scheduler):
+    calls = []
+
+    def poll():
+        calls.append(1)
+        raise RuntimeError("reader unplugged")
+
+    poller = ScheduledPoller(scheduler, poll, error_delay=0.01)
+    poller.start()
+    time.sleep(0.1)
+    poller.stop()
+    assert len(calls) >= 3
+
+class ManualScheduler:
+    def __init__(self):
+        self.timers = []
+
+    def call_later(self, delay, callback):
+        timer = Timer(time.monotonic() + delay, callback)
+        self.timers.append(timer)
+        return timer
+
+    def pending(self):
+        return [timer for timer in self.timers if not timer.cancelled]
+
+    def fire(self, timer):
+        # As TimerScheduler does: popped first, then called
+        self.timers.remove(timer)
+        timer.callback()
+
+def test_poll_soon_racing_a_fired_timer_keeps_one_chain():
+    scheduler = ManualScheduler()
+    polls = []
+    poller = ScheduledPoller(scheduler, lambda: polls.append(1) or 5)
+    poller.start()
+    (fired,) = scheduler.timers
+    # The scheduler has popped the timer but _run hasn't taken the lock yet
+    scheduler.timers.remove(fired)
+    poller.poll_soon(0.05)
+    fired.callback()
+    assert polls == [] and len(scheduler.pending()) == 1
+
+    scheduler.fire(scheduler.pending()[0])
+    assert polls == [1] and len(scheduler.pending()) == 1
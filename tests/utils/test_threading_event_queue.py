@@ -0,0 +1,60 @@
+import threading
+import time
+import pytest
+from src.utils.threading_event_queue import EventQueue
+
+def test_events_are_not_overwritten():
+    event_queue = EventQueue()
+    event_queue.put("card_a")
+    event_queue.put("card_b")
+    assert event_queue.get(timeout=0) == "card_a"
+    assert event_queue.get(timeout=0) == "card_b"
+    assert event_queue.get(timeout=0) is None
+
+def test_get_blocks_until_event_is_published():
+    event_queue = EventQueue()
+    threading.Timer(0.05, event_queue.put, args=("card_a",)).start()
+    start = time.perf_counter()
+    assert event_queue.get(timeout=2) == "card_a"
+    assert time.perf_counter() - start < 1
+
+def test_get_times_out():
+    assert EventQueue().get(timeout=0.01) is None
+
+def test_drop_oldest_policy():
+    event_queue = EventQueue(maxsize=2)
+    for event in ("a", "b", "c"):
+        assert event_queue.put(event)
+    assert [event_queue.get_nowait(), event_queue.get_nowait()] == ["b", "c"]
+    assert event_queue.stats()["dropped"] == 1
+
+def test_drop_newest_policy():
+    event_queue = EventQueue(maxsize=2, overflow_policy="drop_newest")
+    assert event_queue.put("a")
+    assert event_queue.put("b")
+    assert not event_queue.put("c")
+    assert [event_queue.get_nowait(), event_queue.get_nowait()] == ["a", "b"]
+
+def test_coalesce_repeated_events():
+    event_queue = EventQueue(coalesce=True)
+    for event in ("a", "a", "a", "b", "a"):
+        event_queue.put(event)
+    assert len(event_queue) == 3
+    stats = event_queue.stats()
+    assert stats["published"] == 5
+    assert stats["coalesced"] == 2
+    assert stats["high_water"] == 3
+
+def test_none_cannot_be_published():
+    with pytest.raises(ValueError):
+        EventQueue().put(None)
+
+def test_concurrent_publishers_lose_nothing():
+    event_queue = EventQueue(maxsize=10_000)
+    publishers = [threading.Thread(target=lambda n=n: [event_queue.put((n, i)) for i in range(500)]) for n in range(4)]
+    for publisher in publishers:
+        publisher.start()
+    for publisher in publishers:
+        publisher.join()
+    assert len(event_queue) == 2000
+    assert event_queue.stats()["dropped"] == 0
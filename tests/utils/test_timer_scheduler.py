@@ -0,0 +1,42 @@
+import threading
+import time
+import pytest
+from src.utils.timer_scheduler import TimerScheduler
+
+@pytest.fixture
+def scheduler():
+    timer_scheduler = TimerScheduler("test_timer_scheduler")
+    timer_scheduler.start()
+    yield timer_scheduler
+    timer_scheduler.stop()
+
+def test_timers_fire_in_deadline_order(scheduler):
+    fired = []
+    done = threading.Event()
+    scheduler.call_later(0.03, lambda: (fired.append("late"), done.set()))
+    scheduler.call_later(0.01, lambda: fired.append("early"))
+    assert done.wait(1)
+    assert fired == ["early", "late"]
+
+def test_cancelled_timer_does_not_fire(scheduler):
+    fired = []
+    timer = scheduler.call_later(0.01, lambda: fired.append("cancelled"))
+    timer.cancel()
+    time.sleep(0.05)
+    assert fired == []
+    assert len(scheduler) == 0
+
+def test_callback_error_does_not_stop_scheduler(scheduler):
+    done = threading.Event()
+    scheduler.call_later(0, lambda: 1 / 0)
+    scheduler.call_later(0.01, done.set)
+    assert done.wait(1)
+
+def test_stop_discards_pending_timers():
+    timer_scheduler = TimerScheduler("test_timer_scheduler_stop")
+    timer_scheduler.start()
+    fired = []
+    timer_scheduler.call_later(0.05, lambda: fired.append("discarded"))
+    timer_scheduler.stop()
+    time.sleep(0.1)
+    assert fired == []
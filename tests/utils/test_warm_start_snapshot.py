@@ -0,0 +1,143 @@
+import json
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pytest
+from src.database.implementations.json_database import JsonDatabase
+from src.managers.implementations.access_control_manager import AccessControlManager
+from src.utils import warm_start_snapshot
+from src.utils.access_schedule import access_schedule_cache
+from src.utils.warm_start_snapshot import WarmStartSnapshot
+from tests.helpers import make_member
+
+UTC = ZoneInfo("UTC")
+
+@pytest.fixture
+def source(tmp_path):
+    data = {
+        "admin": make_member("admin", level="admin"),
+        "guest": make_member("guest", access_interval="R3/2024-02-08T11:00:00/PT9H"),
+        "lapsed": make_member("lapsed", level="member", status="inactive"),
+        "broken": make_member("broken", access_interval="not an interval"),
+        "monthly": make_member("monthly", access_interval="R2/2024-02-08T11:00:00/P1M")
+    }
+    path = tmp_path / "db.json"
+    path.write_text(json.dumps(data))
+    return path, data
+
+def test_round_trip_preloads_schedules_and_verdicts(source):
+    path, data = source
+    snapshot = WarmStartSnapshot(f"{path}.warm", time_zone="UTC")
+    snapshot.save(path, data)
+
+    access_schedule_cache.clear()
+    assert snapshot.load(path) == data
+    assert ("R3/2024-02-08T11:00:00/PT9H", "UTC") in access_schedule_cache.schedules
+    verdicts = snapshot.take_verdicts("UTC")
+    # Members that compile with an error or a calendar duration are left out
+    assert set(verdicts) == {"admin", "guest", "lapsed"}
+    assert verdicts["guest"][2].contains(datetime(2024, 2, 9, 12, tzinfo=UTC))
+    assert snapshot.take_verdicts("UTC") is None
+
+def test_verdicts_for_another_time_zone_are_not_used(source):
+    path, data = source
+    snapshot = WarmStartSnapshot(f"{path}.warm", time_zone="UTC")
+    snapshot.save(path, data)
+    snapshot.load(path)
+    assert snapshot.take_verdicts("America/Los_Angeles") is None
+
+def test_stale_snapshot_is_ignored(source):
+    path, data = source
+    snapshot = WarmStartSnapshot(f"{path}.warm")
+    snapshot.save(path, data)
+    stat = os.stat(path)
+    # Same size and mtime, different content
+    path.write_text(path.read_text().replace("admin", "ADMIN"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert snapshot.load(path) is None
+
+@pytest.mark.parametrize("damage", ["truncate", "flip", "garbage"])
+def test_damaged_snapshot_is_ignored(source, damage):
+    path, data = source
+    snapshot = WarmStartSnapshot(f"{path}.warm")
+    snapshot.save(path, data)
+    raw = bytearray(snapshot.filepath.read_bytes())
+    if damage == "truncate":
+        raw = raw[:len(raw) // 2]
+    elif damage == "flip":
+        raw[-10] ^= 0xFF
+    else:
+        raw = bytearray(b"not a snapshot")
+    snapshot.filepath.write_bytes(bytes(raw))
+    assert snapshot.load(path) is None
+
+def test_other_format_version_is_ignored(source, monkeypatch):
+    path, data = source
+    snapshot = WarmStartSnapshot(f"{path}.warm")
+    snapshot.save(path, data)
+    monkeypatch.setattr(warm_start_snapshot, "FORMAT_VERSION", warm_start_snapshot.FORMAT_VERSION + 1)
+    assert snapshot.load(path) is None
+
+def test_json_database_starts_from_snapshot(source, monkeypatch):
+    path, data = source
+    config = {"name": "warm_db", "connection_info": str(path), "warm_start_path": f"{path}.warm"}
+    JsonDatabase(config)  # Full parse writes the snapshot
+    assert os.path.exists(f"{path}.warm")
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("JSON file parsed on a warm start")
+    monkeypatch.setattr(json, "load", no_parse)
+    assert JsonDatabase(config).data == data
+
+def test_warm_start_decisions_match_full_parse(source):
+    path, _ = source
+    config = {"name": "warm_db", "connection_info": str(path), "warm_start_path": f"{path}.warm"}
+    cold = AccessControlManager({"database": JsonDatabase(config), "time_zone": "UTC"})
+    warm_db = JsonDatabase(config)
+    assert warm_db.warm_start.verdicts is not None
+    warm = AccessControlManager({"database": warm_db, "time_zone": "UTC"})
+    assert warm_db.warm_start.verdicts is None
+
+    for moment in (datetime(2024, 2, 9, 12, tzinfo=UTC), datetime(2024, 2, 9, 22, tzinfo=UTC), datetime(2024, 3, 20, 12, tzinfo=UTC)):
+        for obf_rfid in ("admin", "guest", "lapsed", "broken", "monthly", "unknown"):
+            assert warm.validate_access(obf_rfid, moment=moment) == cold.validate_access(obf_rfid, moment=moment), (obf_rfid, moment)
+
+def test_change_before_table_is_built_discards_verdicts(source):
+    path, _ = source
+    config = {"name": "warm_db", "connection_info": str(path), "warm_start_path": f"{path}.warm"}
+    JsonDatabase(config)
+    db = JsonDatabase(config)
+    db.update_member({"obf_rfid": "admin", "membership_status": "inactive"})
+    manager = AccessControlManager({"database": db, "time_zone": "UTC"})
+    assert not manager.validate_access("admin")
+
+def test_saves_leave_the_snapshot_to_a_debounced_rebuild(source, monkeypatch):
+    path, _ = source
+    config = {"name": "warm_db", "connection_info": str(path), "warm_start_path": f"{path}.warm", "warm_start_delay": 60}
+    JsonDatabase(config)
+    db = JsonDatabase(config)
+    saves = []
+    monkeypatch.setattr(db.warm_start, "save", lambda *args: saves.append(args))
+    db.update_member({"obf_rfid": "admin", "membership_status": "inactive"})
+    db.update_member({"obf_rfid": "guest", "membership_status": "inactive"})
+    assert saves == []
+    monkeypatch.undo()
+
+    # close() writes the pending snapshot, which then matches the saved file
+    db.close()
+    assert db.warm_start_timer is None
+    warm = JsonDatabase(config)
+    assert warm.warm_start.verdicts is not None
+    assert warm.data["admin"]["membership_status"] == "inactive"
+
+def test_deferred_write_on_close_refreshes_the_snapshot(source):
+    path, _ = source
+    config = {"name": "warm_db", "connection_info": str(path), "warm_start_path": f"{path}.warm",
+              "durability": "deferred", "commit_delay": 60}
+    JsonDatabase(config)
+    db = JsonDatabase(config)
+    db.update_member({"obf_rfid": "admin", "membership_status": "inactive"})
+    db.close()
+    warm = JsonDatabase(config)
+    assert warm.warm_start.verdicts is not None
+    assert warm.data["admin"]["membership_status"] == "inactive"